@@ -69,6 +69,12 @@ def proxy(
         help="Auto-commit memory changes to git. Initializes a repo in `--memory-path` if needed. Provides full history of memory evolution.",
         rich_help_panel="Memory Configuration",
     ),
+    fused_ingest: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--fused-ingest/--no-fused-ingest",
+        help="Extract facts, reconcile them and update the summary in a single LLM call per turn instead of separate calls. Faster on local backends; falls back to separate calls if the combined response is invalid.",
+        rich_help_panel="Memory Configuration",
+    ),
     log_level: opts.LogLevel = opts.SERVER_LOG_LEVEL,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
@@ -152,6 +158,8 @@ def proxy(
     )
     if not summarization:
         console.print("  ⚙️  Summaries: [red]disabled[/red]")
+    if fused_ingest:
+        console.print("  ⚡ Fused ingestion: [green]enabled[/green]")
     if git_versioning:
         console.print("  📝 Git Versioning: [green]enabled[/green]")
 
@@ -169,6 +177,7 @@ def proxy(
         recency_weight=recency_weight,
         score_threshold=score_threshold,
         enable_git_versioning=git_versioning,
+        ingest_mode="fused" if fused_ingest else "staged",
     )
 
     uvicorn.run(fastapi_app, host=host, port=port, log_config=None)
@@ -55,6 +55,36 @@ def rag_proxy(
         help="Enable `read_full_document()` tool so the LLM can request full document content when retrieved snippets are insufficient. Can be overridden per-request via `rag_enable_tools` in the JSON body.",
         rich_help_panel="RAG Configuration",
     ),
+    index_convert_workers: int = typer.Option(
+        4,
+        help="Worker threads that read and convert documents during a full (re)index.",
+        rich_help_panel="Indexing",
+    ),
+    index_chunk_workers: int = typer.Option(
+        2,
+        help="Worker threads that chunk documents and diff them against stored chunks.",
+        rich_help_panel="Indexing",
+    ),
+    index_embed_workers: int = typer.Option(
+        4,
+        help="Concurrent embedding requests during a full (re)index.",
+        rich_help_panel="Indexing",
+    ),
+    index_embed_batch_size: int = typer.Option(
+        64,
+        help="Initial number of chunks per embedding request. Adapts to the server's latency and shrinks after failed requests.",
+        rich_help_panel="Indexing",
+    ),
+    index_upsert_batch_size: int = typer.Option(
+        512,
+        help="Chunks written to ChromaDB per upsert.",
+        rich_help_panel="Indexing",
+    ),
+    index_queue_size: int = typer.Option(
+        64,
+        help="Capacity of the queues between indexing stages. Bounds memory use while a slow stage catches up.",
+        rich_help_panel="Indexing",
+    ),
 ) -> None:
     """Start a RAG proxy server that enables "chat with your documents".
 
@@ -113,6 +143,7 @@ def rag_proxy(
 
     import uvicorn  # noqa: PLC0415
 
+    from agent_cli.rag._pipeline import BulkIndexConfig  # noqa: PLC0415
     from agent_cli.rag.api import create_app  # noqa: PLC0415
 
     docs_folder = docs_folder.resolve()
@@ -161,6 +192,14 @@ def rag_proxy(
         chat_api_key=openai_api_key,
         limit=limit,
         enable_rag_tools=enable_rag_tools,
+        index_config=BulkIndexConfig(
+            convert_workers=index_convert_workers,
+            chunk_workers=index_chunk_workers,
+            embed_workers=index_embed_workers,
+            embed_batch_size=index_embed_batch_size,
+            upsert_batch_size=index_upsert_batch_size,
+            queue_size=index_queue_size,
+        ),
     )
 
     uvicorn.run(fastapi_app, host=host, port=port, log_config=None)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 from agent_cli.constants import DEFAULT_OPENAI_EMBEDDING_MODEL
+from agent_cli.core.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -13,6 +15,25 @@ if TYPE_CHECKING:
     from chromadb import Collection
     from pydantic import BaseModel
 
+# Mutation counter kept on each collection object, bumped on every upsert/delete
+# through this module so cached retrieval results can detect that the index
+# changed. Chroma collections are unhashable, so they cannot key a weak mapping.
+_GENERATION_ATTR = "_agent_cli_generation"
+_GENERATIONS_LOCK = threading.Lock()
+
+EMBEDDING_CACHE_FILENAME = "embedding_cache.sqlite3"
+
+
+def collection_generation(collection: Collection) -> int:
+    """Return the current mutation generation of a collection."""
+    return vars(collection).get(_GENERATION_ATTR, 0)
+
+
+def bump_generation(collection: Collection) -> None:
+    """Mark a collection as changed, invalidating cached retrieval results."""
+    with _GENERATIONS_LOCK:
+        setattr(collection, _GENERATION_ATTR, collection_generation(collection) + 1)
+
 
 def init_collection(
     persistence_path: Path,
@@ -22,8 +43,13 @@ def init_collection(
     openai_base_url: str | None = None,
     openai_api_key: str | None = None,
     subdir: str | None = None,
+    cache_embeddings: bool = True,
 ) -> Collection:
-    """Initialize a Chroma collection with OpenAI-compatible embeddings."""
+    """Initialize a Chroma collection with OpenAI-compatible embeddings.
+
+    With `cache_embeddings`, vectors are stored in an on-disk cache next to the
+    collection, so re-upserting unchanged text never re-embeds it.
+    """
     import chromadb  # noqa: PLC0415
     from chromadb.config import Settings  # noqa: PLC0415
     from chromadb.utils import embedding_functions  # noqa: PLC0415
@@ -39,7 +65,31 @@ def init_collection(
         api_key=openai_api_key or "dummy",
         model_name=embedding_model,
     )
-    return client.get_or_create_collection(name=name, embedding_function=embed_fn)
+    embedding_function: Any = embed_fn
+    if cache_embeddings:
+        embedding_function = CachedEmbeddingFunction(
+            embed_fn,
+            EmbeddingCache(target_path / EMBEDDING_CACHE_FILENAME),
+            model=embedding_model,
+        )
+    return client.get_or_create_collection(
+        name=name,
+        embedding_function=embedding_function,
+    )
+
+
+def embed_documents(collection: Collection, documents: list[str]) -> list[Any] | None:
+    """Embed documents with the collection's embedding function.
+
+    Lets bulk indexing embed outside of Chroma and upsert precomputed vectors.
+    Returns None when the collection has no embedding function (e.g. a test
+    double); callers should then let Chroma embed on upsert.
+    """
+    # The instance attribute Chroma embeds with, read without attribute magic
+    embedding_function = getattr(collection, "__dict__", {}).get("_embedding_function")
+    if embedding_function is None:
+        return None
+    return list(embedding_function(documents))
 
 
 def flatten_metadatas(metadatas: Sequence[BaseModel]) -> list[dict[str, Any]]:
@@ -54,6 +104,7 @@ def upsert(
     documents: list[str],
     metadatas: Sequence[BaseModel],
     batch_size: int = 10,
+    embeddings: Sequence[Any] | None = None,
 ) -> None:
     """Upsert documents with JSON-serialized metadata.
 
@@ -63,6 +114,7 @@ def upsert(
         documents: Document contents.
         metadatas: Pydantic metadata models.
         batch_size: Max documents per embedding API call (default: 10).
+        embeddings: Precomputed vectors; when given, Chroma skips embedding.
 
     """
     if not ids:
@@ -74,15 +126,39 @@ def upsert(
         batch_ids = ids[i : i + batch_size]
         batch_docs = documents[i : i + batch_size]
         batch_metas = serialized[i : i + batch_size]
-        collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_metas)
+        if embeddings is None:
+            collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_metas)
+        else:
+            collection.upsert(
+                ids=batch_ids,
+                documents=batch_docs,
+                metadatas=batch_metas,
+                embeddings=list(embeddings[i : i + batch_size]),
+            )
+    bump_generation(collection)
+
+
+def update_metadata(
+    collection: Collection,
+    *,
+    ids: list[str],
+    metadatas: Sequence[BaseModel],
+) -> None:
+    """Replace metadata of existing documents without re-embedding them."""
+    if not ids:
+        return
+    collection.update(ids=ids, metadatas=flatten_metadatas(metadatas))
+    bump_generation(collection)
 
 
 def delete(collection: Collection, ids: list[str]) -> None:
     """Delete documents by ID."""
     if ids:
         collection.delete(ids=ids)
+        bump_generation(collection)
 
 
 def delete_where(collection: Collection, where: Mapping[str, Any]) -> None:
     """Delete documents by a filter."""
     collection.delete(where=where)
+    bump_generation(collection)
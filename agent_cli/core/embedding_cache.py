@@ -0,0 +1,146 @@
+"""On-disk embedding cache keyed by (model, sha256(text)) (used by both RAG and Memory).
+
+Wraps the Chroma embedding function so unchanged chunks and repeated memory
+facts are never sent to the embedding server twice, including across restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, text_hash)
+) WITHOUT ROWID
+"""
+# SQLite caps bound parameters per statement; stay well below the limit.
+_LOOKUP_CHUNK = 500
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Thread-safe SQLite store of float32 embedding vectors."""
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) the cache database at `path`."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, texts: list[str]) -> list[np.ndarray | None]:
+        """Return cached vectors for `texts`, with None for each miss."""
+        import numpy as np  # noqa: PLC0415
+
+        hashes = [_text_hash(text) for text in texts]
+        found: dict[bytes, bytes] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for i in range(0, len(unique), _LOOKUP_CHUNK):
+                chunk = unique[i : i + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings"  # noqa: S608
+                    f" WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *chunk],
+                ).fetchall()
+                found.update(rows)
+            results = [
+                np.frombuffer(found[h], dtype=np.float32) if h in found else None for h in hashes
+            ]
+            hit_count = sum(vec is not None for vec in results)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+        return results
+
+    def put_many(self, model: str, texts: list[str], vectors: list[Any]) -> None:
+        """Store vectors for `texts` under `model`."""
+        import numpy as np  # noqa: PLC0415
+
+        rows = [
+            (model, _text_hash(text), np.asarray(vec, dtype=np.float32).tobytes())
+            for text, vec in zip(texts, vectors, strict=True)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddingFunction:
+    """Chroma embedding function that serves repeated texts from an `EmbeddingCache`.
+
+    Everything except embedding (name, config, ...) is delegated to the wrapped
+    function, so Chroma persists the same collection configuration as before.
+    """
+
+    def __init__(self, inner: Any, cache: EmbeddingCache, model: str) -> None:
+        """Wrap `inner`, caching its vectors under `model`."""
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+
+    def __call__(self, input: list[str]) -> list[np.ndarray]:  # noqa: A002
+        """Embed `input`, calling the wrapped function only for uncached texts."""
+        import numpy as np  # noqa: PLC0415
+
+        texts = list(input)
+        vectors = self._cache.get_many(self._model, texts)
+        missing = [i for i, vec in enumerate(vectors) if vec is None]
+        if missing:
+            # Embed each distinct missing text once, even if it repeats in the batch.
+            to_embed = list(dict.fromkeys(texts[i] for i in missing))
+            embedded = [np.asarray(vec, dtype=np.float32) for vec in self._inner(to_embed)]
+            self._cache.put_many(self._model, to_embed, embedded)
+            by_text = dict(zip(to_embed, embedded, strict=True))
+            for i in missing:
+                vectors[i] = by_text[texts[i]]
+            LOGGER.debug(
+                "Embedded %d texts (%d served from cache)",
+                len(to_embed),
+                len(texts) - len(missing),
+            )
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, input: list[str]) -> list[np.ndarray]:  # noqa: A002
+        """Embed query texts through the same cache."""
+        return self(input)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else (name, config, ...) to the wrapped function."""
+        return getattr(self._inner, name)
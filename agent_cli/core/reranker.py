@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,19 +45,141 @@ def _download_onnx_model(model_name: str, onnx_filename: str) -> str:
             raise
 
 
+# Pairs are grouped into these token-length buckets before batching, so short
+# pairs never pad up to the longest document in the request.
+_LENGTH_BUCKETS = (32, 64, 128, 256, 512)
+_DEFAULT_TOKEN_CACHE_BYTES = 64 * 1024 * 1024
+_CACHE_ENTRY_OVERHEAD_BYTES = 128  # dict slot, key and ndarray header
+
+
+class _TokenCache:
+    """Thread-safe LRU of document token IDs keyed by text hash, bounded by bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        with self._lock:
+            ids = self._entries.get(key)
+            if ids is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return ids
+
+    def put(self, key: bytes, ids: np.ndarray) -> None:
+        size = ids.nbytes + _CACHE_ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes + _CACHE_ENTRY_OVERHEAD_BYTES
+            self._entries[key] = ids
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes + _CACHE_ENTRY_OVERHEAD_BYTES
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@dataclass(frozen=True)
+class _PairTemplate:
+    """Special-token layout of an encoded pair: `prefix q middle d suffix`."""
+
+    prefix: list[int]
+    middle: list[int]
+    suffix: list[int]
+    query_type: int
+    doc_type: int
+
+    @property
+    def n_special(self) -> int:
+        return len(self.prefix) + len(self.middle) + len(self.suffix)
+
+    @classmethod
+    def from_tokenizer(cls, tokenizer: Any) -> _PairTemplate | None:
+        """Derive the layout by encoding a probe pair; None for slow tokenizers."""
+        if not getattr(tokenizer, "is_fast", False):
+            return None
+        encoding = tokenizer("a", "b", return_token_type_ids=True)
+        ids = encoding["input_ids"]
+        types = encoding.get("token_type_ids") or [0] * len(ids)
+        sequence_ids = encoding.sequence_ids()
+        query_pos = [i for i, seq in enumerate(sequence_ids) if seq == 0]
+        doc_pos = [i for i, seq in enumerate(sequence_ids) if seq == 1]
+        if not query_pos or not doc_pos:
+            return None
+        return cls(
+            prefix=ids[: query_pos[0]],
+            middle=ids[query_pos[-1] + 1 : doc_pos[0]],
+            suffix=ids[doc_pos[-1] + 1 :],
+            query_type=types[query_pos[0]],
+            doc_type=types[doc_pos[0]],
+        )
+
+
+def _truncate_longest_first(n_query: int, n_doc: int, budget: int) -> tuple[int, int]:
+    """Trim the longer sequence first until the pair fits `budget` tokens."""
+    if n_query + n_doc <= budget:
+        return n_query, n_doc
+    half = budget // 2
+    if n_query <= half:
+        return n_query, budget - n_query
+    if n_doc <= budget - half:
+        return budget - n_doc, n_doc
+    return half, budget - half
+
+
 class OnnxCrossEncoder:
-    """A lightweight CrossEncoder using ONNX Runtime."""
+    """A lightweight CrossEncoder using ONNX Runtime.
+
+    Document token IDs are cached by content hash, so reranking the same chunks
+    for new queries skips most tokenizer work. Pairs are grouped into length
+    buckets and each batch is padded only to its own longest member.
+    """
 
     def __init__(
         self,
         model_name: str = "Xenova/ms-marco-MiniLM-L-6-v2",
         onnx_filename: str = "model.onnx",
+        *,
+        max_length: int = 512,
+        token_cache_bytes: int = _DEFAULT_TOKEN_CACHE_BYTES,
     ) -> None:
-        """Initialize the ONNX CrossEncoder."""
+        """Initialize the ONNX CrossEncoder.
+
+        Args:
+            model_name: Hugging Face repo with the ONNX export and tokenizer.
+            onnx_filename: ONNX file name inside the repo.
+            max_length: Truncation budget in tokens per (query, document) pair.
+            token_cache_bytes: Memory bound for the document token cache.
+
+        """
         from onnxruntime import InferenceSession  # noqa: PLC0415
         from transformers import AutoTokenizer  # noqa: PLC0415
 
         self.model_name = model_name
+        self.max_length = max_length
 
         # Download model if needed
         LOGGER.info("Loading ONNX model: %s", model_name)
@@ -54,17 +187,113 @@ class OnnxCrossEncoder:
 
         self.session = InferenceSession(model_path)
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        self._template = _PairTemplate.from_tokenizer(self.tokenizer)
+        self._pad_id = self.tokenizer.pad_token_id or 0
+        self.token_cache = _TokenCache(token_cache_bytes)
 
     def predict(
         self,
-        pairs: list[tuple[str, str]],
+        pairs: Sequence[tuple[str, str]],
         batch_size: int = 32,
     ) -> list[float]:
         """Predict relevance scores for query-document pairs."""
-        import numpy as np  # noqa: PLC0415
-
         if not pairs:
             return []
+        if self._template is None:
+            return self._predict_untemplated(pairs, batch_size)
+
+        template = self._template
+        budget = max(self.max_length - template.n_special, 2)
+        query_ids = self._encode_queries({q for q, _ in pairs})
+        encoded: list[tuple[np.ndarray, np.ndarray]] = []
+        for query, doc in pairs:
+            q_ids = query_ids[query]
+            d_ids = self._doc_ids(doc, budget)
+            n_q, n_d = _truncate_longest_first(len(q_ids), len(d_ids), budget)
+            encoded.append((q_ids[:n_q], d_ids[:n_d]))
+
+        scores = [0.0] * len(pairs)
+        for indices in self._bucketed_batches(encoded, template, batch_size):
+            batch_scores = self._run_batch([encoded[i] for i in indices], template)
+            for index, score in zip(indices, batch_scores, strict=True):
+                scores[index] = score
+        return scores
+
+    def _encode_queries(self, queries: set[str]) -> dict[str, np.ndarray]:
+        """Tokenize each distinct query once (without special tokens)."""
+        import numpy as np  # noqa: PLC0415
+
+        ordered = list(queries)
+        ids = self.tokenizer(ordered, add_special_tokens=False)["input_ids"]
+        return {q: np.asarray(q_ids, dtype=np.int32) for q, q_ids in zip(ordered, ids, strict=True)}
+
+    def _doc_ids(self, doc: str, budget: int) -> np.ndarray:
+        """Return (cached) token IDs for a document, clipped to the pair budget."""
+        import numpy as np  # noqa: PLC0415
+
+        key = _TokenCache.key(doc)
+        ids = self.token_cache.get(key)
+        if ids is None:
+            raw = self.tokenizer(doc, add_special_tokens=False)["input_ids"]
+            ids = np.asarray(raw[:budget], dtype=np.int32)
+            self.token_cache.put(key, ids)
+        return ids
+
+    def _bucketed_batches(
+        self,
+        encoded: list[tuple[np.ndarray, np.ndarray]],
+        template: _PairTemplate,
+        batch_size: int,
+    ) -> list[list[int]]:
+        """Group pair indices by length bucket, then split buckets into batches."""
+        lengths = [len(q) + len(d) + template.n_special for q, d in encoded]
+        buckets: dict[int, list[int]] = {}
+        for index, length in enumerate(lengths):
+            bucket = next((b for b in _LENGTH_BUCKETS if length <= b), self.max_length)
+            buckets.setdefault(bucket, []).append(index)
+        batches: list[list[int]] = []
+        for bucket in sorted(buckets):
+            members = sorted(buckets[bucket], key=lengths.__getitem__)
+            batches.extend(members[i : i + batch_size] for i in range(0, len(members), batch_size))
+        return batches
+
+    def _run_batch(
+        self,
+        batch: list[tuple[np.ndarray, np.ndarray]],
+        template: _PairTemplate,
+    ) -> list[float]:
+        """Assemble padded ONNX inputs for pre-tokenized pairs and run inference."""
+        import numpy as np  # noqa: PLC0415
+
+        n_prefix, n_middle = len(template.prefix), len(template.middle)
+        width = max(len(q) + len(d) for q, d in batch) + template.n_special
+        input_ids = np.full((len(batch), width), self._pad_id, dtype=np.int64)
+        token_type_ids = np.zeros((len(batch), width), dtype=np.int64)
+        attention_mask = np.zeros((len(batch), width), dtype=np.int64)
+        for row, (q_ids, d_ids) in enumerate(batch):
+            doc_start = n_prefix + len(q_ids) + n_middle
+            end = doc_start + len(d_ids) + len(template.suffix)
+            input_ids[row, :end] = np.concatenate(
+                (template.prefix, q_ids, template.middle, d_ids, template.suffix),
+            )
+            token_type_ids[row, :doc_start] = template.query_type
+            token_type_ids[row, doc_start:end] = template.doc_type
+            attention_mask[row, :end] = 1
+
+        ort_inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            ort_inputs["token_type_ids"] = token_type_ids
+        logits = self.session.run(None, ort_inputs)[0]
+        return (logits.flatten() if logits.ndim > 1 else logits).tolist()
+
+    def _predict_untemplated(
+        self,
+        pairs: Sequence[tuple[str, str]],
+        batch_size: int,
+    ) -> list[float]:
+        """Fallback for tokenizers without pair layout info: tokenize every batch."""
+        import numpy as np  # noqa: PLC0415
 
         all_scores = []
 
@@ -81,7 +310,7 @@ class OnnxCrossEncoder:
                 padding=True,
                 truncation=True,
                 return_tensors="np",
-                max_length=512,
+                max_length=self.max_length,
             )
 
             # ONNX Input
@@ -105,6 +334,182 @@ class OnnxCrossEncoder:
         return all_scores
 
 
+class _PendingRerank:
+    """A caller's pairs waiting to be scored in a shared batch."""
+
+    __slots__ = ("done", "error", "pairs", "scores")
+
+    def __init__(self, pairs: Sequence[tuple[str, str]]) -> None:
+        self.pairs = pairs
+        self.scores: list[float] = []
+        self.error: BaseException | None = None
+        self.done = False
+
+
+@dataclass
+class RerankStats:
+    """Cumulative and last-flush statistics of a `RerankBatcher`."""
+
+    flushes: int = 0
+    requests: int = 0
+    pairs: int = 0
+    total_flush_ms: float = 0.0
+    last_flush_requests: int = 0
+    last_flush_pairs: int = 0
+    last_flush_ms: float = 0.0
+    last_flush_wait_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Return the stats with derived averages, suitable for `/health`."""
+        return {
+            **asdict(self),
+            "avg_pairs_per_flush": self.pairs / self.flushes if self.flushes else 0.0,
+            "avg_requests_per_flush": self.requests / self.flushes if self.flushes else 0.0,
+        }
+
+
+class RerankBatcher:
+    """Micro-batching scheduler for a shared cross-encoder.
+
+    Thread-safe drop-in for `OnnxCrossEncoder.predict`. Callers queue their
+    `(query, doc)` pairs; the first caller to find the model idle becomes the
+    leader, waits up to `max_wait_ms` for more pairs (or until `max_batch_pairs`
+    are queued), then scores the whole batch in one `predict` call and hands each
+    caller its slice. Pairs are sorted by length before inference so each ONNX
+    sub-batch pads to a similar length. Callers that arrive while a batch is
+    running are served by the next leader.
+    """
+
+    def __init__(
+        self,
+        model: OnnxCrossEncoder,
+        *,
+        max_batch_pairs: int = 64,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """Wrap a cross-encoder model."""
+        self.model = model
+        self.max_batch_pairs = max_batch_pairs
+        self.max_wait_ms = max_wait_ms
+        self._cond = threading.Condition()
+        self._pending: list[_PendingRerank] = []
+        self._pending_pairs = 0
+        self._busy = False
+        self._stats = RerankStats()
+
+    def predict(self, pairs: Sequence[tuple[str, str]]) -> list[float]:
+        """Predict relevance scores, sharing the ONNX batch with concurrent callers."""
+        if not pairs:
+            return []
+        request = _PendingRerank(pairs)
+        with self._cond:
+            self._pending.append(request)
+            self._pending_pairs += len(pairs)
+            self._cond.notify_all()
+        while True:
+            with self._cond:
+                while self._busy and not request.done:
+                    self._cond.wait()
+                if request.done:
+                    break
+                self._busy = True
+                wait_ms = self._wait_for_batch()
+                batch = self._take_batch()
+            try:
+                self._flush(batch, wait_ms)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+        if request.error is not None:
+            raise request.error
+        return request.scores
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the batching (and token cache) statistics."""
+        with self._cond:
+            stats: dict[str, Any] = {
+                **self._stats.to_dict(),
+                "queued_pairs": self._pending_pairs,
+                "max_batch_pairs": self.max_batch_pairs,
+                "max_wait_ms": self.max_wait_ms,
+            }
+        if isinstance(self.model, OnnxCrossEncoder):
+            stats["token_cache"] = self.model.token_cache.stats()
+        return stats
+
+    def _wait_for_batch(self) -> float:
+        """Wait (holding the leader role) until the batch is full or the window closes."""
+        start = time.perf_counter()
+        deadline = start + self.max_wait_ms / 1000
+        while self._pending_pairs < self.max_batch_pairs:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+        return (time.perf_counter() - start) * 1000
+
+    def _take_batch(self) -> list[_PendingRerank]:
+        """Pop whole requests from the queue up to `max_batch_pairs` (at least one)."""
+        batch: list[_PendingRerank] = []
+        n_pairs = 0
+        while self._pending:
+            size = len(self._pending[0].pairs)
+            if batch and n_pairs + size > self.max_batch_pairs:
+                break
+            batch.append(self._pending.pop(0))
+            n_pairs += size
+        self._pending_pairs -= n_pairs
+        return batch
+
+    def _flush(self, batch: list[_PendingRerank], wait_ms: float) -> None:
+        """Score all pairs of `batch` with one model call and distribute results."""
+        start = time.perf_counter()
+        pairs = [pair for request in batch for pair in request.pairs]
+        order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+        try:
+            sorted_scores = self.model.predict([pairs[i] for i in order])
+            scores = [0.0] * len(pairs)
+            for position, index in enumerate(order):
+                scores[index] = sorted_scores[position]
+            offset = 0
+            for request in batch:
+                request.scores = scores[offset : offset + len(request.pairs)]
+                offset += len(request.pairs)
+                request.done = True
+        except Exception as exc:
+            for request in batch:
+                request.error = exc
+                request.done = True
+            return
+        finally:
+            # A BaseException (e.g. KeyboardInterrupt) propagates from the leader;
+            # still settle the popped requests so their callers stop waiting
+            for request in batch:
+                if not request.done:
+                    request.error = RuntimeError("Rerank batch was interrupted")
+                    request.done = True
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._cond:
+            stats = self._stats
+            stats.flushes += 1
+            stats.requests += len(batch)
+            stats.pairs += len(pairs)
+            stats.total_flush_ms += elapsed_ms
+            stats.last_flush_requests = len(batch)
+            stats.last_flush_pairs = len(pairs)
+            stats.last_flush_ms = elapsed_ms
+            stats.last_flush_wait_ms = wait_ms
+        LOGGER.debug(
+            "Rerank flush: requests=%d, pairs=%d, wait=%.1f ms, inference=%.1f ms",
+            len(batch),
+            len(pairs),
+            wait_ms,
+            elapsed_ms,
+        )
+
+
 def get_reranker_model(
     model_name: str = "Xenova/ms-marco-MiniLM-L-6-v2",
 ) -> OnnxCrossEncoder:
@@ -113,7 +518,7 @@ def get_reranker_model(
 
 
 def predict_relevance(
-    model: OnnxCrossEncoder,
+    model: OnnxCrossEncoder | RerankBatcher,
     pairs: list[tuple[str, str]],
 ) -> list[float]:
     """Predict relevance scores for query-document pairs."""
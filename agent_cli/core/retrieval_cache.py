@@ -0,0 +1,82 @@
+"""LRU + TTL cache for retrieval results (shared by RAG and Memory).
+
+Entries are tagged with the collection generation (see `core.chroma`) at the
+time they were computed, so any upsert or delete on the collection makes all
+earlier results stale without having to track which queries they affected.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def make_cache_key(query: str, *params: Any) -> str:
+    """Build a cache key from a whitespace/case-normalized query and parameters."""
+    normalized = " ".join(query.split()).casefold()
+    return json.dumps([normalized, *params], sort_keys=True, default=str)
+
+
+class RetrievalCache(Generic[T]):
+    """Thread-safe LRU cache with a TTL, invalidated by collection generation."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0) -> None:
+        """Create a cache holding at most `max_entries` results for `ttl_seconds`."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[int, float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, key: str, generation: int) -> T | None:
+        """Return a cached value computed at `generation`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            entry_generation, stored_at, value = entry
+            if entry_generation != generation or time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stale += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, generation: int, value: T) -> None:
+        """Store a value computed while the collection was at `generation`."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for `/health`."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
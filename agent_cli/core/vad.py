@@ -16,6 +16,7 @@ from agent_cli import constants
 if TYPE_CHECKING:
     import numpy as np
     from numpy.typing import NDArray
+    from onnxruntime import InferenceSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -42,25 +43,38 @@ def _get_model_path() -> Path:
     return SILERO_VAD_CACHE
 
 
-class _SileroVADOnnx:
-    """Pure numpy wrapper for Silero VAD ONNX model."""
+def load_vad_session(*, force_cpu: bool = True) -> InferenceSession:
+    """Load the Silero VAD ONNX model, downloading it if needed.
 
-    def __init__(self, *, force_cpu: bool = True) -> None:
-        """Initialize the ONNX model session."""
-        import onnxruntime  # noqa: PLC0415
+    The session holds no stream state, so one session can serve many detectors.
+    """
+    import onnxruntime  # noqa: PLC0415
 
-        model_path = _get_model_path()
+    model_path = _get_model_path()
 
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
 
-        providers = ["CPUExecutionProvider"] if force_cpu else None
-        self._session = onnxruntime.InferenceSession(
-            str(model_path),
-            providers=providers,
-            sess_options=opts,
-        )
+    providers = ["CPUExecutionProvider"] if force_cpu else None
+    return onnxruntime.InferenceSession(
+        str(model_path),
+        providers=providers,
+        sess_options=opts,
+    )
+
+
+class _SileroVADOnnx:
+    """Pure numpy wrapper for Silero VAD ONNX model."""
+
+    def __init__(
+        self,
+        *,
+        force_cpu: bool = True,
+        session: InferenceSession | None = None,
+    ) -> None:
+        """Initialize the stream state, loading a session unless one is given."""
+        self._session = session or load_vad_session(force_cpu=force_cpu)
         self._sample_rates = [8000, 16000]
         self.reset_states()
 
@@ -140,8 +154,13 @@ class VoiceActivityDetector:
         silence_threshold_ms: int = 1000,
         min_speech_duration_ms: int = 250,
         pre_speech_buffer_ms: int = 300,
+        session: InferenceSession | None = None,
     ) -> None:
-        """Initialize VAD with configurable thresholds."""
+        """Initialize VAD with configurable thresholds.
+
+        Pass a `session` from `load_vad_session` to share one loaded model
+        between detectors; each detector keeps its own stream state.
+        """
         if sample_rate not in (8000, 16000):
             msg = f"Sample rate must be 8000 or 16000, got {sample_rate}"
             raise ValueError(msg)
@@ -162,7 +181,7 @@ class VoiceActivityDetector:
         )
 
         # Model and state
-        self._model = _SileroVADOnnx()
+        self._model = _SileroVADOnnx(session=session)
         self._pre_speech_buffer: deque[bytes] = deque(maxlen=pre_speech_windows)
         self._pending = bytearray()
         self._audio_buffer = bytearray()
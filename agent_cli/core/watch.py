@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,6 +14,8 @@ if TYPE_CHECKING:
 
     from watchfiles import Change
 
+LOGGER = logging.getLogger(__name__)
+
 
 def _default_skip_hidden(path: Path, root: Path) -> bool:
     """Default filter that skips hidden files and directories."""
@@ -18,6 +23,17 @@ def _default_skip_hidden(path: Path, root: Path) -> bool:
     return any(part.startswith(".") for part in rel_parts)
 
 
+def _select_filter(
+    skip_hidden: bool,
+    ignore_filter: Callable[[Path, Path], bool] | None,
+) -> Callable[[Path, Path], bool] | None:
+    if ignore_filter is not None:
+        return ignore_filter
+    if skip_hidden:
+        return _default_skip_hidden
+    return None
+
+
 async def watch_directory(
     root: Path,
     handler: Callable[[Change, Path], None],
@@ -41,14 +57,7 @@ async def watch_directory(
     from watchfiles import awatch  # noqa: PLC0415
 
     loop = asyncio.get_running_loop()
-
-    # Determine which filter to use
-    if ignore_filter is not None:
-        should_skip = ignore_filter
-    elif skip_hidden:
-        should_skip = _default_skip_hidden
-    else:
-        should_skip = None
+    should_skip = _select_filter(skip_hidden, ignore_filter)
 
     async for changes in awatch(root):
         for change_type, file_path_str in changes:
@@ -63,3 +72,180 @@ async def watch_directory(
                 await loop.run_in_executor(None, handler, change_type, path)
             else:
                 handler(change_type, path)
+
+
+@dataclass
+class ChangeQueueStats:
+    """Counters describing how a `ChangeQueue` coalesced and dispatched events."""
+
+    events: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    paths: int = 0
+    max_pending: int = 0
+    backpressure_waits: int = 0
+
+
+class ChangeQueue:
+    """Coalesce file events per path and dispatch them in batches to a worker pool.
+
+    Only the last change seen for a path is kept. Events are flushed once no
+    new event arrived for `debounce` seconds (or after `max_delay` under a
+    constant stream). At most `max_workers` batches run at once; while all
+    workers are busy, new events keep coalescing in the pending map. A path
+    is never in two running batches, so its changes are applied in order.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[tuple[Change, Path]]], None],
+        *,
+        debounce: float = 0.5,
+        max_delay: float = 5.0,
+        max_batch_size: int = 64,
+        max_workers: int = 2,
+    ) -> None:
+        """Dispatch batches of (change, path) pairs to `handler` on worker threads."""
+        self._handler = handler
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.stats = ChangeQueueStats()
+        self._pending: dict[Path, Change] = {}
+        self._in_flight: set[Path] = set()
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_workers)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="watch")
+
+    def put(self, change: Change, path: Path) -> None:
+        """Record a change, replacing any pending change for the same path."""
+        now = asyncio.get_running_loop().time()
+        self.stats.events += 1
+        if path in self._pending:
+            self.stats.coalesced += 1
+        elif not self._pending:
+            self._first_event = now
+        self._pending[path] = change
+        self._last_event = now
+        self.stats.max_pending = max(self.stats.max_pending, len(self._pending))
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Flush pending changes whenever the debounce window closes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            while True:
+                now = loop.time()
+                deadline = min(self._last_event + self.debounce, self._first_event + self.max_delay)
+                if now >= deadline:
+                    break
+                await asyncio.sleep(deadline - now)
+            self._wakeup.clear()
+            await self._dispatch_ready()
+
+    async def drain(self) -> None:
+        """Dispatch everything pending now and wait for all batches to finish."""
+        while self._pending or self._tasks:
+            await self._dispatch_ready()
+            if self._tasks:
+                await asyncio.wait(set(self._tasks))
+
+    def close(self) -> None:
+        """Stop the worker threads without waiting for running batches."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _dispatch_ready(self) -> None:
+        ready = [path for path in self._pending if path not in self._in_flight]
+        for i in range(0, len(ready), self.max_batch_size):
+            if self._slots.locked():
+                self.stats.backpressure_waits += 1
+            await self._slots.acquire()
+            # Pop at dispatch time, so changes that arrived meanwhile are included
+            batch = [
+                (self._pending.pop(path), path)
+                for path in ready[i : i + self.max_batch_size]
+                if path in self._pending
+            ]
+            if not batch:
+                self._slots.release()
+                continue
+            self._in_flight.update(path for _, path in batch)
+            self.stats.batches += 1
+            self.stats.paths += len(batch)
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if self._pending:
+            self._first_event = asyncio.get_running_loop().time()
+        LOGGER.debug("Watch queue: %s", self.stats)
+
+    async def _run_batch(self, batch: list[tuple[Change, Path]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._handler, batch)
+        except Exception:
+            LOGGER.exception("Watcher batch of %d changes failed", len(batch))
+        finally:
+            self._in_flight.difference_update(path for _, path in batch)
+            self._slots.release()
+            if self._pending:
+                # Changes for paths that were in flight can go now
+                self._wakeup.set()
+
+
+async def watch_directory_batched(
+    root: Path,
+    handler: Callable[[list[tuple[Change, Path]]], None],
+    *,
+    skip_hidden: bool = True,
+    ignore_filter: Callable[[Path, Path], bool] | None = None,
+    debounce: float = 0.5,
+    max_batch_size: int = 64,
+    max_workers: int = 2,
+) -> None:
+    """Watch a directory and invoke handler(batch) with coalesced changes.
+
+    Like `watch_directory`, but events go through a `ChangeQueue`: a burst such
+    as a `git checkout` becomes a few batches with one change per path, and
+    repeated saves of one file are applied once.
+
+    Args:
+        root: The directory to watch.
+        handler: Callback invoked on a worker thread with a list of
+            (change_type, path) pairs, one per distinct path.
+        skip_hidden: If True, skip files/dirs starting with '.'. Ignored if
+            ignore_filter is provided.
+        ignore_filter: Optional custom filter function(path, root) -> bool.
+            Returns True if the path should be ignored. Overrides skip_hidden.
+        debounce: Seconds without new events before pending changes are flushed.
+        max_batch_size: Maximum number of paths per handler call.
+        max_workers: Maximum number of handler calls running at once.
+
+    """
+    from watchfiles import awatch  # noqa: PLC0415
+
+    should_skip = _select_filter(skip_hidden, ignore_filter)
+    queue = ChangeQueue(
+        handler,
+        debounce=debounce,
+        max_batch_size=max_batch_size,
+        max_workers=max_workers,
+    )
+    dispatcher = asyncio.create_task(queue.run())
+    try:
+        async for changes in awatch(root):
+            for change_type, file_path_str in changes:
+                path = Path(file_path_str)
+                if path.is_dir():  # noqa: ASYNC240
+                    continue
+                if should_skip is not None and should_skip(path, root):
+                    continue
+                queue.put(change_type, path)
+        await queue.drain()
+    finally:
+        dispatcher.cancel()
+        queue.close()
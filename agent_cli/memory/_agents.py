@@ -0,0 +1,310 @@
+"""Long-lived LLM agents for memory ingestion (facts, reconciliation, summaries).
+
+Building an `OpenAIProvider`, `OpenAIChatModel` and `Agent` per call also
+creates a fresh HTTP client, so every turn paid connection setup three times.
+`MemoryAgents` keeps one agent per (kind, base URL, API key, model) and routes
+all of them through a single keep-alive `httpx.AsyncClient`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from pydantic_ai import RunContext  # noqa: TC002 - validator annotations are resolved at runtime
+
+from agent_cli.memory._prompt import (
+    FACT_SYSTEM_PROMPT,
+    FUSED_INGEST_PROMPT,
+    SUMMARY_PROMPT,
+    UPDATE_MEMORY_PROMPT,
+)
+from agent_cli.memory.models import (
+    FusedIngestOutput,
+    MemoryDecision,
+    MemoryDelete,
+    MemoryIgnore,
+    MemoryUpdate,
+    SummaryOutput,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    import httpx
+    from pydantic_ai import Agent
+
+LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONCURRENCY = 4
+_DEFAULT_MAX_AGENTS = 32
+_DEFAULT_TIMEOUT = 120.0
+
+
+def _decision_errors(decisions: list[MemoryDecision], existing_ids: frozenset[int]) -> list[str]:
+    errors = []
+    for dec in decisions:
+        if (
+            isinstance(dec, (MemoryUpdate, MemoryDelete, MemoryIgnore))
+            and dec.id not in existing_ids
+        ):
+            if isinstance(dec, MemoryUpdate):
+                errors.append(
+                    f"UPDATE with id={dec.id} is invalid: that ID doesn't exist. "
+                    f"Valid existing IDs are: {sorted(existing_ids)}. "
+                    f"For NEW facts, use ADD with a new ID.",
+                )
+            elif isinstance(dec, MemoryDelete):
+                errors.append(f"DELETE with id={dec.id} is invalid: that ID doesn't exist.")
+            else:  # MemoryIgnore (NONE)
+                errors.append(f"NONE with id={dec.id} is invalid: that ID doesn't exist.")
+    return errors
+
+
+def _raise_for_errors(errors: list[str]) -> None:
+    if errors:
+        from pydantic_ai import ModelRetry  # noqa: PLC0415
+
+        msg = "Invalid memory decisions:\n" + "\n".join(f"- {e}" for e in errors)
+        raise ModelRetry(msg)
+
+
+class MemoryAgents:
+    """Registry of reusable ingestion agents sharing one HTTP client.
+
+    Agents are created on first use and kept in a small LRU. `run` bounds how
+    many LLM calls are in flight at once, so bursts of turns queue here
+    instead of flooding the backend.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_agents: int = _DEFAULT_MAX_AGENTS,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> None:
+        """Allow `max_concurrency` LLM calls at once and keep up to `max_agents` agents."""
+        self.max_concurrency = max_concurrency
+        self.max_agents = max_agents
+        self.timeout = timeout
+        self._agents: OrderedDict[tuple[Any, ...], Agent[Any, Any]] = OrderedDict()
+        self._http_client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.created = 0
+        self.reused = 0
+        self.in_flight = 0
+
+    def facts(self, *, base_url: str, api_key: str | None, model: str) -> Agent[None, list[str]]:
+        """Return the fact-extraction agent."""
+
+        def build(model_cfg: Any) -> Agent[None, list[str]]:
+            from pydantic_ai import Agent  # noqa: PLC0415
+
+            return Agent(
+                model=model_cfg,
+                system_prompt=FACT_SYSTEM_PROMPT,
+                output_type=list[str],
+                retries=2,
+            )
+
+        return self._get(("facts", base_url, api_key, model), build, base_url, api_key, model)
+
+    def reconcile(
+        self,
+        *,
+        base_url: str,
+        api_key: str | None,
+        model: str,
+    ) -> Agent[frozenset[int], list[MemoryDecision]]:
+        """Return the reconciliation agent; run it with the existing ids as `deps`."""
+
+        def build(model_cfg: Any) -> Agent[frozenset[int], list[MemoryDecision]]:
+            from pydantic_ai import Agent, PromptedOutput  # noqa: PLC0415
+
+            agent: Agent[frozenset[int], list[MemoryDecision]] = Agent(
+                model=model_cfg,
+                system_prompt=UPDATE_MEMORY_PROMPT,
+                output_type=PromptedOutput(list[MemoryDecision]),  # JSON mode, not tool calls
+                deps_type=frozenset[int],
+                retries=3,
+            )
+
+            @agent.output_validator
+            def validate_decisions(
+                ctx: RunContext[frozenset[int]],
+                decisions: list[MemoryDecision],
+            ) -> list[MemoryDecision]:
+                """Reject decisions that reference ids missing from the existing ids."""
+                _raise_for_errors(_decision_errors(decisions, ctx.deps))
+                return decisions
+
+            return agent
+
+        return self._get(
+            ("reconcile", base_url, api_key, model),
+            build,
+            base_url,
+            api_key,
+            model,
+            temperature=0.0,
+            max_tokens=512,
+        )
+
+    def summary(
+        self,
+        *,
+        base_url: str,
+        api_key: str | None,
+        model: str,
+        max_tokens: int = 256,
+    ) -> Agent[None, SummaryOutput]:
+        """Return the summary agent."""
+
+        def build(model_cfg: Any) -> Agent[None, SummaryOutput]:
+            from pydantic_ai import Agent  # noqa: PLC0415
+
+            return Agent(model=model_cfg, system_prompt=SUMMARY_PROMPT, output_type=SummaryOutput)
+
+        return self._get(
+            ("summary", base_url, api_key, model, max_tokens),
+            build,
+            base_url,
+            api_key,
+            model,
+            temperature=0.2,
+            max_tokens=max_tokens,
+        )
+
+    def fused(
+        self,
+        *,
+        base_url: str,
+        api_key: str | None,
+        model: str,
+    ) -> Agent[frozenset[int], FusedIngestOutput]:
+        """Return the one-shot extract+reconcile+summary agent (existing ids as `deps`)."""
+
+        def build(model_cfg: Any) -> Agent[frozenset[int], FusedIngestOutput]:
+            from pydantic_ai import Agent, PromptedOutput  # noqa: PLC0415
+
+            agent: Agent[frozenset[int], FusedIngestOutput] = Agent(
+                model=model_cfg,
+                system_prompt=FUSED_INGEST_PROMPT,
+                output_type=PromptedOutput(FusedIngestOutput),
+                deps_type=frozenset[int],
+                retries=3,
+            )
+
+            @agent.output_validator
+            def validate_fused(
+                ctx: RunContext[frozenset[int]],
+                output: FusedIngestOutput,
+            ) -> FusedIngestOutput:
+                """Reject decisions that reference ids missing from the existing ids."""
+                _raise_for_errors(_decision_errors(output.decisions, ctx.deps))
+                return output
+
+            return agent
+
+        return self._get(
+            ("fused", base_url, api_key, model),
+            build,
+            base_url,
+            api_key,
+            model,
+            temperature=0.0,
+            max_tokens=1024,
+        )
+
+    async def run(self, agent: Agent[Any, Any], *args: Any, **kwargs: Any) -> Any:
+        """Run `agent`, waiting for a free slot when `max_concurrency` calls are in flight."""
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                return await agent.run(*args, **kwargs)
+            finally:
+                self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and drop all agents."""
+        self._agents.clear()
+        client, self._http_client = self._http_client, None
+        if client is not None:
+            await client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters for `/health`."""
+        return {
+            "agents": len(self._agents),
+            "created": self.created,
+            "reused": self.reused,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def _get(
+        self,
+        key: tuple[Any, ...],
+        build: Callable[[Any], Agent[Any, Any]],
+        base_url: str,
+        api_key: str | None,
+        model: str,
+        **settings: Any,
+    ) -> Agent[Any, Any]:
+        agent = self._agents.get(key)
+        if agent is not None:
+            self._agents.move_to_end(key)
+            self.reused += 1
+            return agent
+
+        from pydantic_ai.models.openai import OpenAIChatModel  # noqa: PLC0415
+        from pydantic_ai.providers.openai import OpenAIProvider  # noqa: PLC0415
+        from pydantic_ai.settings import ModelSettings  # noqa: PLC0415
+
+        provider = OpenAIProvider(
+            api_key=api_key or "dummy",
+            base_url=base_url,
+            http_client=self._client(),
+        )
+        model_cfg = OpenAIChatModel(
+            model_name=model,
+            provider=provider,
+            settings=ModelSettings(**settings) if settings else None,
+        )
+        agent = build(model_cfg)
+        self._agents[key] = agent
+        self.created += 1
+        while len(self._agents) > self.max_agents:
+            self._agents.popitem(last=False)
+        LOGGER.debug("Created memory agent %s for %s (%s)", key[0], model, base_url)
+        return agent
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            import httpx  # noqa: PLC0415
+
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._http_client
+
+
+@asynccontextmanager
+async def borrow_agents(agents: MemoryAgents | None) -> AsyncIterator[MemoryAgents]:
+    """Yield `agents`, or a temporary registry closed on exit when None."""
+    if agents is not None:
+        yield agents
+        return
+    owned = MemoryAgents()
+    try:
+        yield owned
+    finally:
+        await owned.aclose()
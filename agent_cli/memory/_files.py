@@ -4,24 +4,33 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from pydantic import ValidationError
 
 from agent_cli.core.utils import atomic_write_text
+from agent_cli.memory._frontmatter import dump_front_matter, load_front_matter
 from agent_cli.memory.models import MemoryMetadata
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
 
 LOGGER = logging.getLogger(__name__)
 
 _ENTRIES_DIRNAME = "entries"
 _SNAPSHOT_FILENAME = "memory_index.json"
+_JOURNAL_SUFFIX = ".journal"
+# Compact once the journal outgrows the snapshot (and this many bytes)
+_JOURNAL_MIN_COMPACT_BYTES = 1 << 20
+_JOURNAL_LOCK = threading.Lock()
 _DELETED_DIRNAME = "deleted"
+_READ_WORKERS = min(8, (os.cpu_count() or 1) + 4)
 
 
 @dataclass
@@ -32,6 +41,21 @@ class MemoryFileRecord:
     path: Path
     metadata: MemoryMetadata
     content: str
+    # File stat at read/write time; lets startup skip unchanged files
+    mtime_ns: int | None = None
+    size: int | None = None
+
+    def same_stat(self, st: os.stat_result) -> bool:
+        """Return True if `st` matches the stat recorded for this file."""
+        return self.mtime_ns == st.st_mtime_ns and self.size == st.st_size
+
+    def same_document(self, other: MemoryFileRecord) -> bool:
+        """Return True if `other` would be indexed identically (ignoring stat)."""
+        return (
+            self.path == other.path
+            and self.content == other.content
+            and self.metadata == other.metadata
+        )
 
 
 def ensure_store_dirs(root: Path) -> tuple[Path, Path]:
@@ -42,6 +66,13 @@ def ensure_store_dirs(root: Path) -> tuple[Path, Path]:
     return entries_dir, snapshot_path
 
 
+def conversation_paths(root: Path, conversation_id: str) -> list[Path]:
+    """Return the directories holding a conversation's files, tombstones included."""
+    entries_dir = root / _ENTRIES_DIRNAME
+    slug = _slugify(conversation_id)
+    return [entries_dir / slug, entries_dir / _DELETED_DIRNAME / slug]
+
+
 def _safe_timestamp(value: str) -> str:
     """Return a filesystem-safe timestamp-ish token."""
     return "".join(ch if ch.isalnum() or ch in "-._" else "-" for ch in value) or "ts"
@@ -128,27 +159,42 @@ def write_memory_file(
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     atomic_write_text(file_path, body)
-
-    return MemoryFileRecord(id=doc_id, path=file_path, metadata=metadata, content=content)
+    st = file_path.stat()
+
+    return MemoryFileRecord(
+        id=doc_id,
+        path=file_path,
+        metadata=metadata,
+        content=content,
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+    )
 
 
-def load_memory_files(root: Path) -> list[MemoryFileRecord]:
-    """Load all memory files from disk."""
+def iter_memory_paths(root: Path) -> Iterator[Path]:
+    """Yield all memory file paths, skipping soft-deleted ones."""
     entries_dir, _ = ensure_store_dirs(root)
-    records: list[MemoryFileRecord] = []
     for path in entries_dir.rglob("*.md"):
         # Skip anything under a deleted tombstone folder.
-        if _DELETED_DIRNAME in path.parts:
-            continue
-        rec = read_memory_file(path)
-        if rec:
-            records.append(rec)
-    return records
+        if _DELETED_DIRNAME not in path.parts:
+            yield path
+
+
+def read_memory_files(paths: Iterable[Path]) -> list[MemoryFileRecord]:
+    """Parse memory files on a thread pool; invalid files are skipped."""
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        return [rec for rec in pool.map(read_memory_file, paths) if rec]
+
+
+def load_memory_files(root: Path) -> list[MemoryFileRecord]:
+    """Load all memory files from disk."""
+    return read_memory_files(iter_memory_paths(root))
 
 
 def read_memory_file(path: Path) -> MemoryFileRecord | None:
     """Parse a single memory file; return None if invalid."""
     try:
+        st = path.stat()
         text = path.read_text(encoding="utf-8")
     except Exception:
         LOGGER.warning("Failed to read memory file %s", path, exc_info=True)
@@ -170,59 +216,161 @@ def read_memory_file(path: Path) -> MemoryFileRecord | None:
         LOGGER.warning("Memory file %s has invalid metadata; skipping", path, exc_info=True)
         return None
 
-    return MemoryFileRecord(id=str(doc_id), path=path, metadata=metadata, content=body.strip())
+    return MemoryFileRecord(
+        id=str(doc_id),
+        path=path,
+        metadata=metadata,
+        content=body.strip(),
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+    )
+
+
+def _record_to_json(rec: MemoryFileRecord) -> dict[str, Any]:
+    item = {
+        "id": rec.id,
+        "path": str(rec.path),
+        "metadata": rec.metadata.model_dump(exclude_none=True),
+        "content": rec.content,
+    }
+    if rec.mtime_ns is not None:
+        item["mtime_ns"] = rec.mtime_ns
+        item["size"] = rec.size
+    return item
+
+
+def _record_from_json(item: dict[str, Any]) -> MemoryFileRecord:
+    return MemoryFileRecord(
+        id=str(item["id"]),
+        path=Path(item["path"]),
+        metadata=MemoryMetadata(**item["metadata"]),
+        content=str(item.get("content") or ""),
+        mtime_ns=item.get("mtime_ns"),
+        size=item.get("size"),
+    )
+
+
+def journal_path(snapshot_path: Path) -> Path:
+    """Return the path of the write-ahead journal next to a snapshot."""
+    return snapshot_path.with_suffix(_JOURNAL_SUFFIX)
 
 
 def write_snapshot(snapshot_path: Path, records: Iterable[MemoryFileRecord]) -> None:
-    """Write a JSON snapshot of current memories for easy inspection."""
-    payload = [
-        {
-            "id": rec.id,
-            "path": str(rec.path),
-            "metadata": rec.metadata.model_dump(exclude_none=True),
-            "content": rec.content,
-        }
-        for rec in records
-    ]
+    """Write a compact JSON snapshot of current memories and clear the journal.
 
-    atomic_write_text(snapshot_path, json.dumps(payload, ensure_ascii=False, indent=2))
+    The snapshot is replaced atomically before the journal is removed, so a
+    crash in between only leaves journal entries that replay idempotently.
+    """
+    with _JOURNAL_LOCK:
+        _write_snapshot_locked(snapshot_path, records)
 
 
-def load_snapshot(snapshot_path: Path) -> dict[str, MemoryFileRecord]:
-    """Load snapshot into a mapping from id to record (if the snapshot exists)."""
-    if not snapshot_path.exists():
-        return {}
+def _write_snapshot_locked(snapshot_path: Path, records: Iterable[MemoryFileRecord]) -> None:
+    payload = [_record_to_json(rec) for rec in records]
+    atomic_write_text(
+        snapshot_path,
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+    )
+    journal_path(snapshot_path).unlink(missing_ok=True)
+
+
+def append_snapshot_journal(
+    snapshot_path: Path,
+    upserts: Iterable[MemoryFileRecord] = (),
+    removals: Iterable[str] = (),
+) -> None:
+    """Append upserts and removals to the snapshot journal (one line each)."""
+    lines = [json.dumps({"op": "del", "id": doc_id}) for doc_id in removals]
+    lines.extend(
+        json.dumps({"op": "put", "record": _record_to_json(rec)}, ensure_ascii=False)
+        for rec in upserts
+    )
+    if not lines:
+        return
+    with _JOURNAL_LOCK, journal_path(snapshot_path).open("a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def snapshot_needs_compaction(snapshot_path: Path) -> bool:
+    """Return True once the journal is large relative to the snapshot."""
     try:
-        data = json.loads(snapshot_path.read_text(encoding="utf-8"))
-    except Exception:
-        LOGGER.warning("Failed to read memory snapshot %s", snapshot_path, exc_info=True)
-        return {}
+        journal_size = journal_path(snapshot_path).stat().st_size
+    except FileNotFoundError:
+        return False
+    try:
+        snapshot_size = snapshot_path.stat().st_size
+    except FileNotFoundError:
+        snapshot_size = 0
+    return journal_size > max(snapshot_size, _JOURNAL_MIN_COMPACT_BYTES)
+
+
+def journal_snapshot_changes(
+    snapshot_path: Path,
+    upserts: Iterable[MemoryFileRecord] = (),
+    removals: Iterable[str] = (),
+    *,
+    current: Callable[[], Iterable[MemoryFileRecord]] | None = None,
+) -> None:
+    """Journal changes and compact the snapshot once the journal has grown large.
+
+    `current` returns the up-to-date records to compact into; without it they
+    are loaded from the snapshot and journal, which only happens on compaction.
+    """
+    append_snapshot_journal(snapshot_path, upserts, removals)
+    if not snapshot_needs_compaction(snapshot_path):
+        return
+    with _JOURNAL_LOCK:
+        if snapshot_needs_compaction(snapshot_path):  # Not already compacted by another writer
+            records = current() if current else load_snapshot(snapshot_path).values()
+            _write_snapshot_locked(snapshot_path, records)
+
+
+def _replay_journal(path: Path, records: dict[str, MemoryFileRecord]) -> None:
+    """Apply journal entries to `records`; a torn trailing line is skipped."""
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if entry["op"] == "del":
+                    records.pop(str(entry["id"]), None)
+                else:
+                    record = _record_from_json(entry["record"])
+                    records[record.id] = record
+            except Exception:
+                LOGGER.warning("Invalid journal entry %s:%d; skipping", path, line_no)
 
+
+def load_snapshot(snapshot_path: Path) -> dict[str, MemoryFileRecord]:
+    """Load snapshot plus journal into a mapping from id to record."""
     records: dict[str, MemoryFileRecord] = {}
-    for item in data:
+    if snapshot_path.exists():
         try:
-            metadata = MemoryMetadata(**item["metadata"])
-            record = MemoryFileRecord(
-                id=str(item["id"]),
-                path=Path(item["path"]),
-                metadata=metadata,
-                content=str(item.get("content") or ""),
-            )
-            records[record.id] = record
+            data = json.loads(snapshot_path.read_text(encoding="utf-8"))
         except Exception:
-            LOGGER.warning("Invalid snapshot entry; skipping", exc_info=True)
-            continue
+            LOGGER.warning("Failed to read memory snapshot %s", snapshot_path, exc_info=True)
+            data = []
+
+        for item in data:
+            try:
+                record = _record_from_json(item)
+                records[record.id] = record
+            except Exception:
+                LOGGER.warning("Invalid snapshot entry; skipping", exc_info=True)
+                continue
+    _replay_journal(journal_path(snapshot_path), records)
     return records
 
 
 def _render_front_matter(doc_id: str, metadata: MemoryMetadata) -> str:
     """Return YAML front matter string."""
-    import yaml  # noqa: PLC0415
-
-    meta_dict = metadata.model_dump(exclude_none=True)
-    meta_dict = {"id": doc_id, **meta_dict}
-    yaml_block = yaml.safe_dump(meta_dict, sort_keys=False)
-    return f"---\n{yaml_block}---"
+    meta_dict = {"id": doc_id, **metadata.model_dump(exclude_none=True)}
+    return f"---\n{dump_front_matter(meta_dict)}---"
 
 
 def _split_front_matter(text: str) -> tuple[dict | None, str]:
@@ -232,12 +380,8 @@ def _split_front_matter(text: str) -> tuple[dict | None, str]:
     end = text.find("\n---", 3)
     if end == -1:
         return None, text
-    yaml_part = text[3:end]
-    try:
-        import yaml  # noqa: PLC0415
-
-        meta = yaml.safe_load(yaml_part) or {}
-    except Exception:
+    meta = load_front_matter(text[3:end])
+    if meta is None:
         return None, text
     body_start = end + len("\n---")
     body = text[body_start:].lstrip("\n")
@@ -0,0 +1,113 @@
+"""Fixed-schema front-matter codec for memory markdown files.
+
+Memory front matter is a flat mapping of string fields (`id` plus
+`MemoryMetadata`). PyYAML's pure-Python loader and dumper dominate the cost
+of reading and writing thousands of small files, so this module handles the
+shapes we write ourselves and defers to PyYAML for anything else (hand edits,
+folded long values, exotic escapes). Output is always valid YAML.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import cache
+from typing import Any
+
+# A line of our front matter: `key: value` with a simple key
+_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*): (.*)")
+# Plain scalars we read and write without PyYAML: word characters and a few
+# safe punctuation marks, colons only inside words, single inner spaces
+_WORD = r"[\w.~/+-]+(?::[\w.~/+-]+)*"
+_PLAIN_RE = re.compile(rf"(?![-:]){_WORD}(?: {_WORD})*")
+# Characters the YAML reader rejects even inside quotes (mirrors PyYAML),
+# plus the non-ASCII line breaks YAML folds inside quoted scalars
+_SPECIAL_RE = re.compile(
+    "[^\x09\x0a\x0d\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]",
+)
+
+
+@cache
+def _implicit_resolvers() -> dict[str, list[tuple[str, re.Pattern[str]]]]:
+    from yaml.resolver import Resolver  # noqa: PLC0415
+
+    return Resolver.yaml_implicit_resolvers
+
+
+def _is_plain_string(value: str) -> bool:
+    """Return True if YAML reads `value` unquoted back as the same string."""
+    if not _PLAIN_RE.fullmatch(value):
+        return False
+    # Same check PyYAML uses to type plain scalars (bools, numbers, dates, ...)
+    return not any(regex.match(value) for _, regex in _implicit_resolvers().get(value[0], ()))
+
+
+def _encode_value(value: str) -> str:
+    if _is_plain_string(value):
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    return json.dumps(value, ensure_ascii=False)
+
+
+def dump_front_matter(fields: dict[str, Any]) -> str:
+    """Return the YAML block (without `---` fences) for a flat mapping."""
+    if not all(isinstance(v, str) and not _SPECIAL_RE.search(v) for v in fields.values()):
+        import yaml  # noqa: PLC0415
+
+        return yaml.safe_dump(fields, sort_keys=False)
+    return "".join(f"{key}: {_encode_value(value)}\n" for key, value in fields.items())
+
+
+def _decode_double_quoted(value: str) -> str | None:
+    if len(value) < 2 or value[-1] != '"':  # noqa: PLR2004
+        return None
+    try:
+        decoded = json.loads(value)
+    except ValueError:
+        return None
+    return decoded if isinstance(decoded, str) else None
+
+
+def _decode_single_quoted(value: str) -> str | None:
+    inner = value[1:-1]
+    if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):  # noqa: PLR2004
+        return None
+    return inner.replace("''", "'")
+
+
+def _decode_value(raw: str) -> str | None:
+    """Decode one scalar, or return None if it needs the full YAML parser."""
+    value = raw.strip(" ")  # Tabs are left for PyYAML, which is picky about them
+    if not value:
+        return None
+    if value[0] == '"':
+        return _decode_double_quoted(value)
+    if value[0] == "'":
+        return _decode_single_quoted(value)
+    # Plain scalar: only accept what YAML would also read back as this string
+    return value if _is_plain_string(value) else None
+
+
+def load_front_matter(block: str) -> dict[str, Any] | None:
+    """Parse a YAML front-matter block; return None if it is not valid YAML."""
+    if "\r" in block or _SPECIAL_RE.search(block):
+        return _load_yaml(block)
+    fields: dict[str, Any] = {}
+    for line in block.split("\n"):
+        if not line:
+            continue
+        match = _LINE_RE.fullmatch(line)
+        if match is None or (value := _decode_value(match.group(2))) is None:
+            return _load_yaml(block)
+        fields[match.group(1)] = value
+    return fields
+
+
+def _load_yaml(block: str) -> dict[str, Any] | None:
+    import yaml  # noqa: PLC0415
+
+    try:
+        data = yaml.safe_load(block) or {}
+    except Exception:  # PyYAML also raises e.g. ValueError on "0b"
+        return None
+    return data if isinstance(data, dict) else None
@@ -6,9 +6,11 @@ import asyncio
 import logging
 import shutil
 import subprocess
+from contextlib import suppress
 from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
@@ -74,13 +76,53 @@ async def _run_git_async(
     return GitCommandResult(proc.returncode, stdout_text, stderr_text)
 
 
+# Derived data rebuilt from the Markdown files; never versioned
+_IGNORED_DERIVED_DATA = ("chroma/", "memory_index.json", "memory_index.journal")
+
+
+def _ensure_ignored_derived_data(path: Path) -> bool:
+    """Append derived-data entries missing from an existing .gitignore.
+
+    Returns True if the file changed.
+    """
+    gitignore_path = path / ".gitignore"
+    if not gitignore_path.exists():
+        return False
+    content = gitignore_path.read_text(encoding="utf-8")
+    present = {line.strip() for line in content.splitlines()}
+    missing = [entry for entry in _IGNORED_DERIVED_DATA if entry not in present]
+    if not missing:
+        return False
+    if content and not content.endswith("\n"):
+        content += "\n"
+    gitignore_path.write_text(
+        content + "".join(f"{entry}\n" for entry in missing), encoding="utf-8"
+    )
+    return True
+
+
 def init_repo(path: Path) -> None:
-    """Initialize a git repository if one does not exist."""
+    """Initialize a git repository if one does not exist.
+
+    For an existing repository, only adds missing derived-data entries
+    (e.g. the index journal) to its .gitignore.
+    """
     if not _is_git_installed():
         LOGGER.warning("Git is not installed; skipping repository initialization.")
         return
 
     if (path / ".git").exists():
+        if _ensure_ignored_derived_data(path):
+            LOGGER.info("Added derived index files to %s", path / ".gitignore")
+            try:
+                _run_git_sync(["add", ".gitignore"], cwd=path)
+                _run_git_sync(
+                    ["commit", "-m", "Ignore derived index files", "--", ".gitignore"],
+                    cwd=path,
+                    check=False,
+                )
+            except subprocess.CalledProcessError:
+                LOGGER.exception("Failed to commit .gitignore update")
         return
 
     try:
@@ -98,8 +140,13 @@ def init_repo(path: Path) -> None:
         # Create .gitignore to exclude derived data (vector db, cache)
         gitignore_path = path / ".gitignore"
         if not gitignore_path.exists():
-            gitignore_content = "chroma/\nmemory_index.json\n__pycache__/\n*.tmp\n.DS_Store\n"
+            gitignore_content = "".join(
+                f"{entry}\n"
+                for entry in (*_IGNORED_DERIVED_DATA, "__pycache__/", "*.tmp", ".DS_Store")
+            )
             gitignore_path.write_text(gitignore_content, encoding="utf-8")
+        else:
+            _ensure_ignored_derived_data(path)
 
         # Create README.md
         readme_path = path / "README.md"
@@ -155,3 +202,99 @@ async def commit_changes(path: Path, message: str) -> None:
 
     except Exception:
         LOGGER.exception("Failed to commit changes")
+
+
+class GitCommitter:
+    """Batch memory-store commits in the background.
+
+    Writers `record` the paths they touched instead of committing per turn.
+    Pending paths are staged with a pathspec (so git only rescans those
+    subtrees) and committed together every `interval` seconds, or sooner once
+    `max_pending` changes have accumulated. `aclose` flushes what is left.
+    """
+
+    def __init__(self, repo: Path, *, interval: float = 10.0, max_pending: int = 50) -> None:
+        """Commit changes under `repo` at most every `interval` seconds."""
+        self.repo = repo
+        self.interval = interval
+        self.max_pending = max_pending
+        self._paths: set[Path] = set()
+        self._messages: list[str] = []
+        self._changes = 0
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.commits = 0
+
+    def record(self, paths: Iterable[Path], message: str) -> None:
+        """Queue `paths` (files or directories) for the next commit."""
+        self._paths.update(paths)
+        if message not in self._messages:
+            self._messages.append(message)
+        self._changes += 1
+        if self._changes >= self.max_pending:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the periodic flush loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="memory-git-committer")
+
+    async def flush(self) -> None:
+        """Stage and commit everything recorded so far."""
+        async with self._lock:
+            paths, self._paths = self._paths, set()
+            messages, self._messages = self._messages, []
+            self._changes = 0
+            self._wakeup.clear()
+            if not paths or not _is_git_installed() or not (self.repo / ".git").exists():
+                return
+            # A pathspec that matches nothing makes `git add` fail
+            pathspecs = [str(p.relative_to(self.repo)) for p in sorted(paths) if p.exists()]
+            if not pathspecs:
+                return
+            message = messages[0] if len(messages) == 1 else _batch_message(messages)
+            try:
+                await _run_git_async(["add", "-A", "--", *pathspecs], cwd=self.repo)
+                result = await _run_git_async(
+                    ["commit", "-q", "-m", message], cwd=self.repo, check=False
+                )
+            except Exception:
+                LOGGER.exception("Failed to commit memory changes")
+                return
+            if result.returncode == 0:
+                self.commits += 1
+                LOGGER.info("Committed memory changes: %s", message.splitlines()[0])
+
+    async def aclose(self) -> None:
+        """Stop the flush loop and commit pending changes."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            await self.flush()
+
+
+def _batch_message(messages: list[str]) -> str:
+    return f"Update memory ({len(messages)} changes)\n\n" + "\n".join(f"- {m}" for m in messages)
+
+
+async def commit_or_record(
+    repo: Path,
+    message: str,
+    *,
+    paths: Iterable[Path],
+    committer: GitCommitter | None,
+) -> None:
+    """Hand `paths` to `committer`, or commit the whole repo now without one."""
+    if committer is not None:
+        committer.record(paths, message)
+    else:
+        await commit_changes(repo, message)
@@ -6,16 +6,19 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from agent_cli.core.watch import watch_directory
+from agent_cli.core.watch import watch_directory_batched
 from agent_cli.memory._files import (
     _DELETED_DIRNAME,
     MemoryFileRecord,
     ensure_store_dirs,
-    load_memory_files,
+    iter_memory_paths,
+    journal_snapshot_changes,
     load_snapshot,
     read_memory_file,
+    read_memory_files,
     write_snapshot,
 )
+from agent_cli.memory._persistence import note_index_changes
 from agent_cli.memory._store import delete_entries, upsert_memories
 
 if TYPE_CHECKING:
@@ -29,30 +32,47 @@ LOGGER = logging.getLogger(__name__)
 
 @dataclass
 class MemoryIndex:
-    """In-memory view of memory files plus a JSON snapshot on disk."""
+    """In-memory view of memory files plus a journaled snapshot on disk.
+
+    Each mutation appends to the journal; the snapshot is rewritten only by
+    `replace` and when the journal has grown large enough to compact.
+    """
 
     entries: dict[str, MemoryFileRecord] = field(default_factory=dict)
     snapshot_path: Path | None = None
 
     @classmethod
     def from_snapshot(cls, snapshot_path: Path) -> MemoryIndex:
-        """Restore index state from a snapshot file if present."""
+        """Restore index state from a snapshot file (and its journal) if present."""
         return cls(entries=load_snapshot(snapshot_path), snapshot_path=snapshot_path)
 
     def replace(self, records: list[MemoryFileRecord]) -> None:
         """Replace the in-memory index with the given records."""
         self.entries = {rec.id: rec for rec in records}
-        self._persist()
+        if self.snapshot_path:
+            write_snapshot(self.snapshot_path, self.entries.values())
 
     def upsert(self, record: MemoryFileRecord) -> None:
-        """Insert or update a record and persist the snapshot."""
-        self.entries[record.id] = record
-        self._persist()
+        """Insert or update a record and journal the change."""
+        self.apply([record], [])
 
     def remove(self, doc_id: str) -> None:
-        """Remove a record by id and persist the snapshot."""
-        self.entries.pop(doc_id, None)
-        self._persist()
+        """Remove a record by id and journal the change."""
+        self.apply([], [doc_id])
+
+    def apply(self, upserts: list[MemoryFileRecord], removals: list[str]) -> None:
+        """Apply several upserts and removals with a single journal append."""
+        for doc_id in removals:
+            self.entries.pop(doc_id, None)
+        for record in upserts:
+            self.entries[record.id] = record
+        if self.snapshot_path:
+            journal_snapshot_changes(
+                self.snapshot_path,
+                upserts,
+                removals,
+                current=self.entries.values,
+            )
 
     def find_id_by_path(self, path: Path) -> str | None:
         """Find a record id by its file path, if present."""
@@ -61,36 +81,71 @@ class MemoryIndex:
                 return doc_id
         return None
 
-    def _persist(self) -> None:
-        if self.snapshot_path:
-            write_snapshot(self.snapshot_path, self.entries.values())
-
 
 def initial_index(collection: Collection, root: Path, *, index: MemoryIndex) -> None:
-    """Load memory files, reconcile against snapshot, and index into Chroma."""
+    """Reconcile memory files against the snapshot and index changes into Chroma.
+
+    Files whose mtime and size match the snapshot are not read again; files
+    that were touched but whose content and metadata are unchanged are not
+    re-upserted, so unchanged records are never re-embedded. If Chroma does
+    not hold exactly the snapshot's records (e.g. a wiped vector store),
+    everything is re-upserted.
+    """
     entries_dir, snapshot_path = ensure_store_dirs(root)
     if index.snapshot_path is None:
         index.snapshot_path = snapshot_path
 
-    records = load_memory_files(root)
+    known = index.entries
+    trust_snapshot = bool(known) and collection.count() == len(known)
+    known_by_path = {rec.path: rec for rec in known.values()} if trust_snapshot else {}
+
+    records: list[MemoryFileRecord] = []
+    to_read: list[Path] = []
+    for path in iter_memory_paths(root):
+        rec = known_by_path.get(path)
+        try:
+            if rec is not None and rec.same_stat(path.stat()):
+                records.append(rec)
+                continue
+        except OSError:
+            continue
+        to_read.append(path)
+
+    fresh = read_memory_files(to_read)
+    changed = [
+        rec
+        for rec in fresh
+        if not trust_snapshot or rec.id not in known or not rec.same_document(known[rec.id])
+    ]
+    records.extend(fresh)
     current_ids = {rec.id for rec in records}
 
     # Remove stale docs that were present in last snapshot but missing now
-    stale_ids = set(index.entries) - current_ids
+    stale_ids = set(known) - current_ids
     if stale_ids:
         LOGGER.info("Removing %d stale memory docs from index", len(stale_ids))
         delete_entries(collection, list(stale_ids))
 
+    if changed:
+        upsert_memories(
+            collection,
+            ids=[rec.id for rec in changed],
+            contents=[rec.content for rec in changed],
+            metadatas=[rec.metadata for rec in changed],
+        )
     if records:
-        ids = [rec.id for rec in records]
-        docs = [rec.content for rec in records]
-        metas = [rec.metadata for rec in records]
-        upsert_memories(collection, ids=ids, contents=docs, metadatas=metas)
-        LOGGER.info("Indexed %d memory docs from %s", len(records), entries_dir)
+        LOGGER.info(
+            "Indexed %d memory docs from %s (%d read, %d upserted)",
+            len(records),
+            entries_dir,
+            len(to_read),
+            len(changed),
+        )
     else:
         LOGGER.info("No memory files found in %s", entries_dir)
 
-    index.replace(records)
+    if fresh or stale_ids or not trust_snapshot:
+        index.replace(records)
 
 
 async def watch_memory_store(collection: Collection, root: Path, *, index: MemoryIndex) -> None:
@@ -100,43 +155,58 @@ async def watch_memory_store(collection: Collection, root: Path, *, index: Memor
         index.snapshot_path = snapshot_path
 
     LOGGER.info("📁 Watching memory store: %s", entries_dir)
-    await watch_directory(
+    # One worker: every batch rewrites the shared snapshot
+    await watch_directory_batched(
         entries_dir,
-        lambda change, path: _handle_change(change, path, collection, index),
+        lambda changes: _handle_changes(changes, collection, index),
+        max_workers=1,
     )
 
 
-def _handle_change(change: Change, path: Path, collection: Collection, index: MemoryIndex) -> None:
+def _handle_changes(
+    changes: list[tuple[Change, Path]],
+    collection: Collection,
+    index: MemoryIndex,
+) -> None:
     from watchfiles import Change  # noqa: PLC0415
 
-    if path.suffix == ".tmp":
-        return
-
-    if _DELETED_DIRNAME in path.parts:
-        return
-
-    if change == Change.deleted:
-        doc_id = index.find_id_by_path(path)
-        if not doc_id:
-            # Fallback: try to parse ID from filename (timestamp__uuid.md)
-            parts = path.stem.split("__")
-            doc_id = parts[-1] if len(parts) > 1 else path.stem
-
-        LOGGER.info("[deleted] %s", path.name)
-        delete_entries(collection, [doc_id])
-        index.remove(doc_id)
-        return
-
-    if change in {Change.added, Change.modified}:
-        action = "added" if change == Change.added else "modified"
-        LOGGER.info("[%s] %s", action, path.name)
-        record = read_memory_file(path)
-        if not record:
-            return
+    deleted_ids: list[str] = []
+    records: list[MemoryFileRecord] = []
+    for change, path in changes:
+        if path.suffix == ".tmp":
+            continue
+
+        if _DELETED_DIRNAME in path.parts:
+            continue
+
+        if change == Change.deleted:
+            doc_id = index.find_id_by_path(path)
+            if not doc_id:
+                # Fallback: try to parse ID from filename (timestamp__uuid.md)
+                parts = path.stem.split("__")
+                doc_id = parts[-1] if len(parts) > 1 else path.stem
+
+            LOGGER.info("[deleted] %s", path.name)
+            deleted_ids.append(doc_id)
+            continue
+
+        if change in {Change.added, Change.modified}:
+            action = "added" if change == Change.added else "modified"
+            LOGGER.info("[%s] %s", action, path.name)
+            record = read_memory_file(path)
+            if record:
+                records.append(record)
+
+    if deleted_ids:
+        delete_entries(collection, deleted_ids)
+    if records:
         upsert_memories(
             collection,
-            ids=[record.id],
-            contents=[record.content],
-            metadatas=[record.metadata],
+            ids=[record.id for record in records],
+            contents=[record.content for record in records],
+            metadatas=[record.metadata for record in records],
         )
-        index.upsert(record)
+    if deleted_ids or records:
+        index.apply(records, deleted_ids)
+        if index.snapshot_path:
+            note_index_changes(index.snapshot_path, records, deleted_ids)
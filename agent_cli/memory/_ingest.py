@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from time import perf_counter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
-from agent_cli.memory._git import commit_changes
+from agent_cli.core.chroma import embed_documents
+from agent_cli.memory._agents import borrow_agents
+from agent_cli.memory._files import conversation_paths
+from agent_cli.memory._git import commit_or_record
 from agent_cli.memory._persistence import delete_memory_files, persist_entries, persist_summary
-from agent_cli.memory._prompt import (
-    FACT_INSTRUCTIONS,
-    FACT_SYSTEM_PROMPT,
-    SUMMARY_PROMPT,
-    UPDATE_MEMORY_PROMPT,
-)
+from agent_cli.memory._prompt import FACT_INSTRUCTIONS
 from agent_cli.memory._retrieval import gather_relevant_existing_memories
 from agent_cli.memory._store import delete_entries, get_summary_entry
 from agent_cli.memory.entities import Fact, Summary
@@ -26,16 +26,21 @@ from agent_cli.memory.models import (
     MemoryDelete,
     MemoryIgnore,
     MemoryUpdate,
-    SummaryOutput,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from chromadb import Collection
 
+    from agent_cli.memory._agents import MemoryAgents
+    from agent_cli.memory._git import GitCommitter
+
 LOGGER = logging.getLogger(__name__)
 
+IngestMode = Literal["staged", "fused"]
+
 _SUMMARY_ROLE = "summary"
 
 
@@ -51,41 +56,31 @@ async def extract_salient_facts(
     openai_base_url: str,
     api_key: str | None,
     model: str,
+    agents: MemoryAgents | None = None,
 ) -> list[str]:
     """Run an LLM agent to extract facts from the transcript."""
     if not user_message and not assistant_message:
         return []
 
     import httpx  # noqa: PLC0415
-    from pydantic_ai import Agent  # noqa: PLC0415
     from pydantic_ai.exceptions import AgentRunError, UnexpectedModelBehavior  # noqa: PLC0415
-    from pydantic_ai.models.openai import OpenAIChatModel  # noqa: PLC0415
-    from pydantic_ai.providers.openai import OpenAIProvider  # noqa: PLC0415
 
     # Extract facts from the latest user turn only (ignore assistant/system).
     transcript = user_message or ""
     LOGGER.info("Extracting facts from transcript: %r", transcript)
 
-    provider = OpenAIProvider(api_key=api_key or "dummy", base_url=openai_base_url)
-    model_cfg = OpenAIChatModel(model_name=model, provider=provider)
-    agent = Agent(
-        model=model_cfg,
-        system_prompt=FACT_SYSTEM_PROMPT,
-        output_type=list[str],
-        retries=2,
-    )
-    instructions = FACT_INSTRUCTIONS
-
-    try:
-        facts = await agent.run(transcript, instructions=instructions)
-        LOGGER.info("Raw fact extraction output: %s", facts.output)
-        return facts.output
-    except (httpx.HTTPError, AgentRunError, UnexpectedModelBehavior):
-        LOGGER.warning("PydanticAI fact extraction transient failure", exc_info=True)
-        return []
-    except Exception:
-        LOGGER.exception("PydanticAI fact extraction internal error")
-        raise
+    async with borrow_agents(agents) as pool:
+        agent = pool.facts(base_url=openai_base_url, api_key=api_key, model=model)
+        try:
+            facts = await pool.run(agent, transcript, instructions=FACT_INSTRUCTIONS)
+            LOGGER.info("Raw fact extraction output: %s", facts.output)
+            return facts.output
+        except (httpx.HTTPError, AgentRunError, UnexpectedModelBehavior):
+            LOGGER.warning("PydanticAI fact extraction transient failure", exc_info=True)
+            return []
+        except Exception:
+            LOGGER.exception("PydanticAI fact extraction internal error")
+            raise
 
 
 def process_reconciliation_decisions(
@@ -152,12 +147,19 @@ async def reconcile_facts(
     openai_base_url: str,
     api_key: str | None,
     model: str,
+    query_embeddings: Sequence[Any] | None = None,
+    agents: MemoryAgents | None = None,
 ) -> tuple[list[Fact], list[str], dict[str, str]]:
     """Use an LLM to decide add/update/delete/none for facts, with id remapping."""
     if not new_facts:
         return [], [], {}
 
-    existing = gather_relevant_existing_memories(collection, conversation_id, new_facts)
+    existing = gather_relevant_existing_memories(
+        collection,
+        conversation_id,
+        new_facts,
+        query_embeddings=query_embeddings,
+    )
     LOGGER.info("Reconcile: Found %d existing memories for new facts %s", len(existing), new_facts)
     if not existing:
         LOGGER.info("Reconcile: no existing memory facts; defaulting to add all new facts")
@@ -175,52 +177,11 @@ async def reconcile_facts(
         return entries, [], {}
 
     import httpx  # noqa: PLC0415
-    from pydantic_ai import Agent, ModelRetry, PromptedOutput  # noqa: PLC0415
     from pydantic_ai.exceptions import AgentRunError, UnexpectedModelBehavior  # noqa: PLC0415
-    from pydantic_ai.models.openai import OpenAIChatModel  # noqa: PLC0415
-    from pydantic_ai.providers.openai import OpenAIProvider  # noqa: PLC0415
-    from pydantic_ai.settings import ModelSettings  # noqa: PLC0415
 
     id_map: dict[int, str] = {idx: mem.id for idx, mem in enumerate(existing)}
     existing_json = [{"id": idx, "text": mem.content} for idx, mem in enumerate(existing)]
-    existing_ids = set(id_map.keys())
-
-    provider = OpenAIProvider(api_key=api_key or "dummy", base_url=openai_base_url)
-    model_cfg = OpenAIChatModel(
-        model_name=model,
-        provider=provider,
-        settings=ModelSettings(temperature=0.0, max_tokens=512),
-    )
-    agent = Agent(
-        model=model_cfg,
-        system_prompt=UPDATE_MEMORY_PROMPT,
-        output_type=PromptedOutput(list[MemoryDecision]),  # JSON mode instead of tool calls
-        retries=3,
-    )
-
-    @agent.output_validator
-    def validate_decisions(decisions: list[MemoryDecision]) -> list[MemoryDecision]:
-        """Validate LLM decisions and provide feedback for retry."""
-        errors = []
-        for dec in decisions:
-            if (
-                isinstance(dec, (MemoryUpdate, MemoryDelete, MemoryIgnore))
-                and dec.id not in existing_ids
-            ):
-                if isinstance(dec, MemoryUpdate):
-                    errors.append(
-                        f"UPDATE with id={dec.id} is invalid: that ID doesn't exist. "
-                        f"Valid existing IDs are: {sorted(existing_ids)}. "
-                        f"For NEW facts, use ADD with a new ID.",
-                    )
-                elif isinstance(dec, MemoryDelete):
-                    errors.append(f"DELETE with id={dec.id} is invalid: that ID doesn't exist.")
-                else:  # MemoryIgnore (NONE)
-                    errors.append(f"NONE with id={dec.id} is invalid: that ID doesn't exist.")
-        if errors:
-            msg = "Invalid memory decisions:\n" + "\n".join(f"- {e}" for e in errors)
-            raise ModelRetry(msg)
-        return decisions
+    existing_ids = frozenset(id_map)
 
     # Format with separate sections for existing and new facts
     existing_str = json.dumps(existing_json, ensure_ascii=False, indent=2)
@@ -236,7 +197,9 @@ New facts to process:
 ```"""
     LOGGER.info("Reconcile payload: %s", payload)
     try:
-        result = await agent.run(payload)
+        async with borrow_agents(agents) as pool:
+            agent = pool.reconcile(base_url=openai_base_url, api_key=api_key, model=model)
+            result = await pool.run(agent, payload, deps=existing_ids)
         decisions = result.output
     except (httpx.HTTPError, AgentRunError, UnexpectedModelBehavior):
         LOGGER.warning(
@@ -284,30 +247,25 @@ async def update_summary(
     api_key: str | None,
     model: str,
     max_tokens: int = 256,
+    agents: MemoryAgents | None = None,
 ) -> str | None:
     """Update the conversation summary based on new facts."""
     if not new_facts:
         return prior_summary
 
-    from pydantic_ai import Agent  # noqa: PLC0415
-    from pydantic_ai.models.openai import OpenAIChatModel  # noqa: PLC0415
-    from pydantic_ai.providers.openai import OpenAIProvider  # noqa: PLC0415
-    from pydantic_ai.settings import ModelSettings  # noqa: PLC0415
-
-    system_prompt = SUMMARY_PROMPT
     user_parts: list[str] = []
     if prior_summary:
         user_parts.append(f"Previous summary:\n{prior_summary}")
     user_parts.append("New facts:\n" + "\n".join(f"- {fact}" for fact in new_facts))
     prompt_text = "\n\n".join(user_parts)
-    provider = OpenAIProvider(api_key=api_key or "dummy", base_url=openai_base_url)
-    model_cfg = OpenAIChatModel(
-        model_name=model,
-        provider=provider,
-        settings=ModelSettings(temperature=0.2, max_tokens=max_tokens),
-    )
-    agent = Agent(model=model_cfg, system_prompt=system_prompt, output_type=SummaryOutput)
-    result = await agent.run(prompt_text)
+    async with borrow_agents(agents) as pool:
+        agent = pool.summary(
+            base_url=openai_base_url,
+            api_key=api_key,
+            model=model,
+            max_tokens=max_tokens,
+        )
+        result = await pool.run(agent, prompt_text)
     return result.output.summary or prior_summary
 
 
@@ -324,18 +282,112 @@ async def extract_and_store_facts_and_summaries(
     enable_git_versioning: bool = False,
     source_id: str | None = None,
     enable_summarization: bool = True,
+    agents: MemoryAgents | None = None,
+    ingest_mode: IngestMode = "staged",
+    git_committer: GitCommitter | None = None,
 ) -> None:
-    """Run fact extraction and summary updates, persisting results."""
-    fact_start = perf_counter()
+    """Run fact extraction and summary updates, persisting results.
+
+    `ingest_mode="staged"` extracts facts, then reconciles them while the
+    summary is updated concurrently. `"fused"` asks for facts, decisions and
+    the summary in one LLM call and falls back to the staged pipeline if that
+    call fails. Pass the long-lived `agents` registry to reuse LLM agents and
+    connections across turns; without it, a temporary one serves this call.
+    With a `git_committer`, versioning is deferred to its next batched commit.
+    """
+    ingest_start = perf_counter()
     effective_source_id = source_id or str(uuid4())
-    fact_created_at = datetime.now(UTC)
+    created_at = datetime.now(UTC)
+    async with borrow_agents(agents) as pool:
+        plan = None
+        if ingest_mode == "fused" and user_message:
+            plan = await _plan_fused(
+                collection,
+                conversation_id=conversation_id,
+                user_message=user_message,
+                source_id=effective_source_id,
+                created_at=created_at,
+                openai_base_url=openai_base_url,
+                api_key=api_key,
+                model=model,
+                enable_summarization=enable_summarization,
+                agents=pool,
+            )
+        if plan is None:
+            plan = await _plan_staged(
+                collection,
+                conversation_id=conversation_id,
+                user_message=user_message,
+                assistant_message=assistant_message,
+                source_id=effective_source_id,
+                created_at=created_at,
+                openai_base_url=openai_base_url,
+                api_key=api_key,
+                model=model,
+                enable_summarization=enable_summarization,
+                agents=pool,
+            )
+
+    _apply_plan(collection, memory_root=memory_root, conversation_id=conversation_id, plan=plan)
+    LOGGER.info(
+        "Ingestion (%s) finished in %.1f ms (conversation=%s, facts=%d, add=%d, delete=%d)",
+        plan.mode,
+        _elapsed_ms(ingest_start),
+        conversation_id,
+        len(plan.facts),
+        len(plan.to_add),
+        len(plan.to_delete),
+    )
 
+    if enable_git_versioning:
+        await commit_or_record(
+            memory_root,
+            f"Add facts to conversation {conversation_id}",
+            paths=conversation_paths(memory_root, conversation_id),
+            committer=git_committer,
+        )
+
+
+@dataclass
+class _IngestPlan:
+    """Changes decided for one turn, applied by `_apply_plan`."""
+
+    mode: IngestMode
+    facts: list[str]
+    to_add: list[Fact]
+    to_delete: list[str]
+    replacement_map: dict[str, str]
+    summary: str | None  # None leaves the stored summary untouched
+    fact_embeddings: list[Any] | None = None
+
+
+def _prior_summary(collection: Collection, conversation_id: str) -> str | None:
+    entry = get_summary_entry(collection, conversation_id, role=_SUMMARY_ROLE)
+    return entry.content if entry else None
+
+
+async def _plan_staged(
+    collection: Collection,
+    *,
+    conversation_id: str,
+    user_message: str | None,
+    assistant_message: str | None,
+    source_id: str,
+    created_at: datetime,
+    openai_base_url: str,
+    api_key: str | None,
+    model: str,
+    enable_summarization: bool,
+    agents: MemoryAgents,
+) -> _IngestPlan:
+    fact_start = perf_counter()
     facts = await extract_salient_facts(
         user_message=user_message,
         assistant_message=assistant_message,
         openai_base_url=openai_base_url,
         api_key=api_key,
         model=model,
+        agents=agents,
     )
     LOGGER.info(
         "Fact extraction produced %d facts in %.1f ms (conversation=%s)",
@@ -343,66 +395,198 @@ async def extract_and_store_facts_and_summaries(
         _elapsed_ms(fact_start),
         conversation_id,
     )
-    to_add, to_delete, replacement_map = await reconcile_facts(
-        collection,
+    # Embed the facts once: the vectors serve both the reconciliation lookup
+    # and the upsert of facts that end up being added.
+    fact_embeddings = embed_documents(collection, facts) if facts else None
+
+    async def reconcile() -> tuple[list[Fact], list[str], dict[str, str]]:
+        reconcile_start = perf_counter()
+        result = await reconcile_facts(
+            collection,
+            conversation_id,
+            facts,
+            source_id=source_id,
+            created_at=created_at,
+            openai_base_url=openai_base_url,
+            api_key=api_key,
+            model=model,
+            query_embeddings=fact_embeddings,
+            agents=agents,
+        )
+        LOGGER.info(
+            "Reconciliation completed in %.1f ms (conversation=%s)",
+            _elapsed_ms(reconcile_start),
+            conversation_id,
+        )
+        return result
+
+    async def summarize() -> str | None:
+        summary_start = perf_counter()
+        try:
+            new_summary = await update_summary(
+                prior_summary=_prior_summary(collection, conversation_id),
+                new_facts=facts,
+                openai_base_url=openai_base_url,
+                api_key=api_key,
+                model=model,
+                agents=agents,
+            )
+        except Exception:
+            # Runs alongside reconciliation: a failed summary must not lose the facts
+            LOGGER.exception("Summary update failed (conversation=%s)", conversation_id)
+            return None
+        LOGGER.info(
+            "Summary update completed in %.1f ms (conversation=%s)",
+            _elapsed_ms(summary_start),
+            conversation_id,
+        )
+        return new_summary
+
+    new_summary = None
+    if enable_summarization:
+        # The summary only needs the facts, so it does not wait for reconciliation
+        (to_add, to_delete, replacement_map), new_summary = await asyncio.gather(
+            reconcile(),
+            summarize(),
+        )
+    else:
+        to_add, to_delete, replacement_map = await reconcile()
+    return _IngestPlan(
+        mode="staged",
+        facts=facts,
+        to_add=to_add,
+        to_delete=to_delete,
+        replacement_map=replacement_map,
+        summary=new_summary,
+        fact_embeddings=fact_embeddings,
+    )
+
+
+async def _plan_fused(
+    collection: Collection,
+    *,
+    conversation_id: str,
+    user_message: str,
+    source_id: str,
+    created_at: datetime,
+    openai_base_url: str,
+    api_key: str | None,
+    model: str,
+    enable_summarization: bool,
+    agents: MemoryAgents,
+) -> _IngestPlan | None:
+    """Extract, reconcile and summarize in one call; None means fall back to staged."""
+    import httpx  # noqa: PLC0415
+    from pydantic_ai.exceptions import AgentRunError, UnexpectedModelBehavior  # noqa: PLC0415
+
+    fused_start = perf_counter()
+    # The facts are not known yet, so the message itself selects the neighborhood
+    existing = gather_relevant_existing_memories(collection, conversation_id, [user_message])
+    id_map: dict[int, str] = {idx: mem.id for idx, mem in enumerate(existing)}
+    existing_json = [{"id": idx, "text": mem.content} for idx, mem in enumerate(existing)]
+    prior_summary = _prior_summary(collection, conversation_id) if enable_summarization else None
+
+    parts = [
+        "Current memory:\n```\n"
+        + json.dumps(existing_json, ensure_ascii=False, indent=2)
+        + "\n```",
+    ]
+    if not enable_summarization:
+        parts.append("Summary: not requested (return null).")
+    elif prior_summary:
+        parts.append(f"Previous summary:\n{prior_summary}")
+    else:
+        parts.append("Previous summary: (none yet)")
+    parts.append(f"Latest user message:\n```\n{user_message}\n```")
+    payload = "\n\n".join(parts)
+    LOGGER.info("Fused ingestion payload: %s", payload)
+
+    agent = agents.fused(base_url=openai_base_url, api_key=api_key, model=model)
+    try:
+        result = await agents.run(agent, payload, deps=frozenset(id_map))
+    except (httpx.HTTPError, AgentRunError, UnexpectedModelBehavior):
+        LOGGER.warning(
+            "Fused ingestion failed; falling back to the staged pipeline",
+            exc_info=True,
+        )
+        return None
+    output = result.output
+
+    facts = [fact.strip() for fact in output.facts if fact.strip()]
+    if existing:
+        to_add, to_delete, replacement_map = process_reconciliation_decisions(
+            output.decisions,
+            id_map,
+            conversation_id=conversation_id,
+            source_id=source_id,
+            created_at=created_at,
+        )
+    else:
+        # Same as the staged path: with nothing to reconcile against, add all facts
+        to_add = [
+            Fact(
+                id=str(uuid4()),
+                conversation_id=conversation_id,
+                content=fact,
+                source_id=source_id,
+                created_at=created_at,
+            )
+            for fact in facts
+        ]
+        to_delete, replacement_map = [], {}
+    summary = None
+    if enable_summarization and facts:
+        summary = output.summary or prior_summary
+    LOGGER.info(
+        "Fused extraction+reconcile+summary completed in %.1f ms (conversation=%s)",
+        _elapsed_ms(fused_start),
         conversation_id,
-        facts,
-        source_id=effective_source_id,
-        created_at=fact_created_at,
-        openai_base_url=openai_base_url,
-        api_key=api_key,
-        model=model,
     )
+    return _IngestPlan(
+        mode="fused",
+        facts=facts,
+        to_add=to_add,
+        to_delete=to_delete,
+        replacement_map=replacement_map,
+        summary=summary,
+    )
+
 
-    if to_delete:
-        delete_entries(collection, ids=list(to_delete))
+def _apply_plan(
+    collection: Collection,
+    *,
+    memory_root: Path,
+    conversation_id: str,
+    plan: _IngestPlan,
+) -> None:
+    if plan.to_delete:
+        delete_entries(collection, ids=list(plan.to_delete))
         delete_memory_files(
             memory_root,
             conversation_id,
-            list(to_delete),
-            replacement_map=replacement_map,
+            list(plan.to_delete),
+            replacement_map=plan.replacement_map,
         )
 
-    if to_add:
+    if plan.to_add:
+        embeddings = None
+        if plan.fact_embeddings:
+            embeddings = dict(zip(plan.facts, plan.fact_embeddings, strict=True))
         persist_entries(
             collection,
             memory_root=memory_root,
             conversation_id=conversation_id,
-            entries=list(to_add),
+            entries=list(plan.to_add),
+            embeddings=embeddings,
         )
 
-    if enable_summarization:
-        prior_summary_entry = get_summary_entry(
+    if plan.summary:
+        persist_summary(
             collection,
-            conversation_id,
-            role=_SUMMARY_ROLE,
-        )
-        prior_summary = prior_summary_entry.content if prior_summary_entry else None
-
-        summary_start = perf_counter()
-        new_summary = await update_summary(
-            prior_summary=prior_summary,
-            new_facts=facts,
-            openai_base_url=openai_base_url,
-            api_key=api_key,
-            model=model,
-        )
-        LOGGER.info(
-            "Summary update completed in %.1f ms (conversation=%s)",
-            _elapsed_ms(summary_start),
-            conversation_id,
-        )
-        if new_summary:
-            summary_obj = Summary(
+            memory_root=memory_root,
+            summary=Summary(
                 conversation_id=conversation_id,
-                content=new_summary,
+                content=plan.summary,
                 created_at=datetime.now(UTC),
-            )
-            persist_summary(
-                collection,
-                memory_root=memory_root,
-                summary=summary_obj,
-            )
-
-    if enable_git_versioning:
-        await commit_changes(memory_root, f"Add facts to conversation {conversation_id}")
+            ),
+        )
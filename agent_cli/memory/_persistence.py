@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
-from typing import TYPE_CHECKING
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from agent_cli.memory._files import (
     _DELETED_DIRNAME,
     ensure_store_dirs,
+    journal_snapshot_changes,
     load_snapshot,
     read_memory_file,
     soft_delete_memory_file,
     write_memory_file,
-    write_snapshot,
 )
-from agent_cli.memory._store import delete_entries, list_conversation_entries, upsert_memories
+from agent_cli.memory._store import delete_entries, upsert_memories
 from agent_cli.memory.entities import Fact, Summary, Turn
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from pathlib import Path
 
     from chromadb import Collection
 
+    from agent_cli.memory._files import MemoryFileRecord
     from agent_cli.memory.models import MemoryMetadata
 
 LOGGER = logging.getLogger(__name__)
@@ -29,6 +34,114 @@ LOGGER = logging.getLogger(__name__)
 _SUMMARY_DOC_ID_SUFFIX = "::summary"
 
 
+@dataclass
+class _ConversationOrder:
+    """Evictable entries of one conversation, sorted by (created_at, id)."""
+
+    created: dict[str, str] = field(default_factory=dict)
+    order: list[tuple[str, str]] = field(default_factory=list)
+
+
+class EvictionIndex:
+    """Per-conversation count and created_at order of evictable entries.
+
+    Summaries are not evictable and are never indexed. Built from the
+    snapshot on first use and kept current by the persistence helpers (and
+    by the watcher for files edited outside the proxy), so eviction checks
+    don't have to list a conversation from Chroma. The file path of each
+    entry is kept too, so deleting it needs no snapshot read.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._conversations: dict[str, _ConversationOrder] = {}
+        self._owner: dict[str, str] = {}
+        self._paths: dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[MemoryFileRecord]) -> EvictionIndex:
+        """Build an index from snapshot records."""
+        index = cls()
+        for rec in records:
+            index.add(rec.id, rec.metadata, rec.path)
+        return index
+
+    def add(self, doc_id: str, metadata: MemoryMetadata, path: Path) -> None:
+        """Insert or move an entry; summaries are ignored."""
+        with self._lock:
+            self._discard(doc_id)
+            if metadata.role == "summary":
+                return
+            conv = self._conversations.setdefault(metadata.conversation_id, _ConversationOrder())
+            conv.created[doc_id] = metadata.created_at
+            bisect.insort(conv.order, (metadata.created_at, doc_id))
+            self._owner[doc_id] = metadata.conversation_id
+            self._paths[doc_id] = path
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        """Drop entries by id; unknown ids are ignored."""
+        with self._lock:
+            for doc_id in doc_ids:
+                self._discard(doc_id)
+
+    def count(self, conversation_id: str) -> int:
+        """Return the number of evictable entries in a conversation."""
+        conv = self._conversations.get(conversation_id)
+        return len(conv.order) if conv else 0
+
+    def oldest(self, conversation_id: str, n: int) -> list[str]:
+        """Return the ids of the `n` oldest entries in a conversation."""
+        with self._lock:
+            conv = self._conversations.get(conversation_id)
+            return [doc_id for _, doc_id in conv.order[:n]] if conv else []
+
+    def path(self, doc_id: str) -> Path | None:
+        """Return the file path of an entry, if indexed."""
+        return self._paths.get(doc_id)
+
+    def _discard(self, doc_id: str) -> None:
+        self._paths.pop(doc_id, None)
+        cid = self._owner.pop(doc_id, None)
+        if cid is None:
+            return
+        conv = self._conversations[cid]
+        key = (conv.created.pop(doc_id), doc_id)
+        del conv.order[bisect.bisect_left(conv.order, key)]
+        if not conv.order:
+            del self._conversations[cid]
+
+
+_EVICTION_INDEXES: dict[Path, EvictionIndex] = {}
+_EVICTION_INDEXES_LOCK = threading.Lock()
+
+
+def eviction_index(memory_root: Path) -> EvictionIndex:
+    """Return the eviction index for a store, building it from the snapshot once."""
+    _, snapshot_path = ensure_store_dirs(memory_root)
+    key = snapshot_path.resolve()
+    with _EVICTION_INDEXES_LOCK:
+        index = _EVICTION_INDEXES.get(key)
+        if index is None:
+            index = EvictionIndex.from_records(load_snapshot(snapshot_path).values())
+            _EVICTION_INDEXES[key] = index
+        return index
+
+
+def note_index_changes(
+    snapshot_path: Path,
+    upserts: Iterable[MemoryFileRecord],
+    removals: Iterable[str],
+) -> None:
+    """Apply watcher-observed changes to an already built eviction index."""
+    index = _EVICTION_INDEXES.get(snapshot_path.resolve())
+    if index is None:
+        return  # Built later from the snapshot, which already has these
+    index.remove(removals)
+    for rec in upserts:
+        index.add(rec.id, rec.metadata, rec.path)
+
+
 def _safe_identifier(value: str) -> str:
     """File/ID safe token preserving readability."""
     safe = "".join(ch if ch.isalnum() or ch in "-._" else "_" for ch in value)
@@ -41,11 +154,18 @@ def persist_entries(
     memory_root: Path,
     conversation_id: str,
     entries: list[Turn | Fact | None],
+    embeddings: Mapping[str, Any] | None = None,
 ) -> None:
-    """Persist a batch of entries to disk and Chroma."""
+    """Persist a batch of entries to disk and Chroma.
+
+    `embeddings` maps entry content to a precomputed vector; it is used only
+    when it covers every entry, otherwise Chroma embeds the batch itself.
+    """
     ids: list[str] = []
     contents: list[str] = []
     metadatas: list[MemoryMetadata] = []
+    paths: list[Path] = []
+    vectors: list[Any] = []
 
     for item in entries:
         if item is None:
@@ -74,9 +194,21 @@ def persist_entries(
         ids.append(record.id)
         contents.append(record.content)
         metadatas.append(record.metadata)
+        paths.append(record.path)
+        if embeddings and item.content in embeddings:
+            vectors.append(embeddings[item.content])
 
     if ids:
-        upsert_memories(collection, ids=ids, contents=contents, metadatas=metadatas)
+        upsert_memories(
+            collection,
+            ids=ids,
+            contents=contents,
+            metadatas=metadatas,
+            embeddings=vectors if len(vectors) == len(ids) else None,
+        )
+        index = eviction_index(memory_root)
+        for doc_id, metadata, path in zip(ids, metadatas, paths, strict=True):
+            index.add(doc_id, metadata, path)
 
 
 def persist_summary(
@@ -110,7 +242,11 @@ def delete_memory_files(
     ids: list[str],
     replacement_map: dict[str, str] | None = None,
 ) -> None:
-    """Delete markdown files (move to tombstone) and snapshot entries matching the given ids."""
+    """Delete markdown files (move to tombstone) and snapshot entries matching the given ids.
+
+    Paths come from the in-memory `EvictionIndex`; only ids it does not know
+    (e.g. summaries) fall back to scanning the conversation folder.
+    """
     if not ids:
         return
 
@@ -118,26 +254,25 @@ def delete_memory_files(
     # Ensure we use the correct base for relative paths in soft_delete
     base_entries_dir = entries_dir
     conv_dir = entries_dir / _safe_identifier(conversation_id)
-    snapshot = load_snapshot(snapshot_path)
+    index = eviction_index(memory_root)
     replacements = replacement_map or {}
 
     removed_ids: set[str] = set()
 
-    # Prefer precise paths from the snapshot.
+    # Prefer precise paths from the index.
     for doc_id in ids:
-        rec = snapshot.get(doc_id)
-        if rec:
+        path = index.path(doc_id)
+        if path is not None and path.exists():
             soft_delete_memory_file(
-                rec.path,
+                path,
                 base_entries_dir,
                 replaced_by=replacements.get(doc_id),
             )
-            snapshot.pop(doc_id, None)
             removed_ids.add(doc_id)
 
     remaining = {doc_id for doc_id in ids if doc_id not in removed_ids}
 
-    # Fallback: scan the conversation folder for anything not in the snapshot.
+    # Fallback: scan the conversation folder for anything not in the index.
     if remaining and conv_dir.exists():
         for path in conv_dir.rglob("*.md"):
             if _DELETED_DIRNAME in path.parts:
@@ -149,14 +284,14 @@ def delete_memory_files(
                     base_entries_dir,
                     replaced_by=replacements.get(rec.id),
                 )
-                snapshot.pop(rec.id, None)
                 removed_ids.add(rec.id)
                 remaining.remove(rec.id)
                 if not remaining:
                     break
 
     if removed_ids:
-        write_snapshot(snapshot_path, snapshot.values())
+        journal_snapshot_changes(snapshot_path, removals=sorted(removed_ids))
+    index.remove(ids)
 
 
 def evict_if_needed(
@@ -165,18 +300,19 @@ def evict_if_needed(
     conversation_id: str,
     max_entries: int,
 ) -> None:
-    """Evict oldest non-summary entries beyond the max budget."""
+    """Evict oldest non-summary entries beyond the max budget.
+
+    Uses the in-memory `EvictionIndex` for counts, order and file paths, so
+    the common under-budget case is a dictionary lookup and eviction does not
+    read the snapshot.
+    """
     if max_entries <= 0:
         return
-    entries = list_conversation_entries(collection, conversation_id, include_summary=False)
-    if len(entries) <= max_entries:
+    index = eviction_index(memory_root)
+    overflow = index.count(conversation_id) - max_entries
+    if overflow <= 0:
         return
-    # Sort by created_at asc
-    sorted_entries = sorted(
-        entries,
-        key=lambda e: e.metadata.created_at,
-    )
-    overflow = sorted_entries[:-max_entries]
-    ids_to_remove = [e.id for e in overflow]
+    ids_to_remove = index.oldest(conversation_id, overflow)
+    LOGGER.info("Evicting %d oldest entries (conversation=%s)", len(ids_to_remove), conversation_id)
     delete_entries(collection, ids_to_remove)
     delete_memory_files(memory_root, conversation_id, ids_to_remove)
@@ -89,3 +89,21 @@ You are a concise conversation summarizer. Update the running summary with the n
 Keep it brief, factual, and focused on durable information; do not restate transient chit-chat.
 Prefer aggregating related facts into compact statements; drop redundancies.
 """.strip()
+
+FUSED_INGEST_PROMPT = """
+You maintain the long-term memory of an assistant. For the latest user message, do three things in ONE response.
+
+1. "facts": Extract 1-3 concise fact sentences based ONLY on the user message.
+   - Ignore assistant/system content, greetings, questions and meta statements.
+   - Return [] if there is no meaningful fact. Never output refusals.
+2. "decisions": Compare the facts with the existing memory. For each item decide:
+   - {"event": "ADD", "text": ...} for genuinely new information.
+   - {"event": "UPDATE", "id": <existing id>, "text": ...} only when a fact refines a memory about THE SAME TOPIC.
+   - {"event": "DELETE", "id": <existing id>} when a fact explicitly contradicts a memory.
+   - {"event": "NONE", "id": <existing id>} when a memory is unchanged or unrelated.
+   Only use ids that appear in the existing memory, and give every existing memory a decision.
+3. "summary": The updated running conversation summary: brief, factual, durable information only.
+   Merge the new facts into the previous summary. Use null when no summary is requested.
+
+Return ONLY a JSON object: {"facts": [...], "decisions": [...], "summary": ...}. No prose or code fences.
+""".strip()
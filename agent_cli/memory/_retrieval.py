@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-import math
+from collections import Counter
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from agent_cli.core.reranker import OnnxCrossEncoder, predict_relevance
-from agent_cli.memory._store import get_summary_entry, query_memories
+from agent_cli.core.chroma import collection_generation
+from agent_cli.core.reranker import OnnxCrossEncoder, RerankBatcher, predict_relevance
+from agent_cli.core.retrieval_cache import RetrievalCache, make_cache_key
+from agent_cli.memory._store import (
+    MemoryCandidates,
+    count_memory_candidates,
+    get_summary_entry,
+    query_memories_batch,
+    query_memory_candidates,
+)
 from agent_cli.memory.models import (
     ChatRequest,
     MemoryEntry,
@@ -19,7 +29,11 @@ from agent_cli.memory.models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
     from chromadb import Collection
+    from numpy.typing import NDArray
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,95 +48,118 @@ def gather_relevant_existing_memories(
     new_facts: list[str],
     *,
     neighborhood: int = 5,
+    query_embeddings: Sequence[Any] | None = None,
 ) -> list[StoredMemory]:
-    """Retrieve a small neighborhood of existing memories per new fact, deduped by id."""
+    """Retrieve a small neighborhood of existing memories per new fact, deduped by id.
+
+    All facts go to Chroma as one multi-query call; pass `query_embeddings`
+    (aligned with `new_facts`) to reuse vectors computed by the caller.
+    """
     if not new_facts:
         return []
-    filters = [
-        {"conversation_id": conversation_id},
-        {"role": "memory"},
-        {"role": {"$ne": "summary"}},
-    ]
+    per_fact = query_memories_batch(
+        collection,
+        conversation_ids=[conversation_id],
+        texts=new_facts,
+        n_results=neighborhood,
+        role="memory",
+        query_embeddings=query_embeddings,
+    )
     seen: set[str] = set()
     results: list[StoredMemory] = []
-    for fact in new_facts:
-        raw = collection.query(query_texts=[fact], n_results=neighborhood, where={"$and": filters})
-        docs = raw.get("documents", [[]])[0] or []
-        metas = raw.get("metadatas", [[]])[0] or []
-        ids = raw.get("ids", [[]])[0] or []
-        distances = raw.get("distances", [[]])[0] or []
-        for doc, meta, doc_id, dist in zip(docs, metas, ids, distances, strict=False):
-            assert doc_id is not None
-            if doc_id in seen:
+    for records in per_fact:
+        for mem in records:
+            if mem.id in seen:
                 continue
-            seen.add(doc_id)
-            norm_meta = MemoryMetadata(**dict(meta))
-            results.append(
-                StoredMemory(
-                    id=doc_id,
-                    content=doc,
-                    metadata=norm_meta,
-                    distance=float(dist) if dist is not None else None,
-                ),
-            )
+            seen.add(mem.id)
+            results.append(mem)
     return results
 
 
+def _embedding_matrix(candidates: list[StoredMemory]) -> NDArray[np.float32] | None:
+    """Stack per-record embeddings; missing or mismatched vectors become zero rows."""
+    import numpy as np  # noqa: PLC0415
+
+    dim = next((len(mem.embedding) for mem in candidates if mem.embedding), 0)
+    if not dim:
+        return None
+    matrix = np.zeros((len(candidates), dim), dtype=np.float32)
+    for i, mem in enumerate(candidates):
+        if mem.embedding and len(mem.embedding) == dim:
+            matrix[i] = mem.embedding
+    return matrix
+
+
 def mmr_select(
     candidates: list[StoredMemory],
-    scores: list[float],
+    scores: Sequence[float],
     *,
     max_items: int,
     lambda_mult: float,
+    embeddings: NDArray[np.float32] | None = None,
 ) -> list[tuple[StoredMemory, float]]:
-    """Apply Maximal Marginal Relevance to promote diversity."""
+    """Apply Maximal Marginal Relevance to promote diversity.
+
+    `embeddings` holds one row per candidate; without it, the vectors are
+    taken from `StoredMemory.embedding`. The cosine similarity matrix is
+    computed once and each step only updates the running max-redundancy.
+    """
+    import numpy as np  # noqa: PLC0415
+
     if not candidates or max_items <= 0:
         return []
 
-    def _normalize(vec: list[float] | None) -> list[float] | None:
-        if not vec:
-            return None
-        norm = sum(x * x for x in vec) ** 0.5
-        if norm == 0:
-            return None
-        return [x / norm for x in vec]
-
-    def _cosine(a: list[float] | None, b: list[float] | None) -> float:
-        if not a or not b or len(a) != len(b):
-            return 0.0
-        return sum(x * y for x, y in zip(a, b, strict=False))
-
-    normalized_embeddings: list[list[float] | None] = [
-        _normalize(mem.embedding) for mem in candidates
-    ]
-
-    selected: list[int] = []
-    candidate_indices = list(range(len(candidates)))
+    relevance = np.asarray(scores, dtype=np.float64)
+    if embeddings is None:
+        embeddings = _embedding_matrix(candidates)
+    if embeddings is None:
+        similarity = np.zeros((len(candidates), len(candidates)), dtype=np.float32)
+    else:
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        unit = np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+        similarity = unit @ unit.T
 
     # Start with top scorer
-    first_idx = max(candidate_indices, key=lambda i: scores[i])
-    selected.append(first_idx)
-    candidate_indices.remove(first_idx)
-
-    while candidate_indices and len(selected) < max_items:
-        best_idx = None
-        best_score = float("-inf")
-        for idx in candidate_indices:
-            relevance = scores[idx]
-            redundancy = max(
-                (_cosine(normalized_embeddings[idx], normalized_embeddings[s]) for s in selected),
-                default=0.0,
-            )
-            mmr_score = lambda_mult * relevance - (1 - lambda_mult) * redundancy
-            if mmr_score > best_score:
-                best_score = mmr_score
-                best_idx = idx
-        if best_idx is None:
-            break
+    first_idx = int(np.argmax(relevance))
+    selected = [first_idx]
+    available = np.ones(len(candidates), dtype=bool)
+    available[first_idx] = False
+    redundancy = similarity[first_idx].astype(np.float64)
+
+    while len(selected) < max_items and available.any():
+        mmr_scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        mmr_scores[~available] = -np.inf
+        best_idx = int(np.argmax(mmr_scores))
         selected.append(best_idx)
-        candidate_indices.remove(best_idx)
+        available[best_idx] = False
+        np.maximum(redundancy, similarity[best_idx], out=redundancy)
+
+    return [(candidates[i], float(relevance[i])) for i in selected]
+
 
-    return [(candidates[i], scores[i]) for i in selected]
+def _min_max_normalize(scores: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Normalize scores to 0-1 range using min-max scaling."""
+    import numpy as np  # noqa: PLC0415
+
+    if not scores.size:
+        return scores
+    span = scores.max() - scores.min()
+    if span < _MIN_MAX_EPSILON:
+        return np.full_like(scores, 0.5)  # All scores equal
+    return (scores - scores.min()) / span
+
+
+def _recency_scores(metadatas: list[MemoryMetadata]) -> NDArray[np.float64]:
+    """Exponential decay by age: ~0.36 score at 30 days."""
+    import numpy as np  # noqa: PLC0415
+
+    created = np.fromiter(
+        (datetime.fromisoformat(meta.created_at).timestamp() for meta in metadatas),
+        dtype=np.float64,
+        count=len(metadatas),
+    )
+    age_days = np.maximum((datetime.now(UTC).timestamp() - created) / 86400.0, 0.0)
+    return np.exp(-age_days / 30.0)
 
 
 def retrieve_memory(
@@ -131,74 +168,189 @@ def retrieve_memory(
     conversation_id: str,
     query: str,
     top_k: int,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     include_global: bool = True,
     include_summary: bool = True,
     mmr_lambda: float = _DEFAULT_MMR_LAMBDA,
     recency_weight: float = 0.2,
     score_threshold: float | None = None,
     filters: dict[str, Any] | None = None,
+    cache: RetrievalCache[tuple[MemoryRetrieval, list[str]]] | None = None,
 ) -> tuple[MemoryRetrieval, list[str]]:
-    """Execute search + rerank + recency + MMR."""
-    candidate_conversations = [conversation_id]
-    if include_global and conversation_id != "global":
-        candidate_conversations.append("global")
+    """Execute search + rerank + recency + MMR.
 
-    raw_candidates: list[StoredMemory] = []
-    seen_ids: set[str] = set()
+    With a `cache`, results are reused until the collection changes or the
+    cache TTL expires (which also bounds recency-score drift).
+    """
+    run = functools.partial(
+        _retrieve_memory_uncached,
+        collection,
+        conversation_id=conversation_id,
+        query=query,
+        top_k=top_k,
+        reranker_model=reranker_model,
+        include_global=include_global,
+        include_summary=include_summary,
+        mmr_lambda=mmr_lambda,
+        recency_weight=recency_weight,
+        score_threshold=score_threshold,
+        filters=filters,
+    )
+    if cache is None:
+        return run()
+
+    key = make_cache_key(
+        query,
+        conversation_id,
+        top_k,
+        include_global,
+        include_summary,
+        mmr_lambda,
+        recency_weight,
+        score_threshold,
+        filters,
+    )
+    generation = collection_generation(collection)
+    cached = cache.get(key, generation)
+    if cached is not None:
+        return cached
+    result = run()
+    cache.put(key, generation, result)
+    return result
 
-    for cid in candidate_conversations:
-        records = query_memories(
+
+def _query_scopes(
+    collection: Collection,
+    *,
+    scopes: list[str],
+    text: str,
+    per_scope: int,
+    filters: dict[str, Any] | None,
+) -> MemoryCandidates:
+    """Return up to `per_scope` unique candidates from each scope, scope by scope.
+
+    All scopes are searched with one query. If that result is full, a scope
+    that got less than its quota may have been crowded out by another one;
+    only scopes that hold more matching entries than they got are queried
+    again on their own. A scope that is merely small costs no extra query.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    results = [
+        query_memory_candidates(
             collection,
-            conversation_id=cid,
-            text=query,
-            n_results=top_k * 3,
+            conversation_id=scopes,
+            text=text,
+            n_results=per_scope * len(scopes),
             filters=filters,
+        ),
+    ]
+    counts = Counter(rec.metadata.conversation_id for rec in results[0].records)
+    if len(results[0].records) >= per_scope * len(scopes):
+        crowded = [
+            scope
+            for scope in scopes
+            if counts[scope] < per_scope
+            and count_memory_candidates(
+                collection,
+                conversation_id=scope,
+                limit=per_scope,
+                filters=filters,
+            )
+            > counts[scope]
+        ]
+        results.extend(
+            query_memory_candidates(
+                collection,
+                conversation_id=scope,
+                text=text,
+                n_results=per_scope,
+                filters=filters,
+            )
+            for scope in crowded
         )
-        for rec in records:
-            rec_id = rec.id
-            if rec_id in seen_ids:
-                continue
-            seen_ids.add(rec_id)
-            raw_candidates.append(rec)
-
-    def _min_max_normalize(scores: list[float]) -> list[float]:
-        """Normalize scores to 0-1 range using min-max scaling."""
-        if not scores:
-            return scores
-        min_score = min(scores)
-        max_score = max(scores)
-        if max_score - min_score < _MIN_MAX_EPSILON:
-            return [0.5] * len(scores)  # All scores equal
-        return [(s - min_score) / (max_score - min_score) for s in scores]
-
-    def recency_score(meta: MemoryMetadata) -> float:
-        dt = datetime.fromisoformat(meta.created_at)
-        age_days = max((datetime.now(UTC) - dt).total_seconds() / 86400.0, 0.0)
-        # Exponential decay: ~0.36 score at 30 days
-        return math.exp(-age_days / 30.0)
+
+    records: list[StoredMemory] = []
+    rows: list[NDArray[np.float32]] = []
+    seen_ids: set[str] = set()
+    for scope in scopes:
+        taken = 0
+        for result in results:
+            for i, rec in enumerate(result.records):
+                if taken >= per_scope:
+                    break
+                if rec.metadata.conversation_id != scope or rec.id in seen_ids:
+                    continue
+                seen_ids.add(rec.id)
+                records.append(rec)
+                if result.embeddings is not None:
+                    rows.append(result.embeddings[i])
+                taken += 1
+    embeddings = np.stack(rows) if rows and len(rows) == len(records) else None
+    return MemoryCandidates(records=records, embeddings=embeddings)
+
+
+def _retrieve_memory_uncached(
+    collection: Collection,
+    *,
+    conversation_id: str,
+    query: str,
+    top_k: int,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
+    include_global: bool,
+    include_summary: bool,
+    mmr_lambda: float,
+    recency_weight: float,
+    score_threshold: float | None,
+    filters: dict[str, Any] | None,
+) -> tuple[MemoryRetrieval, list[str]]:
+    """Run the Chroma queries, rerank, recency blend and MMR for `retrieve_memory`."""
+    candidate_conversations = [conversation_id]
+    if include_global and conversation_id != "global":
+        candidate_conversations.append("global")
+
+    candidates = _query_scopes(
+        collection,
+        scopes=candidate_conversations,
+        text=query,
+        per_scope=top_k * 3,
+        filters=filters,
+    )
+    raw_candidates = candidates.records
+    embeddings = candidates.embeddings
 
     final_candidates: list[StoredMemory] = []
-    scores: list[float] = []
+    scores: NDArray[np.float64] | list[float] = []
 
     if raw_candidates:
+        import numpy as np  # noqa: PLC0415
+
         pairs = [(query, mem.content) for mem in raw_candidates]
-        rr_scores = predict_relevance(reranker_model, pairs)
+        rr_scores = np.asarray(predict_relevance(reranker_model, pairs), dtype=np.float64)
         # Normalize raw reranker scores to 0-1 range
-        normalized_scores = _min_max_normalize(rr_scores)
-
-        for mem, relevance in zip(raw_candidates, normalized_scores, strict=False):
-            # Filter out low-relevance memories if threshold is set
-            if score_threshold is not None and relevance < score_threshold:
-                continue
-
-            recency = recency_score(mem.metadata)
-            # Weighted blend
-            total = (1.0 - recency_weight) * relevance + recency_weight * recency
-            scores.append(total)
-            final_candidates.append(mem)
-
-    selected = mmr_select(final_candidates, scores, max_items=top_k, lambda_mult=mmr_lambda)
+        relevance = _min_max_normalize(rr_scores)
+        recency = _recency_scores([mem.metadata for mem in raw_candidates])
+        # Weighted blend
+        totals = (1.0 - recency_weight) * relevance + recency_weight * recency
+
+        # Filter out low-relevance memories if threshold is set
+        if score_threshold is not None:
+            mask = relevance >= score_threshold
+            final_candidates = [mem for mem, ok in zip(raw_candidates, mask, strict=True) if ok]
+            scores = totals[mask]
+            if embeddings is not None:
+                embeddings = embeddings[mask]
+        else:
+            final_candidates = raw_candidates
+            scores = totals
+
+    selected = mmr_select(
+        final_candidates,
+        scores,
+        max_items=top_k,
+        lambda_mult=mmr_lambda,
+        embeddings=embeddings,
+    )
 
     entries: list[MemoryEntry] = [
         MemoryEntry(
@@ -239,7 +391,7 @@ def format_augmented_content(
 async def augment_chat_request(
     request: ChatRequest,
     collection: Collection,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     default_top_k: int = 5,
     default_memory_id: str = "default",
     include_global: bool = True,
@@ -247,6 +399,7 @@ async def augment_chat_request(
     recency_weight: float = 0.2,
     score_threshold: float | None = None,
     filters: dict[str, Any] | None = None,
+    cache: RetrievalCache[tuple[MemoryRetrieval, list[str]]] | None = None,
 ) -> tuple[ChatRequest, MemoryRetrieval | None, str, list[str]]:
     """Retrieve memory context and augment the chat request."""
     user_message = next(
@@ -263,7 +416,9 @@ async def augment_chat_request(
         LOGGER.info("Memory retrieval disabled for this request (top_k=%s)", top_k)
         return request, None, conversation_id, []
 
-    retrieval, summaries = retrieve_memory(
+    # Chroma queries and ONNX reranking block; keep them off the event loop
+    retrieval, summaries = await asyncio.to_thread(
+        retrieve_memory,
         collection,
         conversation_id=conversation_id,
         query=user_message,
@@ -274,6 +429,7 @@ async def augment_chat_request(
         recency_weight=recency_weight,
         score_threshold=score_threshold,
         filters=filters,
+        cache=cache,
     )
 
     if not retrieval.entries and not summaries:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from agent_cli.constants import DEFAULT_OPENAI_EMBEDDING_MODEL
@@ -14,7 +15,9 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    import numpy as np
     from chromadb import Collection
+    from numpy.typing import NDArray
 
 
 def init_memory_collection(
@@ -41,63 +44,59 @@ def upsert_memories(
     ids: list[str],
     contents: list[str],
     metadatas: Sequence[MemoryMetadata],
+    embeddings: Sequence[Any] | None = None,
 ) -> None:
-    """Persist memory entries."""
-    upsert(collection, ids=ids, documents=contents, metadatas=metadatas)
+    """Persist memory entries (with precomputed `embeddings`, if given)."""
+    upsert(collection, ids=ids, documents=contents, metadatas=metadatas, embeddings=embeddings)
 
 
-def query_memories(
-    collection: Collection,
-    *,
-    conversation_id: str,
-    text: str,
-    n_results: int,
-    filters: dict[str, Any] | None = None,
-) -> list[StoredMemory]:
-    """Query for relevant memory entries and return structured results."""
-    base_filters: list[dict[str, Any]] = [
-        {"conversation_id": conversation_id},
-        {"role": {"$ne": "summary"}},
-    ]
-    if filters:
-        chroma_filters = to_chroma_where(filters)
-        if chroma_filters:
-            base_filters.append(chroma_filters)
-    raw = collection.query(
-        query_texts=[text],
-        n_results=n_results,
-        where={"$and": base_filters},
-        include=["documents", "metadatas", "distances", "embeddings"],
-    )
-    docs_list = raw.get("documents")
-    docs = docs_list[0] if docs_list else []
+def _conversation_clause(conversation_ids: list[str]) -> dict[str, Any]:
+    if len(conversation_ids) == 1:
+        return {"conversation_id": conversation_ids[0]}
+    return {"conversation_id": {"$in": conversation_ids}}
+
+
+@dataclass
+class MemoryCandidates:
+    """Records from one query, with their embeddings stacked in one matrix.
+
+    Row `i` of `embeddings` (float32, shape `(len(records), dim)`) belongs to
+    `records[i]`; it is None when embeddings were not requested.
+    """
 
-    metas_list = raw.get("metadatas")
-    metas = metas_list[0] if metas_list else []
+    records: list[StoredMemory]
+    embeddings: NDArray[np.float32] | None = None
 
-    ids_list = raw.get("ids")
-    ids = ids_list[0] if ids_list else []
 
-    dists_list = raw.get("distances")
-    distances = dists_list[0] if dists_list else []
+def _parse_query_row(raw: dict[str, Any], row: int, *, with_embeddings: bool) -> MemoryCandidates:
+    """Convert row `row` of a (multi-query) Chroma result into candidates."""
 
-    raw_embeddings = raw.get("embeddings")
-    embeddings: list[Any] = []
-    if raw_embeddings and len(raw_embeddings) > 0 and raw_embeddings[0] is not None:
-        embeddings = raw_embeddings[0]
+    def column(key: str) -> Any:
+        values = raw.get(key)
+        if values is None or len(values) <= row or values[row] is None:
+            return []
+        return values[row]
+
+    docs = column("documents")
+    metas = column("metadatas")
+    ids = column("ids")
+    distances = column("distances")
+
+    matrix = None
+    if with_embeddings:
+        import numpy as np  # noqa: PLC0415
+
+        embeddings = column("embeddings")
+        if len(embeddings) != len(docs):
+            msg = (
+                f"Chroma returned embeddings of unexpected length: {len(embeddings)} vs {len(docs)}"
+            )
+            raise ValueError(msg)
+        if len(docs):
+            matrix = np.asarray(embeddings, dtype=np.float32)
 
-    if len(embeddings) != len(docs):
-        msg = f"Chroma returned embeddings of unexpected length: {len(embeddings)} vs {len(docs)}"
-        raise ValueError(msg)
     records: list[StoredMemory] = []
-    for doc, meta, doc_id, dist, emb in zip(
-        docs,
-        metas,
-        ids,
-        distances,
-        embeddings,
-        strict=False,
-    ):
+    for doc, meta, doc_id, dist in zip(docs, metas, ids, distances, strict=False):
         assert doc_id is not None
         records.append(
             StoredMemory(
@@ -105,10 +104,152 @@ def query_memories(
                 content=doc,
                 metadata=MemoryMetadata(**dict(meta)),
                 distance=float(dist) if dist is not None else None,
-                embedding=[float(x) for x in emb] if emb is not None else None,
             ),
         )
-    return records
+    return MemoryCandidates(records=records, embeddings=matrix)
+
+
+def _candidate_where(
+    conversation_ids: list[str],
+    filters: dict[str, Any] | None,
+    role: str | None,
+) -> dict[str, Any]:
+    """Chroma `where` clause matching the non-summary entries a query may return."""
+    clauses: list[dict[str, Any]] = [
+        _conversation_clause(conversation_ids),
+        {"role": {"$ne": "summary"}},
+    ]
+    if role is not None:
+        clauses.append({"role": role})
+    if filters:
+        chroma_filters = to_chroma_where(filters)
+        if chroma_filters:
+            clauses.append(chroma_filters)
+    return {"$and": clauses}
+
+
+def _query_candidates(
+    collection: Collection,
+    *,
+    conversation_ids: list[str],
+    texts: list[str],
+    n_results: int,
+    filters: dict[str, Any] | None,
+    role: str | None,
+    query_embeddings: Sequence[Any] | None,
+    include_embeddings: bool,
+) -> list[MemoryCandidates]:
+    if not texts:
+        return []
+    include = ["documents", "metadatas", "distances"]
+    if include_embeddings:
+        include.append("embeddings")
+    query: dict[str, Any] = (
+        {"query_embeddings": list(query_embeddings)}
+        if query_embeddings is not None
+        else {"query_texts": texts}
+    )
+    raw = collection.query(
+        **query,
+        n_results=n_results,
+        where=_candidate_where(conversation_ids, filters, role),
+        include=include,
+    )
+    return [
+        _parse_query_row(raw, row, with_embeddings=include_embeddings) for row in range(len(texts))
+    ]
+
+
+def query_memories_batch(
+    collection: Collection,
+    *,
+    conversation_ids: list[str],
+    texts: list[str],
+    n_results: int,
+    filters: dict[str, Any] | None = None,
+    role: str | None = None,
+    query_embeddings: Sequence[Any] | None = None,
+) -> list[list[StoredMemory]]:
+    """Run one multi-query Chroma call for `texts` across `conversation_ids`.
+
+    Returns one result list per text (without embeddings). Pass
+    `query_embeddings` (aligned with `texts`) to reuse vectors that were
+    already computed for this request.
+    """
+    rows = _query_candidates(
+        collection,
+        conversation_ids=conversation_ids,
+        texts=texts,
+        n_results=n_results,
+        filters=filters,
+        role=role,
+        query_embeddings=query_embeddings,
+        include_embeddings=False,
+    )
+    return [row.records for row in rows]
+
+
+def query_memory_candidates(
+    collection: Collection,
+    *,
+    conversation_id: str | list[str],
+    text: str,
+    n_results: int,
+    filters: dict[str, Any] | None = None,
+) -> MemoryCandidates:
+    """Query for relevant memory entries, keeping embeddings as one matrix.
+
+    Pass several conversation ids to search them with a single query.
+    """
+    conversation_ids = [conversation_id] if isinstance(conversation_id, str) else conversation_id
+    return _query_candidates(
+        collection,
+        conversation_ids=conversation_ids,
+        texts=[text],
+        n_results=n_results,
+        filters=filters,
+        role=None,
+        query_embeddings=None,
+        include_embeddings=True,
+    )[0]
+
+
+def count_memory_candidates(
+    collection: Collection,
+    *,
+    conversation_id: str,
+    limit: int,
+    filters: dict[str, Any] | None = None,
+) -> int:
+    """Count the entries a query on one conversation could return, up to `limit`."""
+    result = collection.get(
+        where=_candidate_where([conversation_id], filters, None),
+        limit=limit,
+        include=[],
+    )
+    return len(result.get("ids") or [])
+
+
+def query_memories(
+    collection: Collection,
+    *,
+    conversation_id: str | list[str],
+    text: str,
+    n_results: int,
+    filters: dict[str, Any] | None = None,
+) -> list[StoredMemory]:
+    """Query for relevant memory entries and return structured results."""
+    candidates = query_memory_candidates(
+        collection,
+        conversation_id=conversation_id,
+        text=text,
+        n_results=n_results,
+        filters=filters,
+    )
+    if candidates.embeddings is not None:
+        for record, vector in zip(candidates.records, candidates.embeddings, strict=True):
+            record.embedding = vector.tolist()
+    return candidates.records
 
 
 def get_summary_entry(
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import Awaitable, Callable, Coroutine
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 _BACKGROUND_TASKS: set[asyncio.Task[Any]] = set()
 
 
@@ -46,3 +49,115 @@ async def wait_for_background_tasks() -> None:
     while _BACKGROUND_TASKS:
         tasks = list(_BACKGROUND_TASKS)
         await asyncio.gather(*tasks, return_exceptions=False)
+
+
+@dataclass
+class IngestionQueueStats:
+    """Counters describing how an `IngestionQueue` merged and ran turns."""
+
+    submitted: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    failed: int = 0
+    max_depth: int = 0
+
+
+class IngestionQueue(Generic[T]):
+    """Serialize post-turn ingestion per conversation, merging queued turns.
+
+    Each conversation has at most one running batch; turns that arrive while
+    it runs are queued and handed to `handler` together as the next batch, so
+    rapid-fire turns never reconcile the same facts concurrently. At most
+    `max_concurrency` batches run at once across all conversations.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, list[T]], Awaitable[None]],
+        *,
+        max_concurrency: int = 2,
+    ) -> None:
+        """Run `handler(conversation_id, items)` for each batch of queued items."""
+        self._handler = handler
+        self.max_concurrency = max_concurrency
+        self.stats = IngestionQueueStats()
+        self._pending: dict[str, list[T]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._running = 0
+
+    def depth(self) -> int:
+        """Return the number of queued items not yet handed to a batch."""
+        return sum(len(items) for items in self._pending.values())
+
+    def submit(self, conversation_id: str, item: T) -> None:
+        """Queue `item`; it joins the next batch for its conversation."""
+        queued = self._pending.setdefault(conversation_id, [])
+        if queued:
+            self.stats.coalesced += 1
+        queued.append(item)
+        self.stats.submitted += 1
+        self.stats.max_depth = max(self.stats.max_depth, self.depth())
+        if conversation_id not in self._workers:
+            self._workers[conversation_id] = run_in_background(
+                self._work(conversation_id),
+                label=f"ingest-{conversation_id}",
+            )
+
+    async def drain(self, grace_seconds: float | None = None) -> bool:
+        """Wait for queued and running batches; cancel them after `grace_seconds`.
+
+        Returns True when everything finished in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if grace_seconds is None else loop.time() + grace_seconds
+        while self._workers:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+            await asyncio.wait(set(self._workers.values()), timeout=remaining)
+        if not self._workers:
+            return True
+        LOGGER.warning(
+            "Ingestion queue drain timed out; dropping %d queued turns in %d conversations",
+            self.depth(),
+            len(self._workers),
+        )
+        for task in list(self._workers.values()):
+            task.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._pending.clear()
+        return False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return queue depth and counters for `/health`."""
+        return {
+            "depth": self.depth(),
+            "conversations": len(self._workers),
+            "running": self._running,
+            "max_concurrency": self.max_concurrency,
+            **asdict(self.stats),
+        }
+
+    async def _work(self, conversation_id: str) -> None:
+        try:
+            while self._pending.get(conversation_id):
+                async with self._slots:
+                    # Take everything queued so far, including turns that
+                    # arrived while this conversation waited for a slot.
+                    batch = self._pending.pop(conversation_id)
+                    self._running += 1
+                    self.stats.batches += 1
+                    try:
+                        await self._handler(conversation_id, batch)
+                    except Exception:
+                        self.stats.failed += 1
+                        LOGGER.exception(
+                            "Ingestion of %d turns failed (conversation=%s)",
+                            len(batch),
+                            conversation_id,
+                        )
+                    finally:
+                        self._running -= 1
+        finally:
+            del self._workers[conversation_id]
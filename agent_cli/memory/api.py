@@ -16,6 +16,8 @@ from agent_cli.memory.models import ChatRequest  # noqa: TC001
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from agent_cli.memory._ingest import IngestMode
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -33,6 +35,7 @@ def create_app(
     recency_weight: float = 0.2,
     score_threshold: float | None = None,
     enable_git_versioning: bool = True,
+    ingest_mode: IngestMode = "staged",
 ) -> FastAPI:
     """Create the FastAPI app for memory-backed chat."""
     LOGGER.info("Initializing memory client...")
@@ -52,6 +55,7 @@ def create_app(
         score_threshold=score_threshold,
         start_watcher=False,  # We control start/stop via app events
         enable_git_versioning=enable_git_versioning,
+        ingest_mode=ingest_mode,
     )
 
     app = FastAPI(title="Memory Proxy")
@@ -91,12 +95,16 @@ def create_app(
         await client.stop()
 
     @app.get("/health")
-    def health() -> dict[str, str]:
+    def health() -> dict[str, Any]:
         return {
             "status": "ok",
             "memory_store": str(client.memory_path),
             "openai_base_url": client.openai_base_url,
             "default_top_k": str(client.default_top_k),
+            "reranker": client.reranker_model.stats(),
+            "retrieval_cache": client.retrieval_cache.stats(),
+            "llm_agents": client.agents.stats(),
+            "ingestion_queue": client.ingestion_queue.snapshot(),
         }
 
     @app.api_route(
@@ -8,15 +8,18 @@ from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Self
 
 from agent_cli.constants import DEFAULT_OPENAI_EMBEDDING_MODEL, DEFAULT_OPENAI_MODEL
-from agent_cli.core.reranker import get_reranker_model
+from agent_cli.core.reranker import RerankBatcher, get_reranker_model
+from agent_cli.core.retrieval_cache import RetrievalCache
+from agent_cli.memory._agents import MemoryAgents
 from agent_cli.memory._files import ensure_store_dirs
-from agent_cli.memory._git import init_repo
+from agent_cli.memory._git import GitCommitter, init_repo
 from agent_cli.memory._indexer import MemoryIndex, initial_index, watch_memory_store
 from agent_cli.memory._ingest import extract_and_store_facts_and_summaries
 from agent_cli.memory._persistence import evict_if_needed
 from agent_cli.memory._retrieval import augment_chat_request
 from agent_cli.memory._store import init_memory_collection, list_conversation_entries
-from agent_cli.memory.engine import process_chat_request
+from agent_cli.memory._tasks import IngestionQueue
+from agent_cli.memory.engine import PendingTurn, ingest_turns, process_chat_request
 from agent_cli.memory.models import ChatRequest, MemoryRetrieval, Message
 
 if TYPE_CHECKING:
@@ -24,11 +27,13 @@ if TYPE_CHECKING:
 
     from chromadb import Collection
 
-    from agent_cli.core.reranker import OnnxCrossEncoder
+    from agent_cli.memory._ingest import IngestMode
 
 
 logger = logging.getLogger("agent_cli.memory.client")
 
+_INGESTION_DRAIN_SECONDS = 30.0
+
 
 class MemoryClient:
     """A client for interacting with the memory system (add, search, chat).
@@ -53,6 +58,7 @@ class MemoryClient:
         score_threshold: float | None = None,
         start_watcher: bool = False,
         enable_git_versioning: bool = True,
+        ingest_mode: IngestMode = "staged",
     ) -> None:
         """Initialize the memory client."""
         self.memory_path = memory_path.resolve()
@@ -65,11 +71,14 @@ class MemoryClient:
         self.recency_weight = recency_weight
         self.score_threshold = score_threshold
         self.enable_git_versioning = enable_git_versioning
+        self.ingest_mode: IngestMode = ingest_mode
 
         _, snapshot_path = ensure_store_dirs(self.memory_path)
 
+        self.git_committer: GitCommitter | None = None
         if self.enable_git_versioning:
             init_repo(self.memory_path)
+            self.git_committer = GitCommitter(self.memory_path)
 
         logger.info("Initializing memory collection...")
         self.collection: Collection = init_memory_collection(
@@ -83,26 +92,35 @@ class MemoryClient:
         initial_index(self.collection, self.memory_path, index=self.index)
 
         logger.info("Loading reranker model...")
-        self.reranker_model: OnnxCrossEncoder = get_reranker_model()
+        self.reranker_model = RerankBatcher(get_reranker_model())
+        self.retrieval_cache: RetrievalCache[tuple[MemoryRetrieval, list[str]]] = RetrievalCache()
+        self.agents = MemoryAgents()
+        self.ingestion_queue: IngestionQueue[PendingTurn] = IngestionQueue(ingest_turns)
 
         self._watch_task: asyncio.Task | None = None
         if start_watcher:
             self.start()
 
     def start(self) -> None:
-        """Start the background file watcher."""
+        """Start the background file watcher and batched git committer."""
         if self._watch_task is None:
             self._watch_task = asyncio.create_task(
                 watch_memory_store(self.collection, self.memory_path, index=self.index),
             )
+        if self.git_committer is not None:
+            self.git_committer.start()
 
     async def stop(self) -> None:
-        """Stop the background file watcher."""
+        """Stop the file watcher, finish queued ingestion, flush git and close LLM connections."""
         if self._watch_task:
             self._watch_task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._watch_task
             self._watch_task = None
+        await self.ingestion_queue.drain(grace_seconds=_INGESTION_DRAIN_SECONDS)
+        if self.git_committer is not None:
+            await self.git_committer.aclose()
+        await self.agents.aclose()
 
     async def __aenter__(self) -> Self:
         """Start the client context."""
@@ -135,8 +153,13 @@ class MemoryClient:
             model=model,
             enable_git_versioning=self.enable_git_versioning,
             enable_summarization=self.enable_summarization,
+            agents=self.agents,
+            ingest_mode=self.ingest_mode,
+            git_committer=self.git_committer,
         )
         evict_if_needed(self.collection, self.memory_path, conversation_id, self.max_entries)
+        if self.git_committer is not None:
+            await self.git_committer.flush()
 
     async def search(
         self,
@@ -183,6 +206,7 @@ class MemoryClient:
             if score_threshold is not None
             else self.score_threshold,
             filters=filters,
+            cache=self.retrieval_cache,
         )
         return retrieval or MemoryRetrieval(entries=[])
 
@@ -270,4 +294,9 @@ class MemoryClient:
             postprocess_in_background=True,
             enable_git_versioning=self.enable_git_versioning,
             filters=filters,
+            retrieval_cache=self.retrieval_cache,
+            agents=self.agents,
+            ingest_mode=self.ingest_mode,
+            ingestion_queue=self.ingestion_queue,
+            git_committer=self.git_committer,
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from time import perf_counter
 from typing import TYPE_CHECKING, Any
@@ -12,7 +13,8 @@ from fastapi.responses import StreamingResponse
 
 from agent_cli.core.openai_proxy import forward_chat_request
 from agent_cli.memory import _streaming
-from agent_cli.memory._git import commit_changes
+from agent_cli.memory._files import conversation_paths
+from agent_cli.memory._git import commit_or_record
 from agent_cli.memory._ingest import extract_and_store_facts_and_summaries
 from agent_cli.memory._persistence import evict_if_needed, persist_entries
 from agent_cli.memory._retrieval import augment_chat_request
@@ -25,8 +27,13 @@ if TYPE_CHECKING:
 
     from chromadb import Collection
 
-    from agent_cli.core.reranker import OnnxCrossEncoder
-    from agent_cli.memory.models import ChatRequest
+    from agent_cli.core.reranker import OnnxCrossEncoder, RerankBatcher
+    from agent_cli.core.retrieval_cache import RetrievalCache
+    from agent_cli.memory._agents import MemoryAgents
+    from agent_cli.memory._git import GitCommitter
+    from agent_cli.memory._ingest import IngestMode
+    from agent_cli.memory._tasks import IngestionQueue
+    from agent_cli.memory.models import ChatRequest, MemoryRetrieval
 
 LOGGER = logging.getLogger(__name__)
 
@@ -97,22 +104,34 @@ def _persist_turns(
     )
 
 
+@dataclass(frozen=True)
+class PostprocessOptions:
+    """Settings for fact extraction, summarization and eviction after a turn."""
+
+    collection: Collection
+    memory_root: Path
+    openai_base_url: str
+    api_key: str | None
+    enable_summarization: bool
+    model: str
+    max_entries: int
+    enable_git_versioning: bool
+    agents: MemoryAgents | None = None
+    ingest_mode: IngestMode = "staged"
+    git_committer: GitCommitter | None = None
+
+
 async def _postprocess_after_turn(
+    options: PostprocessOptions,
     *,
-    collection: Collection,
-    memory_root: Path,
     conversation_id: str,
     user_message: str | None,
     assistant_message: str | None,
-    openai_base_url: str,
-    api_key: str | None,
-    enable_summarization: bool,
-    model: str,
-    max_entries: int,
-    enable_git_versioning: bool,
     user_turn_id: str | None = None,
 ) -> None:
     """Run summarization/fact extraction and eviction."""
+    collection = options.collection
+    memory_root = options.memory_root
     post_start = perf_counter()
     summary_start = perf_counter()
     await extract_and_store_facts_and_summaries(
@@ -121,12 +140,14 @@ async def _postprocess_after_turn(
         conversation_id=conversation_id,
         user_message=user_message,
         assistant_message=assistant_message,
-        openai_base_url=openai_base_url,
-        api_key=api_key,
-        model=model,
-        enable_git_versioning=enable_git_versioning,
+        openai_base_url=options.openai_base_url,
+        api_key=options.api_key,
+        model=options.model,
+        enable_git_versioning=False,  # One commit per turn, after eviction below
         source_id=user_turn_id,
-        enable_summarization=enable_summarization,
+        enable_summarization=options.enable_summarization,
+        agents=options.agents,
+        ingest_mode=options.ingest_mode,
     )
     LOGGER.info(
         "Updated facts and summaries in %.1f ms (conversation=%s)",
@@ -134,7 +155,7 @@ async def _postprocess_after_turn(
         conversation_id,
     )
     eviction_start = perf_counter()
-    evict_if_needed(collection, memory_root, conversation_id, max_entries)
+    evict_if_needed(collection, memory_root, conversation_id, options.max_entries)
     LOGGER.info(
         "Eviction check completed in %.1f ms (conversation=%s)",
         _elapsed_ms(eviction_start),
@@ -144,54 +165,84 @@ async def _postprocess_after_turn(
         "Post-processing finished in %.1f ms (conversation=%s, summarization=%s)",
         _elapsed_ms(post_start),
         conversation_id,
-        "enabled" if enable_summarization else "disabled",
+        "enabled" if options.enable_summarization else "disabled",
     )
 
-    if enable_git_versioning:
-        await commit_changes(memory_root, f"Update memory for conversation {conversation_id}")
+    if options.enable_git_versioning:
+        await commit_or_record(
+            memory_root,
+            f"Update memory for conversation {conversation_id}",
+            paths=conversation_paths(memory_root, conversation_id),
+            committer=options.git_committer,
+        )
+
+
+@dataclass
+class PendingTurn:
+    """A persisted turn waiting for fact extraction, summarization and eviction."""
+
+    user_message: str | None
+    assistant_message: str | None
+    user_turn_id: str | None
+    options: PostprocessOptions
+
+
+def _join_messages(messages: list[str | None]) -> str | None:
+    return "\n\n".join(m for m in messages if m) or None
+
+
+async def ingest_turns(conversation_id: str, turns: list[PendingTurn]) -> None:
+    """Post-process queued turns of one conversation as a single turn.
+
+    Messages are concatenated in order; settings come from the latest turn.
+    """
+    latest = turns[-1]
+    if len(turns) > 1:
+        LOGGER.info(
+            "Coalesced %d turns into one ingestion batch (conversation=%s)",
+            len(turns),
+            conversation_id,
+        )
+    await _postprocess_after_turn(
+        latest.options,
+        conversation_id=conversation_id,
+        user_message=_join_messages([t.user_message for t in turns]),
+        assistant_message=_join_messages([t.assistant_message for t in turns]),
+        user_turn_id=latest.user_turn_id,
+    )
 
 
 async def _stream_and_persist_response(
     *,
     forward_payload: dict[str, Any],
-    collection: Collection,
-    memory_root: Path,
+    options: PostprocessOptions,
     conversation_id: str,
     user_message: str | None,
-    openai_base_url: str,
-    api_key: str | None,
-    enable_summarization: bool,
-    model: str,
-    max_entries: int,
-    enable_git_versioning: bool,
     user_turn_id: str | None = None,
+    ingestion_queue: IngestionQueue[PendingTurn] | None = None,
 ) -> StreamingResponse:
     """Forward streaming request, tee assistant text, and persist after completion."""
-    headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+    headers = {"Authorization": f"Bearer {options.api_key}"} if options.api_key else None
     stream_start = perf_counter()
 
-    async def _persist_stream_result(assistant_message: str | None) -> None:
-        post_start = perf_counter()
+    def _persist_assistant_turn(assistant_message: str) -> None:
         _persist_turns(
-            collection,
-            memory_root=memory_root,
+            options.collection,
+            memory_root=options.memory_root,
             conversation_id=conversation_id,
             user_message=None,
             assistant_message=assistant_message,
             user_turn_id=None,  # Assistant turn doesn't reuse user ID
         )
+
+    async def _persist_stream_result(assistant_message: str) -> None:
+        post_start = perf_counter()
+        _persist_assistant_turn(assistant_message)
         await _postprocess_after_turn(
-            collection=collection,
-            memory_root=memory_root,
+            options,
             conversation_id=conversation_id,
             user_message=user_message,
             assistant_message=assistant_message,
-            openai_base_url=openai_base_url,
-            api_key=api_key,
-            enable_summarization=enable_summarization,
-            model=model,
-            max_entries=max_entries,
-            enable_git_versioning=enable_git_versioning,
             user_turn_id=user_turn_id,
         )
         LOGGER.info(
@@ -203,14 +254,20 @@ async def _stream_and_persist_response(
     async def tee_and_accumulate() -> AsyncGenerator[str, None]:
         assistant_chunks: list[str] = []
         async for line in _streaming.stream_chat_sse(
-            openai_base_url=openai_base_url,
+            openai_base_url=options.openai_base_url,
             payload=forward_payload,
             headers=headers,
         ):
             _streaming.accumulate_assistant_text(line, assistant_chunks)
             yield line + "\n\n"
         assistant_message = "".join(assistant_chunks).strip() or None
-        if assistant_message:
+        if assistant_message and ingestion_queue is not None:
+            _persist_assistant_turn(assistant_message)
+            ingestion_queue.submit(
+                conversation_id,
+                PendingTurn(user_message, assistant_message, user_turn_id, options),
+            )
+        elif assistant_message:
             run_in_background(
                 _persist_stream_result(assistant_message),
                 label=f"stream-postprocess-{conversation_id}",
@@ -229,7 +286,7 @@ async def process_chat_request(
     collection: Collection,
     memory_root: Path,
     openai_base_url: str,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     default_top_k: int = 5,
     api_key: str | None = None,
     enable_summarization: bool = True,
@@ -240,8 +297,17 @@ async def process_chat_request(
     postprocess_in_background: bool = True,
     enable_git_versioning: bool = False,
     filters: dict[str, Any] | None = None,
+    retrieval_cache: RetrievalCache[tuple[MemoryRetrieval, list[str]]] | None = None,
+    agents: MemoryAgents | None = None,
+    ingest_mode: IngestMode = "staged",
+    ingestion_queue: IngestionQueue[PendingTurn] | None = None,
+    git_committer: GitCommitter | None = None,
 ) -> Any:
-    """Process a chat request with long-term memory support."""
+    """Process a chat request with long-term memory support.
+
+    With an `ingestion_queue`, background post-processing goes through it
+    (serialized and coalesced per conversation) instead of one task per turn.
+    """
     overall_start = perf_counter()
     retrieval_start = perf_counter()
     aug_request, retrieval, conversation_id, _summaries = await augment_chat_request(
@@ -254,6 +320,7 @@ async def process_chat_request(
         recency_weight=recency_weight,
         score_threshold=score_threshold,
         filters=filters,
+        cache=retrieval_cache,
     )
     retrieval_ms = _elapsed_ms(retrieval_start)
     hit_count = len(retrieval.entries) if retrieval else 0
@@ -266,6 +333,19 @@ async def process_chat_request(
     )
 
     user_turn_id = str(uuid4())
+    options = PostprocessOptions(
+        collection=collection,
+        memory_root=memory_root,
+        openai_base_url=openai_base_url,
+        api_key=api_key,
+        enable_summarization=enable_summarization,
+        model=request.model,
+        max_entries=max_entries,
+        enable_git_versioning=enable_git_versioning,
+        agents=agents,
+        ingest_mode=ingest_mode,
+        git_committer=git_committer,
+    )
 
     if request.stream:
         LOGGER.info(
@@ -285,17 +365,11 @@ async def process_chat_request(
         forward_payload = aug_request.model_dump(exclude={"memory_id", "memory_top_k"})
         return await _stream_and_persist_response(
             forward_payload=forward_payload,
-            collection=collection,
-            memory_root=memory_root,
+            options=options,
             conversation_id=conversation_id,
             user_message=user_message,
-            openai_base_url=openai_base_url,
-            api_key=api_key,
-            enable_summarization=enable_summarization,
-            model=request.model,
-            max_entries=max_entries,
-            enable_git_versioning=enable_git_versioning,
             user_turn_id=user_turn_id,
+            ingestion_queue=ingestion_queue,
         )
 
     llm_start = perf_counter()
@@ -327,26 +401,16 @@ async def process_chat_request(
         user_turn_id=user_turn_id,
     )
 
-    async def run_postprocess() -> None:
-        await _postprocess_after_turn(
-            collection=collection,
-            memory_root=memory_root,
-            conversation_id=conversation_id,
-            user_message=user_message,
-            assistant_message=assistant_message,
-            openai_base_url=openai_base_url,
-            api_key=api_key,
-            enable_summarization=enable_summarization,
-            model=request.model,
-            max_entries=max_entries,
-            enable_git_versioning=enable_git_versioning,
-            user_turn_id=user_turn_id,
-        )
-
-    if postprocess_in_background:
-        run_in_background(run_postprocess(), label=f"postprocess-{conversation_id}")
+    turn = PendingTurn(user_message, assistant_message, user_turn_id, options)
+    if not postprocess_in_background:
+        await ingest_turns(conversation_id, [turn])
+    elif ingestion_queue is not None:
+        ingestion_queue.submit(conversation_id, turn)
     else:
-        await run_postprocess()
+        run_in_background(
+            ingest_turns(conversation_id, [turn]),
+            label=f"postprocess-{conversation_id}",
+        )
 
     response["memory_hits"] = (
         [entry.model_dump() for entry in retrieval.entries] if retrieval else []
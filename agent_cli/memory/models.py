@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Message(BaseModel):
@@ -110,3 +110,11 @@ class MemoryIgnore(BaseModel):
 
 
 MemoryDecision = MemoryAdd | MemoryUpdate | MemoryDelete | MemoryIgnore
+
+
+class FusedIngestOutput(BaseModel):
+    """Facts, reconciliation decisions and summary from one LLM call."""
+
+    facts: list[str] = Field(default_factory=list)
+    decisions: list[MemoryDecision] = Field(default_factory=list)
+    summary: str | None = None
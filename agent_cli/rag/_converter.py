@@ -0,0 +1,101 @@
+"""Rich-document conversion in a warm process pool, cached on disk by file hash.
+
+MarkItDown conversion is CPU-bound and holds the GIL, so it runs in worker
+processes that each keep one converter alive. Converted markdown is stored
+under the file's content hash, so re-indexing, `read_full_document` and
+`RagClient.add_file` never convert the same binary document twice.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from agent_cli.rag import _utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+CONVERSION_CACHE_DIRNAME = "converted"
+
+# One warm MarkItDown instance per worker process (set by `_init_worker`).
+_WORKER_MARKITDOWN: Any = None
+
+
+def _init_worker() -> None:
+    global _WORKER_MARKITDOWN
+    _WORKER_MARKITDOWN = _utils._markitdown_class()()
+
+
+def _convert_in_worker(file_path: str) -> str:
+    return _WORKER_MARKITDOWN.convert(file_path).text_content
+
+
+class DocumentConverter:
+    """Load document text, converting rich formats in a shared process pool.
+
+    Plain-text files are read in the calling thread. The pool is started on the
+    first rich document, so text-only folders never spawn worker processes.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_workers: int = 2) -> None:
+        """Cache converted markdown in `cache_dir` (no caching if None)."""
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self._pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def load(self, file_path: Path, file_hash: str | None = None) -> str | None:
+        """Return the text of `file_path`, or None if unsupported or unreadable.
+
+        Pass `file_hash` when the caller already computed it to avoid rehashing.
+        """
+        if file_path.suffix.lower() not in _utils.MARKITDOWN_EXTENSIONS:
+            return _utils.load_document_text(file_path)
+
+        try:
+            cache_file = None
+            if self.cache_dir is not None:
+                file_hash = file_hash or _utils.get_file_hash(file_path)
+                cache_file = self.cache_dir / f"{file_hash}.md"
+                if cache_file.exists():
+                    return cache_file.read_text(encoding="utf-8")
+
+            text = self._convert(file_path)
+            if cache_file is not None:
+                # Write-then-rename so concurrent readers never see a partial file
+                tmp = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                tmp.replace(cache_file)
+            return text
+        except Exception:
+            LOGGER.exception("Failed to load %s", file_path)
+            return None
+
+    def _convert(self, file_path: Path) -> str:
+        return self._executor().submit(_convert_in_worker, str(file_path)).result()
+
+    def _executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; a later `load` starts a fresh pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
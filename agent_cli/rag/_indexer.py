@@ -5,9 +5,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from agent_cli.core.watch import watch_directory
-from agent_cli.rag._indexing import index_file, remove_file
-from agent_cli.rag._utils import load_gitignore_patterns, should_ignore_path
+from agent_cli.core.watch import watch_directory_batched
+from agent_cli.rag._indexing import index_files, remove_file
+from agent_cli.rag._utils import load_gitignore_matcher, should_ignore_path
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     from chromadb import Collection
     from watchfiles import Change
 
+    from agent_cli.rag._converter import DocumentConverter
+    from agent_cli.rag._utils import GitignoreMatcher
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -23,49 +26,55 @@ async def watch_docs(
     docs_folder: Path,
     file_hashes: dict[str, str],
     file_mtimes: dict[str, float],
+    converter: DocumentConverter | None = None,
+    gitignore: GitignoreMatcher | None = None,
 ) -> None:
-    """Watch docs folder for changes and update index asynchronously."""
+    """Watch docs folder for changes and update index asynchronously.
+
+    Bursts of events are coalesced per path and applied in batches.
+    """
     LOGGER.info("📁 Watching folder: %s", docs_folder)
-    gitignore_patterns = load_gitignore_patterns(docs_folder)
+    matcher = gitignore or load_gitignore_matcher(docs_folder)
 
     def ignore_filter(path: Path, base_folder: Path) -> bool:
-        return should_ignore_path(path, base_folder, gitignore_patterns=gitignore_patterns)
+        return should_ignore_path(path, base_folder, gitignore_patterns=matcher)
 
-    await watch_directory(
+    await watch_directory_batched(
         docs_folder,
-        lambda change, path: _handle_change(
-            change,
-            path,
+        lambda changes: _handle_changes(
+            changes,
             collection,
             docs_folder,
             file_hashes,
             file_mtimes,
+            converter,
         ),
         ignore_filter=ignore_filter,
     )
 
 
-def _handle_change(
-    change: Change,
-    file_path: Path,
+def _handle_changes(
+    changes: list[tuple[Change, Path]],
     collection: Collection,
     docs_folder: Path,
     file_hashes: dict[str, str],
     file_mtimes: dict[str, float],
+    converter: DocumentConverter | None = None,
 ) -> None:
     from watchfiles import Change  # noqa: PLC0415
 
-    try:
-        if change == Change.deleted:
-            LOGGER.info("[deleted] Removing from index: %s", file_path.name)
-            remove_file(collection, docs_folder, file_path, file_hashes, file_mtimes)
-            return
-        if change in {Change.added, Change.modified} and file_path.is_file():
-            action = "created" if change == Change.added else "modified"
-            LOGGER.info("[%s] Indexing: %s", action, file_path.name)
-            index_file(collection, docs_folder, file_path, file_hashes, file_mtimes)
-    except (OSError, UnicodeDecodeError):
-        LOGGER.warning("Watcher handler transient IO error for %s", file_path, exc_info=True)
-    except Exception:
-        LOGGER.exception("Watcher handler failed for %s", file_path)
-        raise
+    to_index: list[Path] = []
+    for change, file_path in changes:
+        try:
+            if change == Change.deleted:
+                LOGGER.info("[deleted] Removing from index: %s", file_path.name)
+                remove_file(collection, docs_folder, file_path, file_hashes, file_mtimes)
+            elif change in {Change.added, Change.modified} and file_path.is_file():
+                action = "created" if change == Change.added else "modified"
+                LOGGER.info("[%s] Indexing: %s", action, file_path.name)
+                to_index.append(file_path)
+        except OSError:
+            LOGGER.warning("Watcher handler transient IO error for %s", file_path, exc_info=True)
+
+    if to_index:
+        index_files(collection, docs_folder, to_index, file_hashes, file_mtimes, converter)
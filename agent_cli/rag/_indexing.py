@@ -4,26 +4,66 @@ from __future__ import annotations
 
 import concurrent.futures
 import datetime
+import hashlib
 import logging
-from typing import TYPE_CHECKING
-
-from agent_cli.rag._store import delete_by_file_path, get_all_metadata, upsert_docs
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from agent_cli.core.chroma import embed_documents
+from agent_cli.rag._converter import DocumentConverter
+from agent_cli.rag._pipeline import (
+    DONE,
+    AdaptiveBatchSize,
+    BulkIndexConfig,
+    IndexProgress,
+    drain,
+    start_stage,
+)
+from agent_cli.rag._store import (
+    delete_by_file_path,
+    delete_docs,
+    get_all_metadata,
+    get_chunks_by_file,
+    get_file_chunks,
+    update_doc_metadata,
+    upsert_docs,
+)
 from agent_cli.rag._utils import (
+    SUPPORTED_EXTENSIONS,
     chunk_text,
     get_file_hash,
+    iter_indexable_files,
     load_document_text,
-    load_gitignore_patterns,
-    should_ignore_path,
+    load_gitignore_matcher,
 )
 from agent_cli.rag.models import DocMetadata
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from chromadb import Collection
 
+    from agent_cli.rag._utils import GitignoreMatcher
+
 LOGGER = logging.getLogger(__name__)
 
+# 4xx statuses that say nothing about the input; the rest (400, 413, 422, ...)
+# may be caused by one oversized or malformed chunk
+_NON_INPUT_STATUSES = frozenset({401, 403, 404, 408, 429})
+
+
+def _is_input_error(exc: Exception) -> bool:
+    """Whether an embedding error depends on the input, so a smaller batch may pass.
+
+    Transport errors (connection refused, timeouts, 5xx) fail any batch alike.
+    """
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status not in _NON_INPUT_STATUSES  # noqa: PLR2004
+
 
 def load_hashes_from_metadata(collection: Collection) -> tuple[dict[str, str], dict[str, float]]:
     """Rebuild hash and mtime caches from existing DB.
@@ -43,16 +83,181 @@ def load_hashes_from_metadata(collection: Collection) -> tuple[dict[str, str], d
     return file_hashes, file_mtimes
 
 
+def _chunk_ids(relative_path: str, chunks: list[str]) -> Iterator[tuple[str, str, str]]:
+    """Yield (doc_id, chunk, chunk_hash) with IDs derived from chunk content.
+
+    Identical chunks within one file get an occurrence suffix to stay unique.
+    """
+    seen: dict[str, int] = {}
+    for chunk in chunks:
+        chunk_hash = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+        occurrence = seen.get(chunk_hash, 0)
+        seen[chunk_hash] = occurrence + 1
+        suffix = f":{occurrence}" if occurrence else ""
+        yield f"{relative_path}:chunk:{chunk_hash[:16]}{suffix}", chunk, chunk_hash
+
+
+@dataclass
+class _ChunkPlan:
+    """Chunks of one file split into what must be embedded, kept or deleted."""
+
+    file_name: str
+    relative_path: str
+    file_hash: str
+    file_mtime: float
+    total_chunks: int
+    new_ids: list[str] = field(default_factory=list)
+    new_docs: list[str] = field(default_factory=list)
+    new_metas: list[DocMetadata] = field(default_factory=list)
+    kept_ids: list[str] = field(default_factory=list)
+    kept_metas: list[DocMetadata] = field(default_factory=list)
+    stale_ids: list[str] = field(default_factory=list)
+    # Bulk indexer bookkeeping: chunks not yet upserted, and whether any failed
+    pending: int = 0
+    failed: bool = False
+
+
+def _detect_change(
+    file_path: Path,
+    relative_path: str,
+    file_hashes: dict[str, str],
+    file_mtimes: dict[str, float],
+) -> tuple[str, float] | None:
+    """Return (hash, mtime) if the file changed since it was indexed, else None.
+
+    Uses mtime-first checking for performance: only computes hash if mtime changed.
+    """
+    current_mtime = file_path.stat().st_mtime
+
+    # Fast path: mtime unchanged → skip (no hash computation needed)
+    if relative_path in file_mtimes and file_mtimes[relative_path] == current_mtime:
+        return None
+
+    # mtime changed or new file: verify with hash
+    current_hash = get_file_hash(file_path)
+
+    # Hash unchanged (file was touched but not modified) → update mtime, skip
+    if relative_path in file_hashes and file_hashes[relative_path] == current_hash:
+        file_mtimes[relative_path] = current_mtime
+        return None
+    return current_hash, current_mtime
+
+
+def _plan_chunks(
+    file_path: Path,
+    relative_path: str,
+    text: str | None,
+    stored: dict[str, dict[str, Any]],
+    current_hash: str,
+    current_mtime: float,
+) -> _ChunkPlan | None:
+    """Chunk `text` and diff content-addressed chunk IDs against `stored`.
+
+    Returns None if the document is unsupported, empty, or yields no chunks.
+    """
+    chunks = chunk_text(text) if text and text.strip() else []
+    if not chunks:
+        return None
+
+    plan = _ChunkPlan(
+        file_name=file_path.name,
+        relative_path=relative_path,
+        file_hash=current_hash,
+        file_mtime=current_mtime,
+        total_chunks=len(chunks),
+    )
+    timestamp = datetime.datetime.now(datetime.UTC).isoformat()
+    for i, (doc_id, chunk, chunk_hash) in enumerate(_chunk_ids(relative_path, chunks)):
+        meta = DocMetadata(
+            source=file_path.name,
+            file_path=relative_path,
+            file_type=file_path.suffix,
+            chunk_id=i,
+            total_chunks=len(chunks),
+            indexed_at=timestamp,
+            file_hash=current_hash,
+            file_mtime=current_mtime,
+            chunk_hash=chunk_hash,
+        )
+        if stored.get(doc_id, {}).get("chunk_hash") == chunk_hash:
+            plan.kept_ids.append(doc_id)
+            plan.kept_metas.append(meta)
+        else:
+            plan.new_ids.append(doc_id)
+            plan.new_docs.append(chunk)
+            plan.new_metas.append(meta)
+    plan.stale_ids = sorted(set(stored) - set(plan.new_ids) - set(plan.kept_ids))
+    return plan
+
+
+def _finish_plan(
+    collection: Collection,
+    plan: _ChunkPlan,
+    file_hashes: dict[str, str],
+    file_mtimes: dict[str, float],
+) -> None:
+    """Refresh kept chunks, drop stale ones and track the file as indexed.
+
+    Called after the plan's new chunks are upserted, so the file is never
+    missing from the index mid-update.
+    """
+    update_doc_metadata(collection, plan.kept_ids, plan.kept_metas)
+    delete_docs(collection, plan.stale_ids)
+    file_hashes[plan.relative_path] = plan.file_hash
+    file_mtimes[plan.relative_path] = plan.file_mtime
+
+
+def _prepare_file(
+    collection: Collection,
+    docs_folder: Path,
+    file_path: Path,
+    file_hashes: dict[str, str],
+    file_mtimes: dict[str, float],
+    converter: DocumentConverter | None,
+) -> _ChunkPlan | None:
+    """Load, chunk and diff a changed file; None if unchanged or not indexable."""
+    relative_path = str(file_path.relative_to(docs_folder))
+    change = _detect_change(file_path, relative_path, file_hashes, file_mtimes)
+    if change is None:
+        return None
+    current_hash, current_mtime = change
+
+    # Load, chunk and diff against what is stored for this file
+    if converter is not None:
+        text = converter.load(file_path, current_hash)
+    else:
+        text = load_document_text(file_path)
+    stored = get_file_chunks(collection, relative_path)
+    plan = _plan_chunks(file_path, relative_path, text, stored, current_hash, current_mtime)
+    if plan is None:
+        remove_file(collection, docs_folder, file_path, file_hashes, file_mtimes)
+        return None  # Unsupported, empty, or no chunks
+    return plan
+
+
+def _log_indexed(plan: _ChunkPlan) -> None:
+    LOGGER.info(
+        "  ✓ Indexed %s: %d chunks (%d new, %d unchanged, %d removed)",
+        plan.file_name,
+        plan.total_chunks,
+        len(plan.new_ids),
+        len(plan.kept_ids),
+        len(plan.stale_ids),
+    )
+
+
 def index_file(
     collection: Collection,
     docs_folder: Path,
     file_path: Path,
     file_hashes: dict[str, str],
     file_mtimes: dict[str, float],
+    converter: DocumentConverter | None = None,
 ) -> bool:
     """Index or reindex a single file.
 
     Uses mtime-first checking for performance: only computes hash if mtime changed.
+    Rich documents go through `converter` (and its cache) when one is given.
 
     Returns:
         True if the file was indexed (changed or new), False otherwise.
@@ -63,73 +268,87 @@ def index_file(
     LOGGER.info("  📄 Processing: %s", file_path.name)
 
     try:
-        relative_path = str(file_path.relative_to(docs_folder))
-        current_mtime = file_path.stat().st_mtime
-
-        # Fast path: mtime unchanged → skip (no hash computation needed)
-        if relative_path in file_mtimes and file_mtimes[relative_path] == current_mtime:
+        plan = _prepare_file(
+            collection,
+            docs_folder,
+            file_path,
+            file_hashes,
+            file_mtimes,
+            converter,
+        )
+        if plan is None:
             return False
 
-        # mtime changed or new file: verify with hash
-        current_hash = get_file_hash(file_path)
+        upsert_docs(collection, plan.new_ids, plan.new_docs, plan.new_metas)
+        _finish_plan(collection, plan, file_hashes, file_mtimes)
+        _log_indexed(plan)
+        return True
 
-        # Hash unchanged (file was touched but not modified) → update mtime, skip
-        if relative_path in file_hashes and file_hashes[relative_path] == current_hash:
-            file_mtimes[relative_path] = current_mtime
-            return False
+    except Exception:
+        LOGGER.exception("Failed to index file %s", file_path)
+        return False
 
-        # Remove old chunks first (atomic-ish update)
-        remove_file(collection, docs_folder, file_path, file_hashes, file_mtimes)
 
-        # Load and chunk document
-        text = load_document_text(file_path)
-        chunks = chunk_text(text) if text and text.strip() else []
-        if not chunks:
-            return False  # Unsupported, empty, or no chunks
-
-        # Index chunks
-        ids = []
-        documents = []
-        metadatas = []
-
-        timestamp = datetime.datetime.now(datetime.UTC).isoformat()
-
-        for i, chunk in enumerate(chunks):
-            doc_id = f"{relative_path}:chunk:{i}"
-            ids.append(doc_id)
-            documents.append(chunk)
-            metadatas.append(
-                DocMetadata(
-                    source=file_path.name,
-                    file_path=relative_path,
-                    file_type=file_path.suffix,
-                    chunk_id=i,
-                    total_chunks=len(chunks),
-                    indexed_at=timestamp,
-                    file_hash=current_hash,
-                    file_mtime=current_mtime,
-                ),
-            )
+def index_files(
+    collection: Collection,
+    docs_folder: Path,
+    file_paths: list[Path],
+    file_hashes: dict[str, str],
+    file_mtimes: dict[str, float],
+    converter: DocumentConverter | None = None,
+) -> list[Path]:
+    """Index or reindex several files, upserting their new chunks together.
 
-        # Upsert to ChromaDB in batches to avoid 502s from large payloads
-        # Use small batch size (10) to avoid overwhelming embedding servers
-        batch_size = 10
-        for i in range(0, len(ids), batch_size):
-            batch_ids = ids[i : i + batch_size]
-            batch_docs = documents[i : i + batch_size]
-            batch_meta = metadatas[i : i + batch_size]
-            upsert_docs(collection, batch_ids, batch_docs, batch_meta)
-
-        # Update tracking
-        file_hashes[relative_path] = current_hash
-        file_mtimes[relative_path] = current_mtime
+    Like `index_file`, but the new chunks of all changed files share embedding
+    batches. If that upsert fails, none of the files is marked as indexed.
 
-        LOGGER.info("  ✓ Indexed %s: %d chunks", file_path.name, len(chunks))
-        return True
+    Returns:
+        The files that were indexed (changed or new).
 
+    """
+    plans: list[tuple[Path, _ChunkPlan]] = []
+    for file_path in file_paths:
+        if not file_path.exists():
+            continue
+        LOGGER.info("  📄 Processing: %s", file_path.name)
+        try:
+            plan = _prepare_file(
+                collection,
+                docs_folder,
+                file_path,
+                file_hashes,
+                file_mtimes,
+                converter,
+            )
+        except Exception:
+            LOGGER.exception("Failed to index file %s", file_path)
+            continue
+        if plan is not None:
+            plans.append((file_path, plan))
+
+    if not plans:
+        return []
+    try:
+        upsert_docs(
+            collection,
+            [doc_id for _, plan in plans for doc_id in plan.new_ids],
+            [doc for _, plan in plans for doc in plan.new_docs],
+            [meta for _, plan in plans for meta in plan.new_metas],
+        )
     except Exception:
-        LOGGER.exception("Failed to index file %s", file_path)
-        return False
+        LOGGER.exception("Failed to index %d files", len(plans))
+        return []
+
+    indexed: list[Path] = []
+    for file_path, plan in plans:
+        try:
+            _finish_plan(collection, plan, file_hashes, file_mtimes)
+        except Exception:
+            LOGGER.exception("Failed to index file %s", file_path)
+            continue
+        _log_indexed(plan)
+        indexed.append(file_path)
+    return indexed
 
 
 def remove_file(
@@ -162,60 +381,334 @@ def remove_file(
         return False
 
 
+@dataclass
+class _EmbeddedBatch:
+    """Chunks (as plan + index pairs) with their vectors, ready to upsert."""
+
+    items: list[tuple[_ChunkPlan, int]]
+    vectors: list[Any] | None
+    failed: bool = False
+
+
+class _BulkIndexer:
+    """Staged pipeline behind `initial_index`.
+
+    walk → load/convert → chunk+diff → embed → upsert, with bounded queues in
+    between and a configurable worker count per stage.
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        docs_folder: Path,
+        file_hashes: dict[str, str],
+        file_mtimes: dict[str, float],
+        config: BulkIndexConfig,
+        converter: DocumentConverter | None,
+        gitignore: GitignoreMatcher | None,
+    ) -> None:
+        self.collection = collection
+        self.docs_folder = docs_folder
+        self.file_hashes = file_hashes
+        self.file_mtimes = file_mtimes
+        self.config = config
+        self.gitignore = gitignore
+        self.progress = IndexProgress()
+        self.batch_size = AdaptiveBatchSize(
+            config.embed_batch_size,
+            config.min_embed_batch_size,
+            config.max_embed_batch_size,
+            config.target_embed_seconds,
+        )
+        self.paths_found_on_disk: set[str] = set()
+        self.processed_files: list[str] = []
+        self._stored_by_file: dict[str, dict[str, dict[str, Any]]] = {}
+        self._dispatch_error: Exception | None = None
+        # Set when a downstream stage fails so upstream stages stop working
+        # and drain their queues instead of blocking on a full one forever
+        self._stop = threading.Event()
+        # Without a shared converter, use a private one for this scan only
+        self._owns_converter = converter is None
+        self.converter = converter or DocumentConverter(max_workers=config.convert_workers)
+
+    def run(self) -> None:
+        config = self.config
+        # One read of all stored chunk metadata instead of one query per file
+        self._stored_by_file = get_chunks_by_file(self.collection)
+
+        path_q: queue.Queue[Any] = queue.Queue(maxsize=config.scan_queue_size)
+        text_q: queue.Queue[Any] = queue.Queue(maxsize=config.queue_size)
+        plan_q: queue.Queue[Any] = queue.Queue(maxsize=config.queue_size)
+        write_q: queue.Queue[Any] = queue.Queue(maxsize=config.queue_size)
+
+        walker = threading.Thread(target=self._walk, args=(path_q,), name="rag-walk", daemon=True)
+        walker.start()
+        start_stage(
+            "load",
+            self._load,
+            path_q,
+            text_q,
+            config.convert_workers,
+            self.progress,
+            self._stop,
+        )
+        start_stage(
+            "chunk",
+            self._chunk,
+            text_q,
+            plan_q,
+            config.chunk_workers,
+            self.progress,
+            self._stop,
+        )
+        embedder = threading.Thread(
+            target=self._embed_dispatch,
+            args=(plan_q, write_q),
+            name="rag-embed",
+            daemon=True,
+        )
+        embedder.start()
+        try:
+            self._write(write_q)
+        except BaseException:
+            self._stop.set()
+            drain(write_q)
+            raise
+        finally:
+            if self._owns_converter:
+                self.converter.shutdown()
+        embedder.join()
+        if self._dispatch_error is not None:
+            raise self._dispatch_error
+
+    # Stage 1: walk and filter paths
+    def _walk(self, path_q: queue.Queue[Any]) -> None:
+        try:
+            gitignore = self.gitignore or load_gitignore_matcher(self.docs_folder)
+            if gitignore:
+                LOGGER.info("📋 Loaded %d .gitignore patterns", len(gitignore))
+            for path in iter_indexable_files(self.docs_folder, gitignore=gitignore):
+                if self._stop.is_set():
+                    break
+                # Track that we found this file (regardless of index result)
+                self.paths_found_on_disk.add(str(path.relative_to(self.docs_folder)))
+                self.progress.add(files_found=1)
+                if path.suffix.lower() in SUPPORTED_EXTENSIONS:
+                    path_q.put(path)
+        except Exception:
+            LOGGER.exception("Error scanning %s", self.docs_folder)
+            self.progress.add(errors=1)
+        finally:
+            path_q.put(DONE)
+
+    # Stage 2: change detection and document conversion
+    def _load(self, file_path: Path) -> Iterator[tuple[Path, str, str, float, str | None]]:
+        relative_path = str(file_path.relative_to(self.docs_folder))
+        change = _detect_change(file_path, relative_path, self.file_hashes, self.file_mtimes)
+        if change is None:
+            self.progress.add(files_skipped=1)
+            return
+        text = self.converter.load(file_path, change[0])
+        self.progress.add(files_converted=1)
+        yield file_path, relative_path, *change, text
+
+    # Stage 3: chunk and diff
+    def _chunk(self, item: tuple[Path, str, str, float, str | None]) -> Iterator[_ChunkPlan]:
+        file_path, relative_path, current_hash, current_mtime, text = item
+        stored = self._stored_by_file.get(relative_path, {})
+        plan = _plan_chunks(file_path, relative_path, text, stored, current_hash, current_mtime)
+        if plan is None:
+            if stored or relative_path in self.file_hashes:
+                remove_file(
+                    self.collection,
+                    self.docs_folder,
+                    file_path,
+                    self.file_hashes,
+                    self.file_mtimes,
+                )
+            return
+        yield plan
+
+    # Stage 4: batch new chunks across files and embed them concurrently
+    def _embed_dispatch(self, plan_q: queue.Queue[Any], write_q: queue.Queue[Any]) -> None:
+        try:
+            self._dispatch(plan_q, write_q)
+        except Exception as exc:
+            # Re-raised by `run` once the writer has drained what was embedded
+            self._dispatch_error = exc
+            self._stop.set()
+            drain(plan_q)
+        finally:
+            write_q.put(DONE)
+
+    def _dispatch(self, plan_q: queue.Queue[Any], write_q: queue.Queue[Any]) -> None:
+        in_flight = threading.Semaphore(2 * self.config.embed_workers)
+        buffer: list[tuple[_ChunkPlan, int]] = []
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.embed_workers,
+            thread_name_prefix="rag-embed",
+        ) as executor:
+
+            def submit(items: list[tuple[_ChunkPlan, int]]) -> None:
+                in_flight.acquire()
+                future = executor.submit(self._embed_batch, items, write_q)
+                future.add_done_callback(lambda _f: in_flight.release())
+
+            while True:
+                try:
+                    # Flush a partial batch rather than wait when input stalls
+                    plan = plan_q.get(timeout=0.05) if buffer else plan_q.get()
+                except queue.Empty:
+                    submit(buffer)
+                    buffer = []
+                    continue
+                if plan is DONE:
+                    plan_q.put(DONE)  # keeps a later drain() from blocking
+                    break
+                if self._stop.is_set():
+                    continue
+                if not plan.new_ids:
+                    write_q.put(plan)
+                    continue
+                plan.pending = len(plan.new_ids)
+                buffer.extend((plan, i) for i in range(len(plan.new_ids)))
+                while len(buffer) >= (size := self.batch_size.size):
+                    submit(buffer[:size])
+                    buffer = buffer[size:]
+            if buffer:
+                submit(buffer)
+
+    def _embed_batch(
+        self,
+        items: list[tuple[_ChunkPlan, int]],
+        write_q: queue.Queue[Any],
+    ) -> None:
+        docs = [plan.new_docs[i] for plan, i in items]
+        start = time.monotonic()
+        try:
+            vectors = embed_documents(self.collection, docs)
+        except Exception as exc:
+            self.batch_size.record_failure()
+            if len(items) > 1 and _is_input_error(exc):
+                # Bisect to isolate the chunk the server rejects
+                mid = len(items) // 2
+                self._embed_batch(items[:mid], write_q)
+                self._embed_batch(items[mid:], write_q)
+                return
+            if len(items) > 1:
+                LOGGER.exception("Failed to embed a batch of %d chunks", len(items))
+            else:
+                LOGGER.exception("Failed to embed chunk of %s", items[0][0].relative_path)
+            self.progress.add(errors=1)
+            write_q.put(_EmbeddedBatch(items, None, failed=True))
+            return
+        self.batch_size.record_success(len(items), time.monotonic() - start)
+        self.progress.add(chunks_embedded=len(items), embed_batches=1)
+        write_q.put(_EmbeddedBatch(items, vectors))
+
+    # Stage 5: bulk upsert (single writer) and per-file bookkeeping
+    def _write(self, write_q: queue.Queue[Any]) -> None:
+        rows: list[_EmbeddedBatch] = []
+        row_count = 0
+        while True:
+            self.progress.maybe_log(self.config.progress_interval)
+            try:
+                item = write_q.get(timeout=0.1 if rows else self.config.progress_interval)
+            except queue.Empty:
+                self._flush(rows)
+                rows = []
+                row_count = 0
+                continue
+            if item is DONE:
+                break
+            if isinstance(item, _ChunkPlan):
+                self._complete(item)
+                continue
+            rows.append(item)
+            row_count += len(item.items)
+            if row_count >= self.config.upsert_batch_size:
+                self._flush(rows)
+                rows = []
+                row_count = 0
+        self._flush(rows)
+
+    def _flush(self, batches: list[_EmbeddedBatch]) -> None:
+        ok = [b for b in batches if not b.failed]
+        items = [item for b in ok for item in b.items]
+        if items:
+            vectors = None
+            if all(b.vectors is not None for b in ok):
+                vectors = [vec for b in ok for vec in b.vectors or []]
+            try:
+                upsert_docs(
+                    self.collection,
+                    [plan.new_ids[i] for plan, i in items],
+                    [plan.new_docs[i] for plan, i in items],
+                    [plan.new_metas[i] for plan, i in items],
+                    embeddings=vectors,
+                    batch_size=self.config.upsert_batch_size,
+                )
+            except Exception:
+                LOGGER.exception("Failed to upsert %d chunks", len(items))
+                self.progress.add(errors=1)
+                for plan, _ in items:
+                    plan.failed = True
+        for batch in batches:
+            for plan, _ in batch.items:
+                plan.failed |= batch.failed
+                plan.pending -= 1
+                if plan.pending == 0:
+                    self._complete(plan)
+
+    def _complete(self, plan: _ChunkPlan) -> None:
+        if plan.failed:
+            return  # left untracked, so the next scan retries it
+        try:
+            _finish_plan(self.collection, plan, self.file_hashes, self.file_mtimes)
+        except Exception:
+            LOGGER.exception("Failed to finalize %s", plan.relative_path)
+            self.progress.add(errors=1)
+            return
+        self.progress.add(files_indexed=1)
+        self.processed_files.append(plan.file_name)
+
+
 def initial_index(
     collection: Collection,
     docs_folder: Path,
     file_hashes: dict[str, str],
     file_mtimes: dict[str, float],
+    config: BulkIndexConfig | None = None,
+    converter: DocumentConverter | None = None,
+    gitignore: GitignoreMatcher | None = None,
 ) -> None:
-    """Index all existing files on startup and remove deleted ones."""
+    """Index all existing files on startup and remove deleted ones.
+
+    Pass `gitignore` to share a compiled matcher (e.g. with the file watcher);
+    otherwise the .gitignore files are loaded for this scan.
+    """
     LOGGER.info("🔍 Scanning existing files...")
 
     # Snapshot of what's in the DB currently
     paths_in_db = set(file_hashes.keys())
-    paths_found_on_disk = set()
-
-    processed_files = []
     removed_files = []
 
-    # Load .gitignore patterns once for the entire scan
-    gitignore_patterns = load_gitignore_patterns(docs_folder)
-    if gitignore_patterns:
-        LOGGER.info("📋 Loaded %d .gitignore patterns", len(gitignore_patterns))
-
-    # Gather all files first, excluding hidden, common dev dirs, and gitignored paths
-    all_files = [
-        p
-        for p in docs_folder.rglob("*")
-        if p.is_file()
-        and not should_ignore_path(p, docs_folder, gitignore_patterns=gitignore_patterns)
-    ]
-
-    # 1. Index Existing Files in Parallel
-    # Use max_workers=4 to match typical local backend parallelism (e.g. llama-server -np 4)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        # Map futures to file paths
-        future_to_file = {
-            executor.submit(index_file, collection, docs_folder, f, file_hashes, file_mtimes): f
-            for f in all_files
-        }
-
-        for future in concurrent.futures.as_completed(future_to_file):
-            file_path = future_to_file[future]
-            try:
-                # Track that we found this file (regardless of index result)
-                rel_path = str(file_path.relative_to(docs_folder))
-                paths_found_on_disk.add(rel_path)
-
-                indexed = future.result()
-                if indexed:
-                    processed_files.append(file_path.name)
-            except Exception:
-                LOGGER.exception("Error processing %s", file_path.name)
+    # 1. Index Existing Files through the staged pipeline
+    indexer = _BulkIndexer(
+        collection,
+        docs_folder,
+        file_hashes,
+        file_mtimes,
+        config or BulkIndexConfig(),
+        converter,
+        gitignore,
+    )
+    indexer.run()
 
     # 2. Clean up Deleted Files
     # If it's in DB but not found on disk, it was deleted offline.
-    paths_to_remove = paths_in_db - paths_found_on_disk
+    paths_to_remove = paths_in_db - indexer.paths_found_on_disk
 
     if paths_to_remove:
         LOGGER.info("🧹 Cleaning up %d deleted files found in index...", len(paths_to_remove))
@@ -227,14 +720,15 @@ def initial_index(
             except Exception:
                 LOGGER.exception("Error removing stale file %s", rel_path)
 
-    if processed_files:
-        LOGGER.info("🆕 Added/Updated: %s", ", ".join(processed_files))
+    if indexer.processed_files:
+        LOGGER.info("🆕 Added/Updated: %s", ", ".join(indexer.processed_files))
 
     if removed_files:
         LOGGER.info("🗑️ Removed: %s", ", ".join(removed_files))
 
     LOGGER.info(
-        "✅ Initial scan complete. Indexed/Checked %d files, Removed %d stale files.",
-        len(paths_found_on_disk),
+        "✅ Initial scan complete. Indexed/Checked %d files, Removed %d stale files. %s",
+        len(indexer.paths_found_on_disk),
         len(removed_files),
+        indexer.progress.summary(),
     )
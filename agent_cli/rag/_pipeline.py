@@ -0,0 +1,168 @@
+"""Building blocks for the staged bulk indexer (see `_indexing.initial_index`).
+
+Stages run on their own worker threads and are connected by bounded queues,
+so a slow stage applies backpressure instead of buffering the whole tree.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import queue
+    from collections.abc import Callable, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+# Queue sentinel marking the end of a stage's input.
+DONE: Any = object()
+
+
+@dataclass
+class BulkIndexConfig:
+    """Worker counts and batch sizes for each stage of the bulk indexer."""
+
+    scan_queue_size: int = 1024
+    convert_workers: int = 4
+    chunk_workers: int = 2
+    embed_workers: int = 4
+    embed_batch_size: int = 64
+    min_embed_batch_size: int = 8
+    max_embed_batch_size: int = 512
+    target_embed_seconds: float = 2.0
+    upsert_batch_size: int = 512
+    queue_size: int = 64
+    progress_interval: float = 5.0
+
+
+@dataclass
+class IndexProgress:
+    """Thread-safe counters for progress and throughput reporting."""
+
+    files_found: int = 0
+    files_skipped: int = 0
+    files_converted: int = 0
+    files_indexed: int = 0
+    chunks_embedded: int = 0
+    embed_batches: int = 0
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    _last_log: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **counts: int) -> None:
+        """Increment the named counters."""
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def summary(self) -> str:
+        """Return a one-line progress summary with throughput."""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return (
+            f"{self.files_found} found, {self.files_skipped} unchanged, "
+            f"{self.files_converted} loaded, {self.files_indexed} indexed, "
+            f"{self.chunks_embedded} chunks in {self.embed_batches} batches, "
+            f"{self.errors} errors ({self.files_indexed / elapsed:.1f} files/s, "
+            f"{self.chunks_embedded / elapsed:.1f} chunks/s)"
+        )
+
+    def maybe_log(self, interval: float) -> None:
+        """Log the summary if `interval` seconds passed since the last log."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_log < interval:
+                return
+            self._last_log = now
+        LOGGER.info("⏳ Indexing: %s", self.summary())
+
+
+class AdaptiveBatchSize:
+    """Embedding batch size that grows while calls are fast and shrinks on failure."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int, target_seconds: float) -> None:
+        """Start at `initial`, staying within [`minimum`, `maximum`]."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self._size = max(minimum, min(initial, maximum))
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Current batch size."""
+        with self._lock:
+            return self._size
+
+    def record_success(self, batch_len: int, seconds: float) -> None:
+        """Grow after a fast full batch, shrink after a slow one."""
+        with self._lock:
+            if seconds > 2 * self.target_seconds:
+                self._size = max(self.minimum, self._size // 2)
+            elif seconds < self.target_seconds / 2 and batch_len >= self._size:
+                self._size = min(self.maximum, self._size * 2)
+
+    def record_failure(self) -> None:
+        """Halve the batch size after a failed call (e.g. 413/502 from the server)."""
+        with self._lock:
+            self._size = max(self.minimum, self._size // 2)
+
+
+def start_stage(
+    name: str,
+    worker: Callable[[Any], Iterable[Any]],
+    inbox: queue.Queue[Any],
+    outbox: queue.Queue[Any] | None,
+    workers: int,
+    progress: IndexProgress,
+    stop: threading.Event | None = None,
+) -> threading.Thread:
+    """Run `worker` on `workers` threads, forwarding its outputs to `outbox`.
+
+    Returns a thread that finishes (after passing `DONE` downstream) once all
+    workers have drained `inbox`. Once `stop` is set, remaining items are
+    discarded so the stage still drains and its threads exit.
+    """
+
+    def loop() -> None:
+        while True:
+            item = inbox.get()
+            if item is DONE:
+                inbox.put(DONE)  # let sibling workers see the end of input too
+                return
+            if stop is not None and stop.is_set():
+                continue
+            try:
+                for out in worker(item):
+                    if outbox is not None:
+                        outbox.put(out)
+            except Exception:
+                LOGGER.exception("%s stage failed for %s", name, item)
+                progress.add(errors=1)
+
+    threads = [
+        threading.Thread(target=loop, name=f"rag-{name}-{i}", daemon=True)
+        for i in range(max(1, workers))
+    ]
+    for thread in threads:
+        thread.start()
+
+    def close() -> None:
+        for thread in threads:
+            thread.join()
+        if outbox is not None:
+            outbox.put(DONE)
+
+    closer = threading.Thread(target=close, name=f"rag-{name}-close", daemon=True)
+    closer.start()
+    return closer
+
+
+def drain(inbox: queue.Queue[Any]) -> None:
+    """Consume and discard items until `DONE`, unblocking upstream producers."""
+    while inbox.get() is not DONE:
+        pass
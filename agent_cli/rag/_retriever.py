@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import TYPE_CHECKING
 
-from agent_cli.core.reranker import OnnxCrossEncoder, predict_relevance
+from agent_cli.core.chroma import collection_generation
+from agent_cli.core.reranker import OnnxCrossEncoder, RerankBatcher, predict_relevance
+from agent_cli.core.retrieval_cache import RetrievalCache, make_cache_key
 from agent_cli.rag._store import query_docs
 from agent_cli.rag.models import RagSource, RetrievalResult
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from chromadb import Collection
 
 LOGGER = logging.getLogger(__name__)
@@ -50,7 +56,7 @@ def format_context(
 
 
 def rerank_and_filter(
-    reranker: OnnxCrossEncoder,
+    reranker: OnnxCrossEncoder | RerankBatcher,
     query: str,
     docs: list[str],
     metas: list[dict],
@@ -107,10 +113,11 @@ def rerank_and_filter(
 
 def search_context(
     collection: Collection,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     query: str,
     top_k: int = 3,
     min_score: float = 0.2,
+    cache: RetrievalCache[RetrievalResult] | None = None,
 ) -> RetrievalResult:
     """Retrieve relevant context for a query using hybrid search.
 
@@ -120,11 +127,36 @@ def search_context(
         query: Search query string.
         top_k: Maximum number of results to return.
         min_score: Minimum relevance score threshold. Results below this are filtered out.
+        cache: Optional result cache; entries are invalidated when the collection changes.
 
     Returns:
         RetrievalResult with context and sources. Empty if no results meet min_score.
 
     """
+    if cache is None:
+        return _search_context_uncached(collection, reranker_model, query, top_k, min_score)
+
+    key = make_cache_key(query, top_k, min_score)
+    # Capture the generation before searching so a concurrent index update
+    # leaves this result stale instead of caching pre-update data as fresh.
+    generation = collection_generation(collection)
+    cached = cache.get(key, generation)
+    if cached is not None:
+        LOGGER.info("Retrieval cache hit for query: '%s'", query[:50])
+        return cached
+    result = _search_context_uncached(collection, reranker_model, query, top_k, min_score)
+    cache.put(key, generation, result)
+    return result
+
+
+def _search_context_uncached(
+    collection: Collection,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
+    query: str,
+    top_k: int,
+    min_score: float,
+) -> RetrievalResult:
+    """Run the Chroma query and rerank for `search_context`."""
     # Initial retrieval - fetch more candidates for reranking
     n_candidates = top_k * 3
     results = query_docs(collection, query, n_results=n_candidates)
@@ -154,3 +186,34 @@ def search_context(
     ]
 
     return RetrievalResult(context=context, sources=sources)
+
+
+async def search_context_async(
+    collection: Collection,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
+    query: str,
+    top_k: int = 3,
+    min_score: float = 0.2,
+    *,
+    executor: Executor | None = None,
+    cache: RetrievalCache[RetrievalResult] | None = None,
+) -> RetrievalResult:
+    """Run `search_context` on a worker thread so the event loop stays responsive.
+
+    The Chroma query and the ONNX rerank are both blocking. Pass a bounded
+    `executor` to cap concurrent retrievals; with a `RerankBatcher` as the
+    reranker, concurrent queries share ONNX batches.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            search_context,
+            collection,
+            reranker_model,
+            query,
+            top_k=top_k,
+            min_score=min_score,
+            cache=cache,
+        ),
+    )
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from agent_cli.core.chroma import delete_where, upsert
+from agent_cli.core.chroma import delete, delete_where, update_metadata, upsert
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -22,9 +22,33 @@ def upsert_docs(
     ids: list[str],
     documents: list[str],
     metadatas: Sequence[DocMetadata],
+    *,
+    embeddings: Sequence[Any] | None = None,
+    batch_size: int = 10,
 ) -> None:
     """Upsert documents into the collection."""
-    upsert(collection, ids=ids, documents=documents, metadatas=metadatas)
+    upsert(
+        collection,
+        ids=ids,
+        documents=documents,
+        metadatas=metadatas,
+        embeddings=embeddings,
+        batch_size=batch_size,
+    )
+
+
+def update_doc_metadata(
+    collection: Collection,
+    ids: list[str],
+    metadatas: Sequence[DocMetadata],
+) -> None:
+    """Update metadata of already-embedded chunks."""
+    update_metadata(collection, ids=ids, metadatas=metadatas)
+
+
+def delete_docs(collection: Collection, ids: list[str]) -> None:
+    """Delete chunks by ID."""
+    delete(collection, ids)
 
 
 def delete_by_file_path(collection: Collection, file_path: str) -> None:
@@ -32,6 +56,26 @@ def delete_by_file_path(collection: Collection, file_path: str) -> None:
     delete_where(collection, {"file_path": file_path})
 
 
+def get_file_chunks(collection: Collection, file_path: str) -> dict[str, dict[str, Any]]:
+    """Return the stored chunk IDs of a file mapped to their metadata."""
+    result = collection.get(where={"file_path": file_path}, include=["metadatas"])
+    ids = result.get("ids", []) or []
+    metadatas = result.get("metadatas", []) or []
+    return {doc_id: dict(meta or {}) for doc_id, meta in zip(ids, metadatas, strict=False)}
+
+
+def get_chunks_by_file(collection: Collection) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return all stored chunk IDs and metadata, grouped by file path."""
+    result = collection.get(include=["metadatas"])
+    ids = result.get("ids", []) or []
+    metadatas = result.get("metadatas", []) or []
+    by_file: dict[str, dict[str, dict[str, Any]]] = {}
+    for doc_id, meta in zip(ids, metadatas, strict=False):
+        if meta:
+            by_file.setdefault(str(meta["file_path"]), {})[doc_id] = dict(meta)
+    return by_file
+
+
 def query_docs(collection: Collection, text: str, n_results: int) -> dict[str, Any]:
     """Query the collection."""
     return collection.query(query_texts=[text], n_results=n_results)
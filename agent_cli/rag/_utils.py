@@ -5,12 +5,16 @@ from __future__ import annotations
 import fnmatch
 import hashlib
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 # Configure logging
@@ -148,64 +152,80 @@ def _compile_gitignore_regex(pattern: str) -> re.Pattern[str]:
     return re.compile(f"^{''.join(regex_parts)}$")
 
 
-def _gitignore_rule_matches(
-    rule: GitignorePattern,
-    rel_parts: tuple[str, ...],
-    is_dir: bool,
-) -> bool:
-    """Check whether one parsed gitignore rule matches one path."""
-    if rule.dir_only and not is_dir:
-        return False
-    if not rel_parts:
-        return False
-
-    path_parts = (*rule.base_prefix, *rel_parts)
-    if not path_parts:
-        return False
-
-    # No-slash patterns match only the basename at any depth.
-    # Ancestor directories are handled by `_matches_gitignore`.
+def _compile_gitignore_rule(rule: GitignorePattern) -> re.Pattern[str]:
+    """Compile one rule into a regex for its match subject (see `GitignoreMatcher`)."""
     if not rule.has_slash and not rule.anchored:
-        return fnmatch.fnmatchcase(path_parts[-1], rule.pattern)
-
-    rel_path_str = "/".join(path_parts)
-    return bool(_compile_gitignore_regex(rule.pattern).fullmatch(rel_path_str))
+        return re.compile(fnmatch.translate(rule.pattern))
+    return _compile_gitignore_regex(rule.pattern)
 
 
-def _is_path_ignored_by_rules(
-    rel_parts: tuple[str, ...],
-    is_dir: bool,
-    gitignore_patterns: list[GitignorePattern],
-) -> bool:
-    """Evaluate gitignore rules for a single path."""
-    ignored = False
-    for rule in gitignore_patterns:
-        if _gitignore_rule_matches(rule, rel_parts, is_dir):
-            ignored = not rule.negated
-    return ignored
-
-
-def _matches_gitignore(
-    rel_path_str: str,
-    is_dir: bool,
-    gitignore_patterns: list[GitignorePattern],
-) -> bool:
-    """Check if a path matches gitignore patterns.
+class GitignoreMatcher:
+    """Gitignore rules compiled once, with decisions cached per directory.
 
-    Processes patterns in order; negation patterns (``!``) can un-ignore
-    previously matched paths. Parent directories are evaluated separately:
-    if any parent directory is ignored, the file inside remains ignored.
+    No-slash rules match the basename at any depth; other rules match the path
+    relative to their .gitignore. If any ancestor directory is ignored, every
+    path below it is ignored too, so scans can prune it without descending.
+    The directory cache is an LRU of at most `max_cached_dirs` entries, so a
+    long-lived watcher over a churning tree doesn't grow it without bound.
     """
-    parts = tuple(part for part in rel_path_str.split("/") if part)
-    if not parts:
+
+    def __init__(self, patterns: list[GitignorePattern], max_cached_dirs: int = 4096) -> None:
+        """Compile `patterns` (in .gitignore order; later rules win)."""
+        # Reversed, so the first matching rule is the one Git would apply
+        self._rules = [
+            (
+                _compile_gitignore_rule(rule),
+                rule.negated,
+                rule.dir_only,
+                not rule.has_slash and not rule.anchored,
+                rule.base_prefix,
+            )
+            for rule in reversed(patterns)
+        ]
+        self.max_cached_dirs = max_cached_dirs
+        # Shared by the startup scan and the file watcher, which run on different threads
+        self._dir_cache: OrderedDict[tuple[str, ...], bool] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of rules."""
+        return len(self._rules)
+
+    def _evaluate(self, rel_parts: tuple[str, ...], is_dir: bool) -> bool:
+        """Apply the rules to one path, ignoring its ancestors."""
+        for regex, negated, dir_only, basename_only, base_prefix in self._rules:
+            if dir_only and not is_dir:
+                continue
+            subject = rel_parts[-1] if basename_only else "/".join((*base_prefix, *rel_parts))
+            if regex.fullmatch(subject):
+                return not negated
         return False
 
-    # If any ancestor directory is ignored, this path is ignored too.
-    for i in range(1, len(parts)):
-        if _is_path_ignored_by_rules(parts[:i], is_dir=True, gitignore_patterns=gitignore_patterns):
+    def is_dir_ignored(self, rel_parts: tuple[str, ...]) -> bool:
+        """Return True if the directory or any of its ancestors is ignored."""
+        with self._cache_lock:
+            ignored = self._dir_cache.get(rel_parts)
+            if ignored is not None:
+                self._dir_cache.move_to_end(rel_parts)
+                return ignored
+        ignored = (len(rel_parts) > 1 and self.is_dir_ignored(rel_parts[:-1])) or (
+            self._evaluate(rel_parts, is_dir=True)
+        )
+        with self._cache_lock:
+            self._dir_cache[rel_parts] = ignored
+            while len(self._dir_cache) > self.max_cached_dirs:
+                self._dir_cache.popitem(last=False)
+        return ignored
+
+    def matches(self, rel_parts: tuple[str, ...], is_dir: bool) -> bool:
+        """Return True if the path (relative to the docs folder) is ignored."""
+        if not rel_parts:
+            return False
+        if is_dir:
+            return self.is_dir_ignored(rel_parts)
+        if len(rel_parts) > 1 and self.is_dir_ignored(rel_parts[:-1]):
             return True
-
-    return _is_path_ignored_by_rules(parts, is_dir, gitignore_patterns)
+        return self._evaluate(rel_parts, is_dir=False)
 
 
 def _find_git_root(start: Path) -> Path | None:
@@ -258,11 +278,28 @@ def load_gitignore_patterns(docs_folder: Path) -> list[GitignorePattern]:
     return all_patterns
 
 
+def load_gitignore_matcher(docs_folder: Path) -> GitignoreMatcher:
+    """Load and compile the .gitignore rules that apply to ``docs_folder``."""
+    return GitignoreMatcher(load_gitignore_patterns(docs_folder))
+
+
+def _is_ignored_part(part: str) -> bool:
+    """Check one path component against the built-in ignore rules."""
+    return (
+        # Hidden files/directories (starting with .)
+        part.startswith(".")
+        # Common ignore directories
+        or part in DEFAULT_IGNORE_DIRS
+        # .egg-info directories
+        or part.endswith(".egg-info")
+    )
+
+
 def should_ignore_path(
     path: Path,
     base_folder: Path,
     *,
-    gitignore_patterns: list[GitignorePattern] | None = None,
+    gitignore_patterns: list[GitignorePattern] | GitignoreMatcher | None = None,
 ) -> bool:
     """Check if a path should be ignored during indexing.
 
@@ -277,7 +314,8 @@ def should_ignore_path(
         path: The file path to check.
         base_folder: The base folder for computing relative paths.
         gitignore_patterns: Pre-parsed gitignore patterns from
-            :func:`load_gitignore_patterns`.
+            :func:`load_gitignore_patterns`, or a :class:`GitignoreMatcher`
+            to reuse its compiled rules and directory cache across calls.
 
     Returns:
         True if the path should be ignored, False otherwise.
@@ -285,16 +323,8 @@ def should_ignore_path(
     """
     rel_parts = path.relative_to(base_folder).parts
 
-    for part in rel_parts:
-        # Hidden files/directories (starting with .)
-        if part.startswith("."):
-            return True
-        # Common ignore directories
-        if part in DEFAULT_IGNORE_DIRS:
-            return True
-        # .egg-info directories
-        if part.endswith(".egg-info"):
-            return True
+    if any(_is_ignored_part(part) for part in rel_parts):
+        return True
 
     # Check specific file patterns
     if path.name in DEFAULT_IGNORE_FILES:
@@ -302,14 +332,57 @@ def should_ignore_path(
 
     # Check gitignore patterns
     if gitignore_patterns:
-        rel_path_str = "/".join(rel_parts)
-        is_dir = path.is_dir()
-        if _matches_gitignore(rel_path_str, is_dir, gitignore_patterns):
+        matcher = (
+            gitignore_patterns
+            if isinstance(gitignore_patterns, GitignoreMatcher)
+            else GitignoreMatcher(gitignore_patterns)
+        )
+        if matcher.matches(rel_parts, path.is_dir()):
             return True
 
     return False
 
 
+def iter_indexable_files(
+    base_folder: Path,
+    *,
+    gitignore: GitignoreMatcher | None = None,
+) -> Iterator[Path]:
+    """Yield the files under ``base_folder`` that `should_ignore_path` keeps.
+
+    Walks with ``os.scandir`` and prunes ignored directories before descending,
+    so ``node_modules``, build output and gitignored trees are never listed.
+    Symlinked directories are not followed.
+    """
+    stack: list[tuple[str, tuple[str, ...]]] = [(str(base_folder), ())]
+    while stack:
+        folder, prefix = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            LOGGER.warning("Cannot list %s", folder, exc_info=True)
+            continue
+        for entry in entries:
+            if _is_ignored_part(entry.name):
+                continue
+            rel_parts = (*prefix, entry.name)
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                if not (gitignore and gitignore.is_dir_ignored(rel_parts)):
+                    stack.append((entry.path, rel_parts))
+            elif (
+                is_file
+                and entry.name not in DEFAULT_IGNORE_FILES
+                and not (gitignore and gitignore.matches(rel_parts, is_dir=False))
+            ):
+                yield base_folder.joinpath(*rel_parts)
+
+
 # Files to read as plain text directly (fast path)
 TEXT_EXTENSIONS = {
     ".txt",
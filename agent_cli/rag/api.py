@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any
 
@@ -14,21 +15,27 @@ from fastapi.middleware.cors import CORSMiddleware
 from agent_cli.constants import DEFAULT_OPENAI_EMBEDDING_MODEL
 from agent_cli.core.chroma import init_collection
 from agent_cli.core.openai_proxy import proxy_request_to_upstream
-from agent_cli.core.reranker import get_reranker_model
+from agent_cli.core.reranker import RerankBatcher, get_reranker_model
+from agent_cli.core.retrieval_cache import RetrievalCache
+from agent_cli.rag._converter import CONVERSION_CACHE_DIRNAME, DocumentConverter
 from agent_cli.rag._indexer import watch_docs
 from agent_cli.rag._indexing import initial_index, load_hashes_from_metadata
 from agent_cli.rag._store import get_all_metadata
+from agent_cli.rag._utils import load_gitignore_matcher
 from agent_cli.rag.engine import process_chat_request
 from agent_cli.rag.models import ChatRequest  # noqa: TC001
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from agent_cli.rag._pipeline import BulkIndexConfig
+    from agent_cli.rag.models import RetrievalResult
+
 
 LOGGER = logging.getLogger(__name__)
 
 
-def create_app(
+def create_app(  # noqa: PLR0915
     docs_folder: Path,
     chroma_path: Path,
     openai_base_url: str,
@@ -38,6 +45,10 @@ def create_app(
     chat_api_key: str | None = None,
     limit: int = 3,
     enable_rag_tools: bool = True,
+    retrieval_workers: int = 4,
+    retrieval_cache_size: int = 256,
+    retrieval_cache_ttl: float = 300.0,
+    index_config: BulkIndexConfig | None = None,
 ) -> FastAPI:
     """Create the FastAPI app."""
     # Initialize State
@@ -53,7 +64,19 @@ def create_app(
     )
 
     LOGGER.info("Loading reranker model (CrossEncoder)...")
-    reranker_model = get_reranker_model()
+    reranker_model = RerankBatcher(get_reranker_model())
+    # Retrieval (Chroma query + ONNX rerank) blocks, so it runs on a bounded pool
+    retrieval_executor = ThreadPoolExecutor(
+        max_workers=retrieval_workers,
+        thread_name_prefix="rag-retrieval",
+    )
+    retrieval_cache: RetrievalCache[RetrievalResult] = RetrievalCache(
+        max_entries=retrieval_cache_size,
+        ttl_seconds=retrieval_cache_ttl,
+    )
+
+    # Rich documents are converted once per content hash, in worker processes
+    converter = DocumentConverter(chroma_path / CONVERSION_CACHE_DIRNAME)
 
     LOGGER.info("Loading existing file index...")
     file_hashes, file_mtimes = load_hashes_from_metadata(collection)
@@ -66,8 +89,17 @@ def create_app(
         LOGGER.info("Starting file watcher...")
         # Background Tasks
         background_tasks = set()
+        # Compiled once; the startup scan and the watcher share its directory cache
+        gitignore = load_gitignore_matcher(docs_folder)
         watcher_task = asyncio.create_task(
-            watch_docs(collection, docs_folder, file_hashes, file_mtimes),
+            watch_docs(
+                collection,
+                docs_folder,
+                file_hashes,
+                file_mtimes,
+                converter,
+                gitignore,
+            ),
         )
         background_tasks.add(watcher_task)
         watcher_task.add_done_callback(background_tasks.discard)
@@ -76,6 +108,7 @@ def create_app(
         threading.Thread(
             target=initial_index,
             args=(collection, docs_folder, file_hashes, file_mtimes),
+            kwargs={"config": index_config, "converter": converter, "gitignore": gitignore},
             daemon=True,
         ).start()
         yield
@@ -83,6 +116,8 @@ def create_app(
         watcher_task.cancel()
         with suppress(asyncio.CancelledError):
             await watcher_task
+        retrieval_executor.shutdown(wait=False, cancel_futures=True)
+        converter.shutdown()
 
     app = FastAPI(title="RAG Proxy", lifespan=lifespan)
 
@@ -115,6 +150,9 @@ def create_app(
             default_top_k=limit,
             api_key=api_key,
             enable_rag_tools=enable_rag_tools,
+            retrieval_executor=retrieval_executor,
+            retrieval_cache=retrieval_cache,
+            converter=converter,
         )
 
     @app.post("/reindex")
@@ -124,6 +162,7 @@ def create_app(
         threading.Thread(
             target=initial_index,
             args=(collection, docs_folder, file_hashes, file_mtimes),
+            kwargs={"config": index_config, "converter": converter},
             daemon=True,
         ).start()
         return {"status": "started reindexing", "total_chunks": collection.count()}
@@ -151,13 +190,15 @@ def create_app(
         return {"files": list(files.values()), "total": len(files)}
 
     @app.get("/health")
-    def health() -> dict[str, str]:
+    def health() -> dict[str, Any]:
         return {
             "status": "ok",
             "rag_docs": str(docs_folder),
             "openai_base_url": openai_base_url,
             "embedding_model": embedding_model,
             "limit": str(limit),
+            "reranker": reranker_model.stats(),
+            "retrieval_cache": retrieval_cache.stats(),
         }
 
     @app.api_route(
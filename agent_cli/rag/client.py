@@ -13,8 +13,9 @@ from agent_cli.constants import (
 )
 from agent_cli.core.chroma import init_collection
 from agent_cli.core.reranker import get_reranker_model
+from agent_cli.rag._converter import CONVERSION_CACHE_DIRNAME, DocumentConverter
 from agent_cli.rag._retriever import format_context, rerank_and_filter
-from agent_cli.rag._utils import chunk_text, load_document_text
+from agent_cli.rag._utils import chunk_text
 from agent_cli.rag.models import RagSource, RetrievalResult
 
 if TYPE_CHECKING:
@@ -78,6 +79,9 @@ class RagClient:
             openai_api_key=openai_api_key,
         )
 
+        # Converted documents are cached next to the index, keyed by file hash
+        self.converter = DocumentConverter(chroma_path / CONVERSION_CACHE_DIRNAME)
+
         logger.info("Loading reranker model...")
         self.reranker: OnnxCrossEncoder = get_reranker_model()
 
@@ -151,7 +155,7 @@ class RagClient:
             ValueError: If file cannot be read.
 
         """
-        text = load_document_text(file_path)
+        text = self.converter.load(file_path)
         if text is None:
             msg = f"Could not read file: {file_path}"
             raise ValueError(msg)
@@ -12,17 +12,21 @@ from fastapi.responses import StreamingResponse
 
 from agent_cli.core.sse import format_chunk, format_done
 from agent_cli.rag._prompt import RAG_PROMPT_NO_TOOLS, RAG_PROMPT_WITH_TOOLS
-from agent_cli.rag._retriever import search_context
+from agent_cli.rag._retriever import search_context_async
 from agent_cli.rag._utils import load_document_text
 from agent_cli.rag.models import Message, RetrievalResult  # noqa: TC001
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from chromadb import Collection
     from pydantic_ai import Agent
     from pydantic_ai.messages import ModelRequest, ModelResponse
     from pydantic_ai.result import RunResult
 
-    from agent_cli.core.reranker import OnnxCrossEncoder
+    from agent_cli.core.reranker import OnnxCrossEncoder, RerankBatcher
+    from agent_cli.core.retrieval_cache import RetrievalCache
+    from agent_cli.rag._converter import DocumentConverter
     from agent_cli.rag.models import ChatRequest
 
 LOGGER = logging.getLogger(__name__)
@@ -69,11 +73,13 @@ def _is_path_safe(base: Path, requested: Path) -> bool:
         return False
 
 
-def _retrieve_context(
+async def _retrieve_context(
     request: ChatRequest,
     collection: Collection,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     default_top_k: int = 3,
+    executor: Executor | None = None,
+    cache: RetrievalCache[RetrievalResult] | None = None,
 ) -> RetrievalResult | None:
     """Retrieve context for the request.
 
@@ -96,7 +102,14 @@ def _retrieve_context(
         LOGGER.info("RAG retrieval disabled for this request (top_k=%s)", top_k)
         return None
 
-    retrieval = search_context(collection, reranker_model, user_message, top_k=top_k)
+    retrieval = await search_context_async(
+        collection,
+        reranker_model,
+        user_message,
+        top_k=top_k,
+        executor=executor,
+        cache=cache,
+    )
 
     if not retrieval.context:
         LOGGER.info("ℹ️  No relevant context found for query: '%s'", user_message[:50])  # noqa: RUF001
@@ -191,16 +204,26 @@ def _build_openai_response(
 async def process_chat_request(
     request: ChatRequest,
     collection: Collection,
-    reranker_model: OnnxCrossEncoder,
+    reranker_model: OnnxCrossEncoder | RerankBatcher,
     openai_base_url: str,
     docs_folder: Path,
     default_top_k: int = 3,
     api_key: str | None = None,
     enable_rag_tools: bool = True,
+    retrieval_executor: Executor | None = None,
+    retrieval_cache: RetrievalCache[RetrievalResult] | None = None,
+    converter: DocumentConverter | None = None,
 ) -> Any:
     """Process a chat request with RAG."""
-    # 1. Retrieve Context
-    retrieval = _retrieve_context(request, collection, reranker_model, default_top_k=default_top_k)
+    # 1. Retrieve Context (off the event loop)
+    retrieval = await _retrieve_context(
+        request,
+        collection,
+        reranker_model,
+        default_top_k=default_top_k,
+        executor=retrieval_executor,
+        cache=retrieval_cache,
+    )
 
     # 2. Define Tool
     def read_full_document(file_path: str) -> str:
@@ -217,7 +240,10 @@ async def process_chat_request(
             if not full_path.exists():
                 return f"Error: File not found: {file_path}"
 
-            text = load_document_text(full_path)
+            if converter is not None:
+                text = converter.load(full_path)
+            else:
+                text = load_document_text(full_path)
             if text is None:
                 return "Error: Could not read file (unsupported format or encoding)."
             return text
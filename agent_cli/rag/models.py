@@ -37,6 +37,7 @@ class DocMetadata(BaseModel):
     indexed_at: str
     file_hash: str
     file_mtime: float
+    chunk_hash: str | None = None
 
 
 class RagSource(BaseModel):
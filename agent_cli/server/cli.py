@@ -301,6 +301,8 @@ def _resolve_whisper_required_extras(kwargs: dict[str, object]) -> tuple[str, ..
     extras = ["server", backend_extra]
     if not kwargs.get("no_wyoming"):
         extras.append("wyoming")
+        if kwargs.get("wyoming_streaming"):
+            extras.append("vad")
     return tuple(extras)
 
 
@@ -423,6 +425,52 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
             ),
         ),
     ] = False,
+    replicas: Annotated[
+        int,
+        typer.Option(
+            "--replicas",
+            min=1,
+            help=(
+                "Worker processes per model. Each replica loads its own copy of the model "
+                "and requests go to the least-loaded one. Raise on many-core CPUs or large "
+                "GPUs to transcribe several requests in parallel"
+            ),
+        ),
+    ] = 1,
+    min_replicas: Annotated[
+        int,
+        typer.Option(
+            "--min-replicas",
+            min=0,
+            help=(
+                "Replicas per model kept loaded at all times (loaded at startup, exempt from "
+                "`--ttl`). Other replicas load on demand and unload independently after `--ttl`"
+            ),
+        ),
+    ] = 0,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size",
+            min=1,
+            help=(
+                "Maximum concurrent short requests (WAV, up to 30s) decoded together in one "
+                "batched call per replica. `1` disables batching. Supported by the "
+                "`faster-whisper` and `transformers` backends"
+            ),
+        ),
+    ] = 1,
+    batch_wait_ms: Annotated[
+        float,
+        typer.Option(
+            "--batch-wait-ms",
+            min=0.0,
+            help=(
+                "Milliseconds the first request of a batch waits for others to join "
+                "(only with `--batch-size` > 1)"
+            ),
+        ),
+    ] = 10.0,
     host: Annotated[
         str,
         typer.Option(
@@ -454,6 +502,25 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
             help="Disable Wyoming protocol server (only run HTTP API)",
         ),
     ] = False,
+    wyoming_streaming: Annotated[
+        bool,
+        typer.Option(
+            "--wyoming-streaming",
+            help=(
+                "Transcribe Wyoming audio incrementally: VAD splits the stream at pauses and "
+                "each speech segment is transcribed while audio is still arriving, so only "
+                "the last segment is decoded after the client stops. Requires the `vad` extra"
+            ),
+        ),
+    ] = False,
+    wyoming_silence_threshold: Annotated[
+        float,
+        typer.Option(
+            "--wyoming-silence-threshold",
+            min=0.1,
+            help="Seconds of silence that end a speech segment (only with `--wyoming-streaming`)",
+        ),
+    ] = 0.5,
     download_only: Annotated[
         bool,
         typer.Option(
@@ -500,6 +567,15 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
         # Run NVIDIA Parakeet with NeMo backend
         agent-cli server whisper --backend nemo
 
+        # Run 4 CPU replicas, keeping one always loaded
+        agent-cli server whisper --device cpu --replicas 4 --min-replicas 1
+
+        # Batch up to 8 concurrent short requests, waiting at most 20ms
+        agent-cli server whisper --batch-size 8 --batch-wait-ms 20
+
+        # Transcribe Wyoming audio segment by segment while the user is speaking
+        agent-cli server whisper --wyoming-streaming
+
         # Download model without starting server
         agent-cli server whisper --model large-v3 --download-only
     """
@@ -545,6 +621,13 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
     if resolved_backend == "transformers" and not download_only:
         _check_transformers_audio_model_deps(model)
 
+    if min_replicas > replicas:
+        err_console.print(
+            f"[bold red]Error:[/bold red] --min-replicas ({min_replicas}) "
+            f"cannot exceed --replicas ({replicas})",
+        )
+        raise typer.Exit(1)
+
     # Validate default model against model list
     if default_model is not None and default_model not in model:
         err_console.print(
@@ -605,6 +688,10 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
             ttl_seconds=ttl,
             cache_dir=cache_dir,
             backend_type=resolved_backend,  # type: ignore[arg-type]
+            replicas=replicas,
+            min_replicas=min_replicas,
+            batch_size=batch_size,
+            batch_wait_ms=batch_wait_ms,
         )
         registry.register(config)
 
@@ -633,13 +720,19 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
     console.print("[dim]Endpoints:[/dim]")
     console.print(f"  HTTP API: [cyan]http://{host}:{port}[/cyan]")
     if not no_wyoming:
-        console.print(f"  Wyoming:  [cyan]{wyoming_uri}[/cyan]")
+        streaming_info = (
+            f" (streaming, {wyoming_silence_threshold:g}s pauses)" if wyoming_streaming else ""
+        )
+        console.print(f"  Wyoming:  [cyan]{wyoming_uri}[/cyan]{streaming_info}")
     console.print()
     console.print("[dim]Models:[/dim]")
     for m in model:
         is_default = m == registry.default_model
         suffix = " [yellow](default)[/yellow]" if is_default else ""
-        console.print(f"  • {m} (ttl={ttl}s){suffix}")
+        replica_info = f", replicas={replicas}" if replicas > 1 else ""
+        if batch_size > 1:
+            replica_info += f", batch={batch_size}/{batch_wait_ms:g}ms"
+        console.print(f"  • {m} (ttl={ttl}s{replica_info}){suffix}")
     console.print()
     console.print("[dim]Usage with agent-cli:[/dim]")
     console.print(
@@ -661,6 +754,8 @@ def whisper_cmd(  # noqa: C901, PLR0912, PLR0915
         registry,
         enable_wyoming=not no_wyoming,
         wyoming_uri=wyoming_uri,
+        wyoming_streaming=wyoming_streaming,
+        wyoming_silence_threshold=wyoming_silence_threshold,
     )
 
     import uvicorn  # noqa: PLC0415
@@ -46,6 +46,7 @@ def create_lifespan(
     wyoming_handler_module: str,
     enable_wyoming: bool = True,
     wyoming_uri: str = "tcp://0.0.0.0:10300",
+    wyoming_options: dict[str, Any] | None = None,
 ) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
     """Create a lifespan context manager for a server.
 
@@ -54,6 +55,7 @@ def create_lifespan(
         wyoming_handler_module: Module path containing start_wyoming_server function.
         enable_wyoming: Whether to start Wyoming server.
         wyoming_uri: URI for Wyoming server.
+        wyoming_options: Extra keyword arguments for start_wyoming_server.
 
     Returns:
         A lifespan context manager function for FastAPI.
@@ -73,12 +75,12 @@ def create_lifespan(
             try:
                 module = importlib.import_module(wyoming_handler_module)
                 start_wyoming_server: Callable[
-                    [Any, str],
+                    ...,
                     Coroutine[Any, Any, None],
                 ] = module.start_wyoming_server
 
                 wyoming_task = asyncio.create_task(
-                    start_wyoming_server(registry, wyoming_uri),
+                    start_wyoming_server(registry, wyoming_uri, **(wyoming_options or {})),
                 )
             except ImportError:
                 logger.warning("Wyoming not available, skipping Wyoming server")
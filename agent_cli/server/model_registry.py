@@ -10,7 +10,7 @@ This module provides a concrete model registry that handles:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, runtime_checkable
 
 if TYPE_CHECKING:
@@ -66,6 +66,8 @@ class ModelStatus:
     last_request_time: float | None
     load_duration_seconds: float | None
     extra: dict[str, float]
+    # Per-replica state for managers that run several workers per model
+    replicas: list[dict[str, Any]] = field(default_factory=list)
 
 
 class ModelRegistry(Generic[ManagerT, ConfigT]):
@@ -111,6 +113,7 @@ class ModelRegistry(Generic[ManagerT, ConfigT]):
             last_request_time=manager.stats.last_request_time,
             load_duration_seconds=manager.stats.load_duration_seconds,
             extra=manager.stats.extra,
+            replicas=manager.replica_status() if hasattr(manager, "replica_status") else [],
         )
 
     @property
@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
-import io
 import logging
-import wave
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile, WebSocket
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
-from agent_cli.server.common import configure_app, create_lifespan, setup_wav_file
+from agent_cli.server.common import configure_app, create_lifespan
 from agent_cli.server.whisper.backends.base import InvalidAudioError, UnsupportedRequestError
+from agent_cli.server.whisper.streaming import LocalAgreementTranscriber
 
 if TYPE_CHECKING:
+    from agent_cli.server.whisper.backends.base import TranscriptionResult
     from agent_cli.server.whisper.model_registry import WhisperModelRegistry
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,19 @@ class VerboseTranscriptionResponse(BaseModel):
     segments: list[dict[str, Any]]
 
 
+class ReplicaStatusResponse(BaseModel):
+    """Status of one worker replica of a model."""
+
+    index: int
+    loaded: bool
+    warm: bool
+    queue_depth: int
+    ttl_remaining: float | None
+    total_requests: int
+    batches: int = 0
+    batched_requests: int = 0
+
+
 class ModelStatusResponse(BaseModel):
     """Status of a single model."""
 
@@ -100,9 +114,11 @@ class ModelStatusResponse(BaseModel):
     total_requests: int
     total_audio_seconds: float
     total_transcription_seconds: float
+    partial_requests: int = 0
     last_load_time: float | None
     last_request_time: float | None
     load_duration_seconds: float | None
+    replicas: list[ReplicaStatusResponse] = []
 
 
 class HealthResponse(BaseModel):
@@ -128,6 +144,8 @@ def create_app(  # noqa: C901, PLR0915
     *,
     enable_wyoming: bool = True,
     wyoming_uri: str = "tcp://0.0.0.0:10300",
+    wyoming_streaming: bool = False,
+    wyoming_silence_threshold: float = 0.5,
 ) -> FastAPI:
     """Create the FastAPI application.
 
@@ -135,6 +153,8 @@ def create_app(  # noqa: C901, PLR0915
         registry: The model registry to use.
         enable_wyoming: Whether to start Wyoming server.
         wyoming_uri: URI for Wyoming server.
+        wyoming_streaming: Transcribe Wyoming speech segments while audio is arriving.
+        wyoming_silence_threshold: Seconds of silence that end a Wyoming speech segment.
 
     Returns:
         Configured FastAPI application.
@@ -145,6 +165,10 @@ def create_app(  # noqa: C901, PLR0915
         wyoming_handler_module="agent_cli.server.whisper.wyoming_handler",
         enable_wyoming=enable_wyoming,
         wyoming_uri=wyoming_uri,
+        wyoming_options={
+            "streaming": wyoming_streaming,
+            "silence_threshold": wyoming_silence_threshold,
+        },
     )
 
     app = FastAPI(
@@ -174,9 +198,11 @@ def create_app(  # noqa: C901, PLR0915
                 total_requests=s.total_requests,
                 total_audio_seconds=s.total_audio_seconds,
                 total_transcription_seconds=s.extra.get("total_transcription_seconds", 0.0),
+                partial_requests=int(s.extra.get("partial_requests", 0)),
                 last_load_time=s.last_load_time,
                 last_request_time=s.last_request_time,
                 load_duration_seconds=s.load_duration_seconds,
+                replicas=[ReplicaStatusResponse(**r) for r in s.replicas],
             )
             for s in registry.list_status()
         ]
@@ -326,10 +352,14 @@ def create_app(  # noqa: C901, PLR0915
     # --- WebSocket Streaming Endpoint ---
 
     @app.websocket("/v1/audio/transcriptions/stream")
-    async def stream_transcription(
+    async def stream_transcription(  # noqa: PLR0915
         websocket: WebSocket,
         model: Annotated[str | None, Query(description="Model to use")] = None,
         language: Annotated[str | None, Query(description="Language code")] = None,
+        partial_interval: Annotated[
+            float,
+            Query(ge=0.0, description="Seconds of new audio between partials (0 disables)"),
+        ] = 1.0,
     ) -> None:
         """WebSocket endpoint for streaming transcription.
 
@@ -339,9 +369,14 @@ def create_app(  # noqa: C901, PLR0915
         - Server sends JSON messages with transcription results
 
         Message format from server:
-        {"type": "partial", "text": "...", "is_final": false}
+        {"type": "partial", "text": "...", "is_final": false, "committed": "..."}
         {"type": "final", "text": "...", "is_final": true, "segments": [...]}
         {"type": "error", "message": "..."}
+
+        Partials re-decode the audio that is not yet committed every
+        `partial_interval` seconds of new audio; `committed` is the prefix
+        of `text` that later messages will not change. A failed partial is
+        logged and skipped; only the final decode reports an error.
         """
         await websocket.accept()
 
@@ -354,52 +389,73 @@ def create_app(  # noqa: C901, PLR0915
             await websocket.close()
             return
 
-        # Collect audio data
-        audio_buffer = io.BytesIO()
-        wav_file: wave.Wave_write | None = None
+        # Only the closing decode counts as a request in the model stats
+        final = False
+
+        async def transcribe(audio: bytes, prompt: str | None) -> TranscriptionResult:
+            return await manager.transcribe(
+                audio,
+                language=language,
+                task="transcribe",
+                initial_prompt=prompt,
+                partial=not final,
+            )
+
+        streamer = LocalAgreementTranscriber(transcribe)
+        partial_task: asyncio.Task[None] | None = None
+
+        async def send_partial() -> None:
+            try:
+                committed, tentative = await streamer.update()
+                await websocket.send_json(
+                    {
+                        "type": "partial",
+                        "text": f"{committed} {tentative}".strip(),
+                        "is_final": False,
+                        "committed": committed,
+                    },
+                )
+            except Exception:
+                # The audio stays in the window, so the next decode covers it
+                logger.warning("Partial transcription failed", exc_info=True)
 
         try:
             while True:
                 data = await websocket.receive_bytes()
 
-                # Initialize WAV file on first chunk (before EOS check)
-                if wav_file is None:
-                    wav_file = wave.open(audio_buffer, "wb")  # noqa: SIM115
-                    setup_wav_file(wav_file)
-
                 # Check for end of stream (EOS marker)
                 eos_marker = b"EOS"
                 eos_len = len(eos_marker)
                 if data == eos_marker:
                     break
                 if data[-eos_len:] == eos_marker:
-                    # Write remaining data before EOS marker
-                    if len(data) > eos_len:
-                        wav_file.writeframes(data[:-eos_len])
+                    # Keep remaining data before EOS marker
+                    streamer.add_audio(data[:-eos_len])
                     break
 
-                wav_file.writeframes(data)
+                streamer.add_audio(data)
 
-            # Close WAV file
-            if wav_file is not None:
-                wav_file.close()
+                # One decode at a time
+                if partial_task is not None and partial_task.done():
+                    partial_task = None
+                if (
+                    partial_task is None
+                    and partial_interval > 0
+                    and streamer.unprocessed_seconds >= partial_interval
+                ):
+                    partial_task = asyncio.create_task(send_partial())
 
-            # Get audio data
-            audio_buffer.seek(0)
-            audio_data = audio_buffer.read()
-
-            if not audio_data:
+            if not streamer.duration:
                 await websocket.send_json({"type": "error", "message": "No audio received"})
                 await websocket.close()
                 return
 
             # Transcribe
             try:
-                result = await manager.transcribe(
-                    audio_data,
-                    language=language,
-                    task="transcribe",
-                )
+                if partial_task is not None:
+                    await partial_task
+                final = True
+                result = await streamer.finish()
 
                 await websocket.send_json(
                     {
@@ -421,6 +477,8 @@ def create_app(  # noqa: C901, PLR0915
                 await websocket.send_json({"type": "error", "message": str(e)})
 
         finally:
+            if partial_task is not None and not partial_task.done():
+                partial_task.cancel()
             with contextlib.suppress(Exception):
                 await websocket.close()
 
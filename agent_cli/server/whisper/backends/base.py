@@ -102,3 +102,26 @@ class WhisperBackend(Protocol):
 
         """
         ...
+
+
+@runtime_checkable
+class BatchTranscriptionBackend(Protocol):
+    """Optional capability: transcribe several clips in one batched call.
+
+    All clips share the same decoding options. Used by the model manager's
+    batching scheduler for concurrent short requests.
+    """
+
+    async def transcribe_batch(
+        self,
+        audios: list[bytes],
+        *,
+        language: str | None = None,
+        task: Literal["transcribe", "translate"] = "transcribe",
+        initial_prompt: str | None = None,
+        temperature: float = 0.0,
+        vad_filter: bool = True,
+        word_timestamps: bool = False,
+    ) -> list[TranscriptionResult]:
+        """Transcribe WAV clips; returns one result per clip, in order."""
+        ...
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
 import tempfile
+from bisect import bisect_right
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from dataclasses import dataclass
 from multiprocessing import get_context
 from pathlib import Path
@@ -17,6 +20,11 @@ from agent_cli.server.whisper.backends.base import (
     BackendConfig,
     TranscriptionResult,
 )
+from agent_cli.server.whisper.backends.shared_audio import (
+    SharedAudio,
+    read_shared_audio,
+    share_wav,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +42,7 @@ class _SubprocessState:
 
     model: Any = None
     device: str | None = None
+    pipeline: Any = None
 
 
 _state = _SubprocessState()
@@ -69,7 +78,7 @@ def _load_model_in_subprocess(
 
 
 def _transcribe_in_subprocess(
-    audio_bytes: bytes,
+    audio: bytes | SharedAudio,
     kwargs: dict[str, Any],
 ) -> dict[str, Any]:
     """Run transcription in subprocess. Reuses model from _state."""
@@ -77,37 +86,142 @@ def _transcribe_in_subprocess(
         msg = "Model not loaded in subprocess. Call _load_model_in_subprocess first."
         raise RuntimeError(msg)
 
-    # Write audio to temp file - faster-whisper needs a file path
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
-
-    try:
-        segments, info = _state.model.transcribe(tmp_path, **kwargs)
+    if isinstance(audio, SharedAudio):
+        segments, info = _state.model.transcribe(read_shared_audio(audio), **kwargs)
         segment_list = list(segments)  # Consume lazy generator
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    else:
+        # Fallback for other formats: faster-whisper decodes them from a file path
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            tmp.write(audio)
+            tmp_path = tmp.name
+        try:
+            segments, info = _state.model.transcribe(tmp_path, **kwargs)
+            segment_list = list(segments)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
 
     return {
         "text": " ".join(seg.text.strip() for seg in segment_list),
         "language": info.language,
         "language_probability": info.language_probability,
         "duration": info.duration,
-        "segments": [
-            {
-                "id": seg.id,
-                "start": seg.start,
-                "end": seg.end,
-                "text": seg.text,
-                "tokens": seg.tokens,
-                "avg_logprob": seg.avg_logprob,
-                "no_speech_prob": seg.no_speech_prob,
-            }
-            for seg in segment_list
-        ],
+        "segments": [_segment_dict(seg) for seg in segment_list],
+    }
+
+
+def _segment_dict(seg: Any, *, segment_id: int | None = None, shift: float = 0.0) -> dict[str, Any]:
+    return {
+        "id": seg.id if segment_id is None else segment_id,
+        "start": seg.start + shift,
+        "end": seg.end + shift,
+        "text": seg.text,
+        "tokens": seg.tokens,
+        "avg_logprob": seg.avg_logprob,
+        "no_speech_prob": seg.no_speech_prob,
     }
 
 
+def _speech_span(audio: Any) -> tuple[int, int] | None:
+    """Return the (start, end) samples from first to last speech, or None if silent."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps  # noqa: PLC0415
+
+    timestamps = get_speech_timestamps(audio, VadOptions())
+    if not timestamps:
+        return None
+    return timestamps[0]["start"], timestamps[-1]["end"]
+
+
+def _transcribe_batch_in_subprocess(
+    audios: list[bytes | SharedAudio],
+    kwargs: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Transcribe several short clips with one batched decode per language.
+
+    The clips are concatenated and passed to `BatchedInferencePipeline` with
+    one clip timestamp each, so every clip becomes one row of the batch.
+    Segments are mapped back to their clip by start time.
+    """
+    if _state.model is None:
+        msg = "Model not loaded in subprocess. Call _load_model_in_subprocess first."
+        raise RuntimeError(msg)
+    try:
+        from faster_whisper import BatchedInferencePipeline, decode_audio  # noqa: PLC0415
+    except ImportError:  # faster-whisper < 1.1 has no batched pipeline
+        return [_transcribe_in_subprocess(audio, kwargs) for audio in audios]
+    import numpy as np  # noqa: PLC0415
+
+    if _state.pipeline is None:
+        _state.pipeline = BatchedInferencePipeline(model=_state.model)
+    options = dict(kwargs)
+    language: str | None = options.pop("language")
+    vad_filter: bool = options.pop("vad_filter")
+    sampling_rate: int = _state.model.feature_extractor.sampling_rate
+
+    arrays = [
+        read_shared_audio(audio)
+        if isinstance(audio, SharedAudio)
+        else decode_audio(io.BytesIO(audio), sampling_rate=sampling_rate)
+        for audio in audios
+    ]
+    results: list[dict[str, Any]] = []
+    groups: dict[str, list[int]] = {}
+    for i, array in enumerate(arrays):
+        if language:
+            clip_language, probability = language, 1.0
+        else:
+            # The pipeline detects one language per call, so group clips by language
+            clip_language, probability, _ = _state.model.detect_language(audio=array)
+        results.append(
+            {
+                "text": "",
+                "language": clip_language,
+                "language_probability": probability,
+                "duration": len(array) / sampling_rate,
+                "segments": [],
+            },
+        )
+        groups.setdefault(clip_language, []).append(i)
+
+    for group_language, indices in groups.items():
+        pieces: list[Any] = []
+        clips: list[dict[str, int]] = []
+        owners: list[tuple[int, float]] = []  # (clip index, seconds to add back)
+        offset = 0
+        for i in indices:
+            span = _speech_span(arrays[i]) if vad_filter else (0, len(arrays[i]))
+            if span is None or span[1] <= span[0]:
+                continue
+            start, end = span
+            pieces.append(arrays[i][start:end])
+            clips.append({"start": offset, "end": offset + end - start})
+            owners.append((i, (start - offset) / sampling_rate))
+            offset += end - start
+        if not clips:
+            continue
+
+        segments, _info = _state.pipeline.transcribe(
+            np.concatenate(pieces),
+            language=group_language,
+            clip_timestamps=clips,
+            vad_filter=False,
+            batch_size=len(clips),
+            **options,
+        )
+        clip_starts = [clip["start"] / sampling_rate for clip in clips]
+        for seg in segments:
+            # Small tolerance: segment starts are rounded to timestamp tokens
+            owner = max(0, bisect_right(clip_starts, seg.start + 0.01) - 1)
+            i, shift = owners[owner]
+            result = results[i]
+            result["segments"].append(
+                _segment_dict(seg, segment_id=len(result["segments"]) + 1, shift=shift),
+            )
+
+    for result in results:
+        result["text"] = " ".join(seg["text"].strip() for seg in result["segments"])
+    return results
+
+
 class FasterWhisperBackend:
     """Whisper backend using faster-whisper (CTranslate2).
 
@@ -210,32 +324,73 @@ class FasterWhisperBackend:
         }
 
         loop = asyncio.get_running_loop()
-        try:
-            result = await loop.run_in_executor(
-                self._executor,
-                _transcribe_in_subprocess,
-                audio,
-                kwargs,
-            )
-        except BrokenProcessPool:
-            logger.warning(
-                "faster-whisper process pool died during transcription; "
-                "reloading model %s and retrying once",
-                self._config.model_name,
-            )
-            await self.unload()
-            await self.load()
-            result = await loop.run_in_executor(
+        with share_wav(audio) as shared:
+            payload = shared or audio
+            try:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    _transcribe_in_subprocess,
+                    payload,
+                    kwargs,
+                )
+            except BrokenProcessPool:
+                logger.warning(
+                    "faster-whisper process pool died during transcription; "
+                    "reloading model %s and retrying once",
+                    self._config.model_name,
+                )
+                await self.unload()
+                await self.load()
+                result = await loop.run_in_executor(
+                    self._executor,
+                    _transcribe_in_subprocess,
+                    payload,
+                    kwargs,
+                )
+
+        return _to_result(result)
+
+    async def transcribe_batch(
+        self,
+        audios: list[bytes],
+        *,
+        language: str | None = None,
+        task: Literal["transcribe", "translate"] = "transcribe",
+        initial_prompt: str | None = None,
+        temperature: float = 0.0,
+        vad_filter: bool = True,
+        word_timestamps: bool = False,
+    ) -> list[TranscriptionResult]:
+        """Transcribe several clips with one batched decode in the subprocess."""
+        if self._executor is None:
+            msg = "Model not loaded. Call load() first."
+            raise RuntimeError(msg)
+
+        kwargs: dict[str, Any] = {
+            "language": language,
+            "task": task,
+            "initial_prompt": initial_prompt,
+            "temperature": temperature,
+            "vad_filter": vad_filter,
+            "word_timestamps": word_timestamps,
+        }
+        loop = asyncio.get_running_loop()
+        with ExitStack() as stack:
+            payloads = [stack.enter_context(share_wav(audio)) or audio for audio in audios]
+            results = await loop.run_in_executor(
                 self._executor,
-                _transcribe_in_subprocess,
-                audio,
+                _transcribe_batch_in_subprocess,
+                payloads,
                 kwargs,
             )
+        return [_to_result(result) for result in results]
 
-        return TranscriptionResult(
-            text=result["text"],
-            language=result["language"],
-            language_probability=result["language_probability"],
-            duration=result["duration"],
-            segments=result["segments"],
-        )
+
+def _to_result(result: dict[str, Any]) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=result["text"],
+        language=result["language"],
+        language_probability=result["language_probability"],
+        duration=result["duration"],
+        segments=result["segments"],
+    )
@@ -7,7 +7,7 @@ import logging
 import wave
 from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import get_context
-from typing import TYPE_CHECKING, Any, Literal
+from typing import Any, Literal
 
 from agent_cli import constants
 from agent_cli.core.audio_format import (
@@ -20,10 +20,11 @@ from agent_cli.server.whisper.backends.base import (
     InvalidAudioError,
     TranscriptionResult,
 )
-
-if TYPE_CHECKING:
-    import numpy as np
-    from numpy.typing import NDArray
+from agent_cli.server.whisper.backends.shared_audio import (
+    SharedAudio,
+    read_shared_audio,
+    share_pcm,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,13 +66,6 @@ def download_model(model_name: str) -> str:
     return resolved_model
 
 
-def _pcm_to_float(audio_bytes: bytes) -> NDArray[np.float32]:
-    """Convert 16-bit PCM audio bytes to float32 array normalized to [-1, 1]."""
-    import numpy as np  # noqa: PLC0415
-
-    return np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-
-
 def _convert_audio_to_pcm(audio_bytes: bytes, source_filename: str | None) -> bytes:
     """Convert audio bytes to raw PCM using FFmpeg."""
     filename = source_filename or "audio"
@@ -129,17 +123,14 @@ def _load_model_in_subprocess(model_name: str) -> None:
 
 def _transcribe_in_subprocess(
     model_name: str,
-    audio_bytes: bytes,
-    audio_shape: tuple[int, ...],
-    audio_dtype: str,
+    audio: SharedAudio,
     kwargs: dict[str, Any],
 ) -> dict[str, Any]:
     """Run transcription in subprocess. Model stays loaded between calls."""
     import mlx.core as mx  # noqa: PLC0415
     import mlx_whisper  # noqa: PLC0415
-    import numpy as np  # noqa: PLC0415
 
-    audio_array = np.frombuffer(audio_bytes, dtype=audio_dtype).reshape(audio_shape)
+    audio_array = read_shared_audio(audio)
     try:
         result = mlx_whisper.transcribe(audio_array, path_or_hf_repo=model_name, **kwargs)
     finally:
@@ -243,7 +234,6 @@ class MLXWhisperBackend:
             raise RuntimeError(msg)
 
         pcm_data = _prepare_audio_pcm(audio, source_filename)
-        audio_array = _pcm_to_float(pcm_data)
 
         kwargs: dict[str, Any] = {
             "temperature": temperature,
@@ -257,15 +247,14 @@ class MLXWhisperBackend:
             kwargs["initial_prompt"] = initial_prompt
 
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            self._executor,
-            _transcribe_in_subprocess,
-            self._resolved_model,
-            audio_array.tobytes(),
-            audio_array.shape,
-            str(audio_array.dtype),
-            kwargs,
-        )
+        with share_pcm(pcm_data) as shared:
+            result = await loop.run_in_executor(
+                self._executor,
+                _transcribe_in_subprocess,
+                self._resolved_model,
+                shared,
+                kwargs,
+            )
 
         text = result.get("text", "").strip()
         detected_language = result.get("language", "en")
@@ -25,6 +25,11 @@ from agent_cli.server.whisper.backends.base import (
     InvalidAudioError,
     TranscriptionResult,
 )
+from agent_cli.server.whisper.backends.shared_audio import (
+    SharedAudio,
+    read_shared_audio,
+    share_wav,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -282,8 +287,21 @@ def _load_model_in_subprocess(model_name: str, device: str) -> str:
     return resolved_device
 
 
+def _transcribe_audio_input(audio_input: Any, kwargs: dict[str, Any]) -> Any | None:
+    """Transcribe one file path or 16 kHz sample array; return its hypothesis."""
+    transcribe_kwargs = _build_transcribe_kwargs(
+        _state.model.transcribe,
+        language=kwargs["language"],
+        word_timestamps=kwargs["word_timestamps"],
+    )
+    outputs = _state.model.transcribe([audio_input], **transcribe_kwargs)
+    if isinstance(outputs, list) and outputs:
+        return outputs[0]
+    return outputs or None
+
+
 def _transcribe_in_subprocess(
-    audio_bytes: bytes,
+    audio: bytes | SharedAudio,
     kwargs: dict[str, Any],
 ) -> dict[str, Any]:
     """Run transcription in subprocess. Reuses model from _state."""
@@ -291,34 +309,26 @@ def _transcribe_in_subprocess(
         msg = "Model not loaded in subprocess. Call _load_model_in_subprocess first."
         raise RuntimeError(msg)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
-
-    try:
-        transcribe_kwargs = _build_transcribe_kwargs(
-            _state.model.transcribe,
-            language=kwargs["language"],
-            word_timestamps=kwargs["word_timestamps"],
-        )
-        outputs = _state.model.transcribe([tmp_path], **transcribe_kwargs)
-
-        hypothesis: Any | None = None
-        if isinstance(outputs, list) and outputs:
-            hypothesis = outputs[0]
-        elif outputs:
-            hypothesis = outputs
-
-        text = _extract_text(hypothesis) if hypothesis is not None else ""
-        segments = (
-            _extract_segments(hypothesis, word_timestamps=kwargs["word_timestamps"])
-            if hypothesis is not None
-            else []
-        )
-        duration = _audio_duration_seconds(tmp_path)
-
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    if isinstance(audio, SharedAudio):
+        hypothesis = _transcribe_audio_input(read_shared_audio(audio), kwargs)
+        duration = audio.duration
+    else:
+        # Fallback for WAVs NeMo must resample itself: transcribe from a file path
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            tmp.write(audio)
+            tmp_path = tmp.name
+        try:
+            hypothesis = _transcribe_audio_input(tmp_path, kwargs)
+            duration = _audio_duration_seconds(tmp_path)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    text = _extract_text(hypothesis) if hypothesis is not None else ""
+    segments = (
+        _extract_segments(hypothesis, word_timestamps=kwargs["word_timestamps"])
+        if hypothesis is not None
+        else []
+    )
 
     language = kwargs["language"] or "en"
     language_probability = 1.0 if kwargs["language"] else 0.95
@@ -441,29 +451,31 @@ class NemoWhisperBackend:
         }
 
         loop = asyncio.get_running_loop()
-        try:
-            result = await loop.run_in_executor(
-                self._executor,
-                _transcribe_in_subprocess,
-                audio,
-                kwargs,
-            )
-        except BrokenProcessPool:
-            logger.warning(
-                "NeMo subprocess for model %s died; reloading and retrying once",
-                self._config.model_name,
-            )
-            await self.unload()
-            await self.load()
-            if self._executor is None:
-                msg = "Model reload failed after NeMo subprocess died."
-                raise RuntimeError(msg) from None
-            result = await loop.run_in_executor(
-                self._executor,
-                _transcribe_in_subprocess,
-                audio,
-                kwargs,
-            )
+        with share_wav(audio) as shared:
+            payload = shared or audio
+            try:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    _transcribe_in_subprocess,
+                    payload,
+                    kwargs,
+                )
+            except BrokenProcessPool:
+                logger.warning(
+                    "NeMo subprocess for model %s died; reloading and retrying once",
+                    self._config.model_name,
+                )
+                await self.unload()
+                await self.load()
+                if self._executor is None:
+                    msg = "Model reload failed after NeMo subprocess died."
+                    raise RuntimeError(msg) from None
+                result = await loop.run_in_executor(
+                    self._executor,
+                    _transcribe_in_subprocess,
+                    payload,
+                    kwargs,
+                )
 
         return TranscriptionResult(
             text=result["text"],
@@ -0,0 +1,128 @@
+"""Shared-memory audio hand-off from the server to backend subprocesses.
+
+Passing audio `bytes` to a `ProcessPoolExecutor` pickles the whole payload
+through a pipe, and workers used to write it to a temporary file just to get
+a path. Instead, the server copies the 16-bit PCM samples once into a
+`multiprocessing.shared_memory` block and sends a small `SharedAudio` handle;
+the worker maps the block with NumPy and converts it to float32 for the model.
+"""
+
+from __future__ import annotations
+
+import io
+import wave
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+from agent_cli import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+_PCM_SAMPLE_WIDTH = 2
+
+
+@dataclass(frozen=True)
+class SharedAudio:
+    """Picklable handle to 16-bit PCM samples in a shared memory block."""
+
+    name: str
+    frames: int
+    sample_rate: int
+    channels: int
+
+    @property
+    def duration(self) -> float:
+        """Audio duration in seconds."""
+        return self.frames / self.sample_rate if self.sample_rate > 0 else 0.0
+
+
+def wav_pcm_view(audio: bytes) -> tuple[memoryview, int, int] | None:
+    """Return (PCM data, sample rate, channels) of a 16-bit PCM WAV without copying.
+
+    Returns None if `audio` is not a readable 16-bit PCM WAV.
+    """
+    buffer = io.BytesIO(audio)
+    try:
+        with wave.open(buffer, "rb") as wav_file:
+            if wav_file.getsampwidth() != _PCM_SAMPLE_WIDTH:
+                return None
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.getnframes()
+            # wave stops at the start of the data chunk, so this is its offset
+            offset = buffer.tell()
+    except (wave.Error, EOFError):
+        return None
+    size = min(frames * channels * _PCM_SAMPLE_WIDTH, len(audio) - offset)
+    size -= size % (channels * _PCM_SAMPLE_WIDTH)
+    return memoryview(audio)[offset : offset + size], sample_rate, channels
+
+
+@contextmanager
+def share_pcm(
+    pcm: bytes | memoryview,
+    *,
+    sample_rate: int = constants.AUDIO_RATE,
+    channels: int = constants.AUDIO_CHANNELS,
+) -> Iterator[SharedAudio]:
+    """Copy 16-bit PCM into a shared memory block that lives for the context."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(pcm)))
+    try:
+        block.buf[: len(pcm)] = pcm
+        yield SharedAudio(
+            name=block.name,
+            frames=len(pcm) // (channels * _PCM_SAMPLE_WIDTH),
+            sample_rate=sample_rate,
+            channels=channels,
+        )
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextmanager
+def share_wav(
+    audio: bytes,
+    *,
+    sample_rate: int | None = constants.AUDIO_RATE,
+) -> Iterator[SharedAudio | None]:
+    """Share the samples of a 16-bit PCM WAV, or yield None to use a fallback.
+
+    With `sample_rate` set, WAVs at other rates also yield None, for models
+    that only take arrays at their native rate.
+    """
+    parsed = wav_pcm_view(audio)
+    if parsed is None or (sample_rate is not None and parsed[1] != sample_rate):
+        yield None
+        return
+    pcm, rate, channels = parsed
+    with share_pcm(pcm, sample_rate=rate, channels=channels) as handle:
+        yield handle
+
+
+def read_shared_audio(handle: SharedAudio) -> NDArray[np.float32]:
+    """Read a shared block in a worker as mono float32 samples in [-1, 1]."""
+    import numpy as np  # noqa: PLC0415
+
+    block = shared_memory.SharedMemory(name=handle.name)
+    try:
+        samples = np.ndarray(
+            (handle.frames, handle.channels),
+            dtype=np.int16,
+            buffer=block.buf,
+        )
+        if handle.channels > 1:
+            result = samples.mean(axis=1, dtype=np.float32)
+        else:
+            result = samples[:, 0].astype(np.float32)  # Copies out of the block
+        result /= 32768.0
+        del samples  # Release the view before closing the block
+    finally:
+        block.close()
+    return result
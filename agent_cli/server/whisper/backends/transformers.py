@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
 import tempfile
 import time
 import wave
 from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from multiprocessing import get_context
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Literal
 
 from agent_cli.core.process import set_process_title
 from agent_cli.server.whisper.backends.base import (
@@ -19,6 +21,11 @@ from agent_cli.server.whisper.backends.base import (
     TranscriptionResult,
     UnsupportedRequestError,
 )
+from agent_cli.server.whisper.backends.shared_audio import (
+    SharedAudio,
+    read_shared_audio,
+    share_wav,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -149,11 +156,11 @@ def _load_model_in_subprocess(
     return device
 
 
-def _read_wav_audio(wav_path: str) -> tuple[Any, int, float]:
+def _read_wav_audio(wav_file_or_path: str | IO[bytes]) -> tuple[Any, int, float]:
     """Read a WAV file into a float32 numpy array."""
     import numpy as np  # noqa: PLC0415
 
-    with wave.open(wav_path, "rb") as wav_file:
+    with wave.open(wav_file_or_path, "rb") as wav_file:
         sample_rate = wav_file.getframerate()
         audio_bytes = wav_file.readframes(wav_file.getnframes())
         duration = wav_file.getnframes() / sample_rate
@@ -162,6 +169,13 @@ def _read_wav_audio(wav_path: str) -> tuple[Any, int, float]:
     return audio_array, sample_rate, duration
 
 
+def _load_clip(audio: SharedAudio | str | bytes) -> tuple[Any, int, float]:
+    """Load a clip handed over as shared samples, a WAV path or WAV bytes."""
+    if isinstance(audio, SharedAudio):
+        return read_shared_audio(audio), audio.sample_rate, audio.duration
+    return _read_wav_audio(audio if isinstance(audio, str) else io.BytesIO(audio))
+
+
 def _make_result(
     *,
     text: str,
@@ -269,20 +283,19 @@ def _transcribe_with_model_helper(
 
 def _transcribe_with_generate(
     *,
-    audio_array: Any,
+    audio_arrays: list[Any],
     sample_rate: int,
     effective_language: str | None,
     task: str,
     initial_prompt: str | None,
     beam_size: int,
-    duration: float,
-) -> dict[str, Any]:
-    """Transcribe with the standard Whisper generate path."""
+    durations: list[float],
+) -> list[dict[str, Any]]:
+    """Transcribe with the standard Whisper generate path (one padded batch)."""
     import torch  # noqa: PLC0415
 
-    audio_tensor = torch.from_numpy(audio_array)
     inputs = _state.processor(
-        audio_tensor,
+        audio_arrays,
         sampling_rate=sample_rate,
         return_tensors="pt",
     )
@@ -318,14 +331,17 @@ def _transcribe_with_generate(
 
     with torch.no_grad():
         generated_ids = _state.model.generate(**generate_args)
-        text = _state.processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
+        texts = _state.processor.batch_decode(generated_ids, skip_special_tokens=True)
 
-    return _make_result(
-        text=text,
-        language=effective_language or "en",
-        language_probability=1.0 if effective_language else 0.95,
-        duration=duration,
-    )
+    return [
+        _make_result(
+            text=text,
+            language=effective_language or "en",
+            language_probability=1.0 if effective_language else 0.95,
+            duration=duration,
+        )
+        for text, duration in zip(texts, durations, strict=True)
+    ]
 
 
 def _transcribe_in_subprocess(kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -334,7 +350,7 @@ def _transcribe_in_subprocess(kwargs: dict[str, Any]) -> dict[str, Any]:
         msg = "Model not loaded in subprocess. Call _load_model_in_subprocess first."
         raise RuntimeError(msg)
 
-    audio_array, sample_rate, duration = _read_wav_audio(kwargs.pop("wav_path"))
+    audio_array, sample_rate, duration = _load_clip(kwargs.pop("audio"))
     effective_language = kwargs.get("language") or kwargs.get("default_language")
     task = kwargs.get("task", "transcribe")
 
@@ -357,13 +373,76 @@ def _transcribe_in_subprocess(kwargs: dict[str, Any]) -> dict[str, Any]:
         )
 
     return _transcribe_with_generate(
-        audio_array=audio_array,
+        audio_arrays=[audio_array],
         sample_rate=sample_rate,
         effective_language=effective_language,
         task=task,
         initial_prompt=kwargs.get("initial_prompt"),
         beam_size=kwargs.get("beam_size", 5),
-        duration=duration,
+        durations=[duration],
+    )[0]
+
+
+def _transcribe_batch_in_subprocess(
+    audios: list[bytes | SharedAudio],
+    kwargs: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Transcribe several WAV clips in one padded batch. Reuses model from _state."""
+    if _state.model is None or _state.processor is None:
+        msg = "Model not loaded in subprocess. Call _load_model_in_subprocess first."
+        raise RuntimeError(msg)
+
+    clips = [_load_clip(audio) for audio in audios]
+    audio_arrays = [array for array, _, _ in clips]
+    durations = [duration for _, _, duration in clips]
+    sample_rate = clips[0][1]
+    if any(rate != sample_rate for _, rate, _ in clips):
+        msg = "Batched clips must share one sample rate"
+        raise ValueError(msg)
+    effective_language = kwargs.get("language") or kwargs.get("default_language")
+    task = kwargs.get("task", "transcribe")
+
+    if _is_cohere_asr_model():
+        # Cohere's processor flow is documented per utterance
+        return [
+            _transcribe_cohere_asr(
+                audio_array=array,
+                sample_rate=sample_rate,
+                effective_language=effective_language,
+                task=task,
+                duration=duration,
+            )
+            for array, duration in zip(audio_arrays, durations, strict=True)
+        ]
+
+    if _state.has_transcribe_helper:
+        if task != "transcribe":
+            msg = "Translation is not supported by this model."
+            raise UnsupportedRequestError(msg)
+        texts = _state.model.transcribe(
+            processor=_state.processor,
+            audio_arrays=audio_arrays,
+            sample_rates=[sample_rate] * len(audio_arrays),
+            language=effective_language,
+        )
+        return [
+            _make_result(
+                text=text,
+                language=effective_language or "unknown",
+                language_probability=1.0 if effective_language else 0.0,
+                duration=duration,
+            )
+            for text, duration in zip(texts, durations, strict=True)
+        ]
+
+    return _transcribe_with_generate(
+        audio_arrays=audio_arrays,
+        sample_rate=sample_rate,
+        effective_language=effective_language,
+        task=task,
+        initial_prompt=kwargs.get("initial_prompt"),
+        beam_size=kwargs.get("beam_size", 5),
+        durations=durations,
     )
 
 
@@ -455,34 +534,81 @@ class TransformersWhisperBackend:
             msg = "Model not loaded. Call load() first."
             raise RuntimeError(msg)
 
-        # Write audio to temp file for wave parsing in subprocess
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(audio)
-            tmp_path = tmp.name
-
         kwargs: dict[str, Any] = {
-            "wav_path": tmp_path,
             "language": language,
             "default_language": self._config.default_language,
             "task": task,
             "initial_prompt": initial_prompt,
         }
+        loop = asyncio.get_running_loop()
+
+        with share_wav(audio, sample_rate=None) as shared:
+            if shared is not None:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    _transcribe_in_subprocess,
+                    {**kwargs, "audio": shared},
+                )
+                return _to_result(result)
+
+        # Fallback: write audio to temp file for wave parsing in subprocess
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            tmp.write(audio)
+            tmp_path = tmp.name
 
         try:
-            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 self._executor,
                 _transcribe_in_subprocess,
-                kwargs,
+                {**kwargs, "audio": tmp_path},
             )
         finally:
             await asyncio.to_thread(Path(tmp_path).unlink, missing_ok=True)
 
-        return TranscriptionResult(
-            text=result["text"],
-            language=result["language"],
-            language_probability=result["language_probability"],
-            duration=result["duration"],
-            segments=result["segments"],
-            supports_segments=result["supports_segments"],
-        )
+        return _to_result(result)
+
+    async def transcribe_batch(
+        self,
+        audios: list[bytes],
+        *,
+        language: str | None = None,
+        task: Literal["transcribe", "translate"] = "transcribe",
+        initial_prompt: str | None = None,
+        temperature: float = 0.0,  # noqa: ARG002 - not used by transformers
+        vad_filter: bool = True,  # noqa: ARG002 - not supported
+        word_timestamps: bool = False,  # noqa: ARG002 - not supported
+    ) -> list[TranscriptionResult]:
+        """Transcribe several WAV clips as one padded `generate` batch in subprocess."""
+        if self._executor is None:
+            msg = "Model not loaded. Call load() first."
+            raise RuntimeError(msg)
+
+        kwargs: dict[str, Any] = {
+            "language": language,
+            "default_language": self._config.default_language,
+            "task": task,
+            "initial_prompt": initial_prompt,
+        }
+        loop = asyncio.get_running_loop()
+        with ExitStack() as stack:
+            payloads = [
+                stack.enter_context(share_wav(audio, sample_rate=None)) or audio for audio in audios
+            ]
+            results = await loop.run_in_executor(
+                self._executor,
+                _transcribe_batch_in_subprocess,
+                payloads,
+                kwargs,
+            )
+        return [_to_result(result) for result in results]
+
+
+def _to_result(result: dict[str, Any]) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=result["text"],
+        language=result["language"],
+        language_probability=result["language_probability"],
+        duration=result["duration"],
+        segments=result["segments"],
+        supports_segments=result["supports_segments"],
+    )
@@ -0,0 +1,109 @@
+"""Dynamic request batching for the Whisper server.
+
+Concurrent requests that share decoding options are gathered for a few
+milliseconds (or until the batch is full) and handed to the backend as one
+batched call, then the results are split back to the individual callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Sequence
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchScheduler(Generic[T, R]):
+    """Group concurrent submissions by key and run each group as one batch.
+
+    The first item of a group starts a `max_wait` timer; the group is
+    dispatched when the timer fires or `max_batch_size` items are waiting,
+    whichever comes first. `run_batch` returns one result (or exception)
+    per item, in order.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, list[T]], Awaitable[Sequence[R | BaseException]]],
+        *,
+        max_batch_size: int,
+        max_wait: float,
+    ) -> None:
+        """Dispatch groups of up to `max_batch_size` items after at most `max_wait` seconds."""
+        self._run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: dict[Hashable, list[tuple[T, asyncio.Future[R]]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.batched_items = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of items waiting for their batch to be dispatched."""
+        return sum(len(group) for group in self._pending.values())
+
+    def pending(self, key: Hashable) -> int:
+        """Number of items waiting in the not yet dispatched group for `key`."""
+        return len(self._pending.get(key, ()))
+
+    async def submit(self, key: Hashable, item: T) -> R:
+        """Queue `item` with others sharing `key` and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((item, future))
+        if len(group) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+        return await future
+
+    async def aclose(self) -> None:
+        """Dispatch everything still waiting and wait for running batches."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        # Callers that gave up (cancelled) don't need a slot in the batch
+        group = [(item, future) for item, future in self._pending.pop(key, []) if not future.done()]
+        if not group:
+            return
+        task = asyncio.create_task(self._run(key, group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, group: list[tuple[T, asyncio.Future[R]]]) -> None:
+        self.batches += 1
+        self.batched_items += len(group)
+        try:
+            results = await self._run_batch(key, [item for item, _ in group])
+        except asyncio.CancelledError:
+            for _, future in group:
+                future.cancel()
+            raise
+        except Exception as e:
+            results = [e] * len(group)
+        if len(results) != len(group):
+            error = RuntimeError(f"Batch returned {len(results)} results for {len(group)} items")
+            results = [error] * len(group)
+        for (_, future), result in zip(group, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import dataclasses
+import io
 import logging
 import time
+import wave
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal
 
 from agent_cli.server.model_manager import ModelConfig, ModelManager, ModelStats
 from agent_cli.server.whisper.backends import (
@@ -14,12 +20,28 @@ from agent_cli.server.whisper.backends import (
     TranscriptionResult,
     create_backend,
 )
+from agent_cli.server.whisper.backends.base import BatchTranscriptionBackend
+from agent_cli.server.whisper.batching import BatchScheduler
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from agent_cli.server.whisper.backends.base import WhisperBackend
 
 logger = logging.getLogger(__name__)
 
+# Only clips that fit one Whisper window are batched
+_MAX_BATCH_AUDIO_SECONDS = 30.0
+# Decoding options a batch must share, in batch-key order
+_BATCH_OPTIONS = (
+    "language",
+    "task",
+    "initial_prompt",
+    "temperature",
+    "vad_filter",
+    "word_timestamps",
+)
+
 
 @dataclass
 class WhisperModelConfig(ModelConfig):
@@ -30,71 +52,258 @@ class WhisperModelConfig(ModelConfig):
     backend_type: BackendType = "auto"
     default_language: str | None = None
     trust_remote_code: bool = False
+    # Independent worker processes for this model; each holds its own copy
+    replicas: int = 1
+    # Replicas kept loaded regardless of the TTL (loaded when the manager starts)
+    min_replicas: int = 0
+    # Concurrent short requests decoded together per replica (1 disables batching)
+    batch_size: int = 1
+    # How long the first request of a batch waits for others to join
+    batch_wait_ms: float = 10.0
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        super().__post_init__()
+        if self.replicas < 1:
+            msg = f"replicas must be >= 1, got {self.replicas}"
+            raise ValueError(msg)
+        if not 0 <= self.min_replicas <= self.replicas:
+            msg = (
+                f"min_replicas must be between 0 and replicas ({self.replicas}), "
+                f"got {self.min_replicas}"
+            )
+            raise ValueError(msg)
+        if self.batch_size < 1:
+            msg = f"batch_size must be >= 1, got {self.batch_size}"
+            raise ValueError(msg)
+        if self.batch_wait_ms < 0:
+            msg = f"batch_wait_ms must be >= 0, got {self.batch_wait_ms}"
+            raise ValueError(msg)
+
+
+def _wav_duration(audio: bytes) -> float | None:
+    """Return the duration of a WAV payload, or None if it is not a readable WAV."""
+    try:
+        with wave.open(io.BytesIO(audio), "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return None
+
+
+def _aggregate_stats(stats: list[ModelStats]) -> ModelStats:
+    """Combine per-replica statistics into model-level statistics."""
+    total = ModelStats()
+    latest_load = 0.0
+    for s in stats:
+        total.load_count += s.load_count
+        total.unload_count += s.unload_count
+        total.total_requests += s.total_requests
+        total.total_audio_seconds += s.total_audio_seconds
+        total.total_processing_seconds += s.total_processing_seconds
+        if s.last_load_time is not None and s.last_load_time >= latest_load:
+            latest_load = s.last_load_time
+            total.last_load_time = s.last_load_time
+            total.load_duration_seconds = s.load_duration_seconds
+        if s.last_request_time is not None:
+            total.last_request_time = max(total.last_request_time or 0.0, s.last_request_time)
+        for key, value in s.extra.items():
+            total.extra[key] = total.extra.get(key, 0.0) + value
+    return total
 
 
 class WhisperModelManager:
     """Manages a Whisper model with TTL-based unloading.
 
-    Thin wrapper around ModelManager that adds the transcribe() method.
+    Wraps one ModelManager per replica and adds the transcribe() method.
+    Each replica has its own backend (and worker process), load state and
+    TTL; requests go to the replica with the fewest requests in flight.
+    With `batch_size > 1`, short WAV requests are batched per replica on
+    backends that support batched decoding, and join a replica that already
+    has a group collecting for their options before spreading out.
     """
 
     def __init__(self, config: WhisperModelConfig) -> None:
         """Initialize the Whisper model manager."""
         self.config = config
-        backend = create_backend(
-            BackendConfig(
-                model_name=config.model_name,
-                device=config.device,
-                compute_type=config.compute_type,
-                cpu_threads=config.cpu_threads,
-                cache_dir=config.cache_dir,
-                default_language=config.default_language,
-                trust_remote_code=config.trust_remote_code,
-            ),
-            backend_type=config.backend_type,
+        backend_config = BackendConfig(
+            model_name=config.model_name,
+            device=config.device,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+            cache_dir=config.cache_dir,
+            default_language=config.default_language,
+            trust_remote_code=config.trust_remote_code,
         )
-        self._manager = ModelManager(backend, config)
+        # Warm replicas ignore the TTL; the others scale down independently
+        warm_config = dataclasses.replace(config, ttl_seconds=0)
+        self._replicas = [
+            ModelManager(
+                create_backend(backend_config, backend_type=config.backend_type),
+                warm_config if index < config.min_replicas else config,
+            )
+            for index in range(config.replicas)
+        ]
+        self._manager = self._replicas[0]
+        # Requests dispatched to each replica, including those waiting for a load
+        self._in_flight = [0] * config.replicas
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._batchers: list[BatchScheduler[bytes, TranscriptionResult]] | None = None
+        if config.batch_size > 1 and isinstance(self._manager.backend, BatchTranscriptionBackend):
+            self._batchers = [
+                BatchScheduler(
+                    partial(self._run_batch, index),
+                    max_batch_size=config.batch_size,
+                    max_wait=config.batch_wait_ms / 1000,
+                )
+                for index in range(config.replicas)
+            ]
 
     @property
     def stats(self) -> ModelStats:
-        """Get the model statistics."""
-        return self._manager.stats
+        """Get the model statistics (summed over replicas)."""
+        if len(self._replicas) == 1:
+            return self._manager.stats
+        return _aggregate_stats([replica.stats for replica in self._replicas])
 
     @property
     def is_loaded(self) -> bool:
-        """Check if the model is currently loaded."""
-        return self._manager.is_loaded
+        """Check if the model is loaded in at least one replica."""
+        return any(replica.is_loaded for replica in self._replicas)
 
     @property
     def device(self) -> str | None:
         """Get the device the model is loaded on."""
-        return self._manager.device
+        return next((r.device for r in self._replicas if r.device is not None), None)
 
     @property
     def active_requests(self) -> int:
-        """Get the number of active requests."""
-        return self._manager.active_requests
+        """Get the number of active requests across replicas."""
+        return sum(replica.active_requests for replica in self._replicas)
 
     @property
     def ttl_remaining(self) -> float | None:
-        """Get seconds remaining before model unloads."""
-        return self._manager.ttl_remaining
+        """Get seconds remaining before the last TTL-managed replica unloads."""
+        remaining = [r.ttl_remaining for r in self._replicas if r.ttl_remaining is not None]
+        return max(remaining, default=None)
+
+    def replica_status(self) -> list[dict[str, Any]]:
+        """Get per-replica load state and queue depth for `/health`."""
+        return [
+            {
+                "index": index,
+                "loaded": replica.is_loaded,
+                "warm": index < self.config.min_replicas,
+                "queue_depth": self._in_flight[index],
+                "ttl_remaining": replica.ttl_remaining,
+                "total_requests": replica.stats.total_requests,
+                "batches": self._batchers[index].batches if self._batchers else 0,
+                "batched_requests": self._batchers[index].batched_items if self._batchers else 0,
+            }
+            for index, replica in enumerate(self._replicas)
+        ]
 
     async def start(self) -> None:
-        """Start the TTL unload watcher."""
-        await self._manager.start()
+        """Start the TTL unload watchers and load the warm replicas."""
+        for replica in self._replicas:
+            await replica.start()
+        if self.config.min_replicas and self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warm_up())
 
     async def stop(self) -> None:
-        """Stop the manager and unload the model."""
-        await self._manager.stop()
+        """Stop the manager and unload all replicas."""
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warmup_task
+            self._warmup_task = None
+        for batcher in self._batchers or ():
+            await batcher.aclose()
+        for replica in self._replicas:
+            await replica.stop()
 
     async def get_model(self) -> WhisperBackend:
-        """Get the backend, loading it if necessary."""
+        """Get the first replica's backend, loading it (and warm replicas) if necessary."""
+        await self._warm_up()
         return await self._manager.get_model()
 
     async def unload(self) -> bool:
-        """Unload the model from memory."""
-        return await self._manager.unload()
+        """Unload the model from every replica."""
+        results = [await replica.unload() for replica in self._replicas]
+        return any(results)
+
+    async def _warm_up(self) -> None:
+        """Load the replicas that are kept warm."""
+        warm = self._replicas[: self.config.min_replicas]
+        try:
+            await asyncio.gather(*(replica.get_model() for replica in warm))
+        except Exception:
+            logger.exception("Failed to warm up replicas of %s", self.config.model_name)
+
+    def _pick_replica(self, batch_key: Hashable | None = None) -> int:
+        """Return the replica for the next request.
+
+        A batchable request (`batch_key` set) goes to the replica whose
+        batcher is already collecting a group for that key and has room, so
+        batches fill up instead of being split across replicas. Otherwise,
+        the least-loaded replica wins, preferring ones already loaded.
+        """
+        if batch_key is not None and self._batchers is not None:
+            waiting = [
+                (batcher.pending(batch_key), index)
+                for index, batcher in enumerate(self._batchers)
+                if 0 < batcher.pending(batch_key) < batcher.max_batch_size
+            ]
+            if waiting:
+                return max(waiting)[1]
+        return min(
+            range(len(self._replicas)),
+            key=lambda i: (self._in_flight[i], not self._replicas[i].is_loaded, i),
+        )
+
+    @staticmethod
+    def _is_batchable(audio: bytes) -> bool:
+        duration = _wav_duration(audio)
+        return duration is not None and 0 < duration <= _MAX_BATCH_AUDIO_SECONDS
+
+    @staticmethod
+    async def _transcribe_one(
+        replica: ModelManager,
+        audio: bytes,
+        **kwargs: Any,
+    ) -> TranscriptionResult:
+        async with replica.request():
+            backend: WhisperBackend = replica.backend  # type: ignore[assignment]
+            return await backend.transcribe(audio, **kwargs)
+
+    async def _run_batch(
+        self,
+        index: int,
+        key: Hashable,
+        audios: list[bytes],
+    ) -> list[TranscriptionResult | BaseException]:
+        """Transcribe one batch on replica `index`; fall back to one call per clip."""
+        replica = self._replicas[index]
+        options = dict(zip(_BATCH_OPTIONS, key, strict=True))  # type: ignore[call-overload]
+        if len(audios) > 1:
+            try:
+                async with replica.request():
+                    backend: BatchTranscriptionBackend = replica.backend  # type: ignore[assignment]
+                    results = await backend.transcribe_batch(audios, **options)
+            except Exception:
+                # Retry individually so one bad clip only fails its own request
+                logger.warning(
+                    "Batched transcription of %d clips failed (model=%s); retrying one by one",
+                    len(audios),
+                    self.config.model_name,
+                    exc_info=True,
+                )
+            else:
+                logger.debug("Transcribed a batch of %d clips on replica %d", len(audios), index)
+                return list(results)
+        return await asyncio.gather(
+            *(self._transcribe_one(replica, audio, **options) for audio in audios),
+            return_exceptions=True,
+        )
 
     async def transcribe(
         self,
@@ -107,6 +316,7 @@ class WhisperModelManager:
         temperature: float = 0.0,
         vad_filter: bool = True,
         word_timestamps: bool = False,
+        partial: bool = False,
     ) -> TranscriptionResult:
         """Transcribe audio data.
 
@@ -119,6 +329,8 @@ class WhisperModelManager:
             temperature: Sampling temperature
             vad_filter: Whether to use VAD filtering
             word_timestamps: Whether to include word-level timestamps
+            partial: Interim decode of a stream, counted as `partial_requests`
+                instead of in `total_requests` and `total_audio_seconds`
 
         Returns:
             TranscriptionResult with text and metadata
@@ -126,35 +338,53 @@ class WhisperModelManager:
         """
         start_time = time.time()
 
-        async with self._manager.request():
-            backend: WhisperBackend = self._manager.backend  # type: ignore[assignment]
-            result = await backend.transcribe(
-                audio,
-                source_filename=source_filename,
-                language=language,
-                task=task,
-                initial_prompt=initial_prompt,
-                temperature=temperature,
-                vad_filter=vad_filter,
-                word_timestamps=word_timestamps,
-            )
+        options = {
+            "language": language,
+            "task": task,
+            "initial_prompt": initial_prompt,
+            "temperature": temperature,
+            "vad_filter": vad_filter,
+            "word_timestamps": word_timestamps,
+        }
+        key: Hashable | None = None
+        if self._batchers is not None and self._is_batchable(audio):
+            key = tuple(options[name] for name in _BATCH_OPTIONS)
+        index = self._pick_replica(key)
+        replica = self._replicas[index]
+        self._in_flight[index] += 1
+        try:
+            if self._batchers is not None and key is not None:
+                result = await self._batchers[index].submit(key, audio)
+            else:
+                result = await self._transcribe_one(
+                    replica,
+                    audio,
+                    source_filename=source_filename,
+                    **options,
+                )
+        finally:
+            self._in_flight[index] -= 1
 
         transcription_duration = time.time() - start_time
 
         # Update stats
-        stats = self._manager.stats
-        stats.total_requests += 1
-        stats.total_audio_seconds += result.duration
+        stats = replica.stats
+        if partial:
+            stats.extra["partial_requests"] = stats.extra.get("partial_requests", 0.0) + 1
+        else:
+            stats.total_requests += 1
+            stats.total_audio_seconds += result.duration
         stats.total_processing_seconds += transcription_duration
         stats.extra["total_transcription_seconds"] = (
             stats.extra.get("total_transcription_seconds", 0.0) + transcription_duration
         )
 
         logger.debug(
-            "Transcribed %.1fs audio in %.2fs (model=%s, lang=%s)",
+            "Transcribed %.1fs audio in %.2fs (model=%s, replica=%d, lang=%s)",
             result.duration,
             transcription_duration,
             self.config.model_name,
+            index,
             result.language,
         )
 
@@ -0,0 +1,213 @@
+"""Incremental transcription for the Whisper streaming WebSocket.
+
+Whisper is not a streaming model, so partial results come from re-decoding
+the audio that is not yet final. A word is committed once two consecutive
+decodes agree on it (local agreement), and audio is trimmed once every word
+of a segment is committed. The uncommitted window is also capped at
+`max_window` seconds, so each decode has bounded cost and the total compute
+grows linearly with the length of the stream.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any
+
+from agent_cli import constants
+from agent_cli.server.whisper.backends.base import TranscriptionResult
+from agent_cli.services import pcm_to_wav
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_BYTES_PER_SECOND = constants.AUDIO_RATE * constants.AUDIO_FORMAT_WIDTH * constants.AUDIO_CHANNELS
+# Committed text passed as the prompt of the next decode, for continuity across trims
+_PROMPT_CHARS = 200
+
+
+def _normalize(word: str) -> str:
+    return word.strip(".,!?;:\"'()[]").lower()
+
+
+def _common_prefix(words: list[str], previous: list[str]) -> int:
+    """Number of leading words two hypotheses agree on."""
+    count = 0
+    for word, other in zip(words, previous, strict=False):
+        if _normalize(word) != _normalize(other):
+            break
+        count += 1
+    return count
+
+
+@dataclasses.dataclass
+class _Hypothesis:
+    """One decode of the window: its segments and their words."""
+
+    result: TranscriptionResult
+    duration: float
+    segments: list[dict[str, Any]] = dataclasses.field(init=False)
+    words: list[list[str]] = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        # Backends without timestamps: one segment spanning the whole window
+        self.segments = self.result.segments or [
+            {"start": 0.0, "end": self.duration, "text": self.result.text},
+        ]
+        self.words = [str(segment.get("text", "")).split() for segment in self.segments]
+
+    @property
+    def all_words(self) -> list[str]:
+        return [word for words in self.words for word in words]
+
+
+class LocalAgreementTranscriber:
+    """Turn repeated decodes of a growing audio window into stable partial text.
+
+    `transcribe(wav, prompt)` decodes a WAV; feed audio with `add_audio`, call
+    `update` whenever a partial is wanted, and `finish` at the end of the stream.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[bytes, str | None], Awaitable[TranscriptionResult]],
+        *,
+        max_window: float = 20.0,
+    ) -> None:
+        """Decode with `transcribe`, keeping at most `max_window` seconds uncommitted."""
+        self._transcribe = transcribe
+        self.max_window = max_window
+        self._window = bytearray()  # Audio from `_window_start` on, not yet trimmed
+        self._window_start = 0.0
+        self._window_committed = 0  # Leading words of the window already committed
+        self._unprocessed = 0  # Bytes added since the last decode started
+        self._previous: list[str] = []  # Uncommitted words of the last decode
+        self._committed: list[str] = []
+        self._committed_segments: list[dict[str, Any]] = []
+        self._language: str | None = None
+        self.decodes = 0
+        self.decoded_seconds = 0.0
+
+    @property
+    def unprocessed_seconds(self) -> float:
+        """Seconds of audio added since the last decode started."""
+        return self._unprocessed / _BYTES_PER_SECOND
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio received so far."""
+        return self._window_start + len(self._window) / _BYTES_PER_SECOND
+
+    @property
+    def committed_text(self) -> str:
+        """Text that will not change anymore."""
+        return " ".join(self._committed)
+
+    def add_audio(self, pcm: bytes) -> None:
+        """Append 16-bit mono PCM at the server sample rate."""
+        self._window.extend(pcm)
+        self._unprocessed += len(pcm)
+
+    async def update(self) -> tuple[str, str]:
+        """Decode the window and return (committed, tentative) text."""
+        hypothesis = await self._decode()
+        if hypothesis is None:
+            return self.committed_text, " ".join(self._previous)
+        words = hypothesis.all_words[self._window_committed :]
+        agreed = _common_prefix(words, self._previous)
+        self._committed.extend(words[:agreed])
+        self._window_committed += agreed
+        self._previous = words[agreed:]
+        self._trim(hypothesis)
+        return self.committed_text, " ".join(self._previous)
+
+    async def finish(self) -> TranscriptionResult:
+        """Decode what is left and return the transcription of the whole stream."""
+        duration = self.duration
+        hypothesis = await self._decode()
+        words = list(self._committed)
+        segments = list(self._committed_segments)
+        language_probability = 1.0
+        if hypothesis is not None:
+            words.extend(hypothesis.all_words[self._window_committed :])
+            segments.extend(self._shifted(hypothesis.result.segments))
+            language_probability = hypothesis.result.language_probability
+        logger.debug(
+            "Stream of %.1fs transcribed in %d decode(s) over %.1fs of audio",
+            duration,
+            self.decodes,
+            self.decoded_seconds,
+        )
+        return TranscriptionResult(
+            text=" ".join(words),
+            language=self._language or "en",
+            language_probability=language_probability,
+            duration=duration,
+            segments=[{**segment, "id": i} for i, segment in enumerate(segments)],
+        )
+
+    async def _decode(self) -> _Hypothesis | None:
+        self._unprocessed = 0
+        if not self._window:
+            return None
+        pcm = bytes(self._window)
+        duration = len(pcm) / _BYTES_PER_SECOND
+        prompt = self.committed_text[-_PROMPT_CHARS:] or None
+        result = await self._transcribe(
+            pcm_to_wav(
+                pcm,
+                sample_rate=constants.AUDIO_RATE,
+                sample_width=constants.AUDIO_FORMAT_WIDTH,
+                channels=constants.AUDIO_CHANNELS,
+            ),
+            prompt,
+        )
+        self.decodes += 1
+        self.decoded_seconds += duration
+        self._language = self._language or result.language
+        return _Hypothesis(result, duration)
+
+    def _trim(self, hypothesis: _Hypothesis) -> None:
+        """Drop audio whose words are all committed; force a cut past `max_window`."""
+        counts = [len(words) for words in hypothesis.words]
+        # Segments fully covered by committed words, never the last (it may still grow)
+        trim = 0
+        covered = 0
+        for i, count in enumerate(counts[:-1]):
+            if covered + count > self._window_committed:
+                break
+            covered += count
+            trim = i + 1
+        if trim == 0 and hypothesis.duration > self.max_window:
+            # No agreement for too long: commit all but the last segment as is
+            trim = len(counts) - 1 or 1
+            forced = hypothesis.all_words[self._window_committed : sum(counts[:trim])]
+            self._committed.extend(forced)
+            self._window_committed += len(forced)
+            self._previous = self._previous[len(forced) :]
+            covered = sum(counts[:trim])
+            logger.debug(
+                "Window exceeded %.1fs, committed %d word(s)", self.max_window, len(forced)
+            )
+        if trim == 0:
+            return
+        end = hypothesis.duration if trim == len(counts) else hypothesis.segments[trim - 1]["end"]
+        end = min(max(float(end), 0.0), hypothesis.duration)
+        self._committed_segments.extend(self._shifted(hypothesis.segments[:trim]))
+        cut = int(end * constants.AUDIO_RATE) * constants.AUDIO_FORMAT_WIDTH
+        del self._window[:cut]
+        self._window_start += cut / _BYTES_PER_SECOND
+        self._window_committed -= covered
+
+    def _shifted(self, segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Segments with timestamps relative to the start of the stream."""
+        return [
+            {
+                **segment,
+                "start": segment.get("start", 0.0) + self._window_start,
+                "end": segment.get("end", 0.0) + self._window_start,
+            }
+            for segment in segments
+        ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from functools import partial
 from typing import TYPE_CHECKING
@@ -16,12 +17,25 @@ from agent_cli.server.whisper.languages import WHISPER_LANGUAGE_CODES
 from agent_cli.services import pcm_to_wav
 
 if TYPE_CHECKING:
+    from onnxruntime import InferenceSession
     from wyoming.event import Event
 
+    from agent_cli.core.vad import VoiceActivityDetector
+    from agent_cli.server.whisper.backends.base import TranscriptionResult
     from agent_cli.server.whisper.model_registry import WhisperModelRegistry
 
 logger = logging.getLogger(__name__)
 
+# Languages written without spaces between words, joined without a separator
+_UNSPACED_LANGUAGES = frozenset({"bo", "ja", "km", "lo", "my", "th", "yue", "zh"})
+
+
+def _join_segment_texts(results: list[TranscriptionResult]) -> str:
+    """Stitch the transcripts of consecutive speech segments."""
+    texts = [result.text.strip() for result in results if result.text.strip()]
+    separator = "" if results and results[0].language in _UNSPACED_LANGUAGES else " "
+    return separator.join(texts)
+
 
 class WyomingWhisperHandler(AsyncEventHandler):
     """Wyoming event handler for Whisper ASR.
@@ -30,12 +44,18 @@ class WyomingWhisperHandler(AsyncEventHandler):
     - Receives audio chunks
     - Transcribes audio when AudioStop is received
     - Returns transcript
+
+    With a VAD session (streaming mode), VAD splits the incoming audio at
+    pauses and each completed speech segment is transcribed while the client
+    is still sending audio, so AudioStop only waits for the final segment.
     """
 
     def __init__(
         self,
         registry: WhisperModelRegistry,
         *args: object,
+        vad_session: InferenceSession | None = None,
+        silence_threshold: float = 0.5,
         **kwargs: object,
     ) -> None:
         """Initialize the handler.
@@ -43,11 +63,18 @@ class WyomingWhisperHandler(AsyncEventHandler):
         Args:
             registry: Model registry for getting transcription models.
             *args: Passed to parent class.
+            vad_session: Silero VAD model shared by all connections; enables
+                streaming transcription of speech segments.
+            silence_threshold: Seconds of silence that end a speech segment.
             **kwargs: Passed to parent class.
 
         """
         super().__init__(*args, **kwargs)
         self._registry = registry
+        self._vad_session = vad_session
+        self._silence_threshold = silence_threshold
+        self._vad: VoiceActivityDetector | None = None
+        self._segment_tasks: list[asyncio.Task[TranscriptionResult]] = []
         self._audio_bytes = bytearray()
         self._audio_converter = AudioChunkConverter(
             rate=constants.AUDIO_RATE,
@@ -88,49 +115,109 @@ class WyomingWhisperHandler(AsyncEventHandler):
 
         chunk = AudioChunk.from_event(event)
         chunk = self._audio_converter.convert(chunk)
+        # Kept in streaming mode too, as a fallback if segmenting yields nothing
         self._audio_bytes.extend(chunk.audio)
+
+        vad = self._get_vad()
+        if vad is not None:
+            _, segment = vad.process_chunk(chunk.audio)
+            if segment is not None:
+                logger.debug(
+                    "Speech segment complete (%.2fs), transcribing",
+                    vad.get_segment_duration_seconds(segment),
+                )
+                self._segment_tasks.append(asyncio.create_task(self._transcribe_pcm(segment)))
         return True
 
-    async def _handle_audio_stop(self) -> bool:
-        """Handle audio stop event - transcribe the collected audio."""
-        logger.debug("AudioStop")
+    def _get_vad(self) -> VoiceActivityDetector | None:
+        """Return this connection's VAD state, creating it on first use."""
+        if self._vad is None and self._vad_session is not None:
+            from agent_cli.core.vad import VoiceActivityDetector  # noqa: PLC0415
 
-        if not self._audio_bytes:
-            logger.warning("AudioStop received but no audio data")
-            await self.write_event(Transcript(text="").event())
-            return False
+            # Keep short utterances ("Yes."): a dropped segment would be lost silently
+            self._vad = VoiceActivityDetector(
+                silence_threshold_ms=int(self._silence_threshold * 1000),
+                min_speech_duration_ms=0,
+                session=self._vad_session,
+            )
+        return self._vad
 
+    async def _transcribe_pcm(self, pcm: bytes) -> TranscriptionResult:
+        """Transcribe 16-bit PCM audio with the current request options."""
         # Wrap PCM in WAV format for the backend
         audio_data = pcm_to_wav(
-            bytes(self._audio_bytes),
+            pcm,
             sample_rate=constants.AUDIO_RATE,
             sample_width=constants.AUDIO_FORMAT_WIDTH,
             channels=constants.AUDIO_CHANNELS,
         )
-        self._audio_bytes.clear()
+        manager = self._registry.get_manager()
+        return await manager.transcribe(
+            audio_data,
+            language=self._language,
+            task="transcribe",
+            initial_prompt=self._initial_prompt,
+        )
+
+    async def _finish_segments(self, vad: VoiceActivityDetector) -> str | None:
+        """Transcribe the final speech segment and stitch it to the earlier ones.
+
+        Returns None if VAD found no speech or a segment failed, so the caller
+        transcribes the full audio instead.
+        """
+        tasks, self._segment_tasks = self._segment_tasks, []
+        tail = vad.flush()
+        if tail is not None:
+            tasks.append(asyncio.create_task(self._transcribe_pcm(tail)))
+        if not tasks:
+            return None
+        results: list[TranscriptionResult] = []
+        for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Speech segment transcription failed, transcribing the full audio",
+                    exc_info=outcome,
+                )
+                return None
+            results.append(outcome)
+        logger.debug("Stitched %d speech segment(s)", len(results))
+        return _join_segment_texts(results)
+
+    async def _handle_audio_stop(self) -> bool:
+        """Handle audio stop event - transcribe the collected audio."""
+        logger.debug("AudioStop")
+
+        if not self._audio_bytes:
+            logger.warning("AudioStop received but no audio data")
+            await self.write_event(Transcript(text="").event())
+            return False
 
         # Transcribe
         try:
-            manager = self._registry.get_manager()
-            result = await manager.transcribe(
-                audio_data,
-                language=self._language,
-                task="transcribe",
-                initial_prompt=self._initial_prompt,
-            )
+            text = await self._finish_segments(self._vad) if self._vad is not None else None
+            if text is None:
+                result = await self._transcribe_pcm(bytes(self._audio_bytes))
+                text = result.text
 
-            logger.info("Wyoming transcription: %s", result.text[:100] if result.text else "")
-            await self.write_event(Transcript(text=result.text).event())
+            logger.info("Wyoming transcription: %s", text[:100] if text else "")
+            await self.write_event(Transcript(text=text).event())
 
         except Exception:
             logger.exception("Wyoming transcription failed")
             await self.write_event(Transcript(text="").event())
 
         # Reset state for next request
+        self._audio_bytes.clear()
         self._language = None
         self._initial_prompt = None
         return False
 
+    async def disconnect(self) -> None:
+        """Cancel segment transcriptions nobody will read."""
+        for task in self._segment_tasks:
+            task.cancel()
+        self._segment_tasks.clear()
+
     def _handle_transcribe(self, event: Event) -> bool:
         """Handle transcribe event - sets language and prompt preferences."""
         logger.debug("Transcribe event")
@@ -186,18 +273,41 @@ class WyomingWhisperHandler(AsyncEventHandler):
 async def start_wyoming_server(
     registry: WhisperModelRegistry,
     uri: str = "tcp://0.0.0.0:10300",
+    *,
+    streaming: bool = False,
+    silence_threshold: float = 0.5,
 ) -> None:
     """Start the Wyoming ASR server.
 
     Args:
         registry: Model registry for transcription.
         uri: URI to bind the server to (e.g., "tcp://0.0.0.0:10300").
+        streaming: Transcribe speech segments while audio is arriving.
+        silence_threshold: Seconds of silence that end a speech segment.
 
     """
+    vad_session = None
+    if streaming:
+        try:
+            from agent_cli.core.vad import load_vad_session  # noqa: PLC0415
+
+            # Loaded once and shared; a first-run download must not block the loop
+            vad_session = await asyncio.to_thread(load_vad_session)
+        except Exception:
+            logger.warning(
+                "Streaming VAD unavailable, transcribing on AudioStop instead",
+                exc_info=True,
+            )
+
     server = AsyncServer.from_uri(uri)
     logger.debug("Wyoming server listening on %s", uri)
 
     # Create handler factory with registry
-    handler_factory = partial(WyomingWhisperHandler, registry)
+    handler_factory = partial(
+        WyomingWhisperHandler,
+        registry,
+        vad_session=vad_session,
+        silence_threshold=silence_threshold,
+    )
 
     await server.run(handler_factory)
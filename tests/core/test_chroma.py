@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
 
 from pydantic import BaseModel
 
 from agent_cli.core import chroma
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class _Meta(BaseModel):
     source: str
@@ -35,3 +39,37 @@ def test_flatten_and_upsert_uses_base_models() -> None:
     assert ids == ["1"]
     assert docs == ["text"]
     assert metas == [{"source": "doc", "tags": ["a", "b"]}]
+
+
+def test_mutations_bump_collection_generation() -> None:
+    """Upserts and deletes advance the per-collection generation counter."""
+    collection = MagicMock()
+    other = MagicMock()
+    start = chroma.collection_generation(collection)
+
+    chroma.upsert(collection, ids=["a"], documents=["doc"], metadatas=[_Meta(source="s", tags=[])])
+    chroma.delete(collection, ["a"])
+    chroma.delete(collection, [])  # no-op, no bump
+    chroma.delete_where(collection, {"file_path": "x"})
+
+    assert chroma.collection_generation(collection) == start + 3
+    assert chroma.collection_generation(other) == 0
+
+
+def test_generation_is_kept_on_a_chroma_collection(tmp_path: Path) -> None:
+    """The counter lives on the (unhashable) Chroma collection object itself."""
+    collection = chroma.init_collection(tmp_path, name="generations", cache_embeddings=False)
+
+    chroma.bump_generation(collection)
+
+    assert chroma.collection_generation(collection) == 1
+
+
+def test_embed_documents_uses_the_collection_embedding_function(tmp_path: Path) -> None:
+    """Vectors come from the function Chroma itself embeds with; doubles get None."""
+    collection = chroma.init_collection(tmp_path, name="embeddings", cache_embeddings=False)
+    collection._embedding_function = MagicMock(return_value=[[1.0, 2.0]])
+
+    assert chroma.embed_documents(collection, ["text"]) == [[1.0, 2.0]]
+    collection._embedding_function.assert_called_once_with(["text"])
+    assert chroma.embed_documents(MagicMock(), ["text"]) is None
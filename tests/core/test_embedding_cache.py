@@ -0,0 +1,56 @@
+"""Tests for the on-disk embedding cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from agent_cli.core.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _FakeEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, input: list[str]) -> list[list[float]]:  # noqa: A002
+        self.calls.append(list(input))
+        return [[float(len(text)), 1.0] for text in input]
+
+    @staticmethod
+    def name() -> str:
+        return "fake"
+
+
+def test_cached_embedding_function_embeds_each_text_once(tmp_path: Path) -> None:
+    """Only texts missing from the cache are sent to the wrapped function."""
+    inner = _FakeEmbedder()
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    embed = CachedEmbeddingFunction(inner, cache, model="m")
+
+    first = embed(["a", "bb", "a"])
+    second = embed(["bb", "ccc"])
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(first[2], np.array([1.0, 1.0], dtype=np.float32))
+    np.testing.assert_array_equal(second[0], first[1])
+    assert embed.name() == "fake"  # delegated to the wrapped function
+
+
+def test_embedding_cache_persists_and_is_keyed_by_model(tmp_path: Path) -> None:
+    """Vectors survive reopening the database and are separated per model."""
+    path = tmp_path / "cache.sqlite3"
+    cache = EmbeddingCache(path)
+    cache.put_many("m1", ["text"], [[0.5, 0.25]])
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    hit, miss = reopened.get_many("m1", ["text", "other"])
+    assert miss is None
+    assert hit is not None
+    np.testing.assert_array_equal(hit, np.array([0.5, 0.25], dtype=np.float32))
+    assert reopened.get_many("m2", ["text"]) == [None]
+    assert reopened.stats() == {"hits": 1, "misses": 2}
@@ -0,0 +1,42 @@
+"""Tests for the retrieval result cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from agent_cli.core.retrieval_cache import RetrievalCache, make_cache_key
+
+
+def test_make_cache_key_normalizes_query() -> None:
+    """Whitespace and case differences map to the same key; params do not."""
+    assert make_cache_key("  What  is\tX? ", 3) == make_cache_key("what is x?", 3)
+    assert make_cache_key("what is x?", 3) != make_cache_key("what is x?", 4)
+    assert make_cache_key("q", {"b": 1, "a": 2}) == make_cache_key("q", {"a": 2, "b": 1})
+
+
+def test_cache_hit_and_generation_invalidation() -> None:
+    """Entries are served only while the collection generation is unchanged."""
+    cache: RetrievalCache[str] = RetrievalCache()
+    cache.put("k", 1, "value")
+
+    assert cache.get("k", 1) == "value"
+    assert cache.get("k", 2) is None
+    assert cache.get("k", 1) is None  # stale entry was dropped
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stale"] == 1
+
+
+def test_cache_ttl_and_lru_eviction() -> None:
+    """Entries expire after the TTL and the least recently used is evicted first."""
+    cache: RetrievalCache[int] = RetrievalCache(max_entries=2, ttl_seconds=10)
+    with patch("agent_cli.core.retrieval_cache.time.monotonic", return_value=100.0):
+        cache.put("a", 0, 1)
+        cache.put("b", 0, 2)
+        assert cache.get("a", 0) == 1  # "b" is now least recently used
+        cache.put("c", 0, 3)
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) == 1
+    with patch("agent_cli.core.retrieval_cache.time.monotonic", return_value=111.0):
+        assert cache.get("a", 0) is None
@@ -17,8 +17,9 @@ if TYPE_CHECKING:
 class _FakeSileroVADOnnx:
     """Small model double for VAD unit tests."""
 
-    def __init__(self, *, force_cpu: bool = True) -> None:
+    def __init__(self, *, force_cpu: bool = True, session: object = None) -> None:
         self.force_cpu = force_cpu
+        self.session = session
 
     def __call__(self, audio: object, sample_rate: int) -> float:
         del audio, sample_rate
@@ -90,6 +91,16 @@ def test_vad_window_size(vad: VoiceActivityDetector) -> None:
     assert vad.window_size_bytes == expected_window_size_bytes
 
 
+def test_vad_shares_session_but_not_state() -> None:
+    """Detectors built from one loaded session keep separate stream state."""
+    session = object()
+    first = VoiceActivityDetector(session=session)
+    second = VoiceActivityDetector(session=session)
+    assert first._model.session is session  # type: ignore[attr-defined]
+    assert second._model.session is session  # type: ignore[attr-defined]
+    assert first._model is not second._model
+
+
 def test_vad_invalid_sample_rate() -> None:
     """Test that invalid sample rate raises ValueError."""
     with pytest.raises(ValueError, match="Sample rate must be"):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
@@ -44,3 +46,75 @@ async def test_watch_directory_skips_hidden(tmp_path: Path) -> None:
     assert "gone.txt" in seen_paths
     assert ".hidden.txt" not in seen_paths
     assert ".nested" not in seen_paths
+
+
+@pytest.mark.asyncio
+async def test_watch_directory_batched_coalesces_per_path(tmp_path: Path) -> None:
+    """Repeated events for a path collapse to its last change, in one batch."""
+    batches: list[list[tuple[Change, Path]]] = []
+    (tmp_path / "a.txt").touch()
+    (tmp_path / "b.txt").touch()
+
+    async def fake_awatch(_root: Path) -> Any:  # type: ignore[override]
+        yield {(Change.added, str(tmp_path / "a.txt")), (Change.added, str(tmp_path / "b.txt"))}
+        yield {(Change.modified, str(tmp_path / "a.txt"))}
+        yield {(Change.deleted, str(tmp_path / "b.txt"))}
+        yield {(Change.added, str(tmp_path / ".hidden"))}
+
+    with patch("watchfiles.awatch", fake_awatch):
+        await watch_mod.watch_directory_batched(tmp_path, batches.append, debounce=0.05)
+
+    assert len(batches) == 1
+    assert {p.name: c for c, p in batches[0]} == {
+        "a.txt": Change.modified,
+        "b.txt": Change.deleted,
+    }
+
+
+@pytest.mark.asyncio
+async def test_change_queue_batches_and_applies_backpressure(tmp_path: Path) -> None:
+    """Large bursts are split into bounded batches on a bounded worker pool."""
+    batches: list[list[tuple[Change, Path]]] = []
+    queue = watch_mod.ChangeQueue(batches.append, debounce=0.01, max_batch_size=10, max_workers=1)
+    for i in range(25):
+        queue.put(Change.added, tmp_path / f"{i}.txt")
+        queue.put(Change.modified, tmp_path / f"{i}.txt")
+
+    await queue.drain()
+    queue.close()
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert {change for batch in batches for change, _ in batch} == {Change.modified}
+    assert queue.stats.events == 50
+    assert queue.stats.coalesced == 25
+    assert queue.stats.max_pending == 25
+    assert queue.stats.backpressure_waits == 2
+
+
+@pytest.mark.asyncio
+async def test_change_queue_keeps_changes_for_in_flight_paths(tmp_path: Path) -> None:
+    """A path changing while its batch runs is dispatched again afterwards."""
+    batches: list[list[tuple[Change, Path]]] = []
+    started = threading.Event()
+    release = threading.Event()
+    path = tmp_path / "a.txt"
+
+    def handler(batch: list[tuple[Change, Path]]) -> None:
+        batches.append(batch)
+        started.set()
+        release.wait(timeout=5)
+
+    queue = watch_mod.ChangeQueue(handler, debounce=0.01, max_workers=2)
+    runner = asyncio.create_task(queue.run())
+    queue.put(Change.added, path)
+    await asyncio.to_thread(started.wait, 5)
+    queue.put(Change.deleted, path)
+    await asyncio.sleep(0.05)
+    assert len(batches) == 1  # not dispatched while the first batch runs
+
+    release.set()
+    await queue.drain()
+    runner.cancel()
+    queue.close()
+
+    assert batches == [[(Change.added, path)], [(Change.deleted, path)]]
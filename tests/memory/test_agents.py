@@ -0,0 +1,70 @@
+"""Tests for the reusable memory ingestion agents."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from agent_cli.memory._agents import MemoryAgents
+from agent_cli.memory.models import MemoryDelete
+
+
+@pytest.mark.asyncio
+async def test_agents_are_reused_per_backend_and_model() -> None:
+    agents = MemoryAgents()
+    first = agents.facts(base_url="http://llm/v1", api_key=None, model="a")
+    assert agents.facts(base_url="http://llm/v1", api_key=None, model="a") is first
+    assert agents.facts(base_url="http://llm/v1", api_key=None, model="b") is not first
+    assert agents.summary(base_url="http://llm/v1", api_key=None, model="a") is not first
+
+    stats = agents.stats()
+    assert stats["created"] == 3
+    assert stats["reused"] == 1
+    await agents.aclose()
+    assert agents.stats()["agents"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_agent_validates_ids_from_deps() -> None:
+    """The shared agent takes the per-call existing ids as deps and retries bad ids."""
+    responses = [
+        {"response": [{"event": "DELETE", "id": 7}]},
+        {"response": [{"event": "DELETE", "id": 0}]},
+    ]
+    seen: list[list[ModelMessage]] = []
+
+    def respond(messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        seen.append(messages)
+        return ModelResponse(parts=[TextPart(json.dumps(responses[len(seen) - 1]))])
+
+    agents = MemoryAgents()
+    agent = agents.reconcile(base_url="http://llm/v1", api_key=None, model="m")
+    with agent.override(model=FunctionModel(respond)):
+        result = await agents.run(agent, "payload", deps=frozenset({0}))
+
+    assert result.output == [MemoryDelete(id=0)]
+    assert len(seen) == 2  # first answer referenced an unknown id
+    await agents.aclose()
+
+
+@pytest.mark.asyncio
+async def test_run_bounds_concurrent_llm_calls() -> None:
+    agents = MemoryAgents(max_concurrency=2)
+    running = 0
+    peak = 0
+
+    class _SlowAgent:
+        async def run(self, *_args: Any, **_kwargs: Any) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(agents.run(_SlowAgent()) for _ in range(6)))  # type: ignore[arg-type]
+    assert peak == 2
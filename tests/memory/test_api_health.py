@@ -48,6 +48,7 @@ def test_memory_health_and_startup_shutdown(tmp_path: Any) -> None:
             body = resp.json()
             assert body["status"] == "ok"
             assert body["memory_store"] == str(tmp_path.resolve())
+            assert body["ingestion_queue"]["depth"] == 0
 
     # startup/shutdown should have triggered watch task creation
     assert started
@@ -7,6 +7,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, Self
 from uuid import uuid4
 
+import numpy as np
 import pytest
 
 from agent_cli.memory import _ingest, _persistence, _retrieval, _tasks, engine
@@ -16,6 +17,7 @@ from agent_cli.memory._files import (
     write_memory_file,
     write_snapshot,
 )
+from agent_cli.memory._store import MemoryCandidates
 from agent_cli.memory.entities import Fact
 from agent_cli.memory.models import (
     ChatRequest,
@@ -228,21 +230,20 @@ async def test_retrieve_memory_prefers_diversity_and_adds_summaries(
         distance=0.3,
     )
 
-    call_count = 0
+    queried: list[str | list[str]] = []
 
-    def fake_query_memories(
+    def fake_query_memory_candidates(
         _collection: Any,
         *,
-        conversation_id: str,
+        conversation_id: str | list[str],
         text: str,  # noqa: ARG001
         n_results: int,  # noqa: ARG001
         filters: dict[str, Any] | None = None,  # noqa: ARG001
-    ) -> list[StoredMemory]:
-        nonlocal call_count
-        call_count += 1
-        return [mem_primary, mem_similar] if conversation_id == "conv1" else [mem_diverse]
+    ) -> MemoryCandidates:
+        queried.append(conversation_id)
+        return MemoryCandidates(records=[mem_primary, mem_similar, mem_diverse])
 
-    monkeypatch.setattr(_retrieval, "query_memories", fake_query_memories)
+    monkeypatch.setattr(_retrieval, "query_memory_candidates", fake_query_memory_candidates)
     monkeypatch.setattr(
         _retrieval,
         "predict_relevance",
@@ -276,7 +277,107 @@ async def test_retrieve_memory_prefers_diversity_and_adds_summaries(
     assert mem_primary.content in contents
     assert mem_diverse.content in contents  # diverse item beats near-duplicate
     assert any("Conversation summary" in text for text in summaries)
-    assert call_count == 2  # conversation + global
+    assert queried == [["conv1", "global"]]  # conversation + global in one query
+
+
+def test_query_scopes_keeps_a_quota_per_scope(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A large global scope cannot crowd the conversation's memories out."""
+
+    def memory(mem_id: str, conversation_id: str) -> StoredMemory:
+        return StoredMemory(
+            id=mem_id,
+            content=mem_id,
+            metadata=MemoryMetadata(
+                conversation_id=conversation_id,
+                role="memory",
+                created_at="2025-01-01T00:00:00+00:00",
+            ),
+        )
+
+    global_hits = [memory(f"g{i}", "global") for i in range(6)]
+    own_hits = [memory("c0", "conv1")]
+    queried: list[str | list[str]] = []
+
+    def fake_query_memory_candidates(
+        _collection: Any,
+        *,
+        conversation_id: str | list[str],
+        n_results: int,
+        **_kwargs: Any,
+    ) -> MemoryCandidates:
+        queried.append(conversation_id)
+        hits = {"conv1": own_hits, "global": global_hits}
+        if isinstance(conversation_id, list):  # Global memories are all nearer
+            return MemoryCandidates(records=global_hits[:n_results])
+        return MemoryCandidates(records=hits[conversation_id][:n_results])
+
+    def fake_count(_collection: Any, *, conversation_id: str, limit: int, **_kwargs: Any) -> int:
+        hits = {"conv1": own_hits, "global": global_hits}
+        return min(len(hits[conversation_id]), limit)
+
+    monkeypatch.setattr(_retrieval, "query_memory_candidates", fake_query_memory_candidates)
+    monkeypatch.setattr(_retrieval, "count_memory_candidates", fake_count)
+
+    candidates = _retrieval._query_scopes(
+        _RecordingCollection(),  # type: ignore[arg-type]
+        scopes=["conv1", "global"],
+        text="q",
+        per_scope=3,
+        filters=None,
+    )
+
+    assert queried == [["conv1", "global"], "conv1"]
+    assert [rec.id for rec in candidates.records] == ["c0", "g0", "g1", "g2"]
+
+
+def test_query_scopes_runs_one_query_when_a_scope_is_small(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A small global scope next to a long conversation needs no per-scope queries."""
+
+    def memory(mem_id: str, conversation_id: str) -> StoredMemory:
+        return StoredMemory(
+            id=mem_id,
+            content=mem_id,
+            metadata=MemoryMetadata(
+                conversation_id=conversation_id,
+                role="memory",
+                created_at="2025-01-01T00:00:00+00:00",
+            ),
+        )
+
+    hits = {
+        "conv1": [memory(f"c{i}", "conv1") for i in range(10)],
+        "global": [memory("g0", "global")],
+    }
+    queried: list[str | list[str]] = []
+
+    def fake_query_memory_candidates(
+        _collection: Any,
+        *,
+        conversation_id: str | list[str],
+        n_results: int,
+        **_kwargs: Any,
+    ) -> MemoryCandidates:
+        queried.append(conversation_id)
+        return MemoryCandidates(records=[hits["global"][0], *hits["conv1"]][:n_results])
+
+    def fake_count(_collection: Any, *, conversation_id: str, limit: int, **_kwargs: Any) -> int:
+        return min(len(hits[conversation_id]), limit)
+
+    monkeypatch.setattr(_retrieval, "query_memory_candidates", fake_query_memory_candidates)
+    monkeypatch.setattr(_retrieval, "count_memory_candidates", fake_count)
+
+    candidates = _retrieval._query_scopes(
+        _RecordingCollection(),  # type: ignore[arg-type]
+        scopes=["conv1", "global"],
+        text="q",
+        per_scope=3,
+        filters=None,
+    )
+
+    assert queried == [["conv1", "global"]]
+    assert [rec.id for rec in candidates.records] == ["c0", "c1", "c2", "g0"]
 
 
 @pytest.mark.asyncio
@@ -306,7 +407,11 @@ async def test_retrieve_memory_returns_all_facts(monkeypatch: pytest.MonkeyPatch
         distance=0.2,
     )
 
-    monkeypatch.setattr(_retrieval, "query_memories", lambda *_args, **_kwargs: [older, newer])
+    monkeypatch.setattr(
+        _retrieval,
+        "query_memory_candidates",
+        lambda *_args, **_kwargs: MemoryCandidates(records=[older, newer]),
+    )
     # Relevance > 0.35 default
     monkeypatch.setattr(_retrieval, "predict_relevance", lambda _model, pairs: [2.0 for _ in pairs])
 
@@ -414,27 +519,6 @@ def test_evict_if_needed_drops_oldest_and_cleans_disk(
     tmp_path: Any,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    entries = [
-        StoredMemory(
-            id="old",
-            content="old",
-            metadata=MemoryMetadata(
-                conversation_id="conv",
-                role="memory",
-                created_at="2023-01-01T00:00:00",
-            ),
-        ),
-        StoredMemory(
-            id="new",
-            content="new",
-            metadata=MemoryMetadata(
-                conversation_id="conv",
-                role="memory",
-                created_at="2024-01-01T00:00:00",
-            ),
-        ),
-    ]
-
     old_record = write_memory_file(
         tmp_path,
         conversation_id="conv",
@@ -455,11 +539,6 @@ def test_evict_if_needed_drops_oldest_and_cleans_disk(
     write_snapshot(snapshot_path, [old_record, new_record])
 
     removed: list[str] = []
-    monkeypatch.setattr(
-        _persistence,
-        "list_conversation_entries",
-        lambda _collection, _cid, include_summary=False: entries,  # noqa: ARG005
-    )
     monkeypatch.setattr(
         _persistence,
         "delete_entries",
@@ -608,3 +687,33 @@ async def test_streaming_with_summarization_persists_facts_and_summaries(
     assert len(files) == 4  # user + assistant + fact + 1 summary
     assert any("facts" in f.parts for f in files)
     assert any(f.parent.name == "summaries" and f.name == "summary.md" for f in files)
+
+
+def test_mmr_select_uses_embedding_matrix() -> None:
+    """MMR skips a near-duplicate of the first pick in favour of a diverse one."""
+    now = datetime.now(UTC).isoformat()
+    candidates = [
+        StoredMemory(
+            id=str(i),
+            content=f"memory {i}",
+            metadata=MemoryMetadata(conversation_id="c", role="memory", created_at=now),
+        )
+        for i in range(3)
+    ]
+    embeddings = np.array([[1.0, 0.0], [0.99, 0.1], [0.0, 1.0]], dtype=np.float32)
+
+    selected = _retrieval.mmr_select(
+        candidates,
+        [0.9, 0.85, 0.6],
+        max_items=2,
+        lambda_mult=0.5,
+        embeddings=embeddings,
+    )
+    assert [mem.id for mem, _ in selected] == ["0", "2"]
+    assert [score for _, score in selected] == pytest.approx([0.9, 0.6])
+
+    # Without a matrix, the vectors come from the records themselves
+    for mem, row in zip(candidates, embeddings, strict=True):
+        mem.embedding = row.tolist()
+    fallback = _retrieval.mmr_select(candidates, [0.9, 0.85, 0.6], max_items=2, lambda_mult=0.5)
+    assert [mem.id for mem, _ in fallback] == ["0", "2"]
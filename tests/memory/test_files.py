@@ -10,6 +10,8 @@ from agent_cli.memory.models import MemoryMetadata
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pytest
+
 
 def test_write_and_read_memory_file_round_trip(tmp_path: Path) -> None:
     """Writes a memory file and reads it back with metadata intact."""
@@ -45,6 +47,61 @@ def test_snapshot_round_trip(tmp_path: Path) -> None:
     assert loaded["1"].content == "hi"
 
 
+def _record(tmp_path: Path, doc_id: str, content: str) -> mem_files.MemoryFileRecord:
+    meta = MemoryMetadata(conversation_id="c1", role="memory", created_at="now")
+    return mem_files.MemoryFileRecord(
+        id=doc_id,
+        path=tmp_path / f"{doc_id}.md",
+        metadata=meta,
+        content=content,
+    )
+
+
+def test_snapshot_journal_replays_on_load(tmp_path: Path) -> None:
+    """Journal appends are applied on top of the snapshot, in order."""
+    snapshot = tmp_path / "snap.json"
+    mem_files.write_snapshot(snapshot, [_record(tmp_path, "1", "a"), _record(tmp_path, "2", "b")])
+
+    mem_files.append_snapshot_journal(snapshot, upserts=[_record(tmp_path, "1", "a2")])
+    mem_files.append_snapshot_journal(snapshot, removals=["2"])
+    mem_files.append_snapshot_journal(snapshot, upserts=[_record(tmp_path, "3", "c")])
+    # A crash mid-append leaves a torn last line, which is skipped
+    with mem_files.journal_path(snapshot).open("a", encoding="utf-8") as f:
+        f.write('{"op": "put", "rec')
+
+    loaded = mem_files.load_snapshot(snapshot)
+    assert {doc_id: rec.content for doc_id, rec in loaded.items()} == {"1": "a2", "3": "c"}
+
+
+def test_write_snapshot_compacts_journal(tmp_path: Path) -> None:
+    """Writing a snapshot folds the journal in and removes it."""
+    snapshot = tmp_path / "snap.json"
+    mem_files.append_snapshot_journal(snapshot, upserts=[_record(tmp_path, "1", "a")])
+    assert mem_files.journal_path(snapshot).exists()
+
+    mem_files.write_snapshot(snapshot, mem_files.load_snapshot(snapshot).values())
+
+    assert not mem_files.journal_path(snapshot).exists()
+    assert set(mem_files.load_snapshot(snapshot)) == {"1"}
+
+
+def test_journal_changes_compact_without_an_index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Removals journaled outside `MemoryIndex` also compact a large journal."""
+    monkeypatch.setattr(mem_files, "_JOURNAL_MIN_COMPACT_BYTES", 0)
+    snapshot = tmp_path / "snap.json"
+    mem_files.write_snapshot(snapshot, [_record(tmp_path, "0", "x" * 200)])
+
+    mem_files.journal_snapshot_changes(snapshot, removals=["0"])
+    assert mem_files.journal_path(snapshot).exists()  # Still smaller than the snapshot
+    mem_files.journal_snapshot_changes(snapshot, upserts=[_record(tmp_path, "1", "y" * 400)])
+
+    assert not mem_files.journal_path(snapshot).exists()
+    assert set(mem_files.load_snapshot(snapshot)) == {"1"}
+
+
 def test_load_memory_files_skips_invalid(tmp_path: Path) -> None:
     """Invalid files without front matter should be ignored."""
     entries_dir = tmp_path / "entries" / "default"
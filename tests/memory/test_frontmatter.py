@@ -0,0 +1,105 @@
+"""Tests for the fixed-schema memory front-matter codec."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+
+from agent_cli.memory import _files as mem_files
+from agent_cli.memory._frontmatter import dump_front_matter, load_front_matter
+from agent_cli.memory.models import MemoryMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_TRICKY_VALUES = [
+    "memory",
+    "2025-01-01T00:00:00Z",
+    "123",
+    "yes",
+    "Null",
+    "",
+    "a: b # not a comment",
+    'it\'s "quoted"',
+    "line\nbreak\ttab\r",
+    "back\\slash",
+    "- dash",
+    "ünïcödé 😀",
+    "nel\x85sep\u2028",
+    "x" * 200,
+]
+
+
+@pytest.mark.parametrize("value", _TRICKY_VALUES)
+def test_dump_is_yaml_and_round_trips(value: str) -> None:
+    fields = {"id": "abc-123", "conversation_id": value, "role": "memory"}
+    block = dump_front_matter(fields)
+    assert yaml.safe_load(block) == fields
+    assert load_front_matter(block) == fields
+
+
+@pytest.mark.parametrize("value", _TRICKY_VALUES)
+def test_load_reads_pyyaml_output(value: str) -> None:
+    fields = {"id": "abc-123", "conversation_id": value}
+    for allow_unicode in (False, True):
+        block = yaml.safe_dump(fields, sort_keys=False, allow_unicode=allow_unicode)
+        assert load_front_matter(block) == yaml.safe_load(block)
+
+
+def test_load_falls_back_to_yaml_for_hand_edits() -> None:
+    block = "id: 42\nrole: memory  # edited\ntags:\n  - a\n"
+    assert load_front_matter(block) == {"id": 42, "role": "memory", "tags": ["a"]}
+    assert load_front_matter("id: [unclosed\n") is None
+    assert load_front_matter("- just\n- a list\n") is None
+
+
+def _best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_codec_benchmark_against_pyyaml() -> None:
+    """Micro-benchmark: read-all (parse every file) and write-one (render one)."""
+    metas = [
+        (
+            f"{i:08x}-4c1b-9f0e-{i:012x}",
+            MemoryMetadata(
+                conversation_id=f"conv-{i % 7}",
+                role="memory",
+                created_at=f"2025-01-01T00:{i % 60:02d}:00+00:00",
+                source_id=f"src-{i}",
+            ),
+        )
+        for i in range(300)
+    ]
+    blocks = [
+        yaml.safe_dump({"id": doc_id, **meta.model_dump(exclude_none=True)}, sort_keys=False)
+        for doc_id, meta in metas
+    ]
+    doc_id, meta = metas[0]
+
+    read_yaml = _best_of(lambda: [yaml.safe_load(block) for block in blocks])
+    read_codec = _best_of(lambda: [load_front_matter(block) for block in blocks])
+    write_yaml = _best_of(
+        lambda: [
+            yaml.safe_dump({"id": doc_id, **meta.model_dump(exclude_none=True)}, sort_keys=False)
+            for _ in range(100)
+        ],
+    )
+    write_codec = _best_of(
+        lambda: [mem_files._render_front_matter(doc_id, meta) for _ in range(100)],
+    )
+    print(
+        f"\nfront matter read-all x{len(blocks)}: yaml {read_yaml * 1e3:.1f} ms, "
+        f"codec {read_codec * 1e3:.1f} ms; write-one x100: yaml {write_yaml * 1e3:.1f} ms, "
+        f"codec {write_codec * 1e3:.1f} ms",
+    )
+    assert read_codec < read_yaml
+    assert write_codec < write_yaml
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import subprocess
 from datetime import UTC, datetime
@@ -12,6 +13,7 @@ from uuid import uuid4
 import pytest
 
 from agent_cli.memory import _ingest
+from agent_cli.memory._git import init_repo
 from agent_cli.memory.client import MemoryClient
 from agent_cli.memory.entities import Fact
 
@@ -163,3 +165,99 @@ async def test_memory_client_git_versioning(
     log_final = _git_log(memory_path)
     assert len(log_final) > len(log_after)
     assert "Add facts to conversation default" in log_final[0]
+
+
+def _git_status(path: Path) -> str:
+    return subprocess.run(
+        ["git", "status", "--porcelain"],  # noqa: S607
+        cwd=path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+@pytest.mark.asyncio
+async def test_git_committer_batches_recorded_paths(tmp_path: Path) -> None:
+    """Recorded paths become one commit; unrecorded changes stay unstaged."""
+    from agent_cli.memory._files import conversation_paths, write_memory_file  # noqa: PLC0415
+    from agent_cli.memory._git import GitCommitter, init_repo  # noqa: PLC0415
+
+    init_repo(tmp_path)
+    committer = GitCommitter(tmp_path, interval=3600)
+    for cid in ("a", "b"):
+        write_memory_file(
+            tmp_path, conversation_id=cid, role="memory", created_at="now", content=cid
+        )
+        committer.record(conversation_paths(tmp_path, cid), f"Update {cid}")
+    write_memory_file(tmp_path, conversation_id="c", role="memory", created_at="now", content="c")
+
+    await committer.flush()
+
+    log = _git_log(tmp_path)
+    assert len(log) == 2
+    assert "Update memory (2 changes)" in log[0]
+    assert _git_status(tmp_path).strip() == "?? entries/c/"
+
+    await committer.flush()  # Nothing recorded: no empty commit
+    assert len(_git_log(tmp_path)) == 2
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+@pytest.mark.asyncio
+async def test_git_committer_flushes_after_max_pending_and_on_close(tmp_path: Path) -> None:
+    from agent_cli.memory._files import conversation_paths, write_memory_file  # noqa: PLC0415
+    from agent_cli.memory._git import GitCommitter, init_repo  # noqa: PLC0415
+
+    init_repo(tmp_path)
+    committer = GitCommitter(tmp_path, interval=3600, max_pending=2)
+    committer.start()
+
+    def change(cid: str) -> None:
+        write_memory_file(
+            tmp_path, conversation_id=cid, role="memory", created_at="now", content=cid
+        )
+        committer.record(conversation_paths(tmp_path, cid), f"Update {cid}")
+
+    change("a")
+    change("b")
+    for _ in range(100):
+        if committer.commits:
+            break
+        await asyncio.sleep(0.05)
+    assert committer.commits == 1
+
+    change("c")
+    await committer.aclose()
+    assert committer.commits == 2
+    assert "Update c" in _git_log(tmp_path)[0]
+    assert _git_status(tmp_path) == ""
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_init_repo_adds_journal_to_existing_gitignore(tmp_path: Path) -> None:
+    """Repos created before the index journal existed start ignoring it."""
+    for args in (
+        ["init"],
+        ["config", "user.email", "test@local"],
+        ["config", "user.name", "Test"],
+    ):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)  # noqa: S607
+    (tmp_path / ".gitignore").write_text("chroma/\nmemory_index.json", encoding="utf-8")
+
+    init_repo(tmp_path)
+    init_repo(tmp_path)
+
+    lines = (tmp_path / ".gitignore").read_text(encoding="utf-8").splitlines()
+    assert lines == ["chroma/", "memory_index.json", "memory_index.journal"]
+    assert _git_log(tmp_path)[0].endswith("Ignore derived index files")
+    (tmp_path / "memory_index.journal").write_text("{}", encoding="utf-8")
+    status = subprocess.run(
+        ["git", "status", "--porcelain"],  # noqa: S607
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert status.stdout == ""
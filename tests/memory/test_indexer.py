@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 from watchfiles import Change
@@ -15,12 +16,17 @@ class _FakeCollection:
         self.upserts: list[tuple[list[str], list[str], list[dict[str, Any]]]] = []
         self.deleted: list[list[str]] = []
 
+        self.size = 0
+
     def upsert(self, ids: list[str], documents: list[str], metadatas: list[dict[str, Any]]) -> None:
         self.upserts.append((ids, documents, metadatas))
 
     def delete(self, ids: list[str]) -> None:
         self.deleted.append(ids)
 
+    def count(self) -> int:
+        return self.size
+
 
 def test_initial_index_deletes_stale_and_indexes_current(tmp_path: Any) -> None:
     fake = _FakeCollection()
@@ -47,6 +53,46 @@ def test_initial_index_deletes_stale_and_indexes_current(tmp_path: Any) -> None:
     assert rec.id in idx.entries
 
 
+def test_initial_index_only_upserts_changed_files(tmp_path: Any, monkeypatch: Any) -> None:
+    recs = [
+        mem_files.write_memory_file(
+            tmp_path,
+            conversation_id="c",
+            role="memory",
+            created_at="now",
+            content=f"fact {i}",
+        )
+        for i in range(3)
+    ]
+    snapshot_path = tmp_path / "memory_index.json"
+    fake = _FakeCollection()
+    _indexer.initial_index(fake, tmp_path, index=_indexer.MemoryIndex.from_snapshot(snapshot_path))
+    assert set(fake.upserts[0][0]) == {rec.id for rec in recs}
+
+    # Restart with Chroma in sync: nothing is read or upserted
+    fake = _FakeCollection()
+    fake.size = 3
+    read: list[Any] = []
+    real_read = mem_files.read_memory_file
+    monkeypatch.setattr(mem_files, "read_memory_file", lambda p: read.append(p) or real_read(p))
+    _indexer.initial_index(fake, tmp_path, index=_indexer.MemoryIndex.from_snapshot(snapshot_path))
+    assert read == []
+    assert fake.upserts == []
+
+    # A touched file is re-read but not re-upserted; an edited one is upserted
+    st = recs[0].path.stat()
+    os.utime(recs[0].path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    recs[1].path.write_text(recs[1].path.read_text().replace("fact 1", "fact one"))
+    _indexer.initial_index(fake, tmp_path, index=_indexer.MemoryIndex.from_snapshot(snapshot_path))
+    assert sorted(read) == sorted([recs[0].path, recs[1].path])
+    assert fake.upserts == [([recs[1].id], ["fact one"], fake.upserts[0][2])]
+
+    # Chroma out of sync with the snapshot (e.g. wiped): everything is upserted
+    fake = _FakeCollection()
+    _indexer.initial_index(fake, tmp_path, index=_indexer.MemoryIndex.from_snapshot(snapshot_path))
+    assert len(fake.upserts[0][0]) == 3
+
+
 def test_handle_change_add_modify_delete(tmp_path: Any) -> None:
     fake = _FakeCollection()
     idx = _indexer.MemoryIndex(snapshot_path=None)
@@ -59,13 +105,61 @@ def test_handle_change_add_modify_delete(tmp_path: Any) -> None:
         content="hello",
     )
 
-    _indexer._handle_change(Change.added, rec.path, fake, idx)
+    _indexer._handle_changes([(Change.added, rec.path)], fake, idx)
     assert fake.upserts
     assert rec.id in idx.entries
 
-    _indexer._handle_change(Change.modified, rec.path, fake, idx)
+    _indexer._handle_changes([(Change.modified, rec.path)], fake, idx)
     assert len(fake.upserts) >= 2
 
-    _indexer._handle_change(Change.deleted, rec.path, fake, idx)
+    _indexer._handle_changes([(Change.deleted, rec.path)], fake, idx)
     assert fake.deleted
     assert rec.id not in idx.entries
+
+
+def test_handle_changes_applies_batch_with_one_upsert(tmp_path: Any) -> None:
+    fake = _FakeCollection()
+    idx = _indexer.MemoryIndex(snapshot_path=None)
+
+    recs = [
+        mem_files.write_memory_file(
+            tmp_path,
+            conversation_id="c",
+            role="memory",
+            created_at="now",
+            content=f"fact {i}",
+        )
+        for i in range(3)
+    ]
+    _indexer._handle_changes([(Change.added, rec.path) for rec in recs], fake, idx)
+
+    assert len(fake.upserts) == 1
+    assert set(fake.upserts[0][0]) == {rec.id for rec in recs}
+    assert set(idx.entries) == {rec.id for rec in recs}
+
+    _indexer._handle_changes([(Change.deleted, recs[0].path)], fake, idx)
+    assert fake.deleted == [[recs[0].id]]
+    assert recs[0].id not in idx.entries
+
+
+def test_memory_index_journals_mutations(tmp_path: Any) -> None:
+    snapshot_path = tmp_path / "memory_index.json"
+    idx = _indexer.MemoryIndex(snapshot_path=snapshot_path)
+    idx.replace([])
+    snapshot_before = snapshot_path.read_text()
+
+    rec = mem_files.write_memory_file(
+        tmp_path,
+        conversation_id="c",
+        role="memory",
+        created_at="now",
+        content="hello",
+    )
+    idx.upsert(rec)
+
+    # The snapshot is untouched; the change lives in the journal until compaction
+    assert snapshot_path.read_text() == snapshot_before
+    assert rec.id in _indexer.MemoryIndex.from_snapshot(snapshot_path).entries
+
+    idx.remove(rec.id)
+    assert rec.id not in _indexer.MemoryIndex.from_snapshot(snapshot_path).entries
@@ -0,0 +1,249 @@
+"""Tests for the staged and fused memory ingestion pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from agent_cli.memory import _ingest
+from agent_cli.memory.entities import Fact
+from agent_cli.memory.models import (
+    FusedIngestOutput,
+    MemoryAdd,
+    MemoryDelete,
+    MemoryMetadata,
+    StoredMemory,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.added: list[str] = []
+        self.deleted: list[str] = []
+        self.summaries: list[str] = []
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch) -> _Recorder:
+    """Capture what ingestion persists instead of touching Chroma or disk."""
+    rec = _Recorder()
+
+    def persist_entries(_collection: Any, *, entries: list[Fact], **_kwargs: Any) -> None:
+        rec.added.extend(entry.content for entry in entries)
+
+    def persist_summary(_collection: Any, *, summary: Any, **_kwargs: Any) -> None:
+        rec.summaries.append(summary.content)
+
+    monkeypatch.setattr(_ingest, "persist_entries", persist_entries)
+    monkeypatch.setattr(_ingest, "persist_summary", persist_summary)
+    monkeypatch.setattr(_ingest, "delete_entries", lambda _c, ids: rec.deleted.extend(ids))
+    monkeypatch.setattr(_ingest, "delete_memory_files", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(_ingest, "get_summary_entry", lambda *_args, **_kwargs: None)
+    return rec
+
+
+def _fact(text: str) -> Fact:
+    return Fact(
+        id=text,
+        conversation_id="c1",
+        content=text,
+        source_id="s",
+        created_at=datetime.now().astimezone(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_staged_summary_runs_concurrently_with_reconcile(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    recorder: _Recorder,
+) -> None:
+    summary_started = asyncio.Event()
+
+    async def fake_extract(**_kwargs: Any) -> list[str]:
+        return ["User likes tea."]
+
+    async def fake_reconcile(
+        _collection: Any,
+        _cid: str,
+        facts: list[str],
+        **_kwargs: Any,
+    ) -> tuple[list[Fact], list[str], dict[str, str]]:
+        # Deadlocks (and times out) if the summary waited for reconciliation
+        await summary_started.wait()
+        return [_fact(f) for f in facts], [], {}
+
+    async def fake_summary(**_kwargs: Any) -> str:
+        summary_started.set()
+        return "Likes tea."
+
+    monkeypatch.setattr(_ingest, "extract_salient_facts", fake_extract)
+    monkeypatch.setattr(_ingest, "reconcile_facts", fake_reconcile)
+    monkeypatch.setattr(_ingest, "update_summary", fake_summary)
+
+    await asyncio.wait_for(
+        _ingest.extract_and_store_facts_and_summaries(
+            collection=object(),  # type: ignore[arg-type]
+            memory_root=tmp_path,
+            conversation_id="c1",
+            user_message="I like tea",
+            assistant_message=None,
+            openai_base_url="http://llm/v1",
+            api_key=None,
+            model="m",
+        ),
+        timeout=1,
+    )
+    assert recorder.added == ["User likes tea."]
+    assert recorder.summaries == ["Likes tea."]
+
+
+@pytest.mark.asyncio
+async def test_fused_mode_applies_facts_decisions_and_summary(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    recorder: _Recorder,
+) -> None:
+    existing = StoredMemory(
+        id="old",
+        content="User likes coffee.",
+        metadata=MemoryMetadata(conversation_id="c1", role="memory", created_at="now"),
+    )
+    monkeypatch.setattr(
+        _ingest,
+        "gather_relevant_existing_memories",
+        lambda *_args, **_kwargs: [existing],
+    )
+    runs: list[dict[str, Any]] = []
+
+    async def fake_run(_self: Any, payload: str, **kwargs: Any) -> Any:
+        runs.append({"payload": payload, **kwargs})
+
+        class _Result:
+            output = FusedIngestOutput(
+                facts=["User hates coffee."],
+                decisions=[MemoryDelete(id=0), MemoryAdd(text="User hates coffee.")],
+                summary="Hates coffee.",
+            )
+
+        return _Result()
+
+    async def unexpected(**_kwargs: Any) -> list[str]:
+        pytest.fail("staged extraction should not run")
+
+    import pydantic_ai  # noqa: PLC0415
+
+    monkeypatch.setattr(pydantic_ai.Agent, "run", fake_run)
+    monkeypatch.setattr(_ingest, "extract_salient_facts", unexpected)
+
+    await _ingest.extract_and_store_facts_and_summaries(
+        collection=object(),  # type: ignore[arg-type]
+        memory_root=tmp_path,
+        conversation_id="c1",
+        user_message="I hate coffee now",
+        assistant_message=None,
+        openai_base_url="http://llm/v1",
+        api_key=None,
+        model="m",
+        ingest_mode="fused",
+    )
+
+    assert len(runs) == 1
+    assert runs[0]["deps"] == frozenset({0})
+    assert "User likes coffee." in runs[0]["payload"]
+    assert recorder.deleted == ["old"]
+    assert recorder.added == ["User hates coffee."]
+    assert recorder.summaries == ["Hates coffee."]
+
+
+@pytest.mark.asyncio
+async def test_fused_mode_falls_back_to_staged_on_failure(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    recorder: _Recorder,
+) -> None:
+    from pydantic_ai.exceptions import UnexpectedModelBehavior  # noqa: PLC0415
+
+    monkeypatch.setattr(_ingest, "gather_relevant_existing_memories", lambda *_a, **_k: [])
+
+    async def failing_run(*_args: Any, **_kwargs: Any) -> Any:
+        msg = "not JSON"
+        raise UnexpectedModelBehavior(msg)
+
+    async def fake_extract(**_kwargs: Any) -> list[str]:
+        return ["User likes tea."]
+
+    async def fake_reconcile(
+        _collection: Any,
+        _cid: str,
+        facts: list[str],
+        **_kwargs: Any,
+    ) -> tuple[list[Fact], list[str], dict[str, str]]:
+        return [_fact(f) for f in facts], [], {}
+
+    import pydantic_ai  # noqa: PLC0415
+
+    monkeypatch.setattr(pydantic_ai.Agent, "run", failing_run)
+    monkeypatch.setattr(_ingest, "extract_salient_facts", fake_extract)
+    monkeypatch.setattr(_ingest, "reconcile_facts", fake_reconcile)
+
+    await _ingest.extract_and_store_facts_and_summaries(
+        collection=object(),  # type: ignore[arg-type]
+        memory_root=tmp_path,
+        conversation_id="c1",
+        user_message="I like tea",
+        assistant_message=None,
+        openai_base_url="http://llm/v1",
+        api_key=None,
+        model="m",
+        enable_summarization=False,
+        ingest_mode="fused",
+    )
+    assert recorder.added == ["User likes tea."]
+    assert recorder.summaries == []
+
+
+@pytest.mark.asyncio
+async def test_staged_summary_failure_still_persists_facts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    recorder: _Recorder,
+) -> None:
+    async def fake_extract(**_kwargs: Any) -> list[str]:
+        return ["User likes tea."]
+
+    async def fake_reconcile(
+        _collection: Any,
+        _cid: str,
+        facts: list[str],
+        **_kwargs: Any,
+    ) -> tuple[list[Fact], list[str], dict[str, str]]:
+        return [_fact(f) for f in facts], ["old"], {}
+
+    async def failing_summary(**_kwargs: Any) -> str:
+        msg = "summary LLM down"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(_ingest, "extract_salient_facts", fake_extract)
+    monkeypatch.setattr(_ingest, "reconcile_facts", fake_reconcile)
+    monkeypatch.setattr(_ingest, "update_summary", failing_summary)
+
+    await _ingest.extract_and_store_facts_and_summaries(
+        collection=object(),  # type: ignore[arg-type]
+        memory_root=tmp_path,
+        conversation_id="c1",
+        user_message="I like tea",
+        assistant_message=None,
+        openai_base_url="http://llm/v1",
+        api_key=None,
+        model="m",
+    )
+    assert recorder.added == ["User likes tea."]
+    assert recorder.deleted == ["old"]
+    assert recorder.summaries == []
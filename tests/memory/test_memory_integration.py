@@ -116,7 +116,7 @@ def client(tmp_path: Path) -> TestClient:
         )
         stack.enter_context(patch("agent_cli.memory.client.init_repo"))
         stack.enter_context(
-            patch("agent_cli.memory.engine.commit_changes", side_effect=_noop_commit),
+            patch("agent_cli.memory.engine.commit_or_record", side_effect=_noop_commit),
         )
         app = memory_api.create_app(
             memory_path=tmp_path,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from agent_cli.memory import _store
+from agent_cli.memory import _retrieval, _store
 from agent_cli.memory.models import MemoryMetadata
 
 
@@ -148,3 +148,81 @@ def test_upsert_and_delete_entries_delegate() -> None:
 
     _store.delete_entries(fake, ["x"])
     assert fake.deleted == [["x"]]
+
+
+class _RecordingQueryCollection(_FakeCollection):
+    def __init__(self, query_result: dict[str, Any]) -> None:
+        super().__init__(query_result=query_result)
+        self.queries: list[dict[str, Any]] = []
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        self.queries.append(kwargs)
+        return self.query_result
+
+
+def _meta(cid: str) -> dict[str, Any]:
+    return {"conversation_id": cid, "role": "memory", "created_at": "now"}
+
+
+def test_query_memories_batch_issues_one_query_per_call() -> None:
+    fake = _RecordingQueryCollection(
+        {
+            "documents": [["a", "b"], ["b"]],
+            "metadatas": [[_meta("c1"), _meta("global")], [_meta("global")]],
+            "ids": [["id-a", "id-b"], ["id-b"]],
+            "distances": [[0.1, 0.2], [0.3]],
+        },
+    )
+    rows = _store.query_memories_batch(
+        fake,
+        conversation_ids=["c1", "global"],
+        texts=["first", "second"],
+        n_results=2,
+        query_embeddings=[[1.0, 0.0], [0.0, 1.0]],
+    )
+
+    assert [[m.id for m in row] for row in rows] == [["id-a", "id-b"], ["id-b"]]
+    assert len(fake.queries) == 1
+    query = fake.queries[0]
+    assert query["query_embeddings"] == [[1.0, 0.0], [0.0, 1.0]]
+    assert "query_texts" not in query
+    assert {"conversation_id": {"$in": ["c1", "global"]}} in query["where"]["$and"]
+
+
+def test_gather_relevant_existing_memories_batches_and_dedupes() -> None:
+    fake = _RecordingQueryCollection(
+        {
+            "documents": [["a", "b"], ["b", "c"]],
+            "metadatas": [[_meta("c1"), _meta("c1")], [_meta("c1"), _meta("c1")]],
+            "ids": [["id-a", "id-b"], ["id-b", "id-c"]],
+            "distances": [[0.1, 0.2], [0.1, 0.4]],
+        },
+    )
+    existing = _retrieval.gather_relevant_existing_memories(fake, "c1", ["fact 1", "fact 2"])
+
+    assert [m.id for m in existing] == ["id-a", "id-b", "id-c"]
+    assert len(fake.queries) == 1
+    assert fake.queries[0]["query_texts"] == ["fact 1", "fact 2"]
+    clauses = fake.queries[0]["where"]["$and"]
+    assert {"conversation_id": "c1"} in clauses
+    assert {"role": "memory"} in clauses
+
+
+def test_query_memory_candidates_stacks_embeddings() -> None:
+    fake = _RecordingQueryCollection(
+        {
+            "documents": [["a", "b"]],
+            "metadatas": [[_meta("c1"), _meta("c1")]],
+            "ids": [["id-a", "id-b"]],
+            "distances": [[0.1, 0.2]],
+            "embeddings": [[[1.0, 0.0, 0.5], [0.0, 1.0, 0.5]]],
+        },
+    )
+    candidates = _store.query_memory_candidates(fake, conversation_id="c1", text="q", n_results=2)
+
+    assert [m.id for m in candidates.records] == ["id-a", "id-b"]
+    assert candidates.embeddings is not None
+    assert candidates.embeddings.dtype == "float32"
+    assert candidates.embeddings.shape == (2, 3)
+    assert all(m.embedding is None for m in candidates.records)
+    assert "embeddings" in fake.queries[0]["include"]
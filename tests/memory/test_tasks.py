@@ -0,0 +1,132 @@
+"""Tests for the per-conversation ingestion queue."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from agent_cli.memory import engine
+from agent_cli.memory._tasks import IngestionQueue
+
+
+@pytest.mark.asyncio
+async def test_turns_queued_during_a_batch_are_coalesced() -> None:
+    release = asyncio.Event()
+    batches: list[tuple[str, list[int]]] = []
+
+    async def handler(cid: str, items: list[int]) -> None:
+        batches.append((cid, items))
+        await release.wait()
+
+    queue: IngestionQueue[int] = IngestionQueue(handler)
+    queue.submit("c1", 1)
+    await asyncio.sleep(0)  # first batch starts with just turn 1
+    for turn in (2, 3, 4):
+        queue.submit("c1", turn)
+    assert queue.depth() == 3
+
+    release.set()
+    assert await queue.drain()
+    assert batches == [("c1", [1]), ("c1", [2, 3, 4])]
+    snapshot = queue.snapshot()
+    assert snapshot["submitted"] == 4
+    assert snapshot["coalesced"] == 2
+    assert snapshot["batches"] == 2
+    assert snapshot["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batches_are_serialized_per_conversation_and_bounded_globally() -> None:
+    running: dict[str, int] = {}
+    peak_per_conversation = 0
+    peak_total = 0
+
+    async def handler(cid: str, _items: list[int]) -> None:
+        nonlocal peak_per_conversation, peak_total
+        running[cid] = running.get(cid, 0) + 1
+        peak_per_conversation = max(peak_per_conversation, running[cid])
+        peak_total = max(peak_total, sum(running.values()))
+        await asyncio.sleep(0.01)
+        running[cid] -= 1
+
+    queue: IngestionQueue[int] = IngestionQueue(handler, max_concurrency=2)
+    for i in range(12):
+        queue.submit(f"c{i % 4}", i)
+        await asyncio.sleep(0.002)
+    assert await queue.drain()
+    assert peak_per_conversation == 1
+    assert peak_total == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_the_conversation() -> None:
+    seen: list[list[str]] = []
+
+    async def handler(_cid: str, items: list[str]) -> None:
+        seen.append(items)
+        if items == ["bad"]:
+            msg = "LLM down"
+            raise RuntimeError(msg)
+
+    queue: IngestionQueue[str] = IngestionQueue(handler)
+    queue.submit("c1", "bad")
+    await asyncio.sleep(0)
+    queue.submit("c1", "good")
+    assert await queue.drain()
+    assert seen == [["bad"], ["good"]]
+    assert queue.snapshot()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_drain_cancels_after_grace_period() -> None:
+    async def handler(_cid: str, _items: list[int]) -> None:
+        await asyncio.sleep(10)
+
+    queue: IngestionQueue[int] = IngestionQueue(handler)
+    queue.submit("c1", 1)
+    await asyncio.sleep(0)
+    queue.submit("c1", 2)
+    assert not await queue.drain(grace_seconds=0.01)
+    assert queue.snapshot()["conversations"] == 0
+    assert queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_turns_merges_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, Any]] = []
+
+    async def fake_postprocess(options: engine.PostprocessOptions, **kwargs: Any) -> None:
+        calls.append({"model": options.model, **kwargs})
+
+    def options(model: str) -> engine.PostprocessOptions:
+        return engine.PostprocessOptions(
+            collection=MagicMock(),
+            memory_root=Path(),
+            openai_base_url="http://localhost",
+            api_key=None,
+            enable_summarization=True,
+            model=model,
+            max_entries=10,
+            enable_git_versioning=False,
+        )
+
+    monkeypatch.setattr(engine, "_postprocess_after_turn", fake_postprocess)
+    turns = [
+        engine.PendingTurn("hi", "hello", "u1", options("a")),
+        engine.PendingTurn("I like tea", "Noted", "u2", options("b")),
+    ]
+    await engine.ingest_turns("c1", turns)
+
+    assert calls == [
+        {
+            "model": "b",
+            "conversation_id": "c1",
+            "user_message": "hi\n\nI like tea",
+            "assistant_message": "hello\n\nNoted",
+            "user_turn_id": "u2",
+        },
+    ]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
-from agent_cli.memory._persistence import evict_if_needed
+from agent_cli.memory._files import ensure_store_dirs, write_memory_file, write_snapshot
+from agent_cli.memory._persistence import evict_if_needed, persist_entries
 from agent_cli.memory._store import list_conversation_entries
+from agent_cli.memory.entities import Fact
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -59,15 +62,28 @@ class FakeCollection:
 
 def test_evict_if_needed_removes_oldest(tmp_path: Path) -> None:
     collection = FakeCollection()
-    base_meta = {"conversation_id": "c1", "role": "memory"}
+    records = [
+        write_memory_file(
+            tmp_path,
+            conversation_id="c1",
+            role=role,
+            created_at=created_at,
+            content=f"{doc_id} doc",
+            doc_id=doc_id,
+            summary_kind="summary" if role == "summary" else None,
+        )
+        for doc_id, role, created_at in [
+            ("new", "memory", "2024-12-01T00:00:00Z"),
+            ("old", "memory", "2024-01-01T00:00:00Z"),
+            ("summary", "summary", "2023-01-01T00:00:00Z"),
+            ("mid", "memory", "2024-06-01T00:00:00Z"),
+        ]
+    ]
+    write_snapshot(ensure_store_dirs(tmp_path)[1], records)
     collection.upsert(
-        ids=["old", "mid", "new"],
-        documents=["old doc", "mid doc", "new doc"],
-        metadatas=[
-            {**base_meta, "created_at": "2024-01-01T00:00:00Z"},
-            {**base_meta, "created_at": "2024-06-01T00:00:00Z"},
-            {**base_meta, "created_at": "2024-12-01T00:00:00Z"},
-        ],
+        ids=[rec.id for rec in records],
+        documents=[rec.content for rec in records],
+        metadatas=[rec.metadata.model_dump(exclude_none=True) for rec in records],
     )
 
     with patch("agent_cli.memory._ingest.delete_memory_files"):
@@ -76,3 +92,43 @@ def test_evict_if_needed_removes_oldest(tmp_path: Path) -> None:
     remaining = list_conversation_entries(collection, "c1")
     remaining_ids = {e.id for e in remaining}
     assert remaining_ids == {"mid", "new"}
+    # Under budget now: nothing else is evicted and summaries never are
+    evict_if_needed(collection, tmp_path, "c1", max_entries=2)
+    assert {e.id for e in list_conversation_entries(collection, "c1", include_summary=True)} == {
+        "mid",
+        "new",
+        "summary",
+    }
+
+
+class _NoListCollection(FakeCollection):
+    def get(self, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        msg = "eviction must not list the conversation"
+        raise AssertionError(msg)
+
+
+def test_evict_uses_index_of_persisted_entries(tmp_path: Path) -> None:
+    collection = _NoListCollection()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    facts = [
+        Fact(
+            id=f"f{i}",
+            conversation_id="c1",
+            content=f"fact {i}",
+            source_id="s",
+            created_at=start + timedelta(days=i),
+        )
+        for i in (2, 0, 1)
+    ]
+    persist_entries(collection, memory_root=tmp_path, conversation_id="c1", entries=[*facts])
+
+    # File paths come from the index too, so eviction never reads the snapshot
+    with patch(
+        "agent_cli.memory._persistence.load_snapshot",
+        side_effect=AssertionError("eviction must not load the snapshot"),
+    ):
+        evict_if_needed(collection, tmp_path, "c1", max_entries=2)
+
+    assert {entry["id"] for entry in collection.docs} == {"f1", "f2"}
+    remaining = {p.stem.split("__")[-1] for p in (tmp_path / "entries" / "c1").rglob("*.md")}
+    assert remaining == {"f1", "f2"}
@@ -6,6 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from agent_cli.rag import api
+from agent_cli.rag._pipeline import BulkIndexConfig
 
 
 @pytest.fixture
@@ -33,6 +34,7 @@ def test_health(client: TestClient) -> None:
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json()["status"] == "ok"
+    assert resp.json()["reranker"]["flushes"] == 0
 
 
 def test_list_files(client: TestClient) -> None:
@@ -56,6 +58,30 @@ def test_reindex(client: TestClient) -> None:
         mock_thread.return_value.start.assert_called()
 
 
+def test_reindex_uses_index_config() -> None:
+    """Test that the configured bulk index settings reach the reindex scan."""
+    config = BulkIndexConfig(embed_workers=8, queue_size=16)
+    with (
+        patch("agent_cli.rag.api.init_collection"),
+        patch("agent_cli.rag.api.get_reranker_model"),
+        patch("agent_cli.rag.api.load_hashes_from_metadata", return_value=({}, {})),
+        patch("pathlib.Path.mkdir"),
+        patch("agent_cli.rag.api.watch_docs"),
+        patch("asyncio.create_task"),
+        patch("threading.Thread") as mock_thread,
+    ):
+        app = api.create_app(
+            docs_folder=MagicMock(),
+            chroma_path=MagicMock(),
+            openai_base_url="http://mock-llama",
+            index_config=config,
+        )
+        resp = TestClient(app).post("/reindex")
+
+    assert resp.status_code == 200
+    assert mock_thread.call_args.kwargs["kwargs"]["config"] is config
+
+
 @pytest.mark.asyncio
 async def test_chat_completion_extra_fields(client: TestClient) -> None:
     """Test that extra fields (like response_format) are accepted."""
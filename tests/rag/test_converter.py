@@ -0,0 +1,46 @@
+"""Tests for pooled, cached document conversion."""
+
+from pathlib import Path
+from typing import Any
+
+from agent_cli.rag._converter import DocumentConverter
+
+
+def test_converter_reads_text_files_directly(tmp_path: Path, mocker: Any) -> None:
+    """Test that plain-text files bypass the process pool."""
+    convert = mocker.patch.object(DocumentConverter, "_convert")
+    f = tmp_path / "notes.md"
+    f.write_text("# Notes")
+
+    converter = DocumentConverter(tmp_path / "cache")
+    assert converter.load(f) == "# Notes"
+    convert.assert_not_called()
+
+
+def test_converter_caches_by_file_hash(tmp_path: Path, mocker: Any) -> None:
+    """Test that a rich document is converted once per content hash."""
+    convert = mocker.patch.object(DocumentConverter, "_convert", return_value="# Converted")
+    f = tmp_path / "report.pdf"
+    f.write_bytes(b"%PDF-1.4 v1")
+
+    converter = DocumentConverter(tmp_path / "cache")
+    assert converter.load(f) == "# Converted"
+    assert converter.load(f) == "# Converted"
+    # A fresh converter (e.g. after restart) reuses the on-disk cache
+    assert DocumentConverter(tmp_path / "cache").load(f) == "# Converted"
+    assert convert.call_count == 1
+
+    f.write_bytes(b"%PDF-1.4 v2")
+    converter.load(f)
+    assert convert.call_count == 2
+
+
+def test_converter_returns_none_on_failure(tmp_path: Path, mocker: Any) -> None:
+    """Test that conversion errors are logged and reported as unreadable."""
+    mocker.patch.object(DocumentConverter, "_convert", side_effect=RuntimeError("corrupt"))
+    f = tmp_path / "broken.docx"
+    f.write_bytes(b"not a docx")
+
+    converter = DocumentConverter(tmp_path / "cache")
+    assert converter.load(f) is None
+    assert not list((tmp_path / "cache").iterdir())
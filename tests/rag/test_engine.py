@@ -111,12 +111,16 @@ def test_convert_messages_keeps_nonempty_system() -> None:
     assert len(history) == 1
 
 
-def test_retrieve_context_direct() -> None:
+@pytest.mark.asyncio
+async def test_retrieve_context_direct() -> None:
     """Test direct usage of _retrieve_context without async/HTTP."""
     mock_collection = MagicMock()
     mock_reranker = MagicMock()
 
-    with patch("agent_cli.rag.engine.search_context") as mock_search:
+    with patch(
+        "agent_cli.rag.engine.search_context_async",
+        new_callable=AsyncMock,
+    ) as mock_search:
         # Case 1: Context found
         mock_search.return_value = MagicMock(
             context="Found it.",
@@ -128,7 +132,7 @@ def test_retrieve_context_direct() -> None:
             messages=[Message(role="user", content="Query")],
         )
 
-        retrieval = engine._retrieve_context(req, mock_collection, mock_reranker)
+        retrieval = await engine._retrieve_context(req, mock_collection, mock_reranker)
 
         assert retrieval is not None
         assert "Found it." in retrieval.context
@@ -136,7 +140,7 @@ def test_retrieve_context_direct() -> None:
         # Case 2: No context
         mock_search.return_value = MagicMock(context="", sources=[])
 
-        retrieval = engine._retrieve_context(req, mock_collection, mock_reranker)
+        retrieval = await engine._retrieve_context(req, mock_collection, mock_reranker)
 
         assert retrieval is None
 
@@ -160,7 +164,10 @@ async def test_process_chat_request_no_rag(tmp_path: Path) -> None:
     # We mock Agent.run on the class itself because each call creates a NEW instance
     with (
         patch("pydantic_ai.Agent.run", new_callable=AsyncMock) as mock_run,
-        patch("agent_cli.rag.engine.search_context") as mock_search,
+        patch(
+            "agent_cli.rag.engine.search_context_async",
+            new_callable=AsyncMock,
+        ) as mock_search,
         patch("pydantic_ai.Agent.__init__", return_value=None) as mock_agent_init,
     ):
         mock_run.return_value = mock_run_result
@@ -207,7 +214,10 @@ async def test_process_chat_request_with_rag(tmp_path: Path) -> None:
 
     with (
         patch("pydantic_ai.Agent.run", new_callable=AsyncMock) as mock_run,
-        patch("agent_cli.rag.engine.search_context") as mock_search,
+        patch(
+            "agent_cli.rag.engine.search_context_async",
+            new_callable=AsyncMock,
+        ) as mock_search,
     ):
         mock_run.return_value = mock_run_result
         # Return some context
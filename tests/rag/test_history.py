@@ -24,7 +24,10 @@ async def test_process_chat_request_preserves_history(tmp_path: Path) -> None:
 
     with (
         patch("pydantic_ai.Agent.run", new_callable=AsyncMock) as mock_run,
-        patch("agent_cli.rag.engine.search_context") as mock_search,
+        patch(
+            "agent_cli.rag.engine.search_context_async",
+            new_callable=AsyncMock,
+        ) as mock_search,
     ):
         mock_run.return_value = mock_run_result
         mock_search.return_value = MagicMock(context="")  # No RAG context for this test
@@ -40,18 +40,21 @@ async def test_watch_docs(tmp_path: Path) -> None:
         yield changes
 
     async def fake_watch_directory(_root: Path, handler: Any, **_kwargs) -> None:  # type: ignore[no-untyped-def]
-        for change, path in changes:
-            handler(change, Path(path))
+        handler([(change, Path(path)) for change, path in changes])
 
     with (
-        patch("agent_cli.rag._indexer.watch_directory", side_effect=fake_watch_directory),
-        patch("agent_cli.rag._indexer.index_file") as mock_index,
+        patch("agent_cli.rag._indexer.watch_directory_batched", side_effect=fake_watch_directory),
+        patch("agent_cli.rag._indexer.index_files") as mock_index,
         patch("agent_cli.rag._indexer.remove_file") as mock_remove,
     ):
         await _indexer.watch_docs(mock_collection, docs_folder, file_hashes, file_mtimes)
 
-        # Check calls
-        assert mock_index.call_count == 2  # added and modified
+        # Added and modified files are indexed together in one batch
+        assert mock_index.call_count == 1
+        assert set(mock_index.call_args.args[2]) == {
+            docs_folder / "new.txt",
+            docs_folder / "mod.txt",
+        }
         assert mock_remove.call_count == 1  # deleted
 
 
@@ -82,7 +85,7 @@ async def test_watch_docs_passes_ignore_filter(tmp_path: Path) -> None:
         assert not ignore_filter(readme, docs_folder)
 
     with patch(
-        "agent_cli.rag._indexer.watch_directory",
+        "agent_cli.rag._indexer.watch_directory_batched",
         side_effect=fake_watch_directory,
     ):
         await _indexer.watch_docs(mock_collection, docs_folder, file_hashes, file_mtimes)
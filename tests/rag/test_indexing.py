@@ -1,13 +1,18 @@
 """Tests for RAG indexing logic."""
 
+import queue
 import shutil
+import threading
+import time
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
 from agent_cli.rag import _indexing
+from agent_cli.rag._pipeline import AdaptiveBatchSize, BulkIndexConfig
 from agent_cli.rag._utils import get_file_hash
 
 
@@ -146,3 +151,204 @@ def test_initial_index_ignores_common_dev_directories(
     assert "__pycache__/module.cpython-313.pyc" not in file_hashes
     assert "node_modules/lodash/index.js" not in file_hashes
     assert "venv/bin/activate" not in file_hashes
+
+
+def test_index_file_only_upserts_changed_chunks(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Re-indexing a changed file upserts new chunks and deletes only stale ones."""
+    file_path = temp_docs_folder / "test.txt"
+    file_path.write_text("v1", encoding="utf-8")
+    file_hashes: dict[str, str] = {}
+    file_mtimes: dict[str, float] = {}
+
+    with patch("agent_cli.rag._indexing.chunk_text", return_value=["same", "old"]):
+        _indexing.index_file(mock_collection, temp_docs_folder, file_path, file_hashes, file_mtimes)
+    first_ids = mock_collection.upsert.call_args.kwargs["ids"]
+    first_metas = mock_collection.upsert.call_args.kwargs["metadatas"]
+    mock_collection.get.return_value = {"ids": first_ids, "metadatas": first_metas}
+    mock_collection.upsert.reset_mock()
+
+    file_path.write_text("v2", encoding="utf-8")
+    file_mtimes["test.txt"] = 0.0
+    with patch("agent_cli.rag._indexing.chunk_text", return_value=["same", "new"]):
+        assert _indexing.index_file(
+            mock_collection,
+            temp_docs_folder,
+            file_path,
+            file_hashes,
+            file_mtimes,
+        )
+
+    mock_collection.upsert.assert_called_once()
+    assert mock_collection.upsert.call_args.kwargs["documents"] == ["new"]
+    mock_collection.update.assert_called_once()
+    assert mock_collection.update.call_args.kwargs["ids"] == [first_ids[0]]
+    mock_collection.delete.assert_called_once_with(ids=[first_ids[1]])
+
+
+def test_initial_index_batches_chunks_across_files(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Test that the bulk indexer upserts chunks of many files in shared batches."""
+    for i in range(20):
+        (temp_docs_folder / f"doc{i}.txt").write_text(f"Document {i}.")
+
+    file_hashes: dict[str, str] = {}
+    file_mtimes: dict[str, float] = {}
+    config = BulkIndexConfig(embed_batch_size=64, upsert_batch_size=64)
+
+    _indexing.initial_index(mock_collection, temp_docs_folder, file_hashes, file_mtimes, config)
+
+    assert len(file_hashes) == 20
+    upserted = [
+        doc_id for call in mock_collection.upsert.call_args_list for doc_id in call.kwargs["ids"]
+    ]
+    assert len(upserted) == 20
+    assert mock_collection.upsert.call_count < 20
+
+
+def test_initial_index_leaves_failed_files_untracked(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Test that a file whose chunks fail to upsert is retried on the next scan."""
+    (temp_docs_folder / "doc.txt").write_text("Hello world.")
+    mock_collection.upsert.side_effect = RuntimeError("embedding server down")
+
+    file_hashes: dict[str, str] = {}
+    file_mtimes: dict[str, float] = {}
+    _indexing.initial_index(mock_collection, temp_docs_folder, file_hashes, file_mtimes)
+
+    assert "doc.txt" not in file_hashes
+
+
+def test_initial_index_raises_when_dispatcher_fails(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Test that an embedding dispatcher error stops the writer and reaches the caller."""
+    (temp_docs_folder / "doc.txt").write_text("Hello world.")
+
+    file_hashes: dict[str, str] = {}
+    file_mtimes: dict[str, float] = {}
+    with (
+        patch.object(
+            AdaptiveBatchSize,
+            "size",
+            new_callable=PropertyMock,
+            side_effect=RuntimeError("dispatcher bug"),
+        ),
+        pytest.raises(RuntimeError, match="dispatcher bug"),
+    ):
+        _indexing.initial_index(mock_collection, temp_docs_folder, file_hashes, file_mtimes)
+
+    mock_collection.upsert.assert_not_called()
+    assert file_hashes == {}
+
+
+def test_failing_dispatcher_does_not_leak_stage_threads(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Test that load/chunk/walk threads exit when the dispatcher fails with full queues."""
+    for i in range(40):
+        (temp_docs_folder / f"doc{i}.txt").write_text(f"Document number {i}.")
+    config = BulkIndexConfig(queue_size=1, scan_queue_size=1, convert_workers=2, chunk_workers=2)
+
+    with (
+        patch.object(
+            AdaptiveBatchSize,
+            "size",
+            new_callable=PropertyMock,
+            side_effect=RuntimeError("dispatcher bug"),
+        ),
+        pytest.raises(RuntimeError, match="dispatcher bug"),
+    ):
+        _indexing.initial_index(mock_collection, temp_docs_folder, {}, {}, config)
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        alive = [t.name for t in threading.enumerate() if t.name.startswith("rag-")]
+        if not alive:
+            break
+        time.sleep(0.01)
+    assert alive == []
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize(("status", "calls"), [(503, 1), (400, 15)])
+def test_embed_batch_bisects_only_input_errors(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+    status: int,
+    calls: int,
+) -> None:
+    """A transport error fails the batch at once; an input error is bisected to single chunks."""
+    indexer = _indexing._BulkIndexer(
+        mock_collection,
+        temp_docs_folder,
+        {},
+        {},
+        BulkIndexConfig(),
+        MagicMock(),
+        None,
+    )
+    plan = _indexing._ChunkPlan("doc.txt", "doc.txt", "hash", 0.0, 8, new_docs=["chunk"] * 8)
+    write_q: queue.Queue[Any] = queue.Queue()
+
+    with patch.object(_indexing, "embed_documents", side_effect=_StatusError(status)) as embed:
+        indexer._embed_batch([(plan, i) for i in range(8)], write_q)
+
+    assert embed.call_count == calls
+    failed = [write_q.get_nowait() for _ in range(write_q.qsize())]
+    assert all(batch.failed for batch in failed)
+    assert sum(len(batch.items) for batch in failed) == 8
+    assert indexer.progress.errors == (1 if status == 503 else 8)
+
+
+def test_adaptive_batch_size() -> None:
+    """Test that the embedding batch size grows when fast and shrinks on failure."""
+    batch_size = AdaptiveBatchSize(16, 4, 64, target_seconds=1.0)
+    batch_size.record_success(16, 0.1)
+    assert batch_size.size == 32
+    batch_size.record_success(8, 0.1)  # partial batch says nothing about capacity
+    assert batch_size.size == 32
+    batch_size.record_success(32, 5.0)
+    assert batch_size.size == 16
+    for _ in range(5):
+        batch_size.record_failure()
+    assert batch_size.size == 4
+
+
+def test_index_files_upserts_changed_files_together(
+    mock_collection: MagicMock,
+    temp_docs_folder: Path,
+) -> None:
+    """Test that a watcher batch embeds the new chunks of all files in one upsert."""
+    paths = []
+    for i in range(3):
+        path = temp_docs_folder / f"doc{i}.txt"
+        path.write_text(f"Document {i}.")
+        paths.append(path)
+
+    file_hashes: dict[str, str] = {}
+    file_mtimes: dict[str, float] = {}
+    indexed = _indexing.index_files(
+        mock_collection,
+        temp_docs_folder,
+        paths,
+        file_hashes,
+        file_mtimes,
+    )
+
+    assert indexed == paths
+    mock_collection.upsert.assert_called_once()
+    assert set(file_hashes) == {"doc0.txt", "doc1.txt", "doc2.txt"}
@@ -92,11 +92,10 @@ async def test_rag_tool_execution_flow(
     )
 
     # Mock the _retrieve_context function in engine
-    monkeypatch.setattr(
-        engine,
-        "_retrieve_context",
-        lambda *_, **__: mock_retrieval,
-    )
+    async def fake_retrieve_context(*_: Any, **__: Any) -> RetrievalResult:
+        return mock_retrieval
+
+    monkeypatch.setattr(engine, "_retrieve_context", fake_retrieve_context)
 
     # 3. Mock the Agent.run to simulate LLM behavior
     call_count = 0
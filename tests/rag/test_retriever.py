@@ -1,10 +1,27 @@
 """Tests for RAG retriever."""
 
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
+
 from agent_cli.core import reranker
+from agent_cli.core.chroma import bump_generation
+from agent_cli.core.retrieval_cache import RetrievalCache
 from agent_cli.rag import _retriever
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from agent_cli.rag.models import RetrievalResult
+
 
 def test_get_reranker_model_installed() -> None:
     """Test loading reranker when installed."""
@@ -52,3 +69,287 @@ def test_search_context_empty() -> None:
 
     assert result.context == ""
     assert result.sources == []
+
+
+@pytest.mark.asyncio
+async def test_search_context_async_runs_in_executor() -> None:
+    """Async search delegates to search_context on the given executor."""
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = {
+        "documents": [["doc1"]],
+        "metadatas": [[{"source": "s1", "file_path": "p1", "chunk_id": 0}]],
+    }
+    mock_reranker = MagicMock()
+    thread_names: list[str] = []
+    mock_reranker.predict.side_effect = lambda _pairs: (
+        thread_names.append(threading.current_thread().name) or [3.0]
+    )
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-test") as executor:
+        result = await _retriever.search_context_async(
+            mock_collection,
+            mock_reranker,
+            "query",
+            top_k=1,
+            executor=executor,
+        )
+
+    assert result.sources[0].path == "p1"
+    assert thread_names[0].startswith("rag-test")
+
+
+def test_rerank_batcher_coalesces_concurrent_calls() -> None:
+    """Callers arriving during a running batch share the next model call."""
+    model = MagicMock()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fake_predict(pairs: list[tuple[str, str]]) -> list[float]:
+        calls.append(len(pairs))
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=5)
+        return [float(len(doc)) for _, doc in pairs]
+
+    model.predict.side_effect = fake_predict
+    batcher = reranker.RerankBatcher(model)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.predict, [("q0", "a")])
+        assert started.wait(timeout=5)
+        second = pool.submit(batcher.predict, [("q1", "bb"), ("q1", "ccc")])
+        third = pool.submit(batcher.predict, [("q2", "dddd")])
+        # Give followers time to queue up behind the running batch
+        while len(batcher._pending) < 2:
+            time.sleep(0.001)
+        release.set()
+        assert first.result() == [1.0]
+        assert second.result() == [2.0, 3.0]
+        assert third.result() == [4.0]
+
+    assert calls == [1, 3]
+
+
+def test_rerank_batcher_propagates_errors() -> None:
+    """Model failures are raised in the calling thread."""
+    model = MagicMock()
+    model.predict.side_effect = RuntimeError("boom")
+    batcher = reranker.RerankBatcher(model)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        batcher.predict([("q", "d")])
+    assert batcher.predict([]) == []
+
+
+class _Interrupted(BaseException):
+    pass
+
+
+def test_rerank_batcher_settles_followers_when_leader_is_interrupted() -> None:
+    """A BaseException in the leader fails the followers of its batch instead of hanging them."""
+    model = MagicMock()
+    calls: list[int] = []
+
+    def fake_predict(pairs: list[tuple[str, str]]) -> list[float]:
+        calls.append(len(pairs))
+        if len(calls) == 1:
+            raise _Interrupted
+        return [0.0] * len(pairs)
+
+    model.predict.side_effect = fake_predict
+    batcher = reranker.RerankBatcher(model, max_wait_ms=5000, max_batch_pairs=2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(batcher.predict, [("q0", "a")])
+        while not batcher._busy:
+            time.sleep(0.001)
+        follower = pool.submit(batcher.predict, [("q1", "b")])
+        with pytest.raises(_Interrupted):
+            leader.result(timeout=5)
+        with pytest.raises(RuntimeError, match="interrupted"):
+            follower.result(timeout=5)
+
+    assert calls == [2]
+
+
+def test_rerank_batcher_sorts_by_length_and_records_stats() -> None:
+    """Pairs are scored shortest-first but returned in caller order."""
+    model = MagicMock()
+    seen: list[list[tuple[str, str]]] = []
+
+    def fake_predict(pairs: list[tuple[str, str]]) -> list[float]:
+        seen.append(list(pairs))
+        return [float(len(doc)) for _, doc in pairs]
+
+    model.predict.side_effect = fake_predict
+    batcher = reranker.RerankBatcher(model, max_wait_ms=0)
+
+    scores = batcher.predict([("q", "long document"), ("q", "a"), ("q", "mid")])
+
+    assert scores == [13.0, 1.0, 3.0]
+    assert [doc for _, doc in seen[0]] == ["a", "mid", "long document"]
+    stats = batcher.stats()
+    assert stats["flushes"] == 1
+    assert stats["pairs"] == 3
+    assert stats["last_flush_requests"] == 1
+    assert stats["queued_pairs"] == 0
+
+
+def test_rerank_batcher_respects_max_batch_pairs() -> None:
+    """Queued requests beyond the size limit are flushed in a later batch."""
+    model = MagicMock()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fake_predict(pairs: list[tuple[str, str]]) -> list[float]:
+        calls.append(len(pairs))
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=5)
+        return [0.0] * len(pairs)
+
+    model.predict.side_effect = fake_predict
+    batcher = reranker.RerankBatcher(model, max_batch_pairs=4, max_wait_ms=0)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(batcher.predict, [("q", "d")])
+        assert started.wait(timeout=5)
+        others = [pool.submit(batcher.predict, [("q", "d")] * 3) for _ in range(3)]
+        while len(batcher._pending) < 3:
+            time.sleep(0.001)
+        release.set()
+        first.result()
+        for future in others:
+            assert future.result() == [0.0] * 3
+
+    # 3 + 3 + 3 pairs with a limit of 4 cannot share a batch
+    assert calls == [1, 3, 3, 3]
+    assert batcher.stats()["flushes"] == 4
+
+
+def test_rerank_batcher_waits_for_concurrent_callers() -> None:
+    """A leader holds the batch open so callers arriving within the window share it."""
+    model = MagicMock()
+    model.predict.side_effect = lambda pairs: [1.0] * len(pairs)
+    batcher = reranker.RerankBatcher(model, max_batch_pairs=2, max_wait_ms=2000)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(batcher.predict, [("q0", "a")])
+        second = pool.submit(batcher.predict, [("q1", "b")])
+        assert first.result() == [1.0]
+        assert second.result() == [1.0]
+
+    # Batch fills up (2 pairs) before the long window expires
+    model.predict.assert_called_once()
+    assert batcher.stats()["last_flush_requests"] == 2
+
+
+class _RecordingSession:
+    """Fake ONNX session that records inputs and scores by sequence length."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, np.ndarray]] = []
+
+    def run(self, _outputs: None, inputs: dict[str, np.ndarray]) -> list[np.ndarray]:
+        self.calls.append(inputs)
+        return [inputs["attention_mask"].sum(axis=1, keepdims=True).astype(np.float32)]
+
+
+@pytest.fixture
+def cross_encoder(tmp_path: Path) -> reranker.OnnxCrossEncoder:
+    """OnnxCrossEncoder with a tiny real BERT tokenizer and a fake session."""
+    from transformers import BertTokenizerFast  # noqa: PLC0415
+
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "what", "is", "a", "cat", "dog", "pet"]
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    with (
+        patch("agent_cli.core.reranker._download_onnx_model", return_value="model.onnx"),
+        patch("onnxruntime.InferenceSession") as mock_session_cls,
+        patch(
+            "transformers.AutoTokenizer.from_pretrained",
+            return_value=BertTokenizerFast(vocab_file=str(vocab_file)),
+        ),
+    ):
+        mock_session_cls.return_value.get_inputs.return_value = [
+            SimpleNamespace(name=n) for n in ("input_ids", "attention_mask", "token_type_ids")
+        ]
+        model = reranker.OnnxCrossEncoder(max_length=8)
+    model.session = _RecordingSession()  # type: ignore[assignment]
+    return model
+
+
+def test_cross_encoder_matches_tokenizer_pair_encoding(
+    cross_encoder: reranker.OnnxCrossEncoder,
+) -> None:
+    """Pre-tokenized pairs produce the same inputs as tokenizing the pair directly."""
+    scores = cross_encoder.predict([("what is", "a cat")])
+
+    expected = cross_encoder.tokenizer("what is", "a cat", return_token_type_ids=True)
+    inputs = cross_encoder.session.calls[0]  # type: ignore[attr-defined]
+    assert inputs["input_ids"][0].tolist() == expected["input_ids"]
+    assert inputs["token_type_ids"][0].tolist() == expected["token_type_ids"]
+    assert scores == [float(len(expected["input_ids"]))]
+
+
+def test_cross_encoder_caches_doc_tokens_and_truncates(
+    cross_encoder: reranker.OnnxCrossEncoder,
+) -> None:
+    """Repeated documents hit the token cache; long pairs respect max_length."""
+    long_doc = "a cat " * 20
+    cross_encoder.predict([("what", long_doc), ("is", "dog")])
+    cross_encoder.predict([("pet", long_doc)])
+
+    stats = cross_encoder.token_cache.stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    for inputs in cross_encoder.session.calls:  # type: ignore[attr-defined]
+        assert inputs["input_ids"].shape[1] <= cross_encoder.max_length
+
+
+def test_cross_encoder_buckets_pairs_by_length(
+    cross_encoder: reranker.OnnxCrossEncoder,
+) -> None:
+    """Short and long pairs are batched separately and scores keep caller order."""
+    cross_encoder.max_length = 64
+    long_doc = " ".join(["dog"] * 40)
+    scores = cross_encoder.predict([("what", long_doc), ("what", "cat"), ("is", long_doc)])
+
+    widths = [c["input_ids"].shape[1] for c in cross_encoder.session.calls]  # type: ignore[attr-defined]
+    assert widths == [5, 44]
+    assert scores == [44.0, 5.0, 44.0]
+
+
+def test_token_cache_evicts_by_bytes() -> None:
+    """The LRU drops the oldest entries once the byte budget is exceeded."""
+    cache = reranker._TokenCache(max_bytes=2 * (40 + reranker._CACHE_ENTRY_OVERHEAD_BYTES))
+    for text in ("a", "b", "c"):
+        cache.put(cache.key(text), np.zeros(10, dtype=np.int32))
+    assert cache.get(cache.key("a")) is None
+    assert cache.get(cache.key("c")) is not None
+    assert cache.stats()["entries"] == 2
+
+
+def test_search_context_uses_cache_until_collection_changes() -> None:
+    """A repeated query is served from cache until the index generation changes."""
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = {
+        "documents": [["doc1"]],
+        "metadatas": [[{"source": "s1", "file_path": "p1", "chunk_id": 0}]],
+    }
+    mock_reranker = MagicMock()
+    mock_reranker.predict.return_value = [3.0]
+    cache: RetrievalCache[RetrievalResult] = RetrievalCache()
+
+    first = _retriever.search_context(mock_collection, mock_reranker, "Query", cache=cache)
+    second = _retriever.search_context(mock_collection, mock_reranker, " query ", cache=cache)
+
+    assert second is first
+    assert mock_collection.query.call_count == 1
+
+    bump_generation(mock_collection)
+    _retriever.search_context(mock_collection, mock_reranker, "query", cache=cache)
+    assert mock_collection.query.call_count == 2
+    assert cache.stats()["hits"] == 1
@@ -674,3 +674,80 @@ class TestGitignoreSupport:
         f.touch()
         assert not _utils.should_ignore_path(f, tmp_path, gitignore_patterns=None)
         assert not _utils.should_ignore_path(f, tmp_path, gitignore_patterns=[])
+
+
+class TestIterIndexableFiles:
+    """Tests for the pruning directory walk used by RAG scans."""
+
+    def test_matches_should_ignore_path(self, tmp_path: Path) -> None:
+        """Test the walk yields exactly the files should_ignore_path keeps."""
+        (tmp_path / ".gitignore").write_text("*.log\nlogs/\n!logs/keep.txt\nsub/skip.md\n")
+        for rel in [
+            "a.md",
+            "b.log",
+            "logs/keep.txt",
+            "sub/skip.md",
+            "sub/deep/c.md",
+            "node_modules/pkg/index.js",
+            ".hidden/d.md",
+            "pkg.egg-info/PKG-INFO",
+            "Thumbs.db",
+        ]:
+            f = tmp_path / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("x")
+
+        matcher = _utils.load_gitignore_matcher(tmp_path)
+        found = set(_utils.iter_indexable_files(tmp_path, gitignore=matcher))
+        expected = {
+            p
+            for p in tmp_path.rglob("*")
+            if p.is_file()
+            and not _utils.should_ignore_path(p, tmp_path, gitignore_patterns=matcher)
+        }
+        assert found == expected
+        assert {p.relative_to(tmp_path).as_posix() for p in found} == {"a.md", "sub/deep/c.md"}
+
+    def test_prunes_ignored_directories(self, tmp_path: Path, mocker: Any) -> None:
+        """Test ignored directories are never listed."""
+        (tmp_path / ".gitignore").write_text("generated/\n")
+        for rel in ["a.md", "node_modules/x/y.js", "build/out.txt", "generated/z.md"]:
+            f = tmp_path / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("x")
+
+        scandir = mocker.spy(_utils.os, "scandir")
+        matcher = _utils.load_gitignore_matcher(tmp_path)
+        found = list(_utils.iter_indexable_files(tmp_path, gitignore=matcher))
+
+        assert found == [tmp_path / "a.md"]
+        assert [call.args[0] for call in scandir.call_args_list] == [str(tmp_path)]
+
+    def test_matcher_caches_directory_decisions(self, tmp_path: Path, mocker: Any) -> None:
+        """Test each directory is evaluated once against the rules."""
+        (tmp_path / ".gitignore").write_text("*.tmp\n")
+        matcher = _utils.load_gitignore_matcher(tmp_path)
+        evaluate = mocker.spy(matcher, "_evaluate")
+
+        for name in ["a.md", "b.md", "c.tmp"]:
+            matcher.matches(("docs", "guide", name), is_dir=False)
+
+        dir_calls = [c for c in evaluate.call_args_list if c.kwargs["is_dir"]]
+        assert len(dir_calls) == 2  # docs/ and docs/guide/
+        assert matcher.matches(("docs", "guide", "c.tmp"), is_dir=False)
+
+    def test_matcher_directory_cache_is_bounded(self, tmp_path: Path) -> None:
+        """Test the directory cache evicts the least recently used entries."""
+        (tmp_path / ".gitignore").write_text("skip/\n")
+        matcher = _utils.GitignoreMatcher(
+            _utils.load_gitignore_patterns(tmp_path),
+            max_cached_dirs=2,
+        )
+
+        assert not matcher.is_dir_ignored(("a",))
+        assert matcher.is_dir_ignored(("skip",))
+        assert not matcher.is_dir_ignored(("a",))  # refresh: "skip" is now the oldest
+        assert not matcher.is_dir_ignored(("b",))
+
+        assert list(matcher._dir_cache) == [("a",), ("b",)]
+        assert matcher.is_dir_ignored(("skip", "sub"))
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from concurrent.futures.process import BrokenProcessPool
+from types import ModuleType, SimpleNamespace
 from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from agent_cli.server.whisper.backends import faster_whisper as fw
 from agent_cli.server.whisper.backends.base import BackendConfig
 from agent_cli.server.whisper.backends.faster_whisper import FasterWhisperBackend
 
 if TYPE_CHECKING:
+    import io
     from concurrent.futures import ProcessPoolExecutor
 
 
@@ -64,3 +68,107 @@ async def test_faster_whisper_transcribe_recovers_from_broken_process_pool() ->
     unload_mock.assert_awaited_once()
     load_mock.assert_awaited_once()
     assert executors_seen == [initial_executor, recovered_executor]
+
+
+def _install_fake_faster_whisper(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, object]]:
+    """Install a fake `faster_whisper` whose batched pipeline echoes its clips."""
+    import numpy as np  # noqa: PLC0415
+
+    calls: list[dict[str, object]] = []
+
+    def decode_audio(file: io.BytesIO, sampling_rate: int) -> np.ndarray:  # noqa: ARG001
+        kind, samples = file.read().decode().split(":")
+        fill = 1.0 if kind == "speech" else 0.0
+        return np.full(int(samples), fill, dtype=np.float32)
+
+    def get_speech_timestamps(audio: np.ndarray, _options: object) -> list[dict[str, int]]:
+        if not audio.any():
+            return []
+        return [{"start": 1600, "end": len(audio) - 1600}]
+
+    class BatchedInferencePipeline:
+        def __init__(self, model: object) -> None:
+            self.model = model
+
+        def transcribe(self, audio: np.ndarray, **kwargs: object) -> tuple[object, object]:
+            calls.append({"samples": len(audio), **kwargs})
+            clips = cast("list[dict[str, int]]", kwargs["clip_timestamps"])
+            segments = [
+                SimpleNamespace(
+                    id=i + 1,
+                    start=clip["start"] / 16000,
+                    end=clip["end"] / 16000,
+                    text=f" {kwargs['language']} clip {i}",
+                    tokens=[],
+                    avg_logprob=0.0,
+                    no_speech_prob=0.0,
+                )
+                for i, clip in enumerate(clips)
+            ]
+            return iter(segments), SimpleNamespace()
+
+    module = ModuleType("faster_whisper")
+    module.BatchedInferencePipeline = BatchedInferencePipeline  # type: ignore[attr-defined]
+    module.decode_audio = decode_audio  # type: ignore[attr-defined]
+    vad = ModuleType("faster_whisper.vad")
+    vad.VadOptions = lambda: None  # type: ignore[attr-defined]
+    vad.get_speech_timestamps = get_speech_timestamps  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+    monkeypatch.setitem(sys.modules, "faster_whisper.vad", vad)
+
+    model = SimpleNamespace(
+        feature_extractor=SimpleNamespace(sampling_rate=16000),
+        detect_language=lambda audio: ("fr", 0.9, []),  # noqa: ARG005
+    )
+    monkeypatch.setattr(fw._state, "model", model)
+    monkeypatch.setattr(fw._state, "pipeline", None)
+    return calls
+
+
+def test_batch_maps_segments_back_to_clips(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clips are decoded in one pipeline call and segments return to their clip."""
+    calls = _install_fake_faster_whisper(monkeypatch)
+    kwargs = {
+        "language": "en",
+        "task": "transcribe",
+        "initial_prompt": None,
+        "temperature": 0.0,
+        "vad_filter": True,
+        "word_timestamps": False,
+    }
+
+    results = fw._transcribe_batch_in_subprocess(
+        [b"speech:32000", b"silence:16000", b"speech:48000"],
+        kwargs,
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["batch_size"] == 2
+    assert calls[0]["vad_filter"] is False
+    # Leading and trailing silence (0.1s each) is trimmed before batching
+    assert calls[0]["samples"] == (32000 - 3200) + (48000 - 3200)
+    assert [r["text"] for r in results] == ["en clip 0", "", "en clip 1"]
+    assert [r["duration"] for r in results] == [2.0, 1.0, 3.0]
+    # Timestamps are relative to each clip's own audio
+    assert results[2]["segments"][0]["start"] == pytest.approx(0.1)
+    assert results[2]["segments"][0]["end"] == pytest.approx(2.9)
+
+
+def test_batch_groups_clips_by_detected_language(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a language, each clip is detected and decoded with its language."""
+    calls = _install_fake_faster_whisper(monkeypatch)
+    kwargs = {
+        "language": None,
+        "task": "transcribe",
+        "initial_prompt": None,
+        "temperature": 0.0,
+        "vad_filter": False,
+        "word_timestamps": False,
+    }
+
+    results = fw._transcribe_batch_in_subprocess([b"speech:16000", b"speech:16000"], kwargs)
+
+    assert [c["language"] for c in calls] == ["fr"]
+    assert [r["language"] for r in results] == ["fr", "fr"]
+    assert [r["language_probability"] for r in results] == [0.9, 0.9]
+    assert [r["text"] for r in results] == ["fr clip 0", "fr clip 1"]
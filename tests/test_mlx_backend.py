@@ -15,6 +15,7 @@ from agent_cli.server.whisper.backends.mlx import (
     MLXWhisperBackend,
     _transcribe_in_subprocess,
 )
+from agent_cli.server.whisper.backends.shared_audio import share_pcm
 
 
 def _make_wav_bytes(
@@ -91,22 +92,23 @@ def test_transcribe_in_subprocess_clears_metal_cache() -> None:
     long-lived subprocess never releases the Metal buffer cache, so it grows to
     the largest working set ever seen and gets pushed to swap.
     """
-    audio = np.zeros(160, dtype=np.float32)
+    pcm = np.zeros(160, dtype=np.int16).tobytes()
     fake_result = {"text": "hi", "language": "en", "segments": []}
 
     fake_mx = MagicMock()
     fake_mlx_whisper = MagicMock()
     fake_mlx_whisper.transcribe.return_value = fake_result
 
-    with patch.dict(
-        "sys.modules",
-        {"mlx": MagicMock(core=fake_mx), "mlx.core": fake_mx, "mlx_whisper": fake_mlx_whisper},
+    with (
+        patch.dict(
+            "sys.modules",
+            {"mlx": MagicMock(core=fake_mx), "mlx.core": fake_mx, "mlx_whisper": fake_mlx_whisper},
+        ),
+        share_pcm(pcm) as shared,
     ):
         result = _transcribe_in_subprocess(
             "mlx-community/whisper-large-v3-mlx",
-            audio.tobytes(),
-            audio.shape,
-            str(audio.dtype),
+            shared,
             {"temperature": 0.0},
         )
 
@@ -122,7 +124,7 @@ def test_transcribe_in_subprocess_clears_cache_on_failure() -> None:
     transcription that raises would otherwise leak. clear_cache() runs in a
     finally block, so it must fire even when mlx_whisper.transcribe raises.
     """
-    audio = np.zeros(160, dtype=np.float32)
+    pcm = np.zeros(160, dtype=np.int16).tobytes()
 
     fake_mx = MagicMock()
     fake_mlx_whisper = MagicMock()
@@ -133,13 +135,12 @@ def test_transcribe_in_subprocess_clears_cache_on_failure() -> None:
             "sys.modules",
             {"mlx": MagicMock(core=fake_mx), "mlx.core": fake_mx, "mlx_whisper": fake_mlx_whisper},
         ),
+        share_pcm(pcm) as shared,
         pytest.raises(RuntimeError, match="boom"),
     ):
         _transcribe_in_subprocess(
             "mlx-community/whisper-large-v3-mlx",
-            audio.tobytes(),
-            audio.shape,
-            str(audio.dtype),
+            shared,
             {"temperature": 0.0},
         )
 
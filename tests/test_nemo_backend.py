@@ -11,11 +11,13 @@ from concurrent.futures.process import BrokenProcessPool
 from types import ModuleType, SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pytest
 
 from agent_cli.server.cli import _is_parakeet_model
 from agent_cli.server.whisper.backends import nemo as backend
 from agent_cli.server.whisper.backends.base import BackendConfig, InvalidAudioError
+from agent_cli.server.whisper.backends.shared_audio import share_wav
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -421,6 +423,35 @@ def test_transcribe_in_subprocess_requests_and_extracts_segment_timestamps(
     ]
 
 
+def test_transcribe_in_subprocess_reads_shared_audio_as_array(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """16 kHz WAVs arrive through shared memory and reach NeMo as a float array."""
+    calls: dict[str, object] = {}
+
+    class _Model:
+        @staticmethod
+        def transcribe(audio: list[object], **_kwargs: object) -> list[object]:
+            calls["audio"] = audio[0]
+            return ["hello"]
+
+    monkeypatch.setattr(backend._state, "model", _Model())
+
+    with share_wav(_create_test_wav()) as shared:
+        assert shared is not None
+        result = backend._transcribe_in_subprocess(
+            shared,
+            {"language": None, "word_timestamps": False},
+        )
+
+    audio = calls["audio"]
+    assert isinstance(audio, np.ndarray)
+    assert audio.dtype == np.float32
+    assert audio.shape == (160,)
+    assert result["text"] == "hello"
+    assert result["duration"] == pytest.approx(0.01)
+
+
 def test_build_transcribe_kwargs_passes_target_lang_for_prompt_models() -> None:
     """Prompt-conditioned Parakeet signatures should receive target_lang."""
 
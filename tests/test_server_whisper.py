@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
+import itertools
 import wave
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 import typer
 from fastapi.testclient import TestClient
@@ -21,6 +24,7 @@ from agent_cli.server.cli import (
 from agent_cli.server.model_manager import ModelStats
 from agent_cli.server.whisper.backends import TranscriptionResult
 from agent_cli.server.whisper.backends.base import UnsupportedRequestError
+from agent_cli.server.whisper.batching import BatchScheduler
 from agent_cli.server.whisper.model_manager import (
     WhisperModelConfig as ModelConfig,
 )
@@ -31,6 +35,7 @@ from agent_cli.server.whisper.model_registry import (
     WhisperModelRegistry,
     create_whisper_registry,
 )
+from agent_cli.server.whisper.streaming import LocalAgreementTranscriber
 
 
 class TestModelConfig:
@@ -84,6 +89,13 @@ class TestModelConfig:
         with pytest.raises(ValueError, match="ttl_seconds must be >= 0"):
             ModelConfig(model_name="small", ttl_seconds=-1)
 
+    def test_replica_counts_are_validated(self) -> None:
+        """Replica counts must be positive and cover the warm minimum."""
+        with pytest.raises(ValueError, match="replicas must be >= 1"):
+            ModelConfig(model_name="small", replicas=0)
+        with pytest.raises(ValueError, match="min_replicas must be between"):
+            ModelConfig(model_name="small", replicas=2, min_replicas=3)
+
 
 class TestServerCliHelpers:
     """Tests for shared server CLI helpers."""
@@ -142,6 +154,15 @@ class TestWhisperDependencyChecks:
             "nemo-whisper",
         )
 
+    def test_resolve_whisper_required_extras_adds_vad_for_wyoming_streaming(self) -> None:
+        """Incremental Wyoming transcription needs the VAD extra."""
+        assert _resolve_whisper_required_extras(
+            {"backend": "nemo", "wyoming_streaming": True},
+        ) == ("server", "nemo-whisper", "wyoming", "vad")
+        assert _resolve_whisper_required_extras(
+            {"backend": "nemo", "wyoming_streaming": True, "no_wyoming": True},
+        ) == ("server", "nemo-whisper")
+
     @pytest.mark.parametrize(
         "model_name",
         [
@@ -359,6 +380,387 @@ class TestWhisperModelManager:
             assert manager.stats.unload_count == 1
 
 
+class _FakeBackend:
+    """In-process backend that blocks each transcription until released."""
+
+    def __init__(self) -> None:
+        self.is_loaded = False
+        self.device: str | None = None
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def load(self) -> float:
+        self.is_loaded = True
+        self.device = "cpu"
+        return 0.0
+
+    async def unload(self) -> None:
+        self.is_loaded = False
+        self.device = None
+
+    async def transcribe(self, _audio: bytes, **_kwargs: object) -> TranscriptionResult:
+        self.calls += 1
+        await self.release.wait()
+        return TranscriptionResult(text="ok", language="en", language_probability=1.0, duration=1.0)
+
+
+class TestWhisperReplicas:
+    """Tests for the per-model replica pool."""
+
+    @staticmethod
+    def _manager(
+        replicas: int, min_replicas: int = 0
+    ) -> tuple[WhisperModelManager, list[_FakeBackend]]:
+        manager = WhisperModelManager(
+            ModelConfig(
+                model_name="tiny",
+                backend_type="faster-whisper",
+                replicas=replicas,
+                min_replicas=min_replicas,
+            ),
+        )
+        backends = [_FakeBackend() for _ in manager._replicas]
+        for replica, backend in zip(manager._replicas, backends, strict=True):
+            replica.backend = backend
+        return manager, backends
+
+    @pytest.mark.asyncio
+    async def test_requests_go_to_least_loaded_replica(self) -> None:
+        """Concurrent requests spread over replicas; a lone request reuses a loaded one."""
+        manager, backends = self._manager(replicas=3)
+
+        tasks = [asyncio.create_task(manager.transcribe(b"audio")) for _ in range(4)]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert [r["queue_depth"] for r in manager.replica_status()] == [2, 1, 1]
+        assert manager.active_requests == 4
+
+        for backend in backends:
+            backend.release.set()
+        await asyncio.gather(*tasks)
+
+        assert [b.calls for b in backends] == [2, 1, 1]
+        assert manager.stats.total_requests == 4
+        assert manager.stats.load_count == 3
+        assert [r["queue_depth"] for r in manager.replica_status()] == [0, 0, 0]
+
+        await manager.transcribe(b"audio")
+        assert backends[0].calls == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_decodes_are_counted_separately(self) -> None:
+        """Interim stream decodes do not inflate the request and audio totals."""
+        manager, backends = self._manager(replicas=1)
+        backends[0].release.set()
+
+        await manager.transcribe(b"audio", partial=True)
+        await manager.transcribe(b"audio", partial=True)
+        await manager.transcribe(b"audio")
+
+        assert manager.stats.total_requests == 1
+        assert manager.stats.total_audio_seconds == 1.0
+        assert manager.stats.extra["partial_requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_replicas_load_at_start_and_ignore_ttl(self) -> None:
+        """Warm replicas load on start and never unload; others keep the TTL."""
+        manager, backends = self._manager(replicas=2, min_replicas=1)
+        await manager.start()
+        assert manager._warmup_task is not None
+        await manager._warmup_task
+
+        assert backends[0].is_loaded
+        assert not backends[1].is_loaded
+        assert manager._replicas[0]._unload_task is None
+        assert manager._replicas[1]._unload_task is not None
+        status = manager.replica_status()
+        assert status[0]["warm"] is True
+        assert status[1]["warm"] is False
+
+        await manager.stop()
+        assert not manager.is_loaded
+
+    def test_health_lists_replicas(self) -> None:
+        """The health endpoint reports per-replica queue depth."""
+        from agent_cli.server.whisper.api import create_app  # noqa: PLC0415
+
+        registry = create_whisper_registry()
+        registry.register(
+            ModelConfig(model_name="tiny", backend_type="faster-whisper", replicas=2),
+        )
+        client = TestClient(create_app(registry, enable_wyoming=False))
+
+        replicas = client.get("/health").json()["models"][0]["replicas"]
+        assert [r["index"] for r in replicas] == [0, 1]
+        assert all(r["queue_depth"] == 0 and not r["loaded"] for r in replicas)
+
+
+class _BatchingFakeBackend(_FakeBackend):
+    """Fake backend that also supports batched transcription."""
+
+    def __init__(self, *, fail_batches: bool = False) -> None:
+        super().__init__()
+        self.release.set()
+        self.batch_sizes: list[int] = []
+        self.fail_batches = fail_batches
+
+    async def transcribe_batch(
+        self,
+        audios: list[bytes],
+        **_kwargs: object,
+    ) -> list[TranscriptionResult]:
+        self.batch_sizes.append(len(audios))
+        if self.fail_batches:
+            msg = "batch failed"
+            raise RuntimeError(msg)
+        return [
+            TranscriptionResult(
+                text=f"clip {i}", language="en", language_probability=1.0, duration=1.0
+            )
+            for i in range(len(audios))
+        ]
+
+
+class TestBatchScheduler:
+    """Tests for the dynamic batching scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_groups_concurrent_items_by_key(self) -> None:
+        """Items with the same key share a batch; full batches dispatch immediately."""
+        batches: list[tuple[object, list[int]]] = []
+
+        async def run_batch(key: object, items: list[int]) -> list[int]:
+            batches.append((key, items))
+            return [item * 10 for item in items]
+
+        scheduler: BatchScheduler[int, int] = BatchScheduler(
+            run_batch,
+            max_batch_size=2,
+            max_wait=0.01,
+        )
+        results = await asyncio.gather(
+            scheduler.submit("a", 1),
+            scheduler.submit("a", 2),
+            scheduler.submit("a", 3),
+            scheduler.submit("b", 4),
+        )
+
+        assert results == [10, 20, 30, 40]
+        assert sorted(batches) == [("a", [1, 2]), ("a", [3]), ("b", [4])]
+        assert scheduler.batches == 3
+        assert scheduler.batched_items == 4
+
+    @pytest.mark.asyncio
+    async def test_per_item_errors_reach_their_caller(self) -> None:
+        """Exceptions returned for one item only fail that item."""
+
+        async def run_batch(_key: object, items: list[int]) -> list[int | BaseException]:
+            return [ValueError("bad") if item < 0 else item for item in items]
+
+        scheduler: BatchScheduler[int, int] = BatchScheduler(
+            run_batch,
+            max_batch_size=8,
+            max_wait=0.001,
+        )
+        good, bad = await asyncio.gather(
+            scheduler.submit("k", 1),
+            scheduler.submit("k", -1),
+            return_exceptions=True,
+        )
+        assert good == 1
+        assert isinstance(bad, ValueError)
+
+
+class TestWhisperBatching:
+    """Tests for batching in WhisperModelManager."""
+
+    @staticmethod
+    def _manager(*backends: _BatchingFakeBackend) -> WhisperModelManager:
+        manager = WhisperModelManager(
+            ModelConfig(
+                model_name="tiny",
+                backend_type="faster-whisper",
+                replicas=len(backends),
+                batch_size=4,
+                batch_wait_ms=5,
+            ),
+        )
+        for replica, backend in zip(manager._replicas, backends, strict=True):
+            replica.backend = backend
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_concurrent_wav_requests_are_batched(self) -> None:
+        """Concurrent short WAV requests become one batched call; others go direct."""
+        backend = _BatchingFakeBackend()
+        manager = self._manager(backend)
+        wav = _create_test_wav()
+
+        results = await asyncio.gather(*(manager.transcribe(wav) for _ in range(3)))
+        assert [r.text for r in results] == ["clip 0", "clip 1", "clip 2"]
+        assert backend.batch_sizes == [3]
+        assert backend.calls == 0
+
+        # Requests with different options don't share a batch
+        await asyncio.gather(manager.transcribe(wav), manager.transcribe(wav, language="de"))
+        assert backend.calls == 2
+
+        # Non-WAV payloads skip the scheduler
+        await manager.transcribe(b"not a wav")
+        assert backend.calls == 3
+        assert manager.stats.total_requests == 6
+        assert manager.replica_status()[0]["batched_requests"] == 5
+
+    @pytest.mark.asyncio
+    async def test_batchable_requests_fill_one_replica_before_spreading(self) -> None:
+        """Requests join the replica already collecting their batch, not the least-loaded one."""
+        backends = (_BatchingFakeBackend(), _BatchingFakeBackend())
+        manager = self._manager(*backends)
+        wav = _create_test_wav()
+
+        await asyncio.gather(*(manager.transcribe(wav) for _ in range(4)))
+        assert backends[0].batch_sizes == [4]
+        assert backends[1].batch_sizes == []
+
+        # Once a batch is full and dispatched, the next request spreads out
+        await asyncio.gather(*(manager.transcribe(wav) for _ in range(5)))
+        assert backends[0].batch_sizes == [4, 4]
+        assert backends[1].calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_requests(self) -> None:
+        """A failing batched call is retried one request at a time."""
+        backend = _BatchingFakeBackend(fail_batches=True)
+        manager = self._manager(backend)
+        wav = _create_test_wav()
+
+        results = await asyncio.gather(manager.transcribe(wav), manager.transcribe(wav))
+        assert [r.text for r in results] == ["ok", "ok"]
+        assert backend.batch_sizes == [2]
+        assert backend.calls == 2
+
+
+# Fake "speech" for streaming tests: word i is 0.5s of samples with value i + 1
+_WORD_SAMPLES = 8000
+
+
+def _spoken_pcm(n_words: int) -> bytes:
+    return b"".join(int(i + 1).to_bytes(2, "little") * _WORD_SAMPLES for i in range(n_words))
+
+
+async def _decode_spoken(audio: bytes, _prompt: str | None = None) -> TranscriptionResult:
+    """Recognize fake speech: complete words are stable, a cut-off word is a guess."""
+    with wave.open(io.BytesIO(audio), "rb") as wav_file:
+        frames = wav_file.readframes(wav_file.getnframes())
+    samples = np.frombuffer(frames, dtype="<i2")
+    # Run-length encode: each run of equal samples is one word
+    starts = np.flatnonzero(np.diff(samples, prepend=samples[:1] - 1))
+    lengths = np.diff(starts, append=len(samples))
+    words = [
+        (f"w{value - 1}" if length == _WORD_SAMPLES else f"w{value - 1}~{length}", start, length)
+        for value, start, length in zip(
+            samples[starts].tolist(),
+            starts.tolist(),
+            lengths.tolist(),
+            strict=True,
+        )
+    ]
+    # Two words per segment, like sentence-level Whisper segments
+    segments = [
+        {
+            "start": words[i][1] / 16000,
+            "end": (words[j - 1][1] + words[j - 1][2]) / 16000,
+            "text": " " + " ".join(word for word, _, _ in words[i:j]),
+        }
+        for i in range(0, len(words), 2)
+        for j in [min(i + 2, len(words))]
+    ]
+    return TranscriptionResult(
+        text="".join(segment["text"] for segment in segments).strip(),
+        language="en",
+        language_probability=1.0,
+        duration=len(samples) / 16000,
+        segments=segments,
+    )
+
+
+class TestLocalAgreementTranscriber:
+    """Tests for incremental decoding with local agreement."""
+
+    @pytest.mark.asyncio
+    async def test_partials_commit_stable_prefix_and_trim_audio(self) -> None:
+        """Committed text only grows, final text is complete, compute stays linear."""
+        streamer = LocalAgreementTranscriber(_decode_spoken)
+        pcm = _spoken_pcm(40)  # 20s of speech
+        chunk = len(pcm) // 80  # 0.25s chunks
+        committed_history: list[str] = []
+        window_sizes: list[float] = []
+        for offset in range(0, len(pcm), chunk):
+            streamer.add_audio(pcm[offset : offset + chunk])
+            if streamer.unprocessed_seconds >= 0.5:
+                window_sizes.append(streamer.duration - streamer._window_start)
+                committed, _ = await streamer.update()
+                committed_history.append(committed)
+
+        result = await streamer.finish()
+
+        assert result.text == " ".join(f"w{i}" for i in range(40))
+        assert result.duration == pytest.approx(20.0)
+        for before, after in itertools.pairwise(committed_history):
+            assert after.startswith(before)
+        assert committed_history[-1].startswith("w0 w1 w2")
+        # Committed audio is not decoded again: the window stays short
+        assert max(window_sizes) < 3.0
+        assert streamer.decoded_seconds < 3 * 20.0
+        starts = [segment["start"] for segment in result.segments]
+        assert starts == sorted(starts)
+        assert [segment["id"] for segment in result.segments] == list(range(len(starts)))
+
+    @pytest.mark.asyncio
+    async def test_window_is_capped_without_agreement(self) -> None:
+        """Decodes that never agree are force-committed once the window is full."""
+        calls = 0
+
+        async def unstable(audio: bytes, _prompt: str | None) -> TranscriptionResult:
+            nonlocal calls
+            calls += 1
+            duration = (len(audio) - 44) / 32000
+            return TranscriptionResult(
+                text=f"guess{calls}",
+                language="en",
+                language_probability=1.0,
+                duration=duration,
+                segments=[{"start": 0.0, "end": duration, "text": f"guess{calls}"}],
+            )
+
+        streamer = LocalAgreementTranscriber(unstable, max_window=2.0)
+        for _ in range(20):
+            streamer.add_audio(b"\x00\x00" * 8000)
+            await streamer.update()
+            assert streamer.duration - streamer._window_start <= 2.5
+
+        assert streamer.committed_text.startswith("guess")
+
+    @pytest.mark.asyncio
+    async def test_prompt_carries_committed_text(self) -> None:
+        """Each decode is prompted with the text committed so far."""
+        prompts: list[str | None] = []
+
+        async def decode(audio: bytes, prompt: str | None) -> TranscriptionResult:
+            prompts.append(prompt)
+            return await _decode_spoken(audio)
+
+        streamer = LocalAgreementTranscriber(decode)
+        pcm = _spoken_pcm(6)
+        for offset in range(0, len(pcm), _WORD_SAMPLES * 2):
+            streamer.add_audio(pcm[offset : offset + _WORD_SAMPLES * 2])
+            await streamer.update()
+
+        assert prompts[0] is None
+        assert prompts[-1] is not None
+        assert prompts[-1].startswith("w0")
+
+
 class TestWhisperModelRegistry:
     """Tests for WhisperModelRegistry."""
 
@@ -912,6 +1314,82 @@ class TestWhisperAPI:
         assert data["is_final"] is True
         assert data["segments"] == []
 
+    def test_websocket_streaming_sends_partials(
+        self,
+        client: TestClient,
+        mock_registry: WhisperModelRegistry,
+    ) -> None:
+        """Partials arrive while audio streams; the final covers the whole stream."""
+        manager = mock_registry.get_manager()
+        pcm = _spoken_pcm(8)
+        chunk = _WORD_SAMPLES  # 0.25s
+        messages: list[dict[str, object]] = []
+
+        async def transcribe(audio: bytes, **kwargs: object) -> TranscriptionResult:
+            return await _decode_spoken(audio, kwargs.get("initial_prompt"))  # type: ignore[arg-type]
+
+        with (
+            patch.object(manager, "transcribe", new=transcribe),
+            client.websocket_connect(
+                "/v1/audio/transcriptions/stream?model=whisper-1&partial_interval=0.5",
+            ) as websocket,
+        ):
+            for offset in range(0, len(pcm), chunk):
+                websocket.send_bytes(pcm[offset : offset + chunk])
+            websocket.send_bytes(b"EOS")
+            while not messages or messages[-1]["type"] != "final":
+                messages.append(websocket.receive_json())
+
+        partials = [m for m in messages if m["type"] == "partial"]
+        assert partials
+        for partial in partials:
+            assert partial["is_final"] is False
+            assert str(partial["text"]).startswith(str(partial["committed"]))
+        assert messages[-1]["text"] == " ".join(f"w{i}" for i in range(8))
+        assert messages[-1]["duration"] == pytest.approx(4.0)
+
+    def test_websocket_streaming_survives_failed_partial(
+        self,
+        client: TestClient,
+        mock_registry: WhisperModelRegistry,
+    ) -> None:
+        """A failed partial decode is skipped; the final still covers the whole stream."""
+        manager = mock_registry.get_manager()
+        pcm = _spoken_pcm(4)
+        chunk = _WORD_SAMPLES  # 0.25s
+        messages: list[dict[str, object]] = []
+
+        async def transcribe(audio: bytes, **kwargs: object) -> TranscriptionResult:
+            if kwargs.get("partial"):
+                msg = "partial boom"
+                raise RuntimeError(msg)
+            return await _decode_spoken(audio, kwargs.get("initial_prompt"))  # type: ignore[arg-type]
+
+        with (
+            patch.object(manager, "transcribe", new=transcribe),
+            client.websocket_connect(
+                "/v1/audio/transcriptions/stream?model=whisper-1&partial_interval=0.5",
+            ) as websocket,
+        ):
+            for offset in range(0, len(pcm), chunk):
+                websocket.send_bytes(pcm[offset : offset + chunk])
+            websocket.send_bytes(b"EOS")
+            while not messages or messages[-1]["type"] not in ("final", "error"):
+                messages.append(websocket.receive_json())
+
+        assert [m["type"] for m in messages] == ["final"]
+        assert messages[-1]["text"] == "w0 w1 w2 w3"
+
+    def test_websocket_streaming_without_audio(self, client: TestClient) -> None:
+        """An immediate EOS is reported as an error instead of decoding silence."""
+        with client.websocket_connect(
+            "/v1/audio/transcriptions/stream?model=whisper-1",
+        ) as websocket:
+            websocket.send_bytes(b"EOS")
+            data = websocket.receive_json()
+
+        assert data == {"type": "error", "message": "No audio received"}
+
     def test_websocket_streaming_unknown_model(self, client: TestClient) -> None:
         """Test WebSocket returns an error for unknown models."""
         with client.websocket_connect(
@@ -1,11 +1,21 @@
 """Tests for the Wyoming Whisper server handler."""
 
-from unittest.mock import MagicMock
+from __future__ import annotations
+
+import asyncio
+import io
+import wave
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from wyoming.audio import AudioChunk
+from wyoming.asr import Transcribe
+from wyoming.audio import AudioChunk, AudioStop
 
 from agent_cli import constants
+from agent_cli.core import vad as vad_module
+from agent_cli.server.whisper import wyoming_handler
+from agent_cli.server.whisper.backends.base import TranscriptionResult
 from agent_cli.server.whisper.wyoming_handler import WyomingWhisperHandler
 
 
@@ -21,3 +31,229 @@ async def test_audio_chunks_are_accumulated_in_place() -> None:
 
     assert handler._audio_bytes is audio_buffer
     assert handler._audio_bytes == b"firstsecond"
+
+
+class _ScriptedVAD:
+    """Stand-in for VoiceActivityDetector: chunks starting with b"E" end a segment."""
+
+    def __init__(self, **_kwargs: Any) -> None:
+        self._speech = bytearray()
+
+    def process_chunk(self, chunk: bytes) -> tuple[bool, bytes | None]:
+        if chunk.startswith(b"E"):
+            segment, self._speech = bytes(self._speech), bytearray()
+            return False, segment or None
+        self._speech.extend(chunk)
+        return True, None
+
+    def flush(self) -> bytes | None:
+        segment, self._speech = bytes(self._speech), bytearray()
+        return segment or None
+
+    def get_segment_duration_seconds(self, segment: bytes) -> float:
+        return len(segment) / 2 / constants.AUDIO_RATE
+
+
+def _pcm_of(wav_bytes: bytes) -> bytes:
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        return wav_file.readframes(wav_file.getnframes())
+
+
+def _streaming_handler(
+    monkeypatch: pytest.MonkeyPatch,
+    transcribe: Any,
+) -> tuple[WyomingWhisperHandler, list[bytes]]:
+    monkeypatch.setattr(vad_module, "VoiceActivityDetector", _ScriptedVAD)
+    decoded: list[bytes] = []
+
+    async def record(audio: bytes, **kwargs: Any) -> TranscriptionResult:
+        pcm = _pcm_of(audio)
+        decoded.append(pcm)
+        return await transcribe(pcm, **kwargs)
+
+    registry = MagicMock()
+    registry.get_manager.return_value.transcribe = record
+    handler = WyomingWhisperHandler(registry, MagicMock(), MagicMock(), vad_session=MagicMock())
+    handler.write_event = AsyncMock()  # type: ignore[method-assign]
+    return handler, decoded
+
+
+async def _send(handler: WyomingWhisperHandler, *chunks: bytes) -> None:
+    for audio in chunks:
+        event = AudioChunk(audio=audio, **constants.WYOMING_AUDIO_CONFIG).event()
+        assert await handler.handle_event(event) is True
+
+
+def _transcript(handler: WyomingWhisperHandler) -> str:
+    event = handler.write_event.await_args.args[0]  # type: ignore[attr-defined]
+    return event.data["text"]
+
+
+def _result(text: str, language: str = "en") -> TranscriptionResult:
+    return TranscriptionResult(text=text, language=language, language_probability=1.0, duration=0.0)
+
+
+@pytest.mark.asyncio
+async def test_streaming_transcribes_segments_before_audio_stop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Completed segments are decoded while audio arrives; AudioStop decodes only the tail."""
+
+    async def transcribe(pcm: bytes, **kwargs: Any) -> TranscriptionResult:
+        assert kwargs["language"] == "en"
+        return _result(f" {pcm.decode()} ")
+
+    handler, decoded = _streaming_handler(monkeypatch, transcribe)
+    await handler.handle_event(Transcribe(language="en").event())
+    await _send(handler, b"aa", b"bb", b"E!", b"cc", b"E!")
+    await asyncio.sleep(0)
+    assert decoded == [b"aabb", b"cc"]
+
+    await _send(handler, b"dd")
+    assert await handler.handle_event(AudioStop().event()) is False
+
+    assert decoded == [b"aabb", b"cc", b"dd"]
+    assert _transcript(handler) == "aabb cc dd"
+
+
+@pytest.mark.asyncio
+async def test_streaming_joins_unspaced_languages_without_separator(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def transcribe(pcm: bytes, **_kwargs: Any) -> TranscriptionResult:
+        return _result(pcm.decode(), language="zh")
+
+    handler, _ = _streaming_handler(monkeypatch, transcribe)
+    await _send(handler, b"aa", b"E!", b"bb")
+    await handler.handle_event(AudioStop().event())
+    assert _transcript(handler) == "aabb"
+
+
+@pytest.mark.asyncio
+async def test_streaming_falls_back_to_full_audio(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed segment (or no detected speech) decodes the whole recording instead."""
+
+    async def transcribe(pcm: bytes, **_kwargs: Any) -> TranscriptionResult:
+        if pcm == b"aa":
+            msg = "boom"
+            raise RuntimeError(msg)
+        return _result("full")
+
+    handler, decoded = _streaming_handler(monkeypatch, transcribe)
+    await _send(handler, b"aa", b"E!", b"bb")
+    await handler.handle_event(AudioStop().event())
+    assert decoded[-1] == b"aaE!bb"
+    assert _transcript(handler) == "full"
+
+    handler, decoded = _streaming_handler(monkeypatch, transcribe)
+    await _send(handler, b"E!")
+    await handler.handle_event(AudioStop().event())
+    assert decoded == [b"E!"]
+    assert _transcript(handler) == "full"
+
+
+@pytest.mark.asyncio
+async def test_server_shares_one_vad_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The VAD model loads once per server; each connection gets its own VAD state."""
+    session = object()
+    load = MagicMock(return_value=session)
+    monkeypatch.setattr(vad_module, "load_vad_session", load)
+    server = MagicMock()
+    server.run = AsyncMock()
+    monkeypatch.setattr(wyoming_handler.AsyncServer, "from_uri", lambda _uri: server)
+
+    await wyoming_handler.start_wyoming_server(MagicMock(), streaming=True)
+
+    factory = server.run.await_args.args[0]
+    first, second = factory(MagicMock(), MagicMock()), factory(MagicMock(), MagicMock())
+    load.assert_called_once_with()
+    first_vad, second_vad = first._get_vad(), second._get_vad()
+    assert first_vad is not second_vad
+    assert first_vad._model._session is session  # type: ignore[union-attr]
+    assert second_vad._model._session is session  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_streaming_without_vad_transcribes_on_audio_stop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """If the VAD model cannot load, connections transcribe the whole audio on AudioStop."""
+
+    def unavailable() -> None:
+        msg = "No module named 'onnxruntime'"
+        raise ImportError(msg)
+
+    monkeypatch.setattr(vad_module, "load_vad_session", unavailable)
+    server = MagicMock()
+    server.run = AsyncMock()
+    monkeypatch.setattr(wyoming_handler.AsyncServer, "from_uri", lambda _uri: server)
+    await wyoming_handler.start_wyoming_server(MagicMock(), streaming=True)
+
+    decoded: list[bytes] = []
+
+    async def transcribe(audio: bytes, **_kwargs: Any) -> TranscriptionResult:
+        decoded.append(_pcm_of(audio))
+        return _result(decoded[-1].decode())
+
+    registry = MagicMock()
+    registry.get_manager.return_value.transcribe = transcribe
+    factory = server.run.await_args.args[0]
+    handler = factory.func(registry, MagicMock(), MagicMock(), **factory.keywords)
+    handler.write_event = AsyncMock()
+    await _send(handler, b"aa", b"E!", b"bb")
+    await handler.handle_event(AudioStop().event())
+    assert decoded == [b"aaE!bb"]
+    assert _transcript(handler) == "aaE!bb"
+
+
+class _LoudnessVAD:
+    """Silero stand-in: any non-zero sample in a window is speech."""
+
+    def __init__(self, **_kwargs: Any) -> None:
+        pass
+
+    def __call__(self, audio: Any, _sample_rate: int) -> float:
+        return float(bool(audio.any()))
+
+    def reset_states(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_streaming_keeps_a_short_trailing_utterance(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A short word after a pause is transcribed, not dropped as too short."""
+    monkeypatch.setattr(vad_module, "_SileroVADOnnx", _LoudnessVAD)
+    decoded: list[float] = []
+
+    async def transcribe(audio: bytes, **_kwargs: Any) -> TranscriptionResult:
+        seconds = len(_pcm_of(audio)) / 2 / constants.AUDIO_RATE
+        decoded.append(seconds)
+        return _result("turn on the lights." if seconds > 0.5 else "Yes.")
+
+    registry = MagicMock()
+    registry.get_manager.return_value.transcribe = transcribe
+    handler = WyomingWhisperHandler(
+        registry,
+        MagicMock(),
+        MagicMock(),
+        vad_session=object(),
+        silence_threshold=0.5,
+    )
+    handler.write_event = AsyncMock()  # type: ignore[method-assign]
+
+    def pcm(seconds: float, *, loud: bool) -> bytes:
+        return (b"\x00\x10" if loud else b"\x00\x00") * int(seconds * constants.AUDIO_RATE)
+
+    await _send(
+        handler,
+        pcm(1.0, loud=True),
+        pcm(0.7, loud=False),
+        pcm(0.1, loud=True),
+        pcm(0.1, loud=False),
+    )
+    await handler.handle_event(AudioStop().event())
+
+    assert len(decoded) == 2
+    assert _transcript(handler) == "turn on the lights. Yes."
@@ -0,0 +1,93 @@
+"""Tests for the shared-memory audio hand-off to Whisper backend subprocesses."""
+
+from __future__ import annotations
+
+import io
+import pickle
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pytest
+
+from agent_cli.server.whisper.backends.shared_audio import (
+    SharedAudio,
+    read_shared_audio,
+    share_pcm,
+    share_wav,
+    wav_pcm_view,
+)
+
+
+def _make_wav(
+    samples: np.ndarray, *, rate: int = 16000, channels: int = 1, sampwidth: int = 2
+) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sampwidth)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_wav_pcm_view_points_at_data_chunk() -> None:
+    samples = np.arange(-80, 80, dtype=np.int16)
+    parsed = wav_pcm_view(_make_wav(samples))
+    assert parsed is not None
+    pcm, rate, channels = parsed
+    assert (rate, channels) == (16000, 1)
+    assert bytes(pcm) == samples.tobytes()
+
+
+def test_wav_pcm_view_rejects_non_pcm16() -> None:
+    assert wav_pcm_view(b"not a wav") is None
+    assert wav_pcm_view(_make_wav(np.zeros(16, dtype=np.uint8), sampwidth=1)) is None
+
+
+def test_share_wav_round_trip_and_cleanup() -> None:
+    samples = np.array([0, 16384, -16384, -32768], dtype=np.int16)
+    with share_wav(_make_wav(samples)) as shared:
+        assert shared is not None
+        assert shared.frames == len(samples)
+        assert shared.duration == pytest.approx(len(samples) / 16000)
+        np.testing.assert_allclose(read_shared_audio(shared), [0.0, 0.5, -0.5, -1.0])
+        name = shared.name
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_share_wav_downmixes_stereo() -> None:
+    stereo = np.array([[16384, 0], [-16384, -16384]], dtype=np.int16)
+    with share_wav(_make_wav(stereo, channels=2)) as shared:
+        assert shared is not None
+        np.testing.assert_allclose(read_shared_audio(shared), [0.25, -0.5])
+
+
+def test_share_wav_yields_none_for_fallback_cases() -> None:
+    with share_wav(b"not a wav") as shared:
+        assert shared is None
+    wav_8k = _make_wav(np.zeros(8, dtype=np.int16), rate=8000)
+    with share_wav(wav_8k) as shared:
+        assert shared is None
+    with share_wav(wav_8k, sample_rate=None) as shared:
+        assert shared is not None
+        assert shared.sample_rate == 8000
+
+
+def test_shared_audio_handle_is_small_to_pickle() -> None:
+    pcm = np.zeros(16000 * 30, dtype=np.int16).tobytes()
+    with share_pcm(pcm) as shared:
+        assert len(pickle.dumps(shared)) < 512
+
+
+def test_read_shared_audio_in_spawned_worker() -> None:
+    samples = np.linspace(-1000, 1000, 320).astype(np.int16)
+    with (
+        share_pcm(samples.tobytes()) as shared,
+        ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor,
+    ):
+        result = executor.submit(read_shared_audio, shared).result(timeout=60)
+    np.testing.assert_allclose(result, samples / 32768.0, rtol=1e-6)
+    assert isinstance(shared, SharedAudio)